@@ -20,6 +20,68 @@ from codeframe.adapters.llm.base import (
 if TYPE_CHECKING:
     from codeframe.core.credentials import CredentialManager
 
+#: Marker that ends a cacheable prompt prefix. The API caches everything up to
+#: and including the marked block, in tools -> system -> messages order.
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+#: Blocks the API refuses a cache_control marker on.
+_UNCACHEABLE_BLOCK_TYPES = frozenset({"thinking", "redacted_thinking"})
+
+
+def _usage_count(usage, field_name: str) -> int:
+    """A token count from an SDK usage object; 0 when absent or not reported.
+
+    Cache counters are None on responses that did not touch the cache and are
+    missing entirely on older SDKs.
+    """
+    value = getattr(usage, field_name, None)
+    return value if isinstance(value, int) else 0
+
+
+def _mark_last_block(message: dict) -> dict:
+    """Copy of ``message`` with a cache breakpoint on its final content block."""
+    content = message.get("content")
+    if isinstance(content, str):
+        if not content:
+            return message
+        blocks = [{"type": "text", "text": content}]
+    elif isinstance(content, list) and content:
+        blocks = list(content)
+    else:
+        return message
+    last = blocks[-1]
+    if not isinstance(last, dict) or last.get("type") in _UNCACHEABLE_BLOCK_TYPES:
+        return message
+    blocks[-1] = {**last, "cache_control": _CACHE_CONTROL}
+    return {**message, "content": blocks}
+
+
+def _apply_prompt_caching(kwargs: dict) -> dict:
+    """Mark the stable prefixes of a Messages API request as cacheable.
+
+    Sets up to three of the API's four breakpoints, each covering everything
+    before it: the last tool schema, the system prompt, and the final block of
+    the conversation. The last one rolls forward every turn, so an agent loop
+    re-reading its whole history pays the cache-read rate for all of it but the
+    newest message. A prefix below the model's minimum cacheable length is
+    simply not cached; the markers never change the response.
+
+    Returns a new dict; the caller's tools and messages are not mutated.
+    """
+    kwargs = dict(kwargs)
+    tools = kwargs.get("tools")
+    if tools:
+        kwargs["tools"] = [*tools[:-1], {**tools[-1], "cache_control": _CACHE_CONTROL}]
+    system = kwargs.get("system")
+    if isinstance(system, str) and system:
+        kwargs["system"] = [
+            {"type": "text", "text": system, "cache_control": _CACHE_CONTROL}
+        ]
+    messages = kwargs.get("messages")
+    if messages:
+        kwargs["messages"] = [*messages[:-1], _mark_last_block(messages[-1])]
+    return kwargs
+
 
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude provider.
@@ -34,6 +96,7 @@ class AnthropicProvider(LLMProvider):
         model_selector: Optional[ModelSelector] = None,
         credential_manager: Optional["CredentialManager"] = None,
         base_url: Optional[str] = None,
+        prompt_caching: bool = True,
     ):
         """Initialize the Anthropic provider.
 
@@ -43,6 +106,9 @@ class AnthropicProvider(LLMProvider):
             credential_manager: Optional credential manager for secure key retrieval
             base_url: Custom API endpoint (proxy/gateway); None uses the
                 SDK default (#780)
+            prompt_caching: Mark tools, system prompt and conversation
+                history as cacheable (see ``_apply_prompt_caching``). Turn off
+                for gateways that reject ``cache_control``.
 
         Raises:
             ValueError: If no API key is available
@@ -78,6 +144,7 @@ class AnthropicProvider(LLMProvider):
 
             base_url = vet_env_base_url("ANTHROPIC_BASE_URL")
         self.base_url = base_url
+        self.prompt_caching = prompt_caching
         self._client = None
         self._async_client = None
 
@@ -137,6 +204,9 @@ class AnthropicProvider(LLMProvider):
         # escape, so `cf prd generate` printed a raw JSON repr at a new user.
         from codeframe.adapters.llm.errors import map_provider_error
 
+        if self.prompt_caching:
+            kwargs = _apply_prompt_caching(kwargs)
+
         try:
             response = self.client.messages.create(**kwargs)
         except Exception as exc:
@@ -183,6 +253,8 @@ class AnthropicProvider(LLMProvider):
             kwargs["system"] = system
         if tools:
             kwargs["tools"] = self._convert_tools(tools)
+        if self.prompt_caching:
+            kwargs = _apply_prompt_caching(kwargs)
 
         try:
             response = await self._async_client.messages.create(**kwargs)
@@ -235,6 +307,8 @@ class AnthropicProvider(LLMProvider):
             "tools": tools,
             "max_tokens": max_tokens,
         }
+        if self.prompt_caching:
+            kwargs = _apply_prompt_caching(kwargs)
 
         # Interleaved extended thinking requires the beta namespace:
         # messages.stream() rejects betas= with TypeError (that was the #766 bug —
@@ -320,6 +394,12 @@ class AnthropicProvider(LLMProvider):
                         input_tokens=final_msg.usage.input_tokens,
                         output_tokens=final_msg.usage.output_tokens,
                         tool_inputs_by_id=tool_inputs_by_id,
+                        cache_creation_input_tokens=_usage_count(
+                            final_msg.usage, "cache_creation_input_tokens"
+                        ),
+                        cache_read_input_tokens=_usage_count(
+                            final_msg.usage, "cache_read_input_tokens"
+                        ),
                     )
 
     def stream(
@@ -357,6 +437,8 @@ class AnthropicProvider(LLMProvider):
 
         if system:
             kwargs["system"] = system
+        if self.prompt_caching:
+            kwargs = _apply_prompt_caching(kwargs)
 
         with self.client.messages.stream(**kwargs) as stream:
             for text in stream.text_stream:
@@ -450,4 +532,10 @@ class AnthropicProvider(LLMProvider):
             model=response.model,
             input_tokens=response.usage.input_tokens,
             output_tokens=response.usage.output_tokens,
+            cache_creation_input_tokens=_usage_count(
+                response.usage, "cache_creation_input_tokens"
+            ),
+            cache_read_input_tokens=_usage_count(
+                response.usage, "cache_read_input_tokens"
+            ),
         )
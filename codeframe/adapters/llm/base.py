@@ -149,6 +149,10 @@ class StreamChunk:
             final inputs are provided in the ``message_stop`` chunk).
         input_tokens: Input token count, populated for ``message_stop``.
         output_tokens: Output token count, populated for ``message_stop``.
+        cache_creation_input_tokens: Input tokens written to the prompt
+            cache, populated for ``message_stop`` by providers that cache.
+        cache_read_input_tokens: Input tokens served from the prompt cache,
+            populated for ``message_stop`` by providers that cache.
         stop_reason: Why the model stopped, populated for ``message_stop``.
         tool_inputs_by_id: Mapping of tool_id → final input dict, populated
             for ``message_stop``.  More reliable than streaming incremental
@@ -177,6 +181,8 @@ class StreamChunk:
     output_tokens: Optional[int] = None
     stop_reason: Optional[str] = None
     tool_inputs_by_id: Optional[dict] = None
+    cache_creation_input_tokens: Optional[int] = None
+    cache_read_input_tokens: Optional[int] = None
 
 
 @dataclass
@@ -218,8 +224,12 @@ class LLMResponse:
         tool_calls: List of tool calls requested by the model
         stop_reason: Why the model stopped generating
         model: Model that generated this response
-        input_tokens: Number of input tokens used
+        input_tokens: Number of input tokens used, excluding cached ones
         output_tokens: Number of output tokens generated
+        cache_creation_input_tokens: Input tokens written to the prompt cache
+            (billed above the base input rate)
+        cache_read_input_tokens: Input tokens served from the prompt cache
+            (billed at a fraction of the base input rate)
     """
 
     content: str
@@ -228,6 +238,8 @@ class LLMResponse:
     model: str = ""
     input_tokens: int = 0
     output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
 
     @property
     def has_tool_calls(self) -> bool:
@@ -9,11 +9,17 @@ scopes are stored on the key; JWT scopes are derived from the user record —
 read+write always, admin only for ``is_superuser`` accounts (issue #898).
 """
 
+import hashlib
+import hmac
 import logging
 import os
 import re
+import secrets
+import sqlite3
 import threading
 import time
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import Callable, Dict, Optional, Any, Tuple
 
 from fastapi import Depends, HTTPException, Request, Security, WebSocket, status
@@ -535,6 +541,104 @@ def _release_last_used_claim(key_id: str) -> None:
         _last_used_writes.pop(key_id, None)
 
 
+# Successful API-key verifications, cached per process. Each request used to
+# pay a prefix lookup, a hash verify per candidate (bcrypt — deliberately slow
+# — for legacy keys) and three SELECTs on the owner, all for a key that had
+# just been verified. A hit instead costs one HMAC and one single-row read of
+# ``auth_generation``.
+#
+# - Keyed by an HMAC of the presented key under a per-process random secret,
+#   so the cache never holds a key or an offline-guessable unsalted hash of one.
+# - Only successes are cached: a wrong key always takes the full path.
+# - Entries live at most _API_KEY_CACHE_TTL_SECONDS and never past the key's
+#   own expires_at. Revocation, owner deactivation/demotion and scope changes
+#   bump ``auth_generation`` (platform_store triggers), which every worker
+#   checks per request, so they take effect on the next request everywhere.
+# - A database without the counter (older schema) is never cached.
+_API_KEY_CACHE_TTL_SECONDS = 60.0
+_API_KEY_CACHE_MAX_ENTRIES = 4096
+
+_api_key_cache_secret = secrets.token_bytes(32)
+# (db identity, auth_required, HMAC) -> (generation, deadline, principal)
+_api_key_cache: "OrderedDict[Tuple[Any, ...], Tuple[int, float, Dict[str, Any]]]" = (
+    OrderedDict()
+)
+_api_key_cache_lock = threading.Lock()
+
+
+def _auth_generation(db: Any) -> Optional[int]:
+    """The control-plane auth generation, or ``None`` if it cannot be read."""
+    try:
+        row = db.conn.execute("SELECT value FROM auth_generation WHERE id = 1").fetchone()
+    except (sqlite3.Error, AttributeError):
+        return None
+    return int(row[0]) if row is not None else None
+
+
+def _api_key_cache_key(db: Any, api_key: str) -> Tuple[Any, ...]:
+    digest = hmac.new(_api_key_cache_secret, api_key.encode(), hashlib.sha256).digest()
+    # The login-capability check depends on the auth mode, so a verification
+    # made with auth off must not be served once it is switched on.
+    return (id(db), str(getattr(db, "db_path", "")), auth_required(), digest)
+
+
+def _cached_principal(cache_key: Tuple[Any, ...], generation: int) -> Optional[Dict[str, Any]]:
+    with _api_key_cache_lock:
+        entry = _api_key_cache.get(cache_key)
+        if entry is None:
+            return None
+        cached_generation, deadline, principal = entry
+        if cached_generation != generation or time.monotonic() >= deadline:
+            del _api_key_cache[cache_key]
+            return None
+        _api_key_cache.move_to_end(cache_key)
+    return {**principal, "scopes": list(principal["scopes"])}
+
+
+def _cache_principal(
+    cache_key: Tuple[Any, ...],
+    generation: int,
+    principal: Dict[str, Any],
+    expires_at: Optional[str],
+) -> None:
+    ttl = _API_KEY_CACHE_TTL_SECONDS
+    if expires_at:
+        try:
+            expiry = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+            if expiry.tzinfo is None:
+                expiry = expiry.replace(tzinfo=timezone.utc)
+        except ValueError:
+            return
+        ttl = min(ttl, (expiry - datetime.now(timezone.utc)).total_seconds())
+    if ttl <= 0:
+        return
+    with _api_key_cache_lock:
+        _api_key_cache[cache_key] = (
+            generation,
+            time.monotonic() + ttl,
+            {**principal, "scopes": list(principal["scopes"])},
+        )
+        _api_key_cache.move_to_end(cache_key)
+        while len(_api_key_cache) > _API_KEY_CACHE_MAX_ENTRIES:
+            _api_key_cache.popitem(last=False)
+
+
+def clear_api_key_cache() -> None:
+    """Drop every cached API-key verification in this process."""
+    with _api_key_cache_lock:
+        _api_key_cache.clear()
+
+
+def _record_last_used(db: Any, key_id: str) -> None:
+    """Refresh ``last_used_at`` at most once per key per window (#902)."""
+    if _should_record_last_used(key_id):
+        try:
+            db.api_keys.update_last_used(key_id)
+        except Exception as e:
+            logger.warning(f"Failed to update last_used_at: {e}")
+            _release_last_used_claim(key_id)
+
+
 async def get_api_key_auth(
     api_key: Optional[str] = Security(api_key_header),
     request: Request = None,
@@ -641,6 +745,17 @@ def _resolve_api_key(api_key: str, request: Optional[Request]) -> Optional[Dict[
             logger.warning("API key auth failed: invalid key format")
             return None
 
+        # Read BEFORE verifying: a change committed while we verify bumps the
+        # counter past this value, so the entry stored below is already stale.
+        generation = _auth_generation(db) if _API_KEY_CACHE_TTL_SECONDS > 0 else None
+        cache_key = None
+        if generation is not None:
+            cache_key = _api_key_cache_key(db, api_key)
+            principal = _cached_principal(cache_key, generation)
+            if principal is not None:
+                _record_last_used(db, principal["key_id"])
+                return principal
+
         # Every live key sharing this prefix, not one arbitrary row: the prefix
         # carries only 4 random hex characters and its index is not UNIQUE, so a
         # collision used to leave one of the two keys permanently dead (#919).
@@ -682,19 +797,17 @@ def _resolve_api_key(api_key: str, request: Optional[Request]) -> Optional[Dict[
         # Refresh last_used_at at most once per key per window (#902) — this is
         # an UPDATE+COMMIT, and doing it on every request made each
         # authenticated call a database writer.
-        if _should_record_last_used(key_record["id"]):
-            try:
-                db.api_keys.update_last_used(key_record["id"])
-            except Exception as e:
-                logger.warning(f"Failed to update last_used_at: {e}")
-                _release_last_used_claim(key_record["id"])
+        _record_last_used(db, key_record["id"])
 
-        return {
+        principal = {
             "type": "api_key",
             "user_id": key_record["user_id"],
             "scopes": _scopes_within_owner_grant(db, key_record),
             "key_id": key_record["id"],
         }
+        if cache_key is not None:
+            _cache_principal(cache_key, generation, principal, key_record.get("expires_at"))
+        return principal
 
     except HTTPException:
         raise
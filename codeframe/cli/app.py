@@ -866,6 +866,11 @@ def review(
         "-w",
         help="Workspace path (defaults to current directory)",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Run every gate even if a cached result matches the current tree",
+    ),
 ) -> None:
     """Run verification gates (tests, lint).
 
@@ -878,6 +883,7 @@ def review(
         codeframe review
         codeframe review --verbose
         codeframe review --gate pytest --gate ruff
+        codeframe review --no-cache
     """
     from codeframe.core.workspace import get_workspace
     from codeframe.core import gates
@@ -890,7 +896,12 @@ def review(
 
         console.print("\n[bold]Running verification gates...[/bold]\n")
 
-        result = gates.run(workspace, gates=gates_to_run, verbose=verbose)
+        result = gates.run(
+            workspace,
+            gates=gates_to_run,
+            verbose=verbose,
+            use_cache=False if no_cache else None,
+        )
 
         # Display results
         for check in result.checks:
@@ -904,7 +915,8 @@ def review(
                 status_str = "[yellow]ERROR[/yellow]"
 
             duration_str = f" ({check.duration_ms}ms)" if check.duration_ms else ""
-            console.print(f"  {escape(check.name)}: {status_str}{duration_str}")
+            cached_str = " [dim](cached)[/dim]" if check.cached else ""
+            console.print(f"  {escape(check.name)}: {status_str}{duration_str}{cached_str}")
 
             # Show output for failures or verbose mode
             if check.output and (check.status == GateStatus.FAILED or verbose):
@@ -2024,6 +2036,12 @@ def prd_stress_test(
         "--interactive", "-i",
         help="Resolve ambiguities inline and update PRD",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ask the LLM about every goal again instead of reusing answers "
+        "for PRD sections that have not changed",
+    ),
     llm_provider: Optional[str] = typer.Option(
         None,
         "--llm-provider",
@@ -2047,6 +2065,10 @@ def prd_stress_test(
 
     Use --interactive to resolve ambiguities inline and update the PRD.
 
+    Answers are cached in the workspace, so a re-run after editing the PRD
+    only calls the LLM for goals whose sections changed. Use --no-cache to
+    analyse everything from scratch.
+
     Requires the API key matching the resolved LLM provider
     (e.g. ANTHROPIC_API_KEY for the default anthropic provider).
 
@@ -2062,6 +2084,7 @@ def prd_stress_test(
     from codeframe.core.llm_resolution import resolve_llm_settings, create_provider
     from codeframe.cli.validators import require_api_key_for_provider
     from codeframe.core.prd_stress_test import (
+        DecompositionCache,
         StressTestError,
         stress_test_prd,
         resolve_ambiguities_into_prd,
@@ -2097,10 +2120,14 @@ def prd_stress_test(
     require_api_key_for_provider(settings.provider_type)
     provider = create_provider(settings)
 
+    cache = None if no_cache else DecompositionCache(workspace)
+
     # Run stress test
     console.print(f"[dim]Recursively decomposing (max depth: {max_depth})...[/dim]")
     try:
-        result = stress_test_prd(record.content, provider, max_depth=max_depth)
+        result = stress_test_prd(
+            record.content, provider, max_depth=max_depth, cache=cache
+        )
     except StressTestError as e:
         # extract_goals now raises rather than returning [] (#927). Without this
         # the CLI shows a traceback where every other failure here is a red line.
@@ -2120,6 +2147,12 @@ def prd_stress_test(
         )
         raise typer.Exit(1)
 
+    if result.cache_hits:
+        console.print(
+            f"[dim]Reused {result.cache_hits} cached answer(s) for unchanged "
+            f"goals (--no-cache to re-ask).[/dim]"
+        )
+
     # Show ambiguity report
     if result.ambiguities:
         console.print(f"\n[bold yellow]⚠ {len(result.ambiguities)} ambiguities found[/bold yellow]\n")
@@ -2190,7 +2223,9 @@ def prd_stress_test(
             # Re-run stress test on updated PRD to reflect resolved ambiguities
             console.print("[dim]Re-analyzing updated PRD...[/dim]")
             try:
-                result = stress_test_prd(new_record.content, provider, max_depth=max_depth)
+                result = stress_test_prd(
+                    new_record.content, provider, max_depth=max_depth, cache=cache
+                )
             except StressTestError as e:
                 console.print(f"[red]Error:[/red] {e}")
                 raise typer.Exit(1)
@@ -2263,6 +2298,13 @@ def tasks_generate(
         min=1,
         max=5,
     ),
+    concurrency: Optional[int] = typer.Option(
+        None,
+        "--concurrency",
+        help="LLM calls in flight during --recursive decomposition "
+        "(default: $CODEFRAME_TASK_TREE_CONCURRENCY or 4)",
+        min=1,
+    ),
     llm_provider: Optional[str] = typer.Option(
         None,
         "--llm-provider",
@@ -2344,6 +2386,7 @@ def tasks_generate(
                     lineage=[],
                     depth=0,
                     max_depth=max_depth,
+                    max_concurrency=concurrency,
                 )
                 created = flatten_task_tree(tree, workspace, prd_id=prd_record.id)
             elif no_llm:
@@ -4406,6 +4449,12 @@ def batch_run(
         "--llm-model",
         help="Model name for the chosen provider (e.g. gpt-4o, qwen2.5-coder:7b)",
     ),
+    warm_workers: Optional[bool] = typer.Option(
+        None,
+        "--warm-workers/--no-warm-workers",
+        help="Run tasks on warm worker processes that import CodeFRAME once "
+        "(POSIX only; default: $CODEFRAME_BATCH_WARM_WORKERS)",
+    ),
 ) -> None:
     """Execute multiple tasks in batch.
 
@@ -4421,6 +4470,7 @@ def batch_run(
         codeframe work batch run --all-ready --engine plan
         codeframe work batch run task1 task2 --dry-run
         codeframe work batch run task1 task2 --retry 2
+        codeframe work batch run --all-ready --warm-workers
     """
     from codeframe.core.workspace import get_workspace
     from codeframe.core import tasks as tasks_module, conductor
@@ -4573,6 +4623,7 @@ def batch_run(
             cloud_timeout_minutes=cloud_timeout,
             llm_provider=llm_provider,
             llm_model=llm_model,
+            warm_workers=warm_workers,
         )
 
         # Show summary
@@ -6015,9 +6066,14 @@ def gates_run(
         "-w",
         help="Workspace path (defaults to current directory)",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Run every gate even if a cached result matches the current tree",
+    ),
 ) -> None:
     """Run verification gates (tests, lint). Alias for `cf review`."""
-    review(gates_to_run, verbose, workspace_path)
+    review(gates_to_run, verbose, workspace_path, no_cache)
 
 
 # =============================================================================
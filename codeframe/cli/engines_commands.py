@@ -4,6 +4,7 @@ Usage:
     codeframe engines list           # Show available engines
     codeframe engines check <name>   # Check engine requirements
     codeframe engines stats          # Show engine performance stats
+    codeframe engines stats --days 7 # ... over the last 7 days
     codeframe engines compare        # Compare engine performance
 """
 
@@ -201,10 +202,16 @@ def _build_stats_table(stats: dict[str, dict[str, float]], title: str = "Engine
 def stats(
     engine: Optional[str] = typer.Option(None, "--engine", "-e", help="Filter by engine name"),
     output_format: str = typer.Option("text", "--format", "-f", help="Output format: text or json"),
+    days: Optional[int] = typer.Option(
+        None, "--days", "-d", min=1, help="Only the last N days (e.g. 7 or 30)"
+    ),
 ) -> None:
     """Show engine performance statistics."""
     workspace = _get_current_workspace()
-    data = engine_stats.get_engine_stats(workspace, engine=engine)
+    if days is None:
+        data = engine_stats.get_engine_stats(workspace, engine=engine)
+    else:
+        data = engine_stats.get_engine_stats_window(workspace, days, engine=engine)
 
     if not data:
         console.print("[yellow]No engine stats recorded yet.[/yellow]")
@@ -214,7 +221,8 @@ def stats(
         console.print(_json.dumps(data, indent=2))
         return
 
-    table = _build_stats_table(data, title="Engine Performance Stats")
+    title = "Engine Performance Stats" + (f" (last {days} days)" if days else "")
+    table = _build_stats_table(data, title=title)
     console.print(table)
 
 
@@ -226,7 +226,9 @@ def doctor(
 
         worktree_root = project_path / WORKTREE_DIR
         leftovers = (
-            sorted(p.name for p in worktree_root.iterdir() if p.is_dir())
+            # Dot-prefixed entries are the worktree pool, not task leftovers.
+            sorted(p.name for p in worktree_root.iterdir()
+                   if p.is_dir() and not p.name.startswith("."))
             if worktree_root.is_dir()
             else []
         )
@@ -4,6 +4,7 @@ Provides `cf proof` subcommands for capturing requirements,
 running obligations, managing waivers, and viewing status.
 """
 
+from contextlib import nullcontext
 from datetime import date
 from pathlib import Path
 from typing import Optional
@@ -143,6 +144,11 @@ def run(
             "a run that verified nothing is not a pass (#1118)."
         ),
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Re-run every gate even if a cached result matches the current tree",
+    ),
 ) -> None:
     """Run proof obligations for current changes.
 
@@ -158,9 +164,11 @@ def run(
         codeframe proof run
         codeframe proof run --full
         codeframe proof run --gate unit
+        codeframe proof run --no-cache
     """
     from codeframe.core.workspace import get_workspace
     from codeframe.core.proof.models import PROOF_CONFIG_FILENAME, Gate, GateOutcome
+    from codeframe.core import gate_cache
     from codeframe.core.proof.runner import EmptyReason, run_proof_with_diagnostics
 
     workspace_path = repo_path or Path.cwd()
@@ -182,9 +190,10 @@ def run(
     mode = "full" if full else "scope-filtered"
     console.print(f"[dim]Running proof obligations ({mode})...[/dim]")
 
-    results, diagnostics = run_proof_with_diagnostics(
-        workspace, full=full, gate_filter=gate_filter
-    )
+    with gate_cache.bypassed() if no_cache else nullcontext():
+        results, diagnostics = run_proof_with_diagnostics(
+            workspace, full=full, gate_filter=gate_filter
+        )
 
     if not results:
         # The runner now reports WHY (#1138). Before that, this block inferred
@@ -6,6 +6,7 @@ directly from the local workspace database (no server required):
 - tokens: View workspace token usage summary
 - costs: View cost report with optional period filtering
 - export: Export usage data to CSV or JSON
+- rebuild: Recompute engine statistics from the run log
 
 Usage:
     cf stats tokens                    # Workspace token summary
@@ -13,6 +14,7 @@ Usage:
     cf stats costs                     # All-time costs
     cf stats costs --period month      # Last 30 days
     cf stats export --format csv --output tokens.csv
+    cf stats rebuild                   # Recompute engine stats
 """
 
 import logging
@@ -305,3 +307,28 @@ def export_data(
         console.print(f"Exported {n} records to {output}")
     finally:
         db.close()
+
+
+@stats_app.command()
+def rebuild():
+    """Recompute engine statistics from the run log.
+
+    Engine stats are running sums kept up to date as each run is recorded.
+    This recomputes them from every logged run — the fix if they have drifted,
+    for example after runs were recorded by an older CodeFRAME.
+
+    Examples:
+        cf stats rebuild
+    """
+    from codeframe.core import engine_stats
+    from codeframe.core.workspace import find_workspace_root, get_workspace
+
+    # Walk up like _get_db (#777): run from a subdirectory, find the workspace.
+    root = find_workspace_root(Path.cwd())
+    if root is None:
+        console.print("[red]Error:[/red] No workspace found. Run 'cf init' first.")
+        raise typer.Exit(1)
+    workspace = get_workspace(root)
+
+    runs = engine_stats.rebuild_stats(workspace)
+    console.print(f"Rebuilt engine stats from {runs} recorded run(s).")
@@ -10,19 +10,26 @@ Environment Variables (via GlobalConfig):
     RATE_LIMIT_STANDARD: Rate limit for standard API endpoints (default: 100/minute)
     RATE_LIMIT_AI: Rate limit for AI/expensive operations (default: 20/minute)
     RATE_LIMIT_WEBSOCKET: Rate limit for WebSocket connections (default: 30/minute)
-    RATE_LIMIT_STORAGE: Storage backend - memory or redis (default: memory)
+    RATE_LIMIT_STORAGE: Storage backend - memory, sqlite or redis (default: memory)
     RATE_LIMIT_TRUSTED_PROXIES: Comma-separated trusted proxy IPs/CIDRs
     REDIS_URL: Redis connection URL for distributed rate limiting (optional)
+
+The sqlite backend keeps its counters in ``rate_limits.db`` next to the
+platform database (``DATABASE_PATH``), shared by every worker on the host.
 """
 
 import ipaddress
 import logging
 from dataclasses import dataclass, field
 from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+#: File name of the sqlite backend's counter table, in the state directory.
+RATE_LIMIT_DB_NAME = "rate_limits.db"
+
 
 @dataclass
 class RateLimitConfig:
@@ -34,7 +41,8 @@ class RateLimitConfig:
         ai_limit: Rate limit for AI/expensive operations
         websocket_limit: Rate limit for WebSocket connections
         enabled: Whether rate limiting is enabled
-        storage: Storage backend ('memory' or 'redis')
+        storage: Storage backend ('memory', 'sqlite' or 'redis')
+        storage_path: Counter file for the 'sqlite' backend
         redis_url: Redis connection URL for distributed rate limiting
         trusted_proxies: List of trusted proxy IP addresses/networks
     """
@@ -45,6 +53,7 @@ class RateLimitConfig:
     websocket_limit: str = "30/minute"
     enabled: bool = True
     storage: str = "memory"
+    storage_path: Optional[str] = None
     redis_url: Optional[str] = None
     trusted_proxies: list = field(default_factory=list)
 
@@ -109,10 +118,10 @@ class RateLimitConfig:
             ]
 
         # Validate storage type (already validated by Pydantic, but double-check)
-        if storage not in ("memory", "redis"):
+        if storage not in ("memory", "sqlite", "redis"):
             logger.warning(
                 f"Invalid RATE_LIMIT_STORAGE: {storage}. "
-                f"Must be 'memory' or 'redis'. Defaulting to 'memory'."
+                f"Must be 'memory', 'sqlite' or 'redis'. Defaulting to 'memory'."
             )
             storage = "memory"
 
@@ -131,6 +140,7 @@ class RateLimitConfig:
             websocket_limit=global_config.rate_limit_websocket,
             enabled=enabled,
             storage=storage,
+            storage_path=str(Path(global_config.database_path).parent / RATE_LIMIT_DB_NAME),
             redis_url=redis_url,
             trusted_proxies=trusted_proxies,
         )
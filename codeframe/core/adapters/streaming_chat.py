@@ -10,12 +10,24 @@ Supports:
 - Interrupt via asyncio.Event
 - Message persistence to session_messages after each complete turn
 - Context-window management via tiktoken token counting
+
+Token counts are computed once per message and stored on its
+``session_messages`` row. Each session's replay window — the newest
+``_MAX_REPLAY_MESSAGES`` rows with their counts — is kept in memory between
+turns and topped up with only the rows written since, so starting a turn
+neither re-reads nor re-encodes the history.
 """
 
 from __future__ import annotations
 
 import asyncio
+import bisect
+import functools
+import itertools
 import logging
+import sqlite3
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -48,6 +60,9 @@ _MAX_HISTORY_TOKENS = 180_000
 # trims further by token budget; this only bounds the query.
 _MAX_REPLAY_MESSAGES = 100
 
+# How many sessions' replay windows to keep in memory per repository.
+_MAX_CACHED_WINDOWS = 256
+
 _REPLAY_ROLE_MAP = {
     "user": "user",
     "assistant": "assistant",
@@ -189,6 +204,83 @@ def build_tool_continuation(
     ]
 
 
+# ---------------------------------------------------------------------------
+# History window
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding():
+    """The tiktoken encoding used for budget counts, or ``None`` without it.
+
+    Resolved once per process: ``get_encoding`` may download its BPE file,
+    and a failed attempt (offline CI) must not be retried for every message.
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def _count_tokens(text: Optional[str]) -> int:
+    """Token cost of one message's content.
+
+    Uses tiktoken; falls back to a character-based estimate (4 chars ≈ 1
+    token) when it is unavailable. Special-token text is counted as plain text
+    rather than rejected — a user may paste ``<|endoftext|>``.
+    """
+    enc = _encoding()
+    if enc is None:
+        return len(text or "") // 4
+    return len(enc.encode(text or "", disallowed_special=()))
+
+
+class _HistoryWindow:
+    """The newest persisted rows of one session, with their token counts.
+
+    Spans the same rows as ``get_recent_messages(limit=_MAX_REPLAY_MESSAGES)``.
+    Entries are ``(seq, message, tokens)`` in insertion order, where
+    ``message`` is ``None`` for display-only roles so they still occupy their
+    slot. ``synced`` is the highest ``seq`` read back from the database; the
+    next turn asks only for rows after it.
+    """
+
+    def __init__(self) -> None:
+        self.entries: list[tuple[int, Optional[dict], int]] = []
+        self.synced = 0
+
+    def add(self, seq: int, role: str, content: str, tokens: int) -> None:
+        """Insert one row, ignoring a ``seq`` already in the window."""
+        i = bisect.bisect_left(self.entries, seq, key=lambda e: e[0])
+        if i < len(self.entries) and self.entries[i][0] == seq:
+            return
+        replay_role = _REPLAY_ROLE_MAP.get(role)
+        message = {"role": replay_role, "content": content} if replay_role else None
+        self.entries.insert(i, (seq, message, tokens))
+        del self.entries[:-_MAX_REPLAY_MESSAGES]
+
+    def replay(self) -> tuple[list[dict], list[int]]:
+        """The replayable messages and their token counts, oldest first."""
+        kept = [(m, t) for _, m, t in self.entries if m is not None]
+        return [dict(m) for m, _ in kept], [t for _, t in kept]
+
+
+#: repository -> {session_id: _HistoryWindow}, least recently used first.
+#: Keyed weakly so a closed ``Database`` takes its windows with it.
+_windows: "weakref.WeakKeyDictionary[object, OrderedDict[str, _HistoryWindow]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _cached_windows(db_repo) -> Optional["OrderedDict[str, _HistoryWindow]"]:
+    try:
+        return _windows.setdefault(db_repo, OrderedDict())
+    except TypeError:  # not weak-referenceable
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Adapter
 # ---------------------------------------------------------------------------
@@ -198,8 +290,8 @@ class StreamingChatAdapter:
     """Async streaming adapter over any :class:`LLMProvider` with ``async_stream()``.
 
     Each call to :meth:`send_message` is a single conversational turn.
-    History is loaded from the DB at call time and persisted after the turn
-    completes.
+    History is loaded from the DB at call time (through the session's cached
+    replay window) and persisted after the turn completes.
 
     Only read-only tools (read_file, list_files, search_codebase) are exposed
     to the model. Write operations and shell execution are intentionally
@@ -267,6 +359,62 @@ class StreamingChatAdapter:
     # History helpers
     # ------------------------------------------------------------------
 
+    def _load_window(self) -> _HistoryWindow:
+        """Bring this session's replay window up to date and return it.
+
+        The first turn reads the newest ``_MAX_REPLAY_MESSAGES`` rows; later
+        turns reuse the in-memory window and fetch only rows written since —
+        by this adapter, the REST API or another worker. Rows stored without a
+        token count (older rows, REST-added ones) are counted here and the
+        counts written back, so each message is encoded once.
+        """
+        windows = _cached_windows(self._db_repo)
+        window = windows.get(self._session_id) if windows is not None else None
+        rows = None
+        if window is not None:
+            rows = self._db_repo.get_messages_after(
+                self._session_id, window.synced, limit=_MAX_REPLAY_MESSAGES
+            )
+            if len(rows) >= _MAX_REPLAY_MESSAGES:
+                # Too far behind to patch up; start over from the newest rows.
+                window = rows = None
+        if window is None:
+            # The NEWEST window, not the oldest: get_messages() orders ascending
+            # and defaults to LIMIT 100, so past 100 messages this replayed the
+            # opening of the conversation every turn and never the current one
+            # (#929).
+            rows = self._db_repo.get_recent_messages(
+                self._session_id, limit=_MAX_REPLAY_MESSAGES
+            )
+            window = _HistoryWindow()
+
+        counted: dict[str, int] = {}
+        for i, r in enumerate(rows):
+            tokens = r.get("token_count")
+            if tokens is None:
+                tokens = _count_tokens(r["content"])
+                if r.get("id"):
+                    counted[r["id"]] = tokens
+            seq = r.get("seq")
+            window.add(seq if seq is not None else i, r["role"], r["content"], tokens)
+            if seq is not None:
+                window.synced = max(window.synced, seq)
+        if counted:
+            try:
+                self._db_repo.set_token_counts(counted)
+            except sqlite3.Error as exc:
+                # Best effort: the counts are recomputed on the next cold load.
+                logger.warning("Could not store message token counts: %s", exc)
+
+        # Rows without a seq (a repository that does not report one) cannot
+        # be synced incrementally, so such a window is rebuilt every turn.
+        if windows is not None and all(r.get("seq") is not None for r in rows):
+            windows[self._session_id] = window
+            windows.move_to_end(self._session_id)
+            while len(windows) > _MAX_CACHED_WINDOWS:
+                windows.popitem(last=False)
+        return window
+
     def _load_history(self) -> list[dict]:
         """Load conversation history from the DB for this session.
 
@@ -281,88 +429,90 @@ class StreamingChatAdapter:
             List of ``{"role": "user"|"assistant", "content": str}`` dicts in
             chronological order.
         """
-        # The NEWEST window, not the oldest: get_messages() orders ascending and
-        # defaults to LIMIT 100, so past 100 messages this replayed the opening
-        # of the conversation every turn and never the current one (#929).
-        rows = self._db_repo.get_recent_messages(self._session_id, limit=_MAX_REPLAY_MESSAGES)
-        history: list[dict] = []
-        for r in rows:
-            role = _REPLAY_ROLE_MAP.get(r["role"])
-            if role is None:
-                continue  # drop system/error and any unknown display-only role
-            history.append({"role": role, "content": r["content"]})
-        return history
-
-    def _truncate_history(self, messages: list[dict]) -> list[dict]:
+        return self._load_window().replay()[0]
+
+    def _truncate_history(
+        self, messages: list[dict], token_counts: Optional[list[int]] = None
+    ) -> list[dict]:
         """Drop oldest messages when the history exceeds the token budget.
 
-        Uses tiktoken for counting. If tiktoken is unavailable (e.g., in CI),
-        falls back to a character-based estimate (4 chars ≈ 1 token).
+        Messages are dropped in pairs from the front. The cut point is found
+        by bisecting a prefix sum of the per-message counts, rather than
+        re-counting the remaining list after every drop.
 
         Args:
             messages: Full message list (oldest first).
+            token_counts: Token count per message, parallel to ``messages``.
+                Counted with :func:`_count_tokens` when omitted.
 
         Returns:
             Trimmed message list that fits within ``_MAX_HISTORY_TOKENS``.
         """
-        try:
-            import tiktoken
-            enc = tiktoken.get_encoding("cl100k_base")
-
-            def _count(msgs: list[dict]) -> int:
-                return sum(
-                    len(enc.encode(m.get("content") or ""))
-                    for m in msgs
-                )
-        except Exception:
-            def _count(msgs: list[dict]) -> int:
-                return sum(len(m.get("content") or "") // 4 for m in msgs)
-
-        while messages and _count(messages) > _MAX_HISTORY_TOKENS:
-            # Drop in pairs so we don't strand an assistant message at index 0
-            trimmed = messages[2:] if len(messages) >= 2 else messages[1:]
-            if not trimmed:
-                # A single turn that busts the budget on its own would otherwise
-                # trim the history to nothing, and the caller sends this list
-                # straight to the provider — an empty `messages` is an API error,
-                # so the request fails instead of the history being shortened.
-                # Keep the last turn and let the provider's own limit judge it.
-                # (#955)
-                break
-            messages = trimmed
+        if not messages:
+            return messages
+        if token_counts is None:
+            token_counts = [_count_tokens(m.get("content")) for m in messages]
+
+        prefix = [0, *itertools.accumulate(token_counts)]
+        # First index whose suffix fits the budget, rounded up so we drop in
+        # pairs and don't strand an assistant message at index 0.
+        start = bisect.bisect_left(prefix, prefix[-1] - _MAX_HISTORY_TOKENS)
+        start += start % 2
+        # A single turn that busts the budget on its own would otherwise trim
+        # the history to nothing, and the caller sends this list straight to
+        # the provider — an empty `messages` is an API error, so the request
+        # fails instead of the history being shortened. Keep the last turn and
+        # let the provider's own limit judge it. (#955)
+        last = len(messages) - 1
+        start = min(start, last - last % 2)
 
         # First message must have role "user". An empty result here means the
         # history holds no user turn at all — unusable, and the caller's own
         # guard, not something truncation invented.
-        while messages and messages[0].get("role") != "user":
-            messages = messages[1:]
+        while start < len(messages) and messages[start].get("role") != "user":
+            start += 1
 
-        return messages
+        return messages[start:]
 
     # ------------------------------------------------------------------
     # Persistence
     # ------------------------------------------------------------------
 
-    async def _persist_turn(self, user_content: str, assistant_content: str) -> None:
+    async def _persist_turn(
+        self,
+        user_content: str,
+        assistant_content: str,
+        user_tokens: Optional[int] = None,
+    ) -> None:
         """Persist user message and assistant response to session_messages.
 
+        Each row is stored with its token count and appended to the session's
+        in-memory replay window, if one is cached.
+
         Args:
             user_content: The user's message text.
             assistant_content: The complete assistant response accumulated
                 across all TEXT_DELTA events in this turn.
+            user_tokens: Token count of ``user_content``, if already counted.
         """
-        await asyncio.to_thread(
-            self._db_repo.add_message,
-            session_id=self._session_id,
-            role="user",
-            content=user_content,
-        )
-        await asyncio.to_thread(
-            self._db_repo.add_message,
-            session_id=self._session_id,
-            role="assistant",
-            content=assistant_content,
-        )
+        if user_tokens is None:
+            user_tokens = _count_tokens(user_content)
+        windows = _cached_windows(self._db_repo)
+        for role, content, tokens in (
+            ("user", user_content, user_tokens),
+            ("assistant", assistant_content, _count_tokens(assistant_content)),
+        ):
+            row = await asyncio.to_thread(
+                self._db_repo.add_message,
+                session_id=self._session_id,
+                role=role,
+                content=content,
+                token_count=tokens,
+            )
+            window = windows.get(self._session_id) if windows is not None else None
+            seq = row.get("seq") if isinstance(row, dict) else None
+            if window is not None and seq is not None:
+                window.add(seq, role, content, tokens)
 
     # ------------------------------------------------------------------
     # Tool execution
@@ -421,12 +571,16 @@ class StreamingChatAdapter:
             ``ChatEvent`` with types from ``ChatEventType``.
         """
         # Load history from DB if caller didn't supply it
+        token_counts: Optional[list[int]] = None
         if not history:
-            history = self._load_history()
+            history, token_counts = self._load_window().replay()
 
         # Build the message list for this turn
+        user_tokens = _count_tokens(content)
         messages: list[dict] = list(history) + [{"role": "user", "content": content}]
-        messages = self._truncate_history(messages)
+        if token_counts is not None:
+            token_counts = token_counts + [user_tokens]
+        messages = self._truncate_history(messages, token_counts)
 
         accumulated_text = ""
 
@@ -446,7 +600,7 @@ class StreamingChatAdapter:
 
         # Persist the turn (errors are logged, not raised)
         try:
-            await self._persist_turn(content, accumulated_text)
+            await self._persist_turn(content, accumulated_text, user_tokens)
         except Exception as exc:
             logger.error("StreamingChatAdapter persistence error: %s", exc)
 
@@ -524,6 +678,8 @@ class StreamingChatAdapter:
                             chunk.input_tokens or 0,
                             chunk.output_tokens or 0,
                             self._model,
+                            cache_creation_tokens=chunk.cache_creation_input_tokens or 0,
+                            cache_read_tokens=chunk.cache_read_input_tokens or 0,
                         ),
                     )
 
@@ -569,12 +725,21 @@ class StreamingChatAdapter:
 # ---------------------------------------------------------------------------
 
 
-def _estimate_cost(input_tokens: int, output_tokens: int, model: str) -> float:
+def _estimate_cost(
+    input_tokens: int,
+    output_tokens: int,
+    model: str,
+    cache_creation_tokens: int = 0,
+    cache_read_tokens: int = 0,
+) -> float:
     """Rough cost estimate in USD.
 
     Uses approximate pricing for claude-sonnet-4-5. Returns 0.0 for unknown models
-    rather than raising — cost tracking is best-effort.
+    rather than raising — cost tracking is best-effort. Prompt-cache writes and
+    reads are priced at the same multiples of the input rate MetricsTracker uses.
     """
+    from codeframe.lib.metrics_tracker import CACHE_READ_MULTIPLIER, CACHE_WRITE_MULTIPLIER
+
     # Per-million-token pricing (input, output) in USD.
     # Last verified: 2026-06-21. Anthropic pricing changes without notice —
     # treat these as best-effort estimates, not billing-accurate figures.
@@ -587,5 +752,9 @@ def _estimate_cost(input_tokens: int, output_tokens: int, model: str) -> float:
     # Match by prefix to handle minor model variant suffixes
     for prefix, (in_price, out_price) in _PRICING.items():
         if model.startswith(prefix):
-            return (input_tokens * in_price + output_tokens * out_price) / 1_000_000
+            cached = (
+                cache_creation_tokens * CACHE_WRITE_MULTIPLIER
+                + cache_read_tokens * CACHE_READ_MULTIPLIER
+            ) * in_price
+            return (input_tokens * in_price + output_tokens * out_price + cached) / 1_000_000
     return 0.0
@@ -267,8 +267,10 @@ def _build_snapshot(workspace: Workspace, include_git_ref: bool = True) -> dict:
         "created_at": _utc_now().isoformat(),
     }
 
-    # Capture tasks
-    all_tasks = tasks.list_tasks(workspace, limit=1000)
+    # Capture tasks. Streamed in pages without descriptions: the snapshot only
+    # keeps the fields below, and a fixed limit silently dropped every task
+    # past the 1000th.
+    all_tasks = tasks.iter_tasks(workspace, include_description=False)
     snapshot["tasks"] = [
         {
             "id": t.id,
@@ -310,7 +312,7 @@ def _build_snapshot(workspace: Workspace, include_git_ref: bool = True) -> dict:
     # Task counts summary
     counts = tasks.count_by_status(workspace)
     snapshot["summary"] = {
-        "total_tasks": len(all_tasks),
+        "total_tasks": len(snapshot["tasks"]),
         "tasks_by_status": counts,
         "open_blockers": sum(1 for b in all_blockers if b.status.value == "OPEN"),
     }
@@ -23,6 +23,8 @@ from typing import TYPE_CHECKING, Callable, Optional
 
 if TYPE_CHECKING:
     from codeframe.core.config_watcher import ConfigReloadState
+    from codeframe.core.task_worker import TaskWorkerPool
+    from codeframe.core.worktrees import WorktreePool
 
 from codeframe.core.workspace import Workspace, get_db_connection
 from codeframe.core import events, tasks, blockers
@@ -94,12 +96,16 @@ SUPERVISOR_TACTICAL_PATTERNS = [
 _decision_cache: dict[str, str] = {}
 
 # Track running subprocesses for force stop capability
-# Structure: {batch_id: {task_id: Popen}}
+# Structure: {batch_id: {task_id: Popen}} — or a PooledTaskProcess, which has
+# the same wait/poll/terminate surface, when the batch runs on warm workers.
 _active_processes: dict[str, dict[str, subprocess.Popen]] = {}
 # Lock for thread-safe access to _active_processes
 _active_processes_lock = threading.Lock()
 # Lock for thread-safe batch database writes
 _batch_db_lock = threading.Lock()
+# Warm worker pools of batches executing in this process: {batch_id: pool}
+_worker_pools: dict[str, "TaskWorkerPool"] = {}
+_worker_pools_lock = threading.Lock()
 
 
 class SupervisorResolver:
@@ -730,6 +736,7 @@ def start_batch(
     cloud_timeout_minutes: int = 30,
     llm_provider: Optional[str] = None,
     llm_model: Optional[str] = None,
+    warm_workers: Optional[bool] = None,
 ) -> BatchRun:
     """Create a batch and run it to completion. **Blocks.**
 
@@ -765,7 +772,10 @@ def start_batch(
     )
     if dry_run:
         return batch
-    return execute_batch(workspace, batch, max_retries=max_retries, on_event=on_event)
+    return execute_batch(
+        workspace, batch, max_retries=max_retries, on_event=on_event,
+        warm_workers=warm_workers,
+    )
 
 
 def execute_batch(
@@ -773,6 +783,7 @@ def execute_batch(
     batch: BatchRun,
     max_retries: int = 0,
     on_event: Optional[Callable[[str, dict], None]] = None,
+    warm_workers: Optional[bool] = None,
 ) -> BatchRun:
     """Run an already-created batch to completion. **Blocks.**
 
@@ -789,10 +800,79 @@ def execute_batch(
         batch: A batch already persisted by ``create_batch``
         max_retries: Max retry attempts for failed tasks (0 = no retries)
         on_event: Optional callback for batch events
+        warm_workers: Run tasks on a pool of warm workers (see
+            ``codeframe.core.task_worker``) instead of a fresh interpreter
+            each. None reads CODEFRAME_BATCH_WARM_WORKERS.
 
     Returns:
         The same BatchRun, with results populated.
     """
+    pool = _start_worker_pool(batch, warm_workers)
+    worktree_pool = _prewarm_worktrees(workspace, batch)
+    try:
+        return _execute_batch(workspace, batch, max_retries, on_event)
+    finally:
+        if worktree_pool is not None:
+            worktree_pool.stop()
+        if pool is not None:
+            with _worker_pools_lock:
+                _worker_pools.pop(batch.id, None)
+            pool.shutdown()
+
+
+def _prewarm_worktrees(workspace: Workspace, batch: BatchRun) -> Optional["WorktreePool"]:
+    """Start filling the worktree pool for a worktree-isolated batch.
+
+    One idle worktree per task that can run at once, created in the
+    background while the first tasks start on whatever is already parked.
+    """
+    if batch.isolation != "worktree":
+        return None
+    from codeframe.core.worktrees import WorktreePool, get_base_branch
+
+    pool = WorktreePool(workspace.repo_path)
+    if pool.max_idle == 0:  # CODEFRAME_WORKTREE_POOL_SIZE=0 turns pooling off
+        return None
+    size = batch.max_parallel if batch.strategy in ("parallel", "auto") else 1
+    pool.max_idle = max(pool.max_idle, size)
+    pool.prewarm(size, base_branch=get_base_branch(workspace.repo_path))
+    return pool
+
+
+def _start_worker_pool(
+    batch: BatchRun, warm_workers: Optional[bool]
+) -> Optional["TaskWorkerPool"]:
+    """Create and register the batch's warm worker pool, if it should have one.
+
+    Any failure leaves the batch on the one-interpreter-per-task path.
+    """
+    from codeframe.core import task_worker
+
+    if warm_workers is None:
+        warm_workers = task_worker.warm_workers_enabled()
+    if not warm_workers:
+        return None
+    if not task_worker.is_supported():
+        logger.warning("Warm workers need os.fork; running one interpreter per task")
+        return None
+
+    size = batch.max_parallel if batch.strategy in ("parallel", "auto") else 1
+    try:
+        pool = task_worker.TaskWorkerPool(size=max(1, size))
+    except (OSError, task_worker.TaskWorkerError) as exc:
+        logger.warning("Could not start warm workers (%s); running one interpreter per task", exc)
+        return None
+    with _worker_pools_lock:
+        _worker_pools[batch.id] = pool
+    return pool
+
+
+def _execute_batch(
+    workspace: Workspace,
+    batch: BatchRun,
+    max_retries: int,
+    on_event: Optional[Callable[[str, dict], None]],
+) -> BatchRun:
     strategy = batch.strategy
     max_parallel = batch.max_parallel
     task_ids = batch.task_ids
@@ -2553,7 +2633,9 @@ def _execute_task_subprocess(
 ) -> str:
     """Execute a single task via subprocess.
 
-    Runs `cf work start <task_id> --execute --engine <engine>` as a subprocess.
+    Runs `cf work start <task_id> --execute --engine <engine>` as a subprocess:
+    a forked child of a warm worker when the batch has a pool, otherwise a
+    fresh interpreter.
 
     Args:
         workspace: Target workspace
@@ -2568,32 +2650,46 @@ def _execute_task_subprocess(
         RunStatus value string (COMPLETED, FAILED, BLOCKED)
     """
     # Build command
-    cmd = [
-        sys.executable, "-m", "codeframe.cli.app",
+    cli_args = [
         "work", "start", task_id, "--execute",
         "--engine", engine,
         "--stall-timeout", str(stall_timeout_s),
         "--stall-action", stall_action,
     ]
     if engine == "cloud":
-        cmd += ["--cloud-timeout", str(cloud_timeout_minutes)]
+        cli_args += ["--cloud-timeout", str(cloud_timeout_minutes)]
     if llm_provider:
-        cmd += ["--llm-provider", llm_provider]
+        cli_args += ["--llm-provider", llm_provider]
     if llm_model:
-        cmd += ["--llm-model", llm_model]
+        cli_args += ["--llm-model", llm_model]
+    cwd = str(worktree_path) if worktree_path else str(workspace.repo_path)
+
+    with _worker_pools_lock:
+        pool = _worker_pools.get(batch_id) if batch_id else None
 
     process = None
     try:
-        # Use Popen instead of run for process tracking
-        process = subprocess.Popen(
-            cmd,
-            cwd=str(worktree_path) if worktree_path else workspace.repo_path,
-            stdout=None,  # Let output flow to terminal
-            stderr=None,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-        )
+        if pool is not None:
+            from codeframe.core.task_worker import TaskWorkerError
+
+            try:
+                process = pool.launch(cli_args, cwd)
+            except TaskWorkerError as exc:
+                logger.warning(
+                    "Warm worker unavailable for task %s (%s); using a fresh interpreter",
+                    task_id, exc,
+                )
+        if process is None:
+            # Use Popen instead of run for process tracking
+            process = subprocess.Popen(
+                [sys.executable, "-m", "codeframe.cli.app", *cli_args],
+                cwd=cwd,
+                stdout=None,  # Let output flow to terminal
+                stderr=None,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
 
         # Track process if batch_id provided (thread-safe)
         if batch_id:
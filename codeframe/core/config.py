@@ -748,7 +748,7 @@ class GlobalConfig(BaseSettings):
     @classmethod
     def validate_rate_limit_storage(cls, v: str) -> str:
         """Validate rate limit storage is valid."""
-        allowed = ["memory", "redis"]
+        allowed = ["memory", "sqlite", "redis"]
         if v not in allowed:
             raise ValueError(f"RATE_LIMIT_STORAGE must be one of {allowed}, got: {v}")
         return v
@@ -6,7 +6,6 @@ Manages context window size to stay within model limits.
 This module is headless - no FastAPI or HTTP dependencies.
 """
 
-import fnmatch
 import os
 import re
 from dataclasses import dataclass, field
@@ -14,7 +13,7 @@ from pathlib import Path
 from typing import Optional
 
 from codeframe.core.workspace import Workspace
-from codeframe.core import tasks, prd, blockers
+from codeframe.core import file_index, relevance_index, tasks, prd, blockers
 from codeframe.core.tasks import Task
 from codeframe.core.prd import PrdRecord
 from codeframe.core.blockers import Blocker, BlockerStatus
@@ -65,6 +64,28 @@ CODE_EXTENSIONS = {
     ".html", ".css", ".scss", ".sql",
 }
 
+# Words too common in task text to say anything about which file is relevant
+STOPWORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to",
+    "for", "of", "with", "by", "from", "is", "are", "was", "were",
+    "be", "been", "being", "have", "has", "had", "do", "does", "did",
+    "will", "would", "could", "should", "may", "might", "must",
+    "this", "that", "these", "those", "it", "its",
+    "as", "if", "then", "else", "when", "where", "which", "who",
+    "what", "how", "why", "all", "each", "every", "both", "few",
+    "more", "most", "other", "some", "such", "no", "not", "only",
+    "own", "same", "so", "than", "too", "very", "just", "can",
+})
+
+# Relevance = weighted sum of the path heuristic (_calculate_relevance), the
+# file's BM25 content score normalized to the best file, and a flat boost for
+# defining a symbol the task names. PRD terms are broad, so they count less
+# than the task's own title and description.
+PATH_SCORE_WEIGHT = 0.25
+CONTENT_SCORE_WEIGHT = 0.55
+SYMBOL_SCORE_WEIGHT = 0.2
+PRD_TERM_WEIGHT = 0.3
+
 
 @dataclass
 class FileInfo:
@@ -306,62 +327,30 @@ class ContextLoader:
     def _scan_file_tree(self) -> list[FileInfo]:
         """Scan repository for source files.
 
+        Reads the workspace's shared ``FileIndex``, which walks the tree once
+        and afterwards rescans only the directories that changed.
+
         Returns:
             List of FileInfo for all relevant files
         """
-        files = []
         repo_path = self.workspace.repo_path
-
-        for root, dirs, filenames in os.walk(repo_path):
-            # Filter directories
-            dirs[:] = [
-                d for d in dirs
-                if not self._should_ignore(os.path.join(root, d), repo_path)
-            ]
-
-            for filename in filenames:
-                file_path = os.path.join(root, filename)
-                rel_path = os.path.relpath(file_path, repo_path)
-
-                if self._should_ignore(file_path, repo_path):
-                    continue
-
-                ext = os.path.splitext(filename)[1].lower()
-                if ext not in CODE_EXTENSIONS:
-                    continue
-
-                try:
-                    size = os.path.getsize(file_path)
-                    files.append(FileInfo(
-                        path=rel_path,
-                        size_bytes=size,
-                        extension=ext,
-                    ))
-                except OSError:
-                    continue
-
+        index = file_index.for_root(repo_path, self.ignore_patterns)
+        files = []
+        for entry in index.files():
+            if entry.extension not in CODE_EXTENSIONS:
+                continue
+            # Sizes are stat-ed here: the index's may predate an in-place edit.
+            try:
+                size = os.path.getsize(repo_path / entry.path)
+            except OSError:
+                continue
+            files.append(FileInfo(
+                path=entry.path.replace("/", os.sep),
+                size_bytes=size,
+                extension=entry.extension,
+            ))
         return files
 
-    def _should_ignore(self, path: str, repo_path: Path) -> bool:
-        """Check if a path should be ignored.
-
-        Args:
-            path: Absolute path to check
-            repo_path: Repository root path
-
-        Returns:
-            True if path should be ignored
-        """
-        rel_path = os.path.relpath(path, repo_path)
-
-        for pattern in self.ignore_patterns:
-            if fnmatch.fnmatch(rel_path, pattern):
-                return True
-            if fnmatch.fnmatch(os.path.basename(path), pattern):
-                return True
-
-        return False
-
     def _score_relevance(
         self,
         files: list[FileInfo],
@@ -370,7 +359,9 @@ class ContextLoader:
     ) -> list[FileInfo]:
         """Score files by relevance to the task.
 
-        Uses keyword matching from task title/description and PRD.
+        Combines path keyword matching with BM25 over file contents from the
+        workspace's shared ``RelevanceIndex``, and boosts files that define a
+        symbol the task names (see ``PATH_SCORE_WEIGHT`` and friends).
 
         Args:
             files: Files to score
@@ -380,15 +371,44 @@ class ContextLoader:
         Returns:
             Files sorted by relevance score (highest first)
         """
+        task_text = task.title + " " + task.description
+        prd_text = prd_record.content[:5000] if prd_record else ""
+
         # Extract keywords from task and PRD
-        keywords = self._extract_keywords(task.title + " " + task.description)
+        keywords = self._extract_keywords(task_text)
         if prd_record:
-            keywords.update(self._extract_keywords(prd_record.content[:5000]))
+            keywords.update(self._extract_keywords(prd_text))
+
+        # Content terms, split like the index splits identifiers
+        query = {
+            term: 1.0
+            for term in relevance_index.term_counts(task_text)
+            if term not in STOPWORDS
+        }
+        for term in relevance_index.term_counts(prd_text):
+            if term not in STOPWORDS:
+                query.setdefault(term, PRD_TERM_WEIGHT)
+        symbols = {
+            name.lower()
+            for name in re.findall(r"\b[a-zA-Z_][a-zA-Z0-9_]*\b", task_text)
+            if len(name) > 3 and name.lower() not in STOPWORDS
+        }
+
+        index = relevance_index.for_root(
+            self.workspace.repo_path, self.ignore_patterns, CODE_EXTENSIONS
+        )
+        content_scores, definers = index.rank(query, symbols)
+        best = max(content_scores.values(), default=0.0)
 
         scored_files = []
         for file_info in files:
-            score = self._calculate_relevance(file_info, keywords)
-            file_info.relevance_score = score
+            key = file_info.path.replace(os.sep, "/")
+            score = PATH_SCORE_WEIGHT * self._calculate_relevance(file_info, keywords)
+            if best:
+                score += CONTENT_SCORE_WEIGHT * content_scores.get(key, 0.0) / best
+            if key in definers:
+                score += SYMBOL_SCORE_WEIGHT
+            file_info.relevance_score = min(score, 1.0)
             scored_files.append(file_info)
 
         # Sort by relevance (highest first)
@@ -412,19 +432,7 @@ class ContextLoader:
         words = re.findall(r"\b[a-zA-Z_][a-zA-Z0-9_]*\b", text.lower())
 
         # Filter out common words
-        stopwords = {
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to",
-            "for", "of", "with", "by", "from", "is", "are", "was", "were",
-            "be", "been", "being", "have", "has", "had", "do", "does", "did",
-            "will", "would", "could", "should", "may", "might", "must",
-            "this", "that", "these", "those", "it", "its",
-            "as", "if", "then", "else", "when", "where", "which", "who",
-            "what", "how", "why", "all", "each", "every", "both", "few",
-            "more", "most", "other", "some", "such", "no", "not", "only",
-            "own", "same", "so", "than", "too", "very", "just", "can",
-        }
-
-        keywords = {w for w in words if len(w) > 2 and w not in stopwords}
+        keywords = {w for w in words if len(w) > 2 and w not in STOPWORDS}
         return keywords
 
     def _calculate_relevance(
@@ -65,6 +65,21 @@ def resolve_cost_cap(repo_path: Path) -> Optional[float]:
     return cap if cap > 0 else None
 
 
+def _record_cost(metrics_tracker, record: dict) -> Optional[float]:
+    """Price one record, prompt-cache reads and writes included.
+
+    Records built before cache accounting (or by hand in callers) carry no
+    cache keys; they price as uncached.
+    """
+    return metrics_tracker.calculate_cost(
+        record["model"],
+        record["input_tokens"],
+        record["output_tokens"],
+        cache_creation_tokens=record.get("cache_creation_input_tokens", 0),
+        cache_read_tokens=record.get("cache_read_input_tokens", 0),
+    )
+
+
 class CostCapExceeded(RuntimeError):
     """Raised when a spending loop must stop. Carries the user-facing reason."""
 
@@ -96,6 +111,8 @@ class CostTracker:
         input_tokens: int,
         output_tokens: int,
         call_type: str = "task_execution",
+        cache_creation_input_tokens: int = 0,
+        cache_read_input_tokens: int = 0,
     ) -> None:
         self.records.append(
             {
@@ -103,6 +120,8 @@ class CostTracker:
                 "input_tokens": int(input_tokens or 0),
                 "output_tokens": int(output_tokens or 0),
                 "call_type": call_type,
+                "cache_creation_input_tokens": int(cache_creation_input_tokens or 0),
+                "cache_read_input_tokens": int(cache_read_input_tokens or 0),
             }
         )
 
@@ -113,6 +132,8 @@ class CostTracker:
             input_tokens=getattr(response, "input_tokens", 0) or 0,
             output_tokens=getattr(response, "output_tokens", 0) or 0,
             call_type=call_type,
+            cache_creation_input_tokens=getattr(response, "cache_creation_input_tokens", 0) or 0,
+            cache_read_input_tokens=getattr(response, "cache_read_input_tokens", 0) or 0,
         )
 
     # -- measurement ----------------------------------------------------
@@ -134,9 +155,7 @@ class CostTracker:
 
             total = 0.0
             for record in self.records:
-                cost = MetricsTracker.calculate_cost(
-                    record["model"], record["input_tokens"], record["output_tokens"]
-                )
+                cost = _record_cost(MetricsTracker, record)
                 # None = unpriced; skip rather than adding 0.0. Whether anything
                 # was unpriced is asked separately, by has_unpriced_records().
                 if cost is not None:
@@ -157,11 +176,7 @@ class CostTracker:
             from codeframe.lib.metrics_tracker import MetricsTracker
 
             return any(
-                MetricsTracker.calculate_cost(
-                    r["model"], r["input_tokens"], r["output_tokens"]
-                )
-                is None
-                for r in self.records
+                _record_cost(MetricsTracker, r) is None for r in self.records
             )
         except Exception:
             return False
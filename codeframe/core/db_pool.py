@@ -0,0 +1,334 @@
+"""Per-process pool of workspace SQLite connections.
+
+Headless by construction — stdlib only, so every layer (core, CLI, routers)
+shares one pool per process.
+
+Why this exists: nearly every function in ``codeframe/core`` opens a fresh
+connection through ``workspace.get_db_connection`` and closes it a few
+statements later. Each open is a file open plus three pragmas (WAL,
+busy_timeout, foreign_keys), so a parallel batch paid thousands of SQLite
+handshakes a minute per workspace for what are mostly single-row reads and
+writes.
+
+The pool keeps a small stack of idle connections per database path. Callers
+still get a handle they ``close()`` exactly as before — closing returns the
+underlying connection to the pool instead of tearing it down — so the existing
+``try/finally: conn.close()`` call sites pool without changing.
+
+Guarantees a returned connection must keep:
+
+* **Exclusive.** A connection is handed to one caller at a time; two
+  checkouts, even from the same thread, get two connections. Connections are
+  opened with ``check_same_thread=False`` only so an idle one may be reused on
+  a different thread than the one that opened it.
+* **Clean.** An open transaction is rolled back on release (the same outcome
+  closing it had) and ``row_factory`` is reset, so one caller's settings never
+  leak into the next.
+* **Pointing at the live file.** Every checkout compares the file's
+  ``(st_dev, st_ino)`` with the one the idle connection was opened against.
+  Workspace init builds ``state.db`` at a temp path and renames it into place,
+  and tests delete and recreate workspaces; a stale handle would silently read
+  the orphaned inode.
+* **Never inherited across fork.** A child process discards the parent's idle
+  connections without closing them — closing can touch WAL state the parent
+  still owns.
+
+Bounded, not blocking: ``max_idle_per_db`` and ``max_idle_total`` cap how many
+*idle* connections are kept; a burst beyond that opens extra connections and
+closes them on release. Checkout never waits, because core functions routinely
+open a second connection while holding a first.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ConnectionPool",
+    "PooledConnection",
+]
+
+#: ``(st_dev, st_ino)`` of the database file a connection was opened against.
+_FileIdentity = tuple[int, int]
+
+# Connections dropped by a forked child. Kept referenced so they are never
+# finalized (and closed) in the child; see ``ConnectionPool._after_fork``.
+_FORK_ORPHANS: list[sqlite3.Connection] = []
+
+
+def _file_identity(path: str) -> Optional[_FileIdentity]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+class PooledConnection:
+    """A checked-out connection. ``close()`` returns it to its pool.
+
+    Behaves like the ``sqlite3.Connection`` it wraps: attribute reads and
+    writes (``row_factory``, ``in_transaction``, ...) pass through, and it is a
+    transaction context manager exactly like the real one. After ``close()``
+    every use raises ``sqlite3.ProgrammingError``, as a closed connection
+    would, and a second ``close()`` is a no-op — the handle can never put a
+    connection back into the pool while someone else holds it.
+    """
+
+    __slots__ = ("_conn", "_pool", "_key", "_identity")
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        pool: Optional["ConnectionPool"],
+        key: Optional[str],
+        identity: Optional[_FileIdentity],
+    ) -> None:
+        object.__setattr__(self, "_conn", conn)
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_identity", identity)
+
+    def _live(self) -> sqlite3.Connection:
+        conn = self._conn
+        if conn is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        return conn
+
+    # The hot methods are spelled out so they skip ``__getattr__``.
+    def execute(self, *args: Any, **kwargs: Any) -> sqlite3.Cursor:
+        return self._live().execute(*args, **kwargs)
+
+    def executemany(self, *args: Any, **kwargs: Any) -> sqlite3.Cursor:
+        return self._live().executemany(*args, **kwargs)
+
+    def executescript(self, *args: Any, **kwargs: Any) -> sqlite3.Cursor:
+        return self._live().executescript(*args, **kwargs)
+
+    def cursor(self, *args: Any, **kwargs: Any) -> sqlite3.Cursor:
+        return self._live().cursor(*args, **kwargs)
+
+    def commit(self) -> None:
+        self._live().commit()
+
+    def rollback(self) -> None:
+        self._live().rollback()
+
+    def close(self) -> None:
+        conn = self._conn
+        if conn is None:
+            return
+        object.__setattr__(self, "_conn", None)
+        if self._pool is None:
+            conn.close()
+        else:
+            self._pool._release(self._key, conn, self._identity)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._live(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._live(), name, value)
+
+    def __enter__(self) -> "PooledConnection":
+        self._live().__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> Any:
+        return self._live().__exit__(exc_type, exc, tb)
+
+
+class _Idle:
+    __slots__ = ("conn", "identity", "since")
+
+    def __init__(self, conn: sqlite3.Connection, identity: _FileIdentity) -> None:
+        self.conn = conn
+        self.identity = identity
+        self.since = time.monotonic()
+
+
+class ConnectionPool:
+    """Idle SQLite connections keyed by database path.
+
+    Args:
+        opener: Opens a configured connection for a path. Must pass
+            ``check_same_thread=False`` so idle connections can move between
+            threads.
+        max_idle_per_db: Idle connections kept per database. ``0`` disables
+            reuse entirely (every checkout opens, every release closes).
+        max_idle_total: Idle connections kept across all databases; the least
+            recently used database gives one up first. Bounds open file
+            descriptors in processes that touch many workspaces.
+        max_idle_seconds: Idle connections older than this are closed instead
+            of reused.
+    """
+
+    def __init__(
+        self,
+        opener: Callable[[Union[str, Path]], sqlite3.Connection],
+        *,
+        max_idle_per_db: int = 8,
+        max_idle_total: int = 64,
+        max_idle_seconds: float = 300.0,
+    ) -> None:
+        self._opener = opener
+        self.max_idle_per_db = max_idle_per_db
+        self.max_idle_total = max_idle_total
+        self.max_idle_seconds = max_idle_seconds
+        self._lock = threading.Lock()
+        # Insertion order doubles as LRU order for max_idle_total eviction.
+        self._idle: "OrderedDict[str, deque[_Idle]]" = OrderedDict()
+        self._idle_count = 0
+        self._pid = os.getpid()
+        self.opened = 0
+        self.reused = 0
+
+    def acquire(self, db_path: Union[str, Path]) -> PooledConnection:
+        """Check out a connection to ``db_path``. The caller must ``close()`` it."""
+        try:
+            key = os.fspath(db_path)
+        except TypeError:
+            # Not a path (a test double). Hand it to the opener untouched so it
+            # fails — or not — exactly as an unpooled connect would.
+            return PooledConnection(self._opener(db_path), None, None, None)
+        if not isinstance(key, str) or key == ":memory:" or key.startswith("file:"):
+            return PooledConnection(self._opener(db_path), None, None, None)
+
+        self._check_fork()
+        identity = _file_identity(key)
+        stale: list[sqlite3.Connection] = []
+        reused: Optional[sqlite3.Connection] = None
+        with self._lock:
+            stack = self._idle.get(key)
+            if stack:
+                horizon = time.monotonic() - self.max_idle_seconds
+                while stack:
+                    idle = stack.pop()
+                    self._idle_count -= 1
+                    if idle.identity != identity:
+                        # The file was replaced, so nothing in the stack can
+                        # be valid either.
+                        stale.append(idle.conn)
+                        stale.extend(i.conn for i in stack)
+                        self._idle_count -= len(stack)
+                        stack.clear()
+                    elif idle.since < horizon:
+                        stale.append(idle.conn)
+                    else:
+                        reused = idle.conn
+                        break
+                if not stack:
+                    del self._idle[key]
+            if reused is not None:
+                self.reused += 1
+        _close_quietly(stale)
+
+        if reused is not None:
+            return PooledConnection(reused, self, key, identity)
+
+        conn = self._opener(db_path)
+        with self._lock:
+            self.opened += 1
+        # Re-read: the opener creates the file when it did not exist yet.
+        return PooledConnection(conn, self, key, identity or _file_identity(key))
+
+    @contextmanager
+    def connection(self, db_path: Union[str, Path]) -> Iterator[PooledConnection]:
+        """``with pool.connection(path) as conn:`` — released on exit."""
+        conn = self.acquire(db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def clear(self, db_path: Union[str, Path, None] = None) -> None:
+        """Close idle connections for one database, or for all of them."""
+        with self._lock:
+            if db_path is None:
+                stacks = list(self._idle.values())
+                self._idle.clear()
+            else:
+                stack = self._idle.pop(os.fspath(db_path), None)
+                stacks = [stack] if stack else []
+            dropped = [i.conn for s in stacks for i in s]
+            self._idle_count -= len(dropped)
+        _close_quietly(dropped)
+
+    def stats(self) -> dict[str, int]:
+        """Counters for health checks and benchmarks."""
+        with self._lock:
+            return {
+                "opened": self.opened,
+                "reused": self.reused,
+                "idle": self._idle_count,
+                "databases": len(self._idle),
+            }
+
+    def _release(
+        self, key: Optional[str], conn: sqlite3.Connection, identity: Optional[_FileIdentity]
+    ) -> None:
+        if os.getpid() != self._pid:
+            _FORK_ORPHANS.append(conn)
+            return
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            if conn.row_factory is not None:
+                conn.row_factory = None
+        except sqlite3.Error:
+            # A connection that cannot roll back is not safe to hand out again.
+            _close_quietly([conn])
+            return
+        if key is None or identity is None or self.max_idle_per_db <= 0:
+            _close_quietly([conn])
+            return
+
+        evicted: list[sqlite3.Connection] = []
+        with self._lock:
+            stack = self._idle.get(key)
+            if stack is None:
+                stack = self._idle[key] = deque()
+            else:
+                self._idle.move_to_end(key)
+            if len(stack) >= self.max_idle_per_db:
+                evicted.append(conn)
+            else:
+                stack.append(_Idle(conn, identity))
+                self._idle_count += 1
+                while self._idle_count > self.max_idle_total:
+                    lru_key, lru_stack = next(iter(self._idle.items()))
+                    evicted.append(lru_stack.popleft().conn)
+                    self._idle_count -= 1
+                    if not lru_stack:
+                        del self._idle[lru_key]
+        _close_quietly(evicted)
+
+    def _check_fork(self) -> None:
+        if os.getpid() != self._pid:
+            self._after_fork()
+
+    def _after_fork(self) -> None:
+        # The lock itself may have been held by another thread at fork time;
+        # the child has only this thread, so replacing it is safe.
+        self._lock = threading.Lock()
+        for stack in self._idle.values():
+            _FORK_ORPHANS.extend(i.conn for i in stack)
+        self._idle = OrderedDict()
+        self._idle_count = 0
+        self._pid = os.getpid()
+
+
+def _close_quietly(conns: list[sqlite3.Connection]) -> None:
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error as exc:  # pragma: no cover - close rarely fails
+            logger.debug("Closing pooled connection failed: %s", exc)
@@ -0,0 +1,426 @@
+"""Shared, content-addressed dependency store for worktree-isolated tasks.
+
+Every ``--isolation worktree`` run gets a fresh ``git worktree``, which has no
+``.venv`` or ``node_modules``. ``gates._ensure_dependencies_installed`` then
+installed the project's dependencies from scratch in each one — minutes per
+task, and a parallel batch of 20 tasks did the identical install 20 times.
+
+The store keeps one built environment per *dependency key*: a hash of the
+manifest and lock files that decide what gets installed (``requirements.txt``
+for Python, ``package.json`` + ``package-lock.json`` for Node), plus the
+platform and the interpreter that builds it. A worktree whose key is already
+in the store gets the environment *materialized* into it instead of installed:
+
+- a tree of hardlinks when the store and the worktree share a filesystem —
+  no data is copied, and because installers replace files rather than write
+  into them, a task that ``pip install``\\ s something extra changes only its
+  own tree. Python console scripts and ``activate`` embed the environment's
+  absolute path, so those few files are copied with the path rewritten;
+- a symlink to the stored environment otherwise (e.g. ``EXDEV``). Such a
+  worktree shares the environment for real; if the entry is later evicted
+  the link dangles, ``.venv`` no longer "exists", and the next gate run
+  materializes it again.
+
+Building an entry holds a per-key file lock, so parallel tasks that miss
+together wait for one install and then all link it. Entries are evicted least
+recently used first once the store exceeds its size budget.
+
+Only linked worktrees use the store (the main checkout installs in place as
+before), and only when the manifest is self-contained: requirements that pull
+in other files or local paths (``-r``, ``-e .``, ``file:``) or npm workspaces
+are installed in place, since the stored copy could not resolve them.
+
+This module is headless - no FastAPI or HTTP dependencies.
+"""
+
+import errno
+import hashlib
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from codeframe.core.atomic_io import atomic_write_json, read_modify_write_lock
+
+logger = logging.getLogger(__name__)
+
+#: Set to 0/false/no/off to install into every worktree as before.
+DEP_CACHE_ENV = "CODEFRAME_DEP_CACHE"
+
+#: Overrides where the store lives (default ``~/.codeframe/dep_cache``).
+DEP_CACHE_DIR_ENV = "CODEFRAME_DEP_CACHE_DIR"
+
+#: Size budget of the store in MB; least recently used entries go first.
+DEP_CACHE_MAX_MB_ENV = "CODEFRAME_DEP_CACHE_MAX_MB"
+
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024 * 1024
+
+#: Bumped when the key derivation or the entry layout changes.
+_FORMAT_VERSION = 1
+
+#: Written last into a finished entry; its mtime is the entry's last use.
+_META_FILENAME = ".cf-dep-cache.json"
+
+_LOCK_DIRNAME = ".locks"
+
+#: link() errors that mean "hardlinks are not possible here", not "broken".
+_NO_HARDLINK_ERRNOS = frozenset({errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP})
+
+#: requirements.txt lines that reference something outside the file itself.
+_NON_HERMETIC_PREFIXES = (
+    "-r", "-c", "-e", "--requirement", "--constraint", "--editable",
+    ".", "/", "~", "file:",
+)
+
+#: Builds an environment at the given path; (success, message) like the installers.
+Builder = Callable[[Path], tuple[bool, str]]
+
+
+def cache_enabled() -> bool:
+    """False when CODEFRAME_DEP_CACHE is set to a falsy value."""
+    raw = os.getenv(DEP_CACHE_ENV, "").strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+def default_root() -> Path:
+    """CODEFRAME_DEP_CACHE_DIR, or the machine-wide ``~/.codeframe/dep_cache``."""
+    override = os.getenv(DEP_CACHE_DIR_ENV)
+    return Path(override) if override else Path.home() / ".codeframe" / "dep_cache"
+
+
+def _max_bytes() -> int:
+    """CODEFRAME_DEP_CACHE_MAX_MB in bytes; a bad value warns and is ignored."""
+    raw = os.getenv(DEP_CACHE_MAX_MB_ENV)
+    if not raw:
+        return DEFAULT_MAX_BYTES
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning("%s=%r is not an integer; ignoring", DEP_CACHE_MAX_MB_ENV, raw)
+        return DEFAULT_MAX_BYTES
+    if value <= 0:
+        logger.warning("%s=%d must be positive; ignoring", DEP_CACHE_MAX_MB_ENV, value)
+        return DEFAULT_MAX_BYTES
+    return value * 1024 * 1024
+
+
+def for_repo(repo_path: Path) -> Optional["DependencyCache"]:
+    """The store to use for ``repo_path``, or None to install in place.
+
+    Only linked worktrees (where ``.git`` is a file, not a directory) share
+    environments; the main checkout keeps its own.
+    """
+    if not cache_enabled() or not (repo_path / ".git").is_file():
+        return None
+    return DependencyCache()
+
+
+def _hash_key(kind: str, parts: list[bytes]) -> str:
+    digest = hashlib.sha256()
+    header = [_FORMAT_VERSION, kind, sys.platform, platform.machine()]
+    digest.update(json.dumps(header).encode())
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return f"{kind}-{digest.hexdigest()[:32]}"
+
+
+def _read_optional(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return b""
+
+
+def python_key(repo_path: Path, requirements_txt: Path, builder_id: str) -> Optional[str]:
+    """Dependency key of a requirements.txt install, or None if not shareable.
+
+    Args:
+        builder_id: Identifies the tool that builds the venv (``uv`` resolves
+            its own interpreter, honouring ``.python-version``; the stdlib
+            fallback uses CodeFRAME's).
+    """
+    try:
+        requirements = requirements_txt.read_bytes()
+    except OSError:
+        return None
+    for line in requirements.decode("utf-8", errors="replace").splitlines():
+        if line.strip().startswith(_NON_HERMETIC_PREFIXES):
+            return None
+    return _hash_key("python", [
+        requirements,
+        _read_optional(repo_path / ".python-version"),
+        builder_id.encode(),
+    ])
+
+
+def node_key(repo_path: Path) -> Optional[str]:
+    """Dependency key of an ``npm install``, or None if not shareable."""
+    try:
+        manifest = (repo_path / "package.json").read_bytes()
+        package = json.loads(manifest)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(package, dict) or "workspaces" in package:
+        return None
+    for section in ("dependencies", "devDependencies", "optionalDependencies"):
+        for spec in (package.get(section) or {}).values():
+            if isinstance(spec, str) and spec.startswith(("file:", "link:", ".", "/")):
+                return None
+    return _hash_key("node", [
+        manifest,
+        _read_optional(repo_path / "package-lock.json"),
+        _read_optional(repo_path / ".npmrc"),
+    ])
+
+
+@dataclass
+class CacheEntry:
+    """A finished environment in the store."""
+
+    key: str
+    path: Path
+    size_bytes: int
+    last_used: float
+
+
+class DependencyCache:
+    """The on-disk store of built environments.
+
+    Args:
+        root: Store directory (default: ``default_root()``).
+        max_bytes: Size budget (default: CODEFRAME_DEP_CACHE_MAX_MB or 10 GB).
+
+    Each entry is a directory ``<root>/<key>/`` that serves as the project
+    directory the environment was built in, so a venv lives at
+    ``<key>/.venv`` and a Node install at ``<key>/node_modules``.
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: Optional[int] = None) -> None:
+        self.root = Path(root) if root is not None else default_root()
+        self.max_bytes = max_bytes if max_bytes is not None else _max_bytes()
+
+    def entry_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def _lock(self, name: str):
+        return read_modify_write_lock(self.root / _LOCK_DIRNAME / f"{name}.lock")
+
+    def _is_ready(self, key: str) -> bool:
+        return (self.entry_dir(key) / _META_FILENAME).is_file()
+
+    def materialize(
+        self,
+        key: str,
+        target: Path,
+        build: Builder,
+        *,
+        relocate: bool = False,
+    ) -> tuple[bool, str]:
+        """Put the environment for ``key`` at ``target``, building it once if needed.
+
+        Args:
+            key: From ``python_key`` / ``node_key``.
+            target: Where the environment goes, e.g. ``<worktree>/.venv``.
+                Must not exist (a dangling symlink left by eviction is fine).
+            build: Installs the environment at the path it is given — the
+                stored ``<entry>/<target.name>`` on a miss.
+            relocate: Rewrite the stored path in ``bin/`` scripts (venvs).
+
+        Returns:
+            (success, message) for the dependency check. A failure of the
+            store itself (disk full, permissions) falls back to ``build(target)``,
+            i.e. the in-place install.
+        """
+        if target.is_symlink() and not target.exists():
+            target.unlink()  # the entry it pointed at was evicted
+        if target.exists() or target.is_symlink():
+            # Never replace something that is already there.
+            return build(target)
+        try:
+            built = self._ensure_entry(key, target.name, build)
+        except OSError as exc:
+            logger.warning("Dependency cache unavailable (%s); installing in place", exc)
+            return build(target)
+        if built is not None and not built[0]:
+            return built
+
+        source = self.entry_dir(key) / target.name
+        try:
+            mode = _link_tree(source, target, relocate=relocate)
+        except OSError as exc:
+            logger.warning("Could not link cached dependencies into %s (%s); "
+                           "installing in place", target, exc)
+            shutil.rmtree(target, ignore_errors=True)
+            return build(target)
+
+        if built is not None:
+            return True, f"{built[1]} (shared via the dependency cache, {mode})"
+        return True, f"Linked cached dependencies into {target.name} ({mode})"
+
+    def _ensure_entry(self, key: str, env_name: str, build: Builder) -> Optional[tuple[bool, str]]:
+        """Build the entry if it is missing; the build's result, or None on a hit."""
+        if self._is_ready(key):
+            self._touch(key)
+            return None
+        with self._lock(key):
+            # Whoever held the lock before us may have built it.
+            if self._is_ready(key):
+                self._touch(key)
+                return None
+            entry = self.entry_dir(key)
+            # Leftovers of a crashed build are never marked ready.
+            shutil.rmtree(entry, ignore_errors=True)
+            entry.mkdir(parents=True)
+            result = build(entry / env_name)
+            if not result[0]:
+                shutil.rmtree(entry, ignore_errors=True)
+                return result
+            atomic_write_json(entry / _META_FILENAME, {
+                "format": _FORMAT_VERSION,
+                "key": key,
+                "env": env_name,
+                "size_bytes": _tree_size(entry / env_name),
+                "created_at": time.time(),
+            })
+        self.evict(keep=key)
+        return result
+
+    def _touch(self, key: str) -> None:
+        try:
+            os.utime(self.entry_dir(key) / _META_FILENAME)
+        except OSError:
+            pass
+
+    def entries(self) -> list[CacheEntry]:
+        """Finished entries, least recently used first."""
+        found = []
+        try:
+            children = list(self.root.iterdir())
+        except OSError:
+            return []
+        for child in children:
+            meta_path = child / _META_FILENAME
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                found.append(CacheEntry(
+                    key=child.name,
+                    path=child,
+                    size_bytes=int(meta.get("size_bytes", 0)),
+                    last_used=meta_path.stat().st_mtime,
+                ))
+            except (OSError, ValueError, TypeError):
+                continue
+        return sorted(found, key=lambda e: e.last_used)
+
+    def evict(self, keep: Optional[str] = None) -> list[str]:
+        """Drop least recently used entries until the store fits ``max_bytes``.
+
+        Worktrees materialized by hardlink keep their files; a symlinked one
+        is repaired on its next dependency check.
+
+        Returns:
+            Keys of the evicted entries.
+        """
+        evicted: list[str] = []
+        with self._lock("evict"):
+            entries = self.entries()
+            total = sum(e.size_bytes for e in entries)
+            for entry in entries:
+                if total <= self.max_bytes:
+                    break
+                if entry.key == keep:
+                    continue
+                with self._lock(entry.key):
+                    # Clear the ready marker first: a reader never sees a
+                    # half-deleted entry as usable.
+                    try:
+                        (entry.path / _META_FILENAME).unlink()
+                    except OSError:
+                        continue
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                total -= entry.size_bytes
+                evicted.append(entry.key)
+        for key in evicted:
+            logger.debug("Evicted %s from the dependency cache", key)
+        return evicted
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for dirpath, dirnames, filenames in os.walk(path):
+        for name in dirnames + filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _link_tree(source: Path, target: Path, *, relocate: bool) -> str:
+    """Recreate ``source`` at ``target`` with hardlinks, or symlink it whole.
+
+    Returns:
+        "hardlink" or "symlink", for the dependency-check message.
+    """
+    try:
+        _hardlink_tree(source, target)
+    except OSError as exc:
+        if exc.errno not in _NO_HARDLINK_ERRNOS:
+            raise
+        shutil.rmtree(target, ignore_errors=True)
+        os.symlink(source, target, target_is_directory=True)
+        return "symlink"
+    if relocate:
+        _relocate_scripts(source, target)
+    return "hardlink"
+
+
+def _hardlink_tree(source: Path, target: Path) -> None:
+    for dirpath, dirnames, filenames in os.walk(source):
+        rel = os.path.relpath(dirpath, source)
+        out_dir = target if rel == "." else target / rel
+        out_dir.mkdir(parents=True, exist_ok=rel != ".")
+        for name in dirnames + filenames:
+            src = os.path.join(dirpath, name)
+            dst = out_dir / name
+            if os.path.islink(src):
+                os.symlink(os.readlink(src), dst)
+                if name in dirnames:
+                    dirnames.remove(name)  # os.walk does not descend into it anyway
+            elif name in filenames:
+                os.link(src, dst)
+
+
+def _relocate_scripts(source: Path, target: Path) -> None:
+    """Point the venv's console scripts and ``activate`` at ``target``.
+
+    pip and uv write the venv's absolute path into every shebang; left alone,
+    ``<worktree>/.venv/bin/pytest`` would run in the stored environment.
+    Rewritten files are private copies, so the stored ones stay intact.
+    """
+    old, new = os.fsencode(str(source)), os.fsencode(str(target))
+    for scripts in ("bin", "Scripts"):
+        script_dir = target / scripts
+        if not script_dir.is_dir():
+            continue
+        for path in script_dir.iterdir():
+            if path.is_symlink() or not path.is_file():
+                continue
+            with open(path, "rb") as handle:
+                head = handle.read(2)
+            if head != b"#!" and not path.name.startswith("activate"):
+                continue
+            content = path.read_bytes()
+            if old not in content:
+                continue
+            mode = path.stat().st_mode
+            path.unlink()  # break the hardlink before writing
+            path.write_bytes(content.replace(old, new))
+            os.chmod(path, mode)
@@ -70,18 +70,14 @@ def build_graph(
         External dependencies are filtered out.
     """
     task_id_set = set(task_ids)
-    graph: dict[str, list[str]] = {}
-
-    for task_id in task_ids:
-        task = task_module.get(workspace, task_id)
-        if task:
-            # Only include dependencies that are in our task set
-            deps = [d for d in task.depends_on if d in task_id_set]
-            graph[task_id] = deps
-        else:
-            graph[task_id] = []
-
-    return graph
+    # One query over the dependency edge table instead of a get() (and a
+    # depends_on JSON parse) per task.
+    edges = task_module.get_dependency_map(workspace, task_ids)
+    # Only include dependencies that are in our task set
+    return {
+        task_id: [d for d in edges[task_id] if d in task_id_set]
+        for task_id in task_ids
+    }
 
 
 def detect_cycle(graph: dict[str, list[str]]) -> Optional[list[str]]:
@@ -3,13 +3,47 @@
 Records per-run engine metrics and computes aggregate statistics
 for comparing engine performance (react vs plan vs external adapters).
 
+Aggregates are running sums, not re-aggregations: each recorded run adds its
+contribution to two ``engine_run_rollups`` rows — its UTC day and the engine's
+all-time row — and the all-time row is re-derived into ``engine_stats``. A run
+therefore costs O(1) however long the workspace's history is. The per-day rows
+back windowed stats (last 7/30 days), and :func:`rebuild_stats` recomputes
+everything from ``run_engine_log`` (``cf stats rebuild``).
+
 This module is headless - no FastAPI or HTTP dependencies.
 """
 
+from datetime import timedelta
 from typing import Optional
 
 from codeframe.core.workspace import Workspace, get_db_connection, _utc_now
 
+#: ``engine_run_rollups.day`` of an engine's all-time row. Sorts before every
+#: ISO date, so ``day >= <cutoff>`` never matches it.
+ALL_TIME = ""
+
+#: Rollup columns and the never-NULL SQL expression giving one
+#: ``run_engine_log`` row's contribution to each. The single definition behind
+#: the per-run delta, the rebuild and the retraction, so they cannot drift.
+_ROLLUP_TERMS: tuple[tuple[str, str], ...] = (
+    ("runs", "1"),
+    ("completed", "CASE WHEN status = 'COMPLETED' THEN 1 ELSE 0 END"),
+    ("failed", "CASE WHEN status = 'FAILED' THEN 1 ELSE 0 END"),
+    ("gates_passed", "CASE WHEN gates_passed = 1 THEN 1 ELSE 0 END"),
+    ("gates_reported", "CASE WHEN gates_passed IS NOT NULL THEN 1 ELSE 0 END"),
+    ("self_corrected", "CASE WHEN self_corrections > 0 THEN 1 ELSE 0 END"),
+    ("duration_sum", "COALESCE(duration_ms, 0)"),
+    ("duration_count", "CASE WHEN duration_ms IS NOT NULL THEN 1 ELSE 0 END"),
+    ("tokens", "COALESCE(tokens_used, 0)"),
+    (
+        "completed_tokens",
+        "CASE WHEN status = 'COMPLETED' THEN COALESCE(tokens_used, 0) ELSE 0 END",
+    ),
+)
+
+_ROLLUP_COLUMNS = ", ".join(column for column, _ in _ROLLUP_TERMS)
+_RUN_DAY = "substr(created_at, 1, 10)"
+
 
 def record_run(
     workspace: Workspace,
@@ -24,7 +58,8 @@ def record_run(
 ) -> None:
     """Record an engine run in the run_engine_log table.
 
-    After inserting, recomputes aggregate stats for the engine.
+    After inserting, adds the run to the engine's rollups and refreshes its
+    aggregate stats.
 
     Args:
         workspace: Active workspace.
@@ -59,72 +94,86 @@ def record_run(
                 now,
             ),
         )
-        # Recompute aggregates in the same connection to avoid TOCTOU issues
+        # Same connection and transaction as the insert, so the log and the
+        # rollups can never disagree.
+        _add_run_conn(conn, run_id)
         _update_aggregate_stats_conn(conn, workspace.id, engine)
         conn.commit()
     finally:
         conn.close()
 
 
-def _update_aggregate_stats_conn(conn, ws_id: str, engine: str) -> None:
-    """Recompute aggregate metrics using an existing connection.
+def _add_run_conn(conn, run_id: str) -> None:
+    """Add one logged run to its day and all-time rollup rows. O(1).
 
     Does NOT commit — caller is responsible for committing.
     """
     now = _utc_now().isoformat()
+    terms = ", ".join(expr for _, expr in _ROLLUP_TERMS)
+    deltas = ", ".join(f"{column} = {column} + excluded.{column}" for column, _ in _ROLLUP_TERMS)
+    for day in (_RUN_DAY, "?"):
+        conn.execute(
+            f"INSERT INTO engine_run_rollups "
+            f"(workspace_id, engine, day, {_ROLLUP_COLUMNS}, updated_at) "
+            f"SELECT workspace_id, engine, {day}, {terms}, ? "
+            f"FROM run_engine_log WHERE run_id = ? "
+            f"ON CONFLICT (workspace_id, engine, day) DO UPDATE SET "
+            f"{deltas}, updated_at = excluded.updated_at",
+            (now, run_id) if day == _RUN_DAY else (ALL_TIME, now, run_id),
+        )
 
-    cur = conn.cursor()
-
-    # Compute all metrics in one pass where possible
-    row = cur.execute(
-        "SELECT "
-        "  COUNT(*), "
-        "  COUNT(CASE WHEN status = 'COMPLETED' THEN 1 END), "
-        "  COUNT(CASE WHEN status = 'FAILED' THEN 1 END), "
-        "  COUNT(CASE WHEN gates_passed = 1 THEN 1 END), "
-        "  COUNT(CASE WHEN gates_passed IS NOT NULL THEN 1 END), "
-        "  COUNT(CASE WHEN self_corrections > 0 THEN 1 END), "
-        "  AVG(CASE WHEN duration_ms IS NOT NULL THEN duration_ms END), "
-        "  SUM(tokens_used), "
-        "  SUM(CASE WHEN status = 'COMPLETED' THEN tokens_used ELSE 0 END), "
-        "  COUNT(CASE WHEN status = 'COMPLETED' THEN 1 END) "
-        "FROM run_engine_log "
-        "WHERE engine = ? AND workspace_id = ?",
-        (engine, ws_id),
-    ).fetchone()
-
-    total = row[0]
-    completed = row[1]
-    failed = row[2]
-    gates_pass_count = row[3]
-    gates_total = row[4]
-    self_corr_count = row[5]
-    avg_duration = row[6]
-    total_tokens = row[7] or 0
-    completed_tokens = row[8] or 0
-    completed_count = row[9]
 
+def _metrics(sums: dict[str, float]) -> dict[str, float]:
+    """The reported metrics, derived from a rollup row's running sums."""
+    total = sums["runs"]
+    completed = sums["completed"]
     gate_pass_rate = (
-        100.0 * gates_pass_count / gates_total if gates_total > 0 else 0.0
+        100.0 * sums["gates_passed"] / sums["gates_reported"]
+        if sums["gates_reported"] > 0 else 0.0
     )
     self_correction_rate = (
-        100.0 * self_corr_count / total if total > 0 else 0.0
+        100.0 * sums["self_corrected"] / total if total > 0 else 0.0
+    )
+    avg_duration = (
+        sums["duration_sum"] / sums["duration_count"]
+        if sums["duration_count"] > 0 else 0.0
     )
     avg_tokens_per_task = (
-        completed_tokens / completed_count if completed_count > 0 else 0.0
+        sums["completed_tokens"] / completed if completed > 0 else 0.0
     )
-
-    metrics = {
+    return {
         "tasks_attempted": float(total),
         "tasks_completed": float(completed),
-        "tasks_failed": float(failed),
+        "tasks_failed": float(sums["failed"]),
         "gate_pass_rate": round(gate_pass_rate, 2),
         "self_correction_rate": round(self_correction_rate, 2),
-        "avg_duration_ms": round(avg_duration, 2) if avg_duration is not None else 0.0,
-        "total_tokens": float(total_tokens),
+        "avg_duration_ms": round(avg_duration, 2),
+        "total_tokens": float(sums["tokens"]),
         "avg_tokens_per_task": round(avg_tokens_per_task, 2),
     }
 
+
+def _update_aggregate_stats_conn(conn, ws_id: str, engine: str) -> None:
+    """Re-derive ``engine_stats`` from the engine's all-time rollup row.
+
+    Does NOT commit — caller is responsible for committing.
+    """
+    now = _utc_now().isoformat()
+
+    cur = conn.cursor()
+    row = cur.execute(
+        f"SELECT {_ROLLUP_COLUMNS} FROM engine_run_rollups "
+        f"WHERE workspace_id = ? AND engine = ? AND day = ?",
+        (ws_id, engine, ALL_TIME),
+    ).fetchone()
+    if row is None:
+        cur.execute(
+            "DELETE FROM engine_stats WHERE workspace_id = ? AND engine = ?",
+            (ws_id, engine),
+        )
+        return
+
+    metrics = _metrics(dict(zip((c for c, _ in _ROLLUP_TERMS), row)))
     for metric, value in metrics.items():
         cur.execute(
             "INSERT OR REPLACE INTO engine_stats "
@@ -134,6 +183,84 @@ def _update_aggregate_stats_conn(conn, ws_id: str, engine: str) -> None:
         )
 
 
+def retract_runs_conn(cursor, where: str, params: tuple) -> None:
+    """Take the ``run_engine_log`` rows matching ``where`` out of the stats.
+
+    For callers about to delete those rows (task deletion): O(rows removed),
+    not O(history). ``where`` is a predicate over ``run_engine_log`` columns.
+    Does NOT commit, and leaves the log rows themselves in place.
+    """
+    sums = ", ".join(f"SUM({expr})" for _, expr in _ROLLUP_TERMS)
+    groups = cursor.execute(
+        f"SELECT workspace_id, engine, {_RUN_DAY}, {sums} "
+        f"FROM run_engine_log WHERE {where} GROUP BY 1, 2, 3",
+        params,
+    ).fetchall()
+    if not groups:
+        return
+    decrements = ", ".join(f"{column} = {column} - ?" for column, _ in _ROLLUP_TERMS)
+    for ws_id, engine, day, *amounts in groups:
+        for rollup_day in (day, ALL_TIME):
+            cursor.execute(
+                f"UPDATE engine_run_rollups SET {decrements} "
+                f"WHERE workspace_id = ? AND engine = ? AND day = ?",
+                (*amounts, ws_id, engine, rollup_day),
+            )
+    cursor.execute("DELETE FROM engine_run_rollups WHERE runs <= 0")
+    for ws_id, engine in {(ws_id, engine) for ws_id, engine, *_ in groups}:
+        _update_aggregate_stats_conn(cursor.connection, ws_id, engine)
+
+
+def rebuild_stats_conn(conn, ws_id: Optional[str] = None) -> int:
+    """Recompute every rollup and ``engine_stats`` row from ``run_engine_log``.
+
+    Scoped to one workspace, or every workspace in the database when
+    ``ws_id`` is None (the schema upgrade). Returns the number of runs
+    counted. Does NOT commit.
+    """
+    now = _utc_now().isoformat()
+    scope, params = ("workspace_id = ?", (ws_id,)) if ws_id else ("1", ())
+    sums = ", ".join(f"SUM({expr})" for _, expr in _ROLLUP_TERMS)
+
+    conn.execute(f"DELETE FROM engine_run_rollups WHERE {scope}", params)
+    conn.execute(f"DELETE FROM engine_stats WHERE {scope}", params)
+    for day in (_RUN_DAY, "?"):
+        conn.execute(
+            f"INSERT INTO engine_run_rollups "
+            f"(workspace_id, engine, day, {_ROLLUP_COLUMNS}, updated_at) "
+            f"SELECT workspace_id, engine, {day}, {sums}, ? "
+            f"FROM run_engine_log WHERE {scope} GROUP BY 1, 2, 3",
+            (now, *params) if day == _RUN_DAY else (ALL_TIME, now, *params),
+        )
+
+    engines = conn.execute(
+        f"SELECT workspace_id, engine, runs FROM engine_run_rollups "
+        f"WHERE day = ? AND {scope}",
+        (ALL_TIME, *params),
+    ).fetchall()
+    for row_ws, engine, _ in engines:
+        _update_aggregate_stats_conn(conn, row_ws, engine)
+    return sum(runs for *_, runs in engines)
+
+
+def rebuild_stats(workspace: Workspace) -> int:
+    """Recompute the workspace's engine stats from its run log.
+
+    The recovery path for rollups that drifted from the log — e.g. runs
+    recorded by an older CodeFRAME that predates them.
+
+    Returns:
+        The number of logged runs the rebuilt stats cover.
+    """
+    conn = get_db_connection(workspace)
+    try:
+        runs = rebuild_stats_conn(conn, workspace.id)
+        conn.commit()
+    finally:
+        conn.close()
+    return runs
+
+
 def get_engine_stats(
     workspace: Workspace, engine: Optional[str] = None
 ) -> dict[str, dict[str, float]]:
@@ -173,6 +300,46 @@ def get_engine_stats(
     return result
 
 
+def get_engine_stats_window(
+    workspace: Workspace, days: int, engine: Optional[str] = None
+) -> dict[str, dict[str, float]]:
+    """Aggregate engine statistics over the last ``days`` UTC days.
+
+    Summed from the per-day rollups, so the cost is O(engines x days) no
+    matter how many runs those days hold. Today counts as the first day.
+
+    Args:
+        workspace: Active workspace.
+        days: Window length in days (e.g. 7 or 30); must be positive.
+        engine: Optional engine filter. If None, returns all engines.
+
+    Returns:
+        Same shape as :func:`get_engine_stats`. Engines with no runs in the
+        window are absent.
+    """
+    if days < 1:
+        raise ValueError(f"days must be positive, got {days}")
+    cutoff = (_utc_now().date() - timedelta(days=days - 1)).isoformat()
+    sums = ", ".join(f"SUM({column})" for column, _ in _ROLLUP_TERMS)
+    sql = (
+        f"SELECT engine, {sums} FROM engine_run_rollups "
+        f"WHERE workspace_id = ? AND day >= ?"
+    )
+    params: tuple = (workspace.id, cutoff)
+    if engine is not None:
+        sql += " AND engine = ?"
+        params += (engine,)
+
+    conn = get_db_connection(workspace)
+    try:
+        rows = conn.execute(sql + " GROUP BY engine", params).fetchall()
+    finally:
+        conn.close()
+
+    columns = [column for column, _ in _ROLLUP_TERMS]
+    return {eng: _metrics(dict(zip(columns, sums))) for eng, *sums in rows}
+
+
 def get_run_log(
     workspace: Workspace, engine: Optional[str] = None, limit: int = 100
 ) -> list[dict]:
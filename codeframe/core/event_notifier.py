@@ -0,0 +1,396 @@
+"""Change notification for push-based event tailing.
+
+Headless by construction — stdlib only.
+
+Why this exists: ``events.tail`` polled ``list_recent`` every 500ms forever,
+and every ``cf work follow`` / ``/api/v2/events`` consumer added another poller
+against state.db. Fifty open dashboards meant a hundred queries a second
+against a database that, most of the time, had not changed.
+
+The notifier turns that around. A *topic* (for the event log: the workspace's
+state.db path) carries a generation counter. Writers ``notify()`` after they
+commit; readers take ``generation()`` *before* querying, and when the query
+comes back empty they ``wait()`` for the generation to move. Taking the
+generation first is what makes this race-free: a commit that lands between the
+query and the wait has already bumped it, so the wait returns at once.
+
+In-process, ``notify()`` wakes waiters directly (threads through a condition,
+asyncio tasks through their loop). Across processes — the batch conductor runs
+each task in its own interpreter — ``notify()`` also rewrites a tiny *signal
+file* with a token that is unique per commit (the newest event id). One watcher
+thread per topic per process watches that file, with inotify on Linux and a
+cheap read-and-compare poll elsewhere, and bumps the in-process generation when
+another process's token appears. Waiters only touch the database after a
+wake-up, so an idle workspace costs no queries no matter how many tails follow
+it.
+
+Topics exist only while someone is interested in them. ``notify()`` on a topic
+nobody has asked about records nothing, and a topic with no waiters, no watcher
+and no ``generation()`` call for ``idle_timeout`` is dropped — otherwise the
+per-task topics ``EventPublisher`` bumps would accumulate for the life of the
+server. Generations come from one notifier-wide counter, so a topic recreated
+after being dropped starts past any generation a reader could still hold.
+
+Tokens, not mtimes: two commits inside one filesystem timestamp tick would
+leave the mtime unchanged, and a reader that queried between them would sleep
+through the second.
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "EventNotifier",
+    "get_notifier",
+]
+
+#: Width the token is padded to, so a shorter token fully overwrites a longer
+#: one without a truncate.
+_TOKEN_WIDTH = 32
+
+TopicKey = Union[str, Path]
+
+
+class _Topic:
+    __slots__ = (
+        "generation",
+        "async_waiters",
+        "waiting",
+        "last_interest",
+        "last_token",
+        "signal_path",
+        "watcher",
+    )
+
+    def __init__(self, generation: int) -> None:
+        self.generation = generation
+        self.async_waiters: set = set()
+        self.waiting = 0
+        self.last_interest = time.monotonic()
+        self.last_token: Optional[str] = None
+        self.signal_path: Optional[Path] = None
+        self.watcher: Optional[threading.Thread] = None
+
+
+class EventNotifier:
+    """Generation counters per topic, with in-process and cross-process wake-ups.
+
+    Args:
+        poll_interval: How often the watcher re-reads a signal file when
+            inotify is unavailable. Bounds cross-process latency in that mode.
+        use_inotify: Use inotify on Linux (falls back automatically if the
+            syscalls are unavailable).
+        idle_timeout: A watcher with no waiters and no ``generation()`` calls
+            for this long exits; the next interested reader restarts it. An
+            idle topic is forgotten after the same interval.
+    """
+
+    def __init__(
+        self,
+        *,
+        poll_interval: float = 0.025,
+        use_inotify: bool = True,
+        idle_timeout: float = 60.0,
+    ) -> None:
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify and _Inotify.available()
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._topics: dict[str, _Topic] = {}
+        #: Last generation handed to any topic; bumps take the next value.
+        self._clock = 0
+
+    # -- writers ---------------------------------------------------------------
+
+    def notify(
+        self,
+        key: TopicKey,
+        token: Optional[str] = None,
+        *,
+        signal_path: Optional[Path] = None,
+    ) -> None:
+        """Record a change to ``key`` and wake everyone waiting on it.
+
+        With ``signal_path``, ``token`` is also written there for waiters in
+        other processes; it must differ from every earlier token for the topic.
+        """
+        name = os.fspath(key)
+        if signal_path is not None and token is not None:
+            with self._lock:
+                # Our own write must not come back through our own watcher as a
+                # second wake-up.
+                topic = self._topics.get(name)
+                if topic is not None:
+                    topic.last_token = token
+            _write_signal(signal_path, token)
+        self._bump(name)
+
+    # -- readers ---------------------------------------------------------------
+
+    def generation(self, key: TopicKey, *, signal_path: Optional[Path] = None) -> int:
+        """Current generation of ``key``. Take it *before* reading the data.
+
+        With ``signal_path``, also makes sure this process is watching that
+        file for other processes' writes.
+        """
+        name = os.fspath(key)
+        with self._lock:
+            topic = self._topic(name)
+            topic.last_interest = time.monotonic()
+            if signal_path is not None:
+                topic.signal_path = Path(signal_path)
+                if topic.watcher is None:
+                    topic.watcher = threading.Thread(
+                        target=self._watch,
+                        args=(name, topic),
+                        name=f"codeframe-notifier-{Path(name).parent.name}",
+                        daemon=True,
+                    )
+                    topic.watcher.start()
+            return topic.generation
+
+    def wait(self, key: TopicKey, generation: int, timeout: Optional[float] = None) -> bool:
+        """Block until ``key`` moves past ``generation``. False on timeout."""
+        name = os.fspath(key)
+        with self._cond:
+            topic = self._topic(name)
+            topic.waiting += 1
+            try:
+                return self._cond.wait_for(lambda: topic.generation != generation, timeout)
+            finally:
+                topic.waiting -= 1
+                topic.last_interest = time.monotonic()
+
+    async def wait_async(
+        self, key: TopicKey, generation: int, timeout: Optional[float] = None
+    ) -> bool:
+        """``wait`` for asyncio code: suspends the task, never a thread."""
+        name = os.fspath(key)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        entry = (loop, future)
+        with self._lock:
+            topic = self._topic(name)
+            if topic.generation != generation:
+                return True
+            topic.async_waiters.add(entry)
+            topic.waiting += 1
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                topic.async_waiters.discard(entry)
+                topic.waiting -= 1
+                topic.last_interest = time.monotonic()
+
+    # -- internals -------------------------------------------------------------
+
+    def _topic(self, name: str) -> _Topic:
+        topic = self._topics.get(name)
+        if topic is None:
+            self._reap()
+            topic = self._topics[name] = _Topic(self._clock)
+        return topic
+
+    def _reap(self) -> None:
+        """Forget topics nobody has waited on or asked about lately."""
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [
+            name
+            for name, topic in self._topics.items()
+            if topic.waiting == 0 and topic.watcher is None and topic.last_interest < cutoff
+        ]
+        for name in idle:
+            del self._topics[name]
+
+    def _bump(self, name: str) -> None:
+        with self._cond:
+            self._clock += 1
+            topic = self._topics.get(name)
+            if topic is None:
+                return  # nobody is interested; a later reader starts past this
+            topic.generation = self._clock
+            self._cond.notify_all()
+            waiters = list(topic.async_waiters)
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, future)
+            except RuntimeError:
+                pass  # loop already closed; its waiter is gone
+
+    def _watch(self, name: str, topic: _Topic) -> None:
+        signal_path = topic.signal_path
+        assert signal_path is not None
+        watch: Optional[_Inotify] = None
+        try:
+            while True:
+                with self._lock:
+                    idle = time.monotonic() - topic.last_interest > self.idle_timeout
+                    if idle and topic.waiting == 0:
+                        topic.watcher = None
+                        return
+                if self.use_inotify:
+                    if watch is None:
+                        watch = _Inotify.open(signal_path)
+                    if watch is None:
+                        time.sleep(self.poll_interval)
+                    elif watch.wait(1.0):
+                        # The file was replaced or removed; watch the new one.
+                        watch.close()
+                        watch = None
+                else:
+                    time.sleep(self.poll_interval)
+
+                token = _read_signal(signal_path)
+                if token is None:
+                    continue
+                with self._lock:
+                    if token == topic.last_token:
+                        continue
+                    topic.last_token = token
+                self._bump(name)
+        except Exception:  # pragma: no cover - defensive: never kill the process
+            logger.warning("Event notifier watcher for %s stopped", name, exc_info=True)
+            with self._lock:
+                topic.watcher = None
+        finally:
+            if watch is not None:
+                watch.close()
+
+
+def _resolve(future: "asyncio.Future") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _write_signal(path: Path, token: str) -> None:
+    data = token.encode()[:_TOKEN_WIDTH].ljust(_TOKEN_WIDTH)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o644)
+    except OSError as exc:
+        logger.debug("Could not open event signal file %s: %s", path, exc)
+        return
+    try:
+        os.pwrite(fd, data, 0)
+    except OSError as exc:
+        logger.debug("Could not write event signal file %s: %s", path, exc)
+    finally:
+        os.close(fd)
+
+
+def _read_signal(path: Path) -> Optional[str]:
+    try:
+        with open(path, "rb") as fh:
+            return fh.read(_TOKEN_WIDTH).decode(errors="replace").strip() or None
+    except OSError:
+        return None
+
+
+class _Inotify:
+    """Minimal ctypes inotify watch on one file (Linux only)."""
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_IGNORED = 0x00008000
+    _EVENT = struct.Struct("iIII")
+
+    _libc = None
+
+    @classmethod
+    def available(cls) -> bool:
+        if not sys.platform.startswith("linux"):
+            return False
+        if cls._libc is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+                libc.inotify_init1  # noqa: B018 - probe the symbol
+                libc.inotify_add_watch  # noqa: B018
+            except (OSError, AttributeError):
+                return False
+            cls._libc = libc
+        return True
+
+    @classmethod
+    def open(cls, path: Path) -> Optional["_Inotify"]:
+        if not cls.available():
+            return None
+        try:
+            # inotify needs the file to exist; an empty one reads as "no token".
+            os.close(os.open(path, os.O_WRONLY | os.O_CREAT, 0o644))
+        except OSError:
+            return None
+        fd = cls._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        mask = (
+            cls.IN_MODIFY
+            | cls.IN_ATTRIB
+            | cls.IN_CLOSE_WRITE
+            | cls.IN_DELETE_SELF
+            | cls.IN_MOVE_SELF
+        )
+        if cls._libc.inotify_add_watch(fd, os.fsencode(path), mask) < 0:
+            os.close(fd)
+            return None
+        return cls(fd)
+
+    def __init__(self, fd: int) -> None:
+        self.fd = fd
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for a change. Returns True if the watch is gone and must be reopened."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        gone = False
+        while True:
+            try:
+                buf = os.read(self.fd, 4096)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset + self._EVENT.size <= len(buf):
+                _, mask, _, length = self._EVENT.unpack_from(buf, offset)
+                if mask & (self.IN_DELETE_SELF | self.IN_MOVE_SELF | self.IN_IGNORED):
+                    gone = True
+                offset += self._EVENT.size + length
+        return gone
+
+    def close(self) -> None:
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+_notifier: Optional[EventNotifier] = None
+_notifier_lock = threading.Lock()
+
+
+def get_notifier() -> EventNotifier:
+    """The process-wide notifier shared by the event log and EventPublisher."""
+    global _notifier
+    if _notifier is None:
+        with _notifier_lock:
+            if _notifier is None:
+                _notifier = EventNotifier()
+    return _notifier
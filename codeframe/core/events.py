@@ -8,8 +8,14 @@ Provides an append-only event log for workspace activity. Events are:
 This module is headless - no FastAPI or HTTP dependencies.
 """
 
+import atexit
 import json
+import logging
+import os
+import queue
 import sqlite3
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,7 +23,10 @@ from typing import Any, Iterator, Optional
 
 from rich.console import Console
 
-from codeframe.core.workspace import get_workspace, get_db_connection, Workspace
+from codeframe.core.event_notifier import get_notifier
+from codeframe.core.workspace import get_cached_workspace, get_db_connection, Workspace
+
+logger = logging.getLogger(__name__)
 
 
 def _utc_now() -> datetime:
@@ -167,41 +176,12 @@ def emit(
     Returns:
         The created Event object
     """
-    payload = payload or {}
-    now = _utc_now().isoformat()
-    payload_json = json.dumps(payload)
-
-    # Find workspace database
-    # For now, we need the repo_path to find the DB. In future, we could cache this.
     if repo_path is None:
         # Try current directory
         repo_path = Path.cwd()
 
-    workspace = get_workspace(repo_path)
-    conn = get_db_connection(workspace)
-    try:
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO events (workspace_id, event_type, payload, created_at) VALUES (?, ?, ?, ?)",
-            (workspace_id, event_type, payload_json, now),
-        )
-        event_id = cursor.lastrowid
-        conn.commit()
-    finally:
-        conn.close()
-
-    event = Event(
-        id=event_id,
-        workspace_id=workspace_id,
-        event_type=event_type,
-        payload=payload,
-        created_at=datetime.fromisoformat(now),
-    )
-
-    if print_event:
-        _print_event(event)
-
-    return event
+    workspace = get_cached_workspace(repo_path)
+    return _record(workspace, workspace_id, event_type, payload, print_event)
 
 
 def emit_for_workspace(
@@ -224,36 +204,259 @@ def emit_for_workspace(
     Returns:
         The created Event object
     """
+    return _record(workspace, workspace.id, event_type, payload, print_event)
+
+
+_INSERT_EVENT = (
+    "INSERT INTO events (workspace_id, event_type, payload, created_at) VALUES (?, ?, ?, ?)"
+)
+
+
+def _record(
+    workspace: Workspace,
+    workspace_id: str,
+    event_type: str,
+    payload: Optional[dict[str, Any]],
+    print_event: bool,
+) -> Event:
     payload = payload or {}
     now = _utc_now().isoformat()
     payload_json = json.dumps(payload)
 
-    conn = get_db_connection(workspace)
-    try:
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO events (workspace_id, event_type, payload, created_at) VALUES (?, ?, ?, ?)",
-            (workspace.id, event_type, payload_json, now),
-        )
-        event_id = cursor.lastrowid
-        conn.commit()
-    finally:
-        conn.close()
-
     event = Event(
-        id=event_id,
-        workspace_id=workspace.id,
+        id=0,
+        workspace_id=workspace_id,
         event_type=event_type,
         payload=payload,
         created_at=datetime.fromisoformat(now),
     )
 
+    row = (workspace_id, event_type, payload_json, now)
+    writer = _active_writer()
+    if writer is None or not writer.submit(workspace, row, event):
+        conn = get_db_connection(workspace)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(_INSERT_EVENT, row)
+            event.id = cursor.lastrowid
+            conn.commit()
+        finally:
+            conn.close()
+        _notify_committed(workspace, event.id)
+
     if print_event:
         _print_event(event)
 
     return event
 
 
+# ---------------------------------------------------------------------------
+# Buffered (group-commit) writes
+# ---------------------------------------------------------------------------
+#
+# Every emit is otherwise its own INSERT + COMMIT, so under a parallel batch
+# the events table is the busiest writer in state.db: each ReactAgent
+# iteration and tool call takes the write lock and pays an fsync. Buffered mode
+# hands the row to a background thread that commits whatever has accumulated
+# — up to ``max_batch`` rows or ``flush_interval`` seconds — in one
+# transaction.
+#
+# Opt-in (``enable_buffered_writes()`` or CODEFRAME_EVENT_BUFFER=1) because it
+# changes two visible things: a buffered event's ``id`` is 0 until its batch
+# commits (the writer fills it in afterwards), and a reader can lag the emitter
+# by up to one flush interval. Tests that read events back call ``flush()``.
+
+#: Truthy value enables buffered event writes for the process on first emit.
+EVENT_BUFFER_ENV = "CODEFRAME_EVENT_BUFFER"
+
+_STOP = object()
+
+
+class _FlushMarker:
+    __slots__ = ("done",)
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+def _commits_now(item: object) -> bool:
+    return item is _STOP or isinstance(item, _FlushMarker)
+
+
+class BufferedEventWriter:
+    """Background writer that commits queued events in multi-row transactions.
+
+    Args:
+        flush_interval: Seconds to keep collecting after the first queued
+            event before committing the batch.
+        max_batch: Commit as soon as this many events are collected.
+        max_queue: Queue capacity. A full queue blocks ``submit`` until the
+            writer catches up (back-pressure) rather than growing without
+            bound or dropping events.
+    """
+
+    def __init__(
+        self,
+        *,
+        flush_interval: float = 0.05,
+        max_batch: int = 500,
+        max_queue: int = 10_000,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="codeframe-event-writer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def alive(self) -> bool:
+        return not self._closed and self._thread.is_alive()
+
+    def submit(self, workspace: Workspace, row: tuple, event: Event) -> bool:
+        """Queue one row for the next group commit.
+
+        Blocks while the queue is full. Returns False if the writer is closed,
+        in which case the caller must write the row itself.
+        """
+        if not self.alive:
+            return False
+        self._queue.put((workspace, row, event))
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every event submitted before this call is committed.
+
+        Returns False if ``timeout`` elapsed first.
+        """
+        if not self.alive:
+            return True
+        marker = _FlushMarker()
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Commit outstanding events and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            # Collect until the batch is full, the interval lapses, or a flush
+            # or stop request arrives — those commit immediately.
+            while len(items) < self.max_batch and not _commits_now(items[-1]):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            stop = items[-1] is _STOP
+            if stop:
+                # Anything that raced past close()'s alive check.
+                while True:
+                    try:
+                        items.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+            self._write([i for i in items if isinstance(i, tuple)])
+            for item in items:
+                if isinstance(item, _FlushMarker):
+                    item.done.set()
+            if stop:
+                return
+
+    def _write(self, batch: list) -> None:
+        # Group by database, keeping per-database submission order.
+        by_db: dict[Path, list] = {}
+        for entry in batch:
+            by_db.setdefault(entry[0].db_path, []).append(entry)
+        for entries in by_db.values():
+            try:
+                conn = get_db_connection(entries[0][0])
+                try:
+                    cursor = conn.cursor()
+                    for _, row, event in entries:
+                        cursor.execute(_INSERT_EVENT, row)
+                        event.id = cursor.lastrowid
+                    conn.commit()
+                finally:
+                    conn.close()
+                _notify_committed(entries[0][0], entries[-1][2].id)
+            except Exception:
+                # Same contract as ReactAgent._emit: losing telemetry must never
+                # take down the run. Unwritten events keep id 0.
+                for _, _, event in entries:
+                    event.id = 0
+                logger.warning(
+                    "Dropped %d buffered event(s) for %s",
+                    len(entries),
+                    entries[0][0].db_path,
+                    exc_info=True,
+                )
+
+
+_writer: Optional[BufferedEventWriter] = None
+_writer_lock = threading.Lock()
+_env_checked = False
+
+
+def enable_buffered_writes(**options: Any) -> BufferedEventWriter:
+    """Switch this process to buffered event writes; returns the writer.
+
+    Idempotent while a writer is running. Options are passed to
+    :class:`BufferedEventWriter`. Outstanding events are flushed at interpreter
+    exit, including after an unhandled exception; a SIGKILL loses at most one
+    flush interval of events.
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None or not _writer.alive:
+            _writer = BufferedEventWriter(**options)
+        return _writer
+
+
+def disable_buffered_writes() -> None:
+    """Flush outstanding events and return to one commit per emit."""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close()
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """Block until all buffered events are committed. No-op when unbuffered."""
+    writer = _writer
+    if writer is None:
+        return True
+    return writer.flush(timeout)
+
+
+def _active_writer() -> Optional[BufferedEventWriter]:
+    global _env_checked
+    if not _env_checked:
+        _env_checked = True
+        if os.environ.get(EVENT_BUFFER_ENV, "").strip().lower() in {"1", "true", "yes", "on"}:
+            enable_buffered_writes()
+    writer = _writer
+    if writer is not None and writer.alive:
+        return writer
+    return None
+
+
+atexit.register(disable_buffered_writes)
+
+
 def list_recent(
     workspace: Workspace,
     limit: int = 20,
@@ -317,37 +520,120 @@ def list_recent(
     ]
 
 
+# ---------------------------------------------------------------------------
+# Change notification
+# ---------------------------------------------------------------------------
+#
+# Readers wait on the shared EventNotifier instead of polling state.db; see
+# event_notifier for the protocol. The topic is the workspace DB path and the
+# cross-process signal is a small file next to it, rewritten with the newest
+# event id after every commit.
+
+#: Signal file in ``.codeframe/`` rewritten after each event commit.
+EVENTS_SIGNAL_FILE = "events.signal"
+
+
+def _topic(workspace: Workspace) -> tuple[str, Path]:
+    return str(workspace.db_path), workspace.state_dir / EVENTS_SIGNAL_FILE
+
+
+def _notify_committed(workspace: Workspace, last_event_id: int) -> None:
+    key, signal_path = _topic(workspace)
+    try:
+        get_notifier().notify(key, str(last_event_id), signal_path=signal_path)
+    except Exception:  # pragma: no cover - notification is best-effort
+        logger.debug("Event notification failed", exc_info=True)
+
+
+def change_generation(workspace: Workspace) -> int:
+    """Event-log generation for ``workspace``; take it before querying.
+
+    Pass the result to :func:`wait_for_change` / :func:`wait_for_change_async`
+    after a query that found nothing new.
+    """
+    key, signal_path = _topic(workspace)
+    return get_notifier().generation(key, signal_path=signal_path)
+
+
+def wait_for_change(
+    workspace: Workspace, generation: int, timeout: Optional[float] = None
+) -> bool:
+    """Block until an event is committed after ``generation`` was taken.
+
+    Woken directly by emitters in this process and through the signal file by
+    emitters in others. Returns False on timeout.
+    """
+    key, _ = _topic(workspace)
+    return get_notifier().wait(key, generation, timeout)
+
+
+async def wait_for_change_async(
+    workspace: Workspace, generation: int, timeout: Optional[float] = None
+) -> bool:
+    """:func:`wait_for_change` for asyncio code (long-poll endpoints)."""
+    key, _ = _topic(workspace)
+    return await get_notifier().wait_async(key, generation, timeout)
+
+
+def _list_after(workspace: Workspace, since_id: int, limit: int) -> list[Event]:
+    """Events with id > since_id, OLDEST first (what a tail must replay)."""
+    conn = get_db_connection(workspace)
+    try:
+        rows = conn.execute(
+            """
+            SELECT id, workspace_id, event_type, payload, created_at
+            FROM events
+            WHERE workspace_id = ? AND id > ?
+            ORDER BY id ASC
+            LIMIT ?
+            """,
+            (workspace.id, since_id, limit),
+        ).fetchall()
+    finally:
+        conn.close()
+    return [
+        Event(
+            id=row[0],
+            workspace_id=row[1],
+            event_type=row[2],
+            payload=json.loads(row[3]) if row[3] else {},
+            created_at=datetime.fromisoformat(row[4]),
+        )
+        for row in rows
+    ]
+
+
 def tail(
     workspace: Workspace,
     since_id: int = 0,
+    *,
+    max_wait: float = 30.0,
 ) -> Iterator[Event]:
     """Tail the event log, yielding new events.
 
-    This is a generator that yields events as they appear.
-    Note: This is a simple polling implementation. For real-time,
-    consider using a file watcher or database triggers.
+    This is a generator that yields events as they appear. It queries the
+    database only when woken by a commit (see :func:`wait_for_change`), so an
+    idle tail costs nothing; ``max_wait`` is just a safety-net re-check.
 
     Args:
         workspace: Workspace to tail
         since_id: Start after this event ID
+        max_wait: Longest sleep between checks when no wake-up arrives
 
     Yields:
-        Event objects as they are recorded
+        Event objects as they are recorded, oldest first
     """
-    import time
-
+    page = 200
     last_id = since_id
 
     while True:
-        events = list_recent(workspace, limit=50, since_id=last_id)
-
-        # Events are returned newest-first, so reverse for chronological order
-        for event in reversed(events):
-            if event.id > last_id:
-                last_id = event.id
-                yield event
-
-        time.sleep(0.5)  # Poll interval
+        generation = change_generation(workspace)
+        batch = _list_after(workspace, last_id, page)
+        for event in batch:
+            last_id = event.id
+            yield event
+        if len(batch) < page:
+            wait_for_change(workspace, generation, timeout=max_wait)
 
 
 def print_event(event: Event) -> None:
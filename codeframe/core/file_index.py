@@ -0,0 +1,391 @@
+"""Persistent index of the files in a workspace tree.
+
+Context loading (``ContextLoader``) and the agent's ``list_files`` and
+``search_codebase`` tools all need "every non-ignored file under the repo".
+Each used to get it from its own ``os.walk``, testing every path against every
+ignore pattern with ``fnmatch`` — per task load and per tool call. In a large
+monorepo that walk dominates a ReAct iteration.
+
+``FileIndex`` walks once and then refreshes incrementally:
+
+- the ignore patterns are compiled into one regular expression, so a path is
+  tested with a single ``match`` instead of two ``fnmatch`` calls per pattern;
+- each directory's listing is stored with its mtime. Adding, removing or
+  renaming an entry changes the directory's mtime, so a directory whose mtime
+  is unchanged is reused without ``scandir``, ``stat`` or matching. A refresh
+  of an unchanged tree is one ``stat`` per directory;
+- directories modified within ``_RACY_NS`` of the previous refresh are
+  rescanned regardless, because a filesystem with coarse timestamps can change
+  a directory twice within one mtime tick (git's "racy" entries, same fix).
+
+In-place edits do not change the directory, so a reused entry's ``size_bytes``
+and ``mtime_ns`` can lag behind the file until its directory changes. Treat
+the index as a path listing: consumers that report sizes (``list_files``,
+``ContextLoader``) stat the entries they return, and the search and relevance
+indexes stat before trusting their own cached contents.
+
+The index is kept per process (``for_root``) and, for a workspace root with a
+``.codeframe/`` state dir, persisted to ``.codeframe/file_index.json`` so a new
+process starts warm (see ``_SAVE_AFTER_DIRS`` for how often). Task worktrees
+have no state dir and keep the index in memory only — writing one into the
+worktree could end up in the task's commit.
+
+This module is headless - no FastAPI or HTTP dependencies.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from codeframe.core.atomic_io import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+#: File under the workspace state dir that holds the persisted index.
+FILE_INDEX_NAME = "file_index.json"
+
+#: Bumped when the persisted layout changes; older files are ignored.
+_FORMAT_VERSION = 1
+
+#: A directory modified this close to the previous refresh is rescanned even
+#: if its mtime matches (2s covers FAT and other coarse-timestamp filesystems).
+_RACY_NS = 2_000_000_000
+
+#: Rewrite the persisted index once this many directories have been rescanned
+#: since the last write. It only has to be close — the next process refreshes
+#: it incrementally — so rewriting the whole file for every edit would cost
+#: more than it saves.
+_SAVE_AFTER_DIRS = 64
+
+
+class IgnoreMatcher:
+    """Ignore patterns compiled into a single regular expression.
+
+    Same semantics as testing each pattern with ``fnmatch`` against both the
+    relative path and the basename, which is what the per-call walkers did.
+    A directory is tested with a trailing slash as well, so ``build/*``
+    prunes a ``build`` directory at any depth without descending into it.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = tuple(patterns)
+        if self.patterns:
+            self._regex: Optional[re.Pattern] = re.compile(
+                "|".join(fnmatch.translate(p) for p in self.patterns)
+            )
+        else:
+            self._regex = None
+
+    def matches(self, rel_path: str) -> bool:
+        """True if a file at ``rel_path`` (POSIX separators) is ignored."""
+        if self._regex is None:
+            return False
+        match = self._regex.match
+        return bool(match(rel_path) or match(rel_path.rpartition("/")[2]))
+
+    def matches_dir(self, rel_path: str) -> bool:
+        """True if the directory at ``rel_path`` should not be descended."""
+        if self._regex is None:
+            return False
+        name = rel_path.rpartition("/")[2]
+        match = self._regex.match
+        return bool(
+            match(rel_path) or match(rel_path + "/")
+            or match(name) or match(name + "/")
+        )
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """One indexed file.
+
+    Attributes:
+        path: Relative path from the root, POSIX separators
+        size_bytes: Size when the entry was last refreshed
+        mtime_ns: Modification time when the entry was last refreshed
+        extension: Lowercased extension including the dot ("" if none)
+        is_link: The entry is a symlink (its target may lie outside the root)
+    """
+
+    path: str
+    size_bytes: int
+    mtime_ns: int
+    extension: str
+    is_link: bool = False
+
+
+@dataclass
+class _DirState:
+    mtime_ns: int
+    subdirs: list[str]
+    files: list[str]
+
+
+def _join(parent: str, name: str) -> str:
+    return f"{parent}/{name}" if parent else name
+
+
+class FileIndex:
+    """Incrementally refreshed listing of the non-ignored files under ``root``.
+
+    Thread-safe: ``refresh`` serialises on an internal lock, and ``files``
+    returns an immutable snapshot.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        ignore_patterns: Iterable[str],
+        state_path: Optional[Path] = None,
+    ):
+        self.root = Path(root)
+        self.matcher = IgnoreMatcher(ignore_patterns)
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self._dirs: dict[str, _DirState] = {}
+        self._files: dict[str, FileEntry] = {}
+        self._sorted: Optional[tuple[FileEntry, ...]] = None
+        self._refreshed_ns = 0
+        self._persisted = False
+        self._unsaved_dirs = 0
+        if state_path is not None:
+            self._load()
+
+    # -- public API ----------------------------------------------------------
+
+    def files(self, refresh: bool = True) -> tuple[FileEntry, ...]:
+        """Every indexed file, sorted by path.
+
+        Args:
+            refresh: Bring the index up to date first (the default). Pass
+                False to reuse the last refresh, e.g. within one operation.
+        """
+        if refresh:
+            self.refresh()
+        with self._lock:
+            if self._sorted is None:
+                self._sorted = tuple(
+                    self._files[p] for p in sorted(self._files)
+                )
+            return self._sorted
+
+    def refresh(self) -> bool:
+        """Bring the index up to date with the tree.
+
+        Returns:
+            True if any listing changed
+        """
+        with self._lock:
+            started = time.time_ns()
+            changed, rescanned = self._refresh_locked()
+            # The scan's START time: a directory modified while it ran is
+            # newer than this and will be treated as racy next time.
+            self._refreshed_ns = started
+            if changed:
+                self._sorted = None
+                self._unsaved_dirs += rescanned
+            if self._unsaved_dirs and (
+                not self._persisted or self._unsaved_dirs >= _SAVE_AFTER_DIRS
+            ):
+                self._save()
+            return changed
+
+    # -- internals -----------------------------------------------------------
+
+    def _refresh_locked(self) -> tuple[bool, int]:
+        """Walk the directories, rescanning the ones that changed, in place.
+
+        Returns:
+            (whether any listing changed, number of directories rescanned)
+        """
+        dirs, files = self._dirs, self._files
+        visited: set[str] = set()
+        changed = False
+        rescanned = 0
+        reuse_before = self._refreshed_ns - _RACY_NS
+
+        stack = [""]
+        while stack:
+            rel = stack.pop()
+            try:
+                mtime_ns = os.stat(self.root / rel).st_mtime_ns
+            except OSError:
+                continue
+            visited.add(rel)
+
+            state = dirs.get(rel)
+            if state is None or state.mtime_ns != mtime_ns or mtime_ns >= reuse_before:
+                rescanned += 1
+                new_state, entries = self._scan_dir(rel, mtime_ns)
+                if new_state != state or any(
+                    files.get(path) != entry for path, entry in entries.items()
+                ):
+                    changed = True
+                    if state is not None:
+                        for name in state.files:
+                            files.pop(_join(rel, name), None)
+                    files.update(entries)
+                dirs[rel] = state = new_state
+            stack.extend(_join(rel, name) for name in state.subdirs)
+
+        # Directories that were deleted, or are now ignored or unreachable.
+        for rel in [rel for rel in dirs if rel not in visited]:
+            for name in dirs.pop(rel).files:
+                files.pop(_join(rel, name), None)
+            changed = True
+
+        return changed, rescanned
+
+    def _scan_dir(self, rel: str, mtime_ns: int) -> tuple[_DirState, dict[str, FileEntry]]:
+        subdirs: list[str] = []
+        names: list[str] = []
+        entries: dict[str, FileEntry] = {}
+        try:
+            iterator = os.scandir(self.root / rel)
+        except OSError:
+            return _DirState(mtime_ns, [], []), {}
+        with iterator:
+            for item in iterator:
+                path = _join(rel, item.name)
+                try:
+                    # Directory symlinks are listed by os.walk but never
+                    # entered; skip them outright, as before.
+                    if item.is_dir(follow_symlinks=False):
+                        if not self.matcher.matches_dir(path):
+                            subdirs.append(item.name)
+                        continue
+                    if item.is_dir():
+                        continue
+                    if self.matcher.matches(path):
+                        continue
+                    st = item.stat()
+                except OSError:
+                    continue  # vanished mid-scan, or a dangling symlink
+                names.append(item.name)
+                entries[path] = FileEntry(
+                    path=path,
+                    size_bytes=st.st_size,
+                    mtime_ns=st.st_mtime_ns,
+                    extension=os.path.splitext(item.name)[1].lower(),
+                    is_link=item.is_symlink(),
+                )
+        subdirs.sort()
+        names.sort()
+        return _DirState(mtime_ns, subdirs, names), entries
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _FORMAT_VERSION
+            or data.get("root") != str(self.root)
+            or tuple(data.get("patterns", ())) != self.matcher.patterns
+        ):
+            return
+        try:
+            self._dirs = {
+                rel: _DirState(mtime, list(subdirs), list(files))
+                for rel, (mtime, subdirs, files) in data["dirs"].items()
+            }
+            self._files = {
+                path: FileEntry(path, size, mtime, ext, bool(link))
+                for path, (size, mtime, ext, link) in data["files"].items()
+            }
+            self._refreshed_ns = int(data["refreshed_ns"])
+            self._persisted = True
+        except (KeyError, TypeError, ValueError):
+            self._dirs, self._files, self._refreshed_ns = {}, {}, 0
+
+    def _save(self) -> None:
+        if self.state_path is None:
+            self._unsaved_dirs = 0
+            return
+        payload = {
+            "version": _FORMAT_VERSION,
+            "root": str(self.root),
+            "patterns": list(self.matcher.patterns),
+            "refreshed_ns": self._refreshed_ns,
+            "dirs": {
+                rel: [s.mtime_ns, s.subdirs, s.files] for rel, s in self._dirs.items()
+            },
+            "files": {
+                path: [e.size_bytes, e.mtime_ns, e.extension, int(e.is_link)]
+                for path, e in self._files.items()
+            },
+        }
+        try:
+            # Compact, not atomic_write_json's indented form: this file is
+            # large and only ever read back by _load.
+            atomic_write_text(self.state_path, json.dumps(payload, separators=(",", ":")))
+            self._persisted = True
+            self._unsaved_dirs = 0
+        except OSError as exc:
+            # The in-memory index still works; only the next process pays.
+            logger.debug("Could not persist file index %s: %s", self.state_path, exc)
+
+
+def state_file(root: Path, name: str) -> Optional[Path]:
+    """Where to persist an index of ``root``, or None to keep it in memory.
+
+    Only a root with its own ``.codeframe/`` state dir (a workspace) gets a
+    file. A task worktree has none, and creating one there could put the
+    index into the task's commit.
+    """
+    state_dir = root / ".codeframe"
+    if state_dir.is_dir() and not state_dir.is_symlink():
+        return state_dir / name
+    return None
+
+
+#: Indexes kept per process. Each task worktree gets its own, so a long-lived
+#: server would otherwise accumulate one per task ever run.
+_MAX_INDEXES = 16
+
+_indexes: OrderedDict[tuple[str, tuple[str, ...]], FileIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def for_root(root: Path, ignore_patterns: Optional[Iterable[str]] = None) -> FileIndex:
+    """The shared index for ``root`` and ``ignore_patterns``.
+
+    Args:
+        root: Tree to index (a workspace repo or a task worktree)
+        ignore_patterns: fnmatch patterns; defaults to the context loader's
+            ``DEFAULT_IGNORE_PATTERNS``
+
+    Returns:
+        The process-wide FileIndex for that pair, created on first use
+    """
+    # Deferred: context imports this module.
+    from codeframe.core.context import DEFAULT_IGNORE_PATTERNS
+
+    root = Path(root).resolve()
+    patterns = tuple(DEFAULT_IGNORE_PATTERNS if ignore_patterns is None else ignore_patterns)
+    key = (str(root), patterns)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            # Only the default patterns are persisted; one file per root.
+            state_path = None
+            if patterns == tuple(DEFAULT_IGNORE_PATTERNS):
+                state_path = state_file(root, FILE_INDEX_NAME)
+            index = FileIndex(root, patterns, state_path=state_path)
+            _indexes[key] = index
+            while len(_indexes) > _MAX_INDEXES:
+                _indexes.popitem(last=False)
+        else:
+            _indexes.move_to_end(key)
+        return index
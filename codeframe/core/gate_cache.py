@@ -0,0 +1,348 @@
+"""Content-addressed cache of verification gate results.
+
+A gate's verdict is a function of its inputs: the working tree, the tool that
+ran, the config that tool reads and, for pytest, the ``-k`` selector. When none
+of those changed since the last run, running the gate again only costs time —
+a conductor retry, ``cf proof run`` right after ``cf work start``, or batch
+validation right after per-task validation all re-verified an identical tree.
+
+Entries live under ``.codeframe/gate_cache/`` as one JSON file per key. The key
+hashes:
+
+- the gate name, the verbosity and per-test reporting (they change what is
+  stored) and the selector,
+- a *tree fingerprint*: the index (``git ls-files --stage``, i.e. the blob id of
+  every tracked file) plus the content of every modified, deleted or untracked
+  file ``git status`` reports. No objects are written to the repository;
+- a *tool fingerprint*: path, size and mtime of each binary the gate can
+  resolve to. A cheap stand-in for ``--version``, which costs a process spawn
+  per gate (``uv run pytest --version`` alone is hundreds of ms) and would
+  defeat the point;
+- the gate's config and lock files, read directly, so a gitignored config
+  (or one outside the index) still invalidates.
+
+Only PASSED and FAILED are cached. SKIPPED usually means a tool was missing and
+ERROR a timeout or crash; neither is a property of the tree. A repository that
+is not a git checkout gets no fingerprint, so nothing is cached.
+
+Eviction is least-recently-used: a hit touches the entry's mtime, and each
+store trims the directory to ``max_entries`` files and ``max_bytes`` total.
+
+This module is headless - no FastAPI or HTTP dependencies.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from codeframe.core.agent_env import build_agent_env
+from codeframe.core.atomic_io import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+#: Directory under the workspace state dir that holds the entries.
+GATE_CACHE_DIRNAME = "gate_cache"
+
+#: Set to 0/false/no/off to disable the cache for the process.
+GATE_CACHE_ENV = "CODEFRAME_GATE_CACHE"
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+#: Bumped when the key derivation or the entry layout changes.
+_FORMAT_VERSION = 1
+
+#: Path components whose contents never feed a gate verdict: the workspace
+#: state dir (this cache lives there) and the tools' own caches. Without this,
+#: an untracked ``.codeframe/`` would change the fingerprint on every store.
+_VOLATILE_DIRS = frozenset({
+    ".codeframe", "__pycache__", ".pytest_cache", ".mypy_cache", ".ruff_cache",
+})
+
+_PYTHON_CONFIG = (
+    "pyproject.toml", "setup.cfg", "setup.py", "tox.ini",
+    "requirements.txt", "uv.lock", "poetry.lock",
+)
+_NODE_CONFIG = (
+    "package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml",
+    "tsconfig.json",
+)
+
+#: Files each gate reads besides the sources.
+_GATE_CONFIG_FILES: dict[str, tuple[str, ...]] = {
+    "pytest": _PYTHON_CONFIG + ("pytest.ini", "conftest.py"),
+    "ruff": ("pyproject.toml", "ruff.toml", ".ruff.toml"),
+    "mypy": ("pyproject.toml", "setup.cfg", "mypy.ini", ".mypy.ini"),
+    "bandit": ("pyproject.toml", ".bandit", "bandit.yaml"),
+    "python-build": _PYTHON_CONFIG,
+    "npm-test": _NODE_CONFIG,
+    "npm-lint": _NODE_CONFIG + (".eslintrc", ".eslintrc.js", ".eslintrc.json", "eslint.config.js"),
+    "tsc": _NODE_CONFIG,
+    "npm-build": _NODE_CONFIG,
+}
+
+#: Executables each gate can end up running; ``uv`` is added for every gate.
+_GATE_TOOLS: dict[str, tuple[str, ...]] = {
+    "pytest": ("pytest", "python"),
+    "ruff": ("ruff",),
+    "mypy": ("mypy", "python"),
+    "bandit": ("bandit",),
+    "python-build": ("python",),
+    "npm-test": ("npm", "node"),
+    "npm-lint": ("npm", "node", "eslint"),
+    "tsc": ("npx", "node", "tsc"),
+    "npm-build": ("npm", "node"),
+}
+
+_CACHEABLE_STATUSES = frozenset({"PASSED", "FAILED"})
+
+_bypassed: ContextVar[bool] = ContextVar("gate_cache_bypassed", default=False)
+
+
+@contextmanager
+def bypassed() -> Iterator[None]:
+    """Run every ``gates.run`` inside the block without the cache.
+
+    For callers that reach the gates through another layer — ``cf proof run
+    --no-cache`` goes through the proof runner, which has no reason to carry a
+    cache flag of its own.
+    """
+    token = _bypassed.set(True)
+    try:
+        yield
+    finally:
+        _bypassed.reset(token)
+
+
+def cache_enabled() -> bool:
+    """Default for ``gates.run(use_cache=None)``.
+
+    False inside ``bypassed()`` or when CODEFRAME_GATE_CACHE is set to a falsy
+    value.
+    """
+    if _bypassed.get():
+        return False
+    raw = os.getenv(GATE_CACHE_ENV, "").strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+def _git(repo_path: Path, *args: str) -> Optional[bytes]:
+    """Run a read-only git command; None if git is missing or it fails."""
+    try:
+        result = subprocess.run(
+            # fsmonitor is repository config, i.e. something the agent can
+            # write — it must not get to run a command on every gate.
+            ["git", "-c", "core.fsmonitor=false", *args],
+            cwd=repo_path,
+            env=build_agent_env(repo_path),
+            capture_output=True,
+            timeout=60,
+        )
+    except (OSError, subprocess.SubprocessError) as exc:
+        logger.debug("git %s failed in %s: %s", args[0], repo_path, exc)
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _is_volatile(rel_path: str) -> bool:
+    return any(part in _VOLATILE_DIRS for part in rel_path.split("/"))
+
+
+def tree_fingerprint(repo_path: Path) -> Optional[str]:
+    """Hash of the tracked and dirty working tree, or None outside git.
+
+    The index listing already names every tracked file by blob id, so only
+    the files ``git status`` reports as different from it are read — on an
+    unchanged checkout this is two git calls and no file reads.
+    """
+    index = _git(repo_path, "ls-files", "--stage", "-z")
+    if index is None:
+        return None
+    status = _git(
+        repo_path, "status", "--porcelain=v1", "-z",
+        "--untracked-files=all", "--no-renames",
+    )
+    if status is None:
+        return None
+
+    digest = hashlib.sha256()
+    digest.update(index)
+    for entry in sorted(status.split(b"\0")):
+        if len(entry) < 4:
+            continue
+        rel_path = entry[3:].decode("utf-8", errors="surrogateescape")
+        if _is_volatile(rel_path):
+            continue
+        digest.update(b"\0" + entry[:2] + rel_path.encode("utf-8", errors="surrogateescape"))
+        path = repo_path / rel_path
+        try:
+            if path.is_symlink():
+                digest.update(b"L" + os.readlink(path).encode("utf-8", errors="surrogateescape"))
+            elif path.is_file():
+                digest.update(b"F" + hashlib.sha256(path.read_bytes()).digest())
+            else:
+                digest.update(b"D" if path.exists() else b"-")
+        except OSError:
+            digest.update(b"?")
+    return digest.hexdigest()
+
+
+def _tool_fingerprint(repo_path: Path, gate_name: str) -> list[list[Any]]:
+    """Identity of every binary the gate may run: (name, path, size, mtime)."""
+    parts: list[list[Any]] = []
+    for tool in (*_GATE_TOOLS.get(gate_name, ()), "uv"):
+        candidates = [
+            repo_path / ".venv" / "bin" / tool,
+            repo_path / "node_modules" / ".bin" / tool,
+        ]
+        found = shutil.which(tool)
+        if found:
+            candidates.append(Path(found))
+        for candidate in candidates:
+            try:
+                resolved = candidate.resolve(strict=True)
+                stat = resolved.stat()
+            except OSError:
+                continue
+            parts.append([tool, str(resolved), stat.st_size, stat.st_mtime_ns])
+    return parts
+
+
+def _config_fingerprint(repo_path: Path, gate_name: str) -> list[list[str]]:
+    parts: list[list[str]] = []
+    for name in _GATE_CONFIG_FILES.get(gate_name, ()):
+        try:
+            data = (repo_path / name).read_bytes()
+        except OSError:
+            continue
+        parts.append([name, hashlib.sha256(data).hexdigest()])
+    return parts
+
+
+def cache_key(
+    repo_path: Path,
+    gate_name: str,
+    tree: str,
+    *,
+    test_selector: Optional[str] = None,
+    verbose: bool = False,
+    test_cases: bool = False,
+) -> str:
+    """The content address of one gate run over ``tree``."""
+    material = {
+        "v": _FORMAT_VERSION,
+        "gate": gate_name,
+        "tree": tree,
+        "selector": test_selector if gate_name == "pytest" else None,
+        "verbose": verbose,
+        "test_cases": test_cases,
+        "tools": _tool_fingerprint(repo_path, gate_name),
+        "config": _config_fingerprint(repo_path, gate_name),
+    }
+    encoded = json.dumps(material, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class GateCache:
+    """LRU store of gate results, one JSON file per key.
+
+    Args:
+        cache_dir: Directory holding the entries (created on first store).
+        max_entries: Most entries kept after a store.
+        max_bytes: Most bytes kept after a store.
+
+    Every failure is logged and swallowed: a broken cache means the gate runs,
+    never that verification breaks.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def for_state_dir(cls, state_dir: Path) -> "GateCache":
+        return cls(Path(state_dir) / GATE_CACHE_DIRNAME)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """The stored check for ``key`` (marking it recently used), or None."""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.debug("Discarding unreadable gate cache entry %s: %s", path, exc)
+            self._unlink(path)
+            return None
+        if not isinstance(entry, dict) or entry.get("v") != _FORMAT_VERSION:
+            self._unlink(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("check")
+
+    def put(self, key: str, check: dict[str, Any]) -> None:
+        """Store ``check`` unless its status is not a verdict of the tree."""
+        if check.get("status") not in _CACHEABLE_STATUSES:
+            return
+        try:
+            atomic_write_json(self._path(key), {"v": _FORMAT_VERSION, "check": check})
+        except OSError as exc:
+            logger.debug("Could not store gate cache entry %s: %s", key, exc)
+            return
+        self._evict()
+
+    def clear(self) -> None:
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _evict(self) -> None:
+        entries: list[tuple[int, int, Path]] = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for item in it:
+                    if not item.name.endswith(".json"):
+                        continue
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, Path(item.path)))
+        except OSError:
+            return
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        count = len(entries)
+        for _, size, path in entries:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            self._unlink(path)
+            count -= 1
+            total -= size
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -12,6 +12,9 @@ import os
 import shutil
 import subprocess
 import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -20,7 +23,7 @@ from typing import Any, Callable, Optional
 
 from codeframe.core.agent_env import build_agent_env
 from codeframe.core.workspace import Workspace
-from codeframe.core import events
+from codeframe.core import dep_cache, events, gate_cache
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +107,12 @@ class GateCheck:
         output: Captured stdout/stderr
         duration_ms: How long the check took
         detailed_errors: Structured error list parsed from tool output
+        cached: Whether the verdict came from the gate result cache instead of
+            running the tool (see ``core/gate_cache.py``)
+        test_cases: Per-test outcomes from pytest's JUnit XML report, when
+            requested with ``collect_test_cases`` — dicts with ``classname``,
+            ``name`` and ``outcome`` (passed/failed/skipped). None when not
+            requested or no report was produced.
     """
 
     name: str
@@ -112,6 +121,8 @@ class GateCheck:
     output: str = ""
     duration_ms: int = 0
     detailed_errors: Optional[list[dict[str, Any]]] = None
+    cached: bool = False
+    test_cases: Optional[list[dict[str, str]]] = None
 
 
 @dataclass
@@ -189,7 +200,7 @@ class GateResult:
 
 
 def _install_python_requirements(
-    repo_path: Path, requirements_txt: Path
+    repo_path: Path, requirements_txt: Path, venv_path: Optional[Path] = None
 ) -> tuple[bool, str]:
     """Install a target repo's requirements into a venv *of its own* (#908).
 
@@ -207,8 +218,12 @@ def _install_python_requirements(
 
     Both are fixed by creating the venv first and pinning ``VIRTUAL_ENV`` to it,
     never to whatever the parent process happened to be using.
+
+    ``venv_path`` defaults to ``<repo>/.venv``; the dependency cache passes the
+    venv of a store entry instead (see ``core/dep_cache.py``).
     """
-    venv_path = repo_path / ".venv"
+    if venv_path is None:
+        venv_path = repo_path / ".venv"
 
     # NB: the repo has no venv at this point, so build_agent_env copies
     # VIRTUAL_ENV straight from the parent — CodeFRAME's own when `cf` is run
@@ -313,6 +328,64 @@ def _self_ignore(venv_path: Path) -> None:
         logger.debug("Could not write %s/.gitignore: %s", venv_path, exc)
 
 
+def _install_node_dependencies(repo_path: Path, node_modules: Path) -> tuple[bool, str]:
+    """``npm install`` producing ``node_modules``.
+
+    In the repo itself when ``node_modules`` is ``<repo>/node_modules``;
+    otherwise the manifest is copied next to ``node_modules`` and installed
+    there (a dependency cache entry).
+    """
+    project_dir = node_modules.parent
+    try:
+        if project_dir != repo_path:
+            for name in ("package.json", "package-lock.json", ".npmrc"):
+                if (repo_path / name).is_file():
+                    shutil.copy2(repo_path / name, project_dir / name)
+        result = subprocess.run(
+            ["npm", "install"],
+            cwd=project_dir,
+            env=build_agent_env(repo_path),
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=300,  # 5 minutes
+        )
+        if result.returncode == 0:
+            return True, "Installed Node dependencies via npm"
+        return False, f"Failed to install Node dependencies: {result.stderr}"
+    except Exception as e:
+        return False, f"Error installing Node dependencies: {e}"
+
+
+def _install_python_with_cache(repo_path: Path, requirements_txt: Path) -> tuple[bool, str]:
+    """Install Python dependencies, through the shared cache in a worktree."""
+    cache = dep_cache.for_repo(repo_path)
+    builder_id = "uv" if shutil.which("uv") else sys.version
+    key = dep_cache.python_key(repo_path, requirements_txt, builder_id) if cache else None
+    if cache is None or key is None:
+        return _install_python_requirements(repo_path, requirements_txt)
+    return cache.materialize(
+        key,
+        repo_path / ".venv",
+        lambda venv: _install_python_requirements(repo_path, requirements_txt, venv),
+        relocate=True,
+    )
+
+
+def _install_node_with_cache(repo_path: Path) -> tuple[bool, str]:
+    """Install Node dependencies, through the shared cache in a worktree."""
+    cache = dep_cache.for_repo(repo_path)
+    key = dep_cache.node_key(repo_path) if cache else None
+    if cache is None or key is None:
+        return _install_node_dependencies(repo_path, repo_path / "node_modules")
+    return cache.materialize(
+        key,
+        repo_path / "node_modules",
+        lambda node_modules: _install_node_dependencies(repo_path, node_modules),
+    )
+
+
 def _ensure_dependencies_installed(
     repo_path: Path,
     auto_install: bool = True,
@@ -323,6 +396,10 @@ def _ensure_dependencies_installed(
     - Python: If requirements.txt exists but no .venv/ or venv/ directory
     - Node.js: If package.json exists but no node_modules/ directory
 
+    In a linked worktree both go through the shared dependency cache
+    (``core/dep_cache.py``): one install per distinct lockfile, hardlinked into
+    every worktree that needs it.
+
     Args:
         repo_path: Path to the repository root
         auto_install: Whether to auto-install missing dependencies (default: True)
@@ -348,7 +425,7 @@ def _ensure_dependencies_installed(
             pip_bin = shutil.which("pip")
 
             if uv_bin or pip_bin:
-                ok, message = _install_python_requirements(repo_path, requirements_txt)
+                ok, message = _install_python_with_cache(repo_path, requirements_txt)
                 if not ok:
                     return False, message
                 messages.append(message)
@@ -368,23 +445,10 @@ def _ensure_dependencies_installed(
             npm_bin = shutil.which("npm")
 
             if npm_bin:
-                try:
-                    result = subprocess.run(
-                        ["npm", "install"],
-                        cwd=repo_path,
-                        env=build_agent_env(repo_path),
-                        capture_output=True,
-                        text=True,
-                        encoding="utf-8",
-                        errors="replace",
-                        timeout=300,  # 5 minutes
-                    )
-                    if result.returncode == 0:
-                        messages.append("Installed Node dependencies via npm")
-                    else:
-                        return False, f"Failed to install Node dependencies: {result.stderr}"
-                except Exception as e:
-                    return False, f"Error installing Node dependencies: {e}"
+                ok, message = _install_node_with_cache(repo_path)
+                if not ok:
+                    return False, message
+                messages.append(message)
             else:
                 messages.append("Node dependencies needed but npm not found")
     elif package_json.exists() and node_modules.exists():
@@ -402,9 +466,15 @@ def run(
     verbose: bool = False,
     auto_install_deps: bool = True,
     test_selector: Optional[str] = None,
+    max_cpu: Optional[int] = None,
+    use_cache: Optional[bool] = None,
+    collect_test_cases: bool = False,
 ) -> GateResult:
     """Run verification gates.
 
+    Independent gates run concurrently within a CPU budget (see
+    ``_schedule_gates``); ``checks`` always follows the order of ``gates``.
+
     Args:
         workspace: Target workspace
         gates: Specific gates to run (None = all available)
@@ -412,6 +482,16 @@ def run(
         auto_install_deps: Whether to auto-install missing dependencies before test gates (default: True)
         test_selector: Optional pytest ``-k`` keyword expression; only applies to
             the pytest gate. With a selector, "no tests matched" is a failure.
+        max_cpu: CPU slots the gates may occupy at once. None reads
+            CODEFRAME_GATE_MAX_CPU, falling back to the machine's CPU count;
+            1 runs the gates one after another.
+        use_cache: Reuse a stored verdict when the gate's inputs are unchanged
+            (see ``core/gate_cache.py``). None defers to
+            ``gate_cache.cache_enabled()`` — on unless CODEFRAME_GATE_CACHE
+            disables it; False always runs the tools.
+        collect_test_cases: Have the pytest gate report per-test outcomes in
+            ``GateCheck.test_cases`` (the PROOF9 runner resolves many evidence
+            rules from one run this way).
 
     Returns:
         GateResult with all check results
@@ -455,45 +535,47 @@ def run(
     if gates is None:
         gates = _detect_available_gates(repo_path)
 
-    # Known gate names
-    known_gates = {"pytest", "ruff", "bandit", "mypy", "npm-test", "npm-lint", "tsc", "python-build", "npm-build"}
-
-    # Run each gate
-    for gate_name in gates:
-        if gate_name == "pytest":
-            check = _run_pytest(repo_path, verbose, test_selector=test_selector)
-        elif gate_name == "ruff":
-            check = _run_ruff(repo_path, verbose)
-        elif gate_name == "bandit":
-            check = _run_bandit(repo_path, verbose)
-        elif gate_name == "mypy":
-            check = _run_mypy(repo_path, verbose)
-        elif gate_name == "npm-test":
-            check = _run_npm_test(repo_path, verbose)
-        elif gate_name == "npm-lint":
-            check = _run_npm_lint(repo_path, verbose)
-        elif gate_name == "tsc":
-            check = _run_tsc(repo_path, verbose)
-        elif gate_name == "python-build":
-            check = _run_python_build(repo_path, verbose)
-        elif gate_name == "npm-build":
-            check = _run_npm_build(repo_path, verbose)
-        else:
-            # Unknown gate: FAILED if explicitly requested, SKIPPED if auto-detected
-            if gates_explicitly_provided:
-                check = GateCheck(
-                    name=gate_name,
-                    status=GateStatus.FAILED,
-                    output=f"Unknown gate: {gate_name}. Valid gates: {', '.join(sorted(known_gates))}",
-                )
-            else:
-                check = GateCheck(
-                    name=gate_name,
-                    status=GateStatus.SKIPPED,
-                    output=f"Unknown gate: {gate_name}",
-                )
+    resolved_max_cpu = max_cpu if max_cpu is not None else _gate_max_cpu()
+
+    # The fingerprint is taken once, before any gate runs. Skipped after a
+    # failed dependency install: a verdict stored against a working
+    # environment says nothing about this one.
+    cache: Optional[gate_cache.GateCache] = None
+    tree: Optional[str] = None
+    if use_cache is None:
+        use_cache = gate_cache.cache_enabled()
+    if use_cache and dep_success:
+        tree = gate_cache.tree_fingerprint(repo_path)
+        if tree is not None:
+            cache = gate_cache.GateCache.for_state_dir(workspace.state_dir)
+
+    def run_one(gate_name: str) -> GateCheck:
+        key = None
+        if cache is not None and tree is not None and gate_name in _KNOWN_GATES:
+            key = gate_cache.cache_key(
+                repo_path, gate_name, tree,
+                test_selector=test_selector, verbose=verbose,
+                test_cases=collect_test_cases,
+            )
+            stored = cache.get(key)
+            if stored is not None:
+                try:
+                    return _check_from_cache(stored)
+                except (KeyError, TypeError, ValueError):
+                    logger.debug("Ignoring malformed gate cache entry %s", key)
+        check = _run_gate(
+            gate_name,
+            repo_path,
+            verbose,
+            test_selector=test_selector,
+            explicitly_requested=gates_explicitly_provided,
+            collect_test_cases=collect_test_cases,
+        )
+        if cache is not None and key is not None:
+            cache.put(key, _check_to_cache(check))
+        return check
 
-        checks.append(check)
+    checks.extend(_schedule_gates(gates, run_one, resolved_max_cpu))
 
     notes: list[str] = []
     if not dep_success:
@@ -525,7 +607,16 @@ def run(
         {
             "passed": passed,
             "summary": result.summary,
-            "checks": [{"name": c.name, "status": c.status.value} for c in checks],
+            "checks": [
+                {
+                    "name": c.name,
+                    "status": c.status.value,
+                    "duration_ms": c.duration_ms,
+                    "cached": c.cached,
+                }
+                for c in checks
+            ],
+            "duration_ms": int((completed_at - started_at).total_seconds() * 1000),
             # Diagnostics that are not gate verdicts (#909). Carried alongside
             # the checks so an event consumer still sees, e.g., that the
             # dependency install failed even when every gate passed.
@@ -537,6 +628,192 @@ def run(
     return result
 
 
+#: Every gate name ``run`` knows how to dispatch.
+_KNOWN_GATES = frozenset({
+    "pytest", "ruff", "bandit", "mypy", "npm-test", "npm-lint", "tsc",
+    "python-build", "npm-build",
+})
+
+#: Gates that must not overlap with any other gate. ``npm run build`` rewrites
+#: the output directories that npm-test, npm-lint and tsc read, and it is
+#: usually the heaviest process of the lot.
+_EXCLUSIVE_GATES = frozenset({"npm-build"})
+
+#: CPU slots a gate occupies while it runs; unlisted gates take one. The test
+#: runners fan out over several cores, the analysers are mostly one.
+_GATE_CPU_COST = {"pytest": 2, "npm-test": 2}
+
+#: Overrides the CPU budget for concurrent gates (1 = run sequentially).
+GATE_MAX_CPU_ENV = "CODEFRAME_GATE_MAX_CPU"
+
+
+def _gate_max_cpu() -> int:
+    """The CPU budget for one ``run`` — CODEFRAME_GATE_MAX_CPU or the CPU count.
+
+    A bad value warns rather than crashing: verification sits on the Golden
+    Path and a typo must not abort the run.
+    """
+    default = os.cpu_count() or 1
+    raw = os.getenv(GATE_MAX_CPU_ENV)
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning("%s=%r is not an integer; ignoring", GATE_MAX_CPU_ENV, raw)
+        return default
+    if value <= 0:
+        logger.warning("%s=%d must be positive; ignoring", GATE_MAX_CPU_ENV, value)
+        return default
+    return value
+
+
+def _gate_cost(gate_name: str, max_cpu: int) -> int:
+    """CPU slots ``gate_name`` holds, clamped so any gate can run on its own.
+
+    An exclusive gate takes the whole budget, which is what keeps everything
+    else from starting beside it.
+    """
+    if gate_name in _EXCLUSIVE_GATES:
+        return max_cpu
+    return min(_GATE_CPU_COST.get(gate_name, 1), max_cpu)
+
+
+def _run_gate(
+    gate_name: str,
+    repo_path: Path,
+    verbose: bool,
+    test_selector: Optional[str] = None,
+    explicitly_requested: bool = True,
+    collect_test_cases: bool = False,
+) -> GateCheck:
+    """Dispatch one gate by name.
+
+    An unknown gate is FAILED if it was explicitly requested and SKIPPED if it
+    came from auto-detection.
+    """
+    if gate_name == "pytest":
+        return _run_pytest(
+            repo_path, verbose,
+            test_selector=test_selector, collect_test_cases=collect_test_cases,
+        )
+    if gate_name == "ruff":
+        return _run_ruff(repo_path, verbose)
+    if gate_name == "bandit":
+        return _run_bandit(repo_path, verbose)
+    if gate_name == "mypy":
+        return _run_mypy(repo_path, verbose)
+    if gate_name == "npm-test":
+        return _run_npm_test(repo_path, verbose)
+    if gate_name == "npm-lint":
+        return _run_npm_lint(repo_path, verbose)
+    if gate_name == "tsc":
+        return _run_tsc(repo_path, verbose)
+    if gate_name == "python-build":
+        return _run_python_build(repo_path, verbose)
+    if gate_name == "npm-build":
+        return _run_npm_build(repo_path, verbose)
+    if explicitly_requested:
+        return GateCheck(
+            name=gate_name,
+            status=GateStatus.FAILED,
+            output=f"Unknown gate: {gate_name}. Valid gates: {', '.join(sorted(_KNOWN_GATES))}",
+        )
+    return GateCheck(
+        name=gate_name,
+        status=GateStatus.SKIPPED,
+        output=f"Unknown gate: {gate_name}",
+    )
+
+
+def _check_to_cache(check: GateCheck) -> dict[str, Any]:
+    return {
+        "name": check.name,
+        "status": check.status.value,
+        "exit_code": check.exit_code,
+        "output": check.output,
+        "duration_ms": check.duration_ms,
+        "detailed_errors": check.detailed_errors,
+        "test_cases": check.test_cases,
+    }
+
+
+def _check_from_cache(data: dict[str, Any]) -> GateCheck:
+    """Rebuild a stored check, marked ``cached``.
+
+    ``duration_ms`` is left at 0 so ``_timed_gate`` records the lookup's own
+    wall time — the original run's time would overstate what this run cost.
+    """
+    return GateCheck(
+        name=data["name"],
+        status=GateStatus(data["status"]),
+        exit_code=data.get("exit_code"),
+        output=data.get("output", ""),
+        detailed_errors=data.get("detailed_errors"),
+        test_cases=data.get("test_cases"),
+        cached=True,
+    )
+
+
+def _timed_gate(run_one: Callable[[str], GateCheck], gate_name: str) -> GateCheck:
+    """Run one gate, recording its wall time and turning a crash into ERROR.
+
+    The runners time only the subprocess and leave ``duration_ms`` at 0 on
+    their early SKIPPED/ERROR returns; the wall time measured here fills that
+    in. A runner that raises must not take its sibling gates down with it.
+    """
+    start = time.monotonic()
+    try:
+        check = run_one(gate_name)
+    except Exception as e:
+        logger.exception("Gate %s raised", gate_name)
+        check = GateCheck(name=gate_name, status=GateStatus.ERROR, output=str(e))
+    if not check.duration_ms:
+        check.duration_ms = int((time.monotonic() - start) * 1000)
+    return check
+
+
+def _schedule_gates(
+    gate_names: list[str],
+    run_one: Callable[[str], GateCheck],
+    max_cpu: int,
+) -> list[GateCheck]:
+    """Run gates concurrently within ``max_cpu`` slots, results in input order.
+
+    Gates are admitted strictly in list order: the next gate starts once its
+    cost (``_gate_cost``) fits in the free slots, and nothing overtakes it
+    while it waits — so an exclusive gate is not starved by the gates behind
+    it. Gates are subprocesses, so threads are enough to overlap them.
+    """
+    if max_cpu <= 1 or len(gate_names) <= 1:
+        return [_timed_gate(run_one, name) for name in gate_names]
+
+    results: list[Optional[GateCheck]] = [None] * len(gate_names)
+    pending = deque(enumerate(gate_names))
+    running: dict[Future, tuple[int, int]] = {}
+    used = 0
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_cpu, len(gate_names)), thread_name_prefix="cf-gate"
+    ) as pool:
+        while pending or running:
+            while pending:
+                index, name = pending[0]
+                cost = _gate_cost(name, max_cpu)
+                if running and used + cost > max_cpu:
+                    break
+                pending.popleft()
+                running[pool.submit(_timed_gate, run_one, name)] = (index, cost)
+                used += cost
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, cost = running.pop(future)
+                used -= cost
+                results[index] = future.result()
+
+    return [check for check in results if check is not None]
+
+
 def _detect_available_gates(repo_path: Path) -> list[str]:
     """Detect which gates are available in the repo."""
     gates = []
@@ -620,10 +897,44 @@ def _tool_is_missing(returncode: int, stderr: Optional[str], tool_names: set[str
     )
 
 
+def _parse_junit_cases(xml_path: Path) -> Optional[list[dict[str, str]]]:
+    """Per-test outcomes from a pytest JUnit XML report, or None if unreadable."""
+    import xml.etree.ElementTree as ET
+
+    try:
+        root = ET.parse(xml_path).getroot()
+    except (OSError, ET.ParseError):
+        return None
+
+    cases = []
+    for case in root.iter("testcase"):
+        if case.find("failure") is not None or case.find("error") is not None:
+            outcome = "failed"
+        elif case.find("skipped") is not None:
+            outcome = "skipped"
+        else:
+            outcome = "passed"
+        cases.append({
+            "classname": case.get("classname", ""),
+            "name": case.get("name", ""),
+            "outcome": outcome,
+        })
+    return cases
+
+
 def _run_pytest(
-    repo_path: Path, verbose: bool = False, test_selector: Optional[str] = None
+    repo_path: Path,
+    verbose: bool = False,
+    test_selector: Optional[str] = None,
+    collect_test_cases: bool = False,
 ) -> GateCheck:
-    """Run pytest, optionally scoped to a ``-k`` keyword expression."""
+    """Run pytest, optionally scoped to a ``-k`` keyword expression.
+
+    With ``collect_test_cases``, pytest also writes a JUnit XML report to a
+    temporary file outside the repo and the parsed cases land in
+    ``GateCheck.test_cases``.
+    """
+    import tempfile
     import time
 
     start = time.time()
@@ -645,16 +956,28 @@ def _run_pytest(
         if test_selector:
             cmd += ["-k", test_selector]
 
-        result = subprocess.run(
-            cmd,
-            cwd=repo_path,
-            env=build_agent_env(repo_path),
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            timeout=300,  # 5 minute timeout
-        )
+        junit_path: Optional[Path] = None
+        if collect_test_cases:
+            fd, junit_name = tempfile.mkstemp(prefix="cf-pytest-", suffix=".xml")
+            os.close(fd)
+            junit_path = Path(junit_name)
+            cmd.append(f"--junitxml={junit_path}")
+
+        try:
+            result = subprocess.run(
+                cmd,
+                cwd=repo_path,
+                env=build_agent_env(repo_path),
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=300,  # 5 minute timeout
+            )
+            test_cases = _parse_junit_cases(junit_path) if junit_path else None
+        finally:
+            if junit_path is not None:
+                junit_path.unlink(missing_ok=True)
 
         duration_ms = int((time.time() - start) * 1000)
 
@@ -722,6 +1045,7 @@ def _run_pytest(
             exit_code=result.returncode,
             output=output if verbose else _summarize_pytest_output(output),
             duration_ms=duration_ms,
+            test_cases=test_cases,
         )
 
     except subprocess.TimeoutExpired:
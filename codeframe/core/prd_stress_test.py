@@ -5,18 +5,27 @@ Recursively decomposes PRD goals using a tri-state classification
 generate a technical specification. This is a human-facing discovery
 tool — not a task generator.
 
+LLM answers can be memoized in the workspace DB (:class:`DecompositionCache`),
+so re-running after editing one section of a PRD only pays for the goals
+that section touches.
+
 This module is headless — no FastAPI or HTTP dependencies.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+import re
 import uuid
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import Enum
 from typing import AsyncGenerator, Callable, Literal, Optional
 
 from codeframe.adapters.llm.base import Purpose
 from codeframe.core.llm_json import LLMJsonError, parse_json_response
+from codeframe.core.workspace import Workspace, get_db_connection
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +77,8 @@ class StressTestResult:
     # True when the call budget ran out mid-walk: the ambiguities found are
     # real, but absence of others is not evidence of their absence (#927).
     partial: bool = False
+    # LLM answers reused from the DecompositionCache instead of paid for.
+    cache_hits: int = 0
 
 
 # ---------------------------------------------------------------------------
@@ -154,13 +165,13 @@ class _Budget:
     max_calls: int = MAX_LLM_CALLS
     is_cancelled: Optional[Callable[[], bool]] = None
     spent: int = 0
+    hits: int = 0
     exhausted: bool = False
     cancelled: bool = False
 
     def take(self) -> bool:
         """Claim one LLM call. False means stop walking."""
-        if self.is_cancelled is not None and self.is_cancelled():
-            self.cancelled = True
+        if self._check_cancelled():
             return False
         if self.spent >= self.max_calls:
             self.exhausted = True
@@ -168,6 +179,19 @@ class _Budget:
         self.spent += 1
         return True
 
+    def reuse(self) -> bool:
+        """Record a cached answer. Free, so only cancellation stops it."""
+        if self._check_cancelled():
+            return False
+        self.hits += 1
+        return True
+
+    def _check_cancelled(self) -> bool:
+        if self.is_cancelled is not None and self.is_cancelled():
+            self.cancelled = True
+            return True
+        return False
+
     @property
     def stopped_early(self) -> bool:
         return self.exhausted or self.cancelled
@@ -184,8 +208,137 @@ def _cap_children(children: list[dict]) -> list[dict]:
     return children[:MAX_CHILDREN_PER_NODE]
 
 
+# ---------------------------------------------------------------------------
+# Decomposition Cache
+# ---------------------------------------------------------------------------
+
+
+#: Part of every cache key. Bump whenever GOAL_EXTRACTION_SYSTEM,
+#: CLASSIFY_AND_DECOMPOSE_SYSTEM or the user messages built below change:
+#: an answer to the old prompt is not an answer to the new one.
+PROMPT_VERSION = 1
+
+_HEADING_RE = re.compile(r"^#{1,6}\s", re.MULTILINE)
+_WORD_RE = re.compile(r"[a-z0-9]{3,}")
+
+
+def _digest(*parts: object) -> str:
+    return hashlib.sha256(
+        json.dumps(parts, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+def _prd_sections(prd_content: str) -> list[str]:
+    """Split a markdown PRD at its headings; the preamble is a section too."""
+    starts = [m.start() for m in _HEADING_RE.finditer(prd_content)]
+    bounds = [0, *[i for i in starts if i > 0], len(prd_content)]
+    return [
+        prd_content[a:b] for a, b in zip(bounds, bounds[1:])
+        if prd_content[a:b].strip()
+    ]
+
+
+def prd_section_hash(goal: str, prd_content: str) -> str:
+    """Hash of the PRD sections a top-level goal is about.
+
+    A section belongs to the goal when it mentions every significant word of
+    the goal ("PDF Export" matches "## Exporting invoices to PDF"). Only those
+    sections key the goal's subtree, so editing an unrelated section leaves
+    its cached answers valid. A goal no section mentions is keyed by the
+    whole document and re-runs on any edit.
+
+    This is a deliberate approximation: the model is shown the whole PRD, so
+    a reused answer was given against the old text of the *other* sections.
+    Run without a cache when that matters.
+    """
+    words = _WORD_RE.findall(goal.lower())
+    matched = [
+        section for section in _prd_sections(prd_content)
+        if words and all(word in section.lower() for word in words)
+    ]
+    return _digest(matched or [prd_content])
+
+
+def _provider_model(provider) -> str:
+    """The model planning calls go to, for the cache key."""
+    try:
+        return str(provider.get_model(Purpose.PLANNING))
+    except Exception:  # noqa: BLE001 - a key component, never a reason to fail
+        return type(provider).__name__
+
+
+class DecompositionCache:
+    """Stress-test LLM answers memoized in the workspace database.
+
+    Stores the raw response text keyed by a hash of the model, the
+    :data:`PROMPT_VERSION` and everything the prompt was built from, so a
+    re-run reuses the answers for unchanged goals and subtrees and only calls
+    the LLM for what changed. Responses are re-parsed on every read, so
+    ambiguity and node ids stay unique per run.
+
+    Failures to read or write are logged and treated as misses: the cache
+    saves money, it must never cost a stress test.
+    """
+
+    def __init__(self, workspace: Workspace) -> None:
+        self.workspace = workspace
+
+    def goals_key(self, provider, prd_content: str) -> str:
+        return _digest(
+            "goals", _provider_model(provider), PROMPT_VERSION, prd_content
+        )
+
+    def node_key(
+        self,
+        provider,
+        title: str,
+        description: str,
+        lineage: list[str],
+        depth: int,
+        section_hash: str,
+    ) -> str:
+        return _digest(
+            "node", _provider_model(provider), PROMPT_VERSION,
+            title, description, lineage, depth, section_hash,
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            conn = get_db_connection(self.workspace)
+            try:
+                row = conn.execute(
+                    "SELECT response FROM prd_decomposition_cache WHERE cache_key = ?",
+                    (key,),
+                ).fetchone()
+            finally:
+                conn.close()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Could not read the decomposition cache: %s", exc)
+            return None
+        return row[0] if row else None
+
+    def put(self, key: str, response: str) -> None:
+        try:
+            conn = get_db_connection(self.workspace)
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO prd_decomposition_cache "
+                    "(cache_key, response, created_at) VALUES (?, ?, ?)",
+                    (key, response, datetime.now(timezone.utc).isoformat()),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Could not write the decomposition cache: %s", exc)
+
+
 def extract_goals(prd_content: str, provider) -> list[str]:
     """Extract high-level deliverable goals from a PRD."""
+    return _parse_goals(_request_goals(prd_content, provider))
+
+
+def _request_goals(prd_content: str, provider) -> str:
     response = provider.complete(
         messages=[{"role": "user", "content": prd_content}],
         purpose=Purpose.PLANNING,
@@ -193,8 +346,12 @@ def extract_goals(prd_content: str, provider) -> list[str]:
         max_tokens=1024,
         temperature=0.0,
     )
+    return response.content
+
+
+def _parse_goals(content: str) -> list[str]:
     try:
-        goals = parse_json_response(response.content, what="goal extraction")
+        goals = parse_json_response(content, what="goal extraction")
     except LLMJsonError as exc:
         # Never return [] here. The caller reads an empty list as "no goals to
         # analyse" and reports "No ambiguities found — PRD is well-specified",
@@ -216,6 +373,26 @@ def extract_goals(prd_content: str, provider) -> list[str]:
     return extracted
 
 
+def _extract_goals_cached(
+    prd_content: str,
+    provider,
+    cache: Optional[DecompositionCache],
+    budget: _Budget,
+) -> list[str]:
+    """:func:`extract_goals`, answered from ``cache`` when the PRD is unchanged."""
+    if cache is None:
+        return extract_goals(prd_content, provider)
+    key = cache.goals_key(provider, prd_content)
+    cached = cache.get(key)
+    if cached is not None:
+        budget.hits += 1
+        return _parse_goals(cached)
+    content = _request_goals(prd_content, provider)
+    goals = _parse_goals(content)
+    cache.put(key, content)
+    return goals
+
+
 def classify_and_decompose(
     title: str,
     description: str,
@@ -225,6 +402,26 @@ def classify_and_decompose(
     provider,
 ) -> tuple[Classification, list[dict], Optional[Ambiguity], str]:
     """Classify a goal node and optionally decompose or flag ambiguity."""
+    content = _request_classification(
+        title, description, lineage, prd_content, depth, provider,
+    )
+    parsed = _parse_classification(title, content)
+    if parsed is None:
+        # A single unparseable node degrades to a leaf rather than failing the
+        # whole run — unlike goal extraction, where an empty result is
+        # indistinguishable from success (#927).
+        return Classification.ATOMIC, [], None, "Low"
+    return parsed
+
+
+def _request_classification(
+    title: str,
+    description: str,
+    lineage: list[str],
+    prd_content: str,
+    depth: int,
+    provider,
+) -> str:
     lineage_ctx = ""
     if lineage:
         lineage_ctx = "\n\nAncestor context:\n" + "\n".join(
@@ -245,22 +442,25 @@ def classify_and_decompose(
         max_tokens=2048,
         temperature=0.0,
     )
+    return response.content
 
+
+def _parse_classification(
+    title: str, content: str
+) -> Optional[tuple[Classification, list[dict], Optional[Ambiguity], str]]:
+    """Parse a classification response; ``None`` if it is unusable."""
     try:
-        data = parse_json_response(response.content, what=f"classification of {title!r}")
+        data = parse_json_response(content, what=f"classification of {title!r}")
     except LLMJsonError as exc:
-        # A single unparseable node degrades to a leaf rather than failing the
-        # whole run — unlike goal extraction, where an empty result is
-        # indistinguishable from success (#927).
         logger.warning("Failed to parse classification for '%s': %s", title, exc)
-        return Classification.ATOMIC, [], None, "Low"
+        return None
 
     if not isinstance(data, dict):
         logger.warning(
             "Classification for '%s' returned %s, expected an object",
             title, type(data).__name__,
         )
-        return Classification.ATOMIC, [], None, "Low"
+        return None
 
     raw_cls = data.get("classification", "atomic").lower()
     try:
@@ -302,18 +502,35 @@ def recursive_decompose(
     ambiguities: list[Ambiguity],
     provider,
     budget: Optional["_Budget"] = None,
+    cache: Optional[DecompositionCache] = None,
+    section_hash: str = "",
 ) -> DecompositionNode:
     """Recursively decompose a goal, collecting ambiguities along the way.
 
     ``budget`` bounds the total number of LLM calls and lets a disconnected
     caller stop the walk. A run that stops early returns the partial tree built
     so far rather than raising — the ambiguities already found are real (#927).
+
+    With a ``cache``, a node whose inputs (and the ``section_hash`` of its
+    top-level goal, see :func:`prd_section_hash`) are unchanged reuses the
+    stored answer. Reuse is counted in ``budget.hits`` and does not spend the
+    call budget — only real calls do.
     """
     if budget is None:
         budget = _Budget()
 
+    key = None
+    content = None
+    if depth < max_depth and cache is not None:
+        key = cache.node_key(
+            provider, title, description, lineage, depth, section_hash
+        )
+        content = cache.get(key)
+
     # Force leaf at max depth, when the call budget is spent, or on cancellation
-    if depth >= max_depth or not budget.take():
+    if depth >= max_depth or not (
+        budget.reuse() if content is not None else budget.take()
+    ):
         return DecompositionNode(
             id=str(uuid.uuid4()),
             title=title,
@@ -325,9 +542,18 @@ def recursive_decompose(
             complexity_hint="Unknown",
         )
 
-    cls, child_dicts, ambiguity, complexity = classify_and_decompose(
-        title, description, lineage, prd_content, depth, provider,
-    )
+    fresh = content is None
+    if fresh:
+        content = _request_classification(
+            title, description, lineage, prd_content, depth, provider,
+        )
+    parsed = _parse_classification(title, content)
+    if parsed is None:
+        # Degrade to a leaf (#927), and do not remember the bad answer.
+        parsed = (Classification.ATOMIC, [], None, "Low")
+    elif fresh and key is not None:
+        cache.put(key, content)
+    cls, child_dicts, ambiguity, complexity = parsed
 
     if ambiguity:
         ambiguities.append(ambiguity)
@@ -346,6 +572,8 @@ def recursive_decompose(
                 ambiguities,
                 provider,
                 budget,
+                cache,
+                section_hash,
             )
             children.append(child_node)
             if budget.stopped_early:
@@ -493,19 +721,26 @@ def resolve_ambiguities_into_prd(
 
 
 def stress_test_prd(
-    prd_content: str, provider, max_depth: int = 3
+    prd_content: str,
+    provider,
+    max_depth: int = 3,
+    cache: Optional[DecompositionCache] = None,
 ) -> StressTestResult:
-    """Run the full PRD stress test: extract goals → recursive decompose → render."""
-    goals = extract_goals(prd_content, provider)
-
-    tree: list[DecompositionNode] = []
-    ambiguities: list[Ambiguity] = []
+    """Run the full PRD stress test: extract goals → recursive decompose → render.
 
+    With a ``cache``, answers from earlier runs are reused for unchanged
+    goals and subtrees (see :class:`DecompositionCache`).
+    """
     # One budget for the whole run, matching the streaming path. Letting each
     # goal default to its own ``_Budget()`` would bound the walk at
     # ``len(goals) × MAX_LLM_CALLS`` instead of the documented total (#927).
     budget = _Budget()
 
+    goals = _extract_goals_cached(prd_content, provider, cache, budget)
+
+    tree: list[DecompositionNode] = []
+    ambiguities: list[Ambiguity] = []
+
     for goal in goals:
         if budget.stopped_early:
             break
@@ -519,6 +754,8 @@ def stress_test_prd(
             ambiguities=ambiguities,
             provider=provider,
             budget=budget,
+            cache=cache,
+            section_hash=prd_section_hash(goal, prd_content) if cache else "",
         )
         tree.append(node)
 
@@ -543,6 +780,7 @@ def stress_test_prd(
         tech_spec_markdown=tech_spec,
         ambiguity_report=amb_report,
         partial=budget.stopped_early,
+        cache_hits=budget.hits,
     )
 
 
@@ -551,37 +789,46 @@ async def stress_test_prd_stream(
     provider,
     max_depth: int = 3,
     is_cancelled: Optional[Callable[[], bool]] = None,
+    cache: Optional[DecompositionCache] = None,
 ) -> AsyncGenerator[dict, None]:
     """Async streaming variant of :func:`stress_test_prd`.
 
     Yields progress event dicts suitable for SSE delivery as each top-level
     goal is decomposed, so a UI can render incremental output:
 
-    - ``{"type": "goals_extracted", "goals": [...]}``
+    - ``{"type": "goals_extracted", "goals": [...], "cache_hits": int}``
     - ``{"type": "goal_analyzed", "goal": str, "classification": str,
-         "ambiguities_so_far": int}`` (once per top-level goal)
+         "ambiguities_so_far": int, "llm_calls": int, "cache_hits": int}``
+      (once per top-level goal)
     - ``{"type": "complete", "ambiguity_count": int,
          "ambiguities": [ambiguity_to_dict(...)],
-         "tech_spec_markdown": str, "ambiguity_report": str}``
+         "tech_spec_markdown": str, "ambiguity_report": str,
+         "llm_calls": int, "cache_hits": int}``
     - ``{"type": "error", "message": str}`` if decomposition raises
 
+    ``llm_calls`` counts the classification calls actually made and
+    ``cache_hits`` the answers reused from ``cache`` (goal extraction
+    included), both running totals, so a UI can show what a re-run saved.
+
     The underlying ``provider.complete()`` calls are synchronous and blocking,
     so each is offloaded via :func:`asyncio.to_thread` to keep the event loop
     responsive. This function stays headless (no FastAPI/HTTP imports).
     """
     try:
-        goals = await asyncio.to_thread(extract_goals, prd_content, provider)
-        yield {"type": "goals_extracted", "goals": goals}
-
-        ambiguities: list[Ambiguity] = []
-        tree: list[DecompositionNode] = []
-
         # One budget for the whole run: the total-call ceiling and the
         # cancellation check both live inside the recursion, so a disconnected
         # client stops paying at the next node rather than at the next
         # top-level goal (#927).
         budget = _Budget(is_cancelled=is_cancelled)
 
+        goals = await asyncio.to_thread(
+            _extract_goals_cached, prd_content, provider, cache, budget
+        )
+        yield {"type": "goals_extracted", "goals": goals, "cache_hits": budget.hits}
+
+        ambiguities: list[Ambiguity] = []
+        tree: list[DecompositionNode] = []
+
         for goal in goals:
             if budget.stopped_early:
                 break
@@ -596,6 +843,8 @@ async def stress_test_prd_stream(
                 ambiguities,
                 provider,
                 budget,
+                cache,
+                prd_section_hash(goal, prd_content) if cache else "",
             )
             tree.append(node)
             yield {
@@ -603,6 +852,8 @@ async def stress_test_prd_stream(
                 "goal": node.title,
                 "classification": node.classification.value,
                 "ambiguities_so_far": len(ambiguities),
+                "llm_calls": budget.spent,
+                "cache_hits": budget.hits,
             }
 
         tech_spec = render_tech_spec(tree, ambiguities)
@@ -616,6 +867,8 @@ async def stress_test_prd_stream(
             # Honest about a truncated walk: the ambiguities found are real,
             # but absence of others is not evidence of their absence (#927).
             "partial": budget.stopped_early,
+            "llm_calls": budget.spent,
+            "cache_hits": budget.hits,
         }
     except Exception as exc:  # noqa: BLE001 — surface any failure to the client
         logger.warning("Stress test stream failed: %s", exc, exc_info=True)
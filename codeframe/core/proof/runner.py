@@ -7,11 +7,13 @@ and attaches evidence artifacts.
 
 import json
 import logging
+import re
 import uuid
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional, Sequence
+from typing import Any, Iterable, Optional, Sequence
 
 from codeframe.core.proof import ledger
 from codeframe.core.proof.evidence import attach_evidence
@@ -237,6 +239,129 @@ _OUTCOME_TO_OBLIGATION_STATUS: dict[GateOutcome, str] = {
 }
 
 
+#: A test id that can be OR-ed into one ``-k`` expression unchanged. Anything
+#: else (brackets, ``::``, spaces) is resolved by its own scoped run.
+_BATCHABLE_TEST_ID = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _case_matches(test_id: str, case: dict[str, str]) -> bool:
+    """Would ``pytest -k test_id`` have selected this JUnit test case?
+
+    ``-k`` matches a bare word case-insensitively as a substring of the item's
+    name or any parent's (module, class, package); JUnit's ``classname`` is
+    those parents, dot-joined. Markers also count as keywords for ``-k`` and
+    are not in the report — irrelevant here, since rule ids are test names.
+    """
+    needle = test_id.lower()
+    if needle in case.get("name", "").lower():
+        return True
+    return any(needle in part.lower() for part in case.get("classname", "").split("."))
+
+
+class _ProofSession:
+    """Per-run state that lets ``_run_gate`` share work across requirements.
+
+    - Evidence rules: every enforced test id planned for the run is resolved
+      from ONE pytest invocation (``-k "a or b or ..."`` with a JUnit report),
+      matched back per id. The per-rule verdicts — "named test missing" vs
+      "collected but failing" — are the ones a scoped run per rule would give.
+    - Whole-gate runs: the first requirement to need, say, ruff runs it; every
+      later requirement in the run reuses that result.
+
+    Anything the batch cannot answer — no report (pytest missing, timeout, a
+    mocked gate), an interrupted session, an id not in the plan — falls back to
+    the scoped run per rule, so the batch is only ever an optimisation.
+    """
+
+    def __init__(self, workspace: Workspace):
+        self.workspace = workspace
+        self._planned: set[str] = set()
+        self._rule_lines: Optional[dict[str, tuple[bool, str]]] = None
+        self._gate_results: dict[str, Any] = {}
+
+    def plan(self, test_ids: Iterable[str]) -> None:
+        self._planned.update(t for t in test_ids if _BATCHABLE_TEST_ID.match(t))
+
+    def rule_line(self, test_id: str) -> Optional[tuple[bool, str]]:
+        """(passed, evidence line) for ``test_id`` from the batch, or None."""
+        if test_id not in self._planned:
+            return None
+        if self._rule_lines is None:
+            self._rule_lines = self._run_batch()
+        return self._rule_lines.get(test_id)
+
+    def _run_batch(self) -> dict[str, tuple[bool, str]]:
+        from codeframe.core import gates as core_gates
+
+        ids = sorted(self._planned)
+        result = core_gates.run(
+            self.workspace,
+            gates=["pytest"],
+            verbose=False,
+            test_selector=" or ".join(ids),
+            collect_test_cases=True,
+        )
+        check = result.checks[0] if result.checks else None
+        # Exit 0/1/5 is a session that ran to the end: every test the
+        # expression selects is in the report. Anything else (collection
+        # error, usage error, timeout) is left to the per-rule runs.
+        if check is None or check.test_cases is None or check.exit_code not in (0, 1, 5):
+            logger.info("Batched evidence run gave no per-test report; running rules one by one")
+            return {}
+
+        lines: dict[str, tuple[bool, str]] = {}
+        for test_id in ids:
+            matched = [c for c in check.test_cases if _case_matches(test_id, c)]
+            if not matched:
+                lines[test_id] = (False, f"{test_id}: FAILED — named test missing (not collected)")
+            elif any(c["outcome"] == "failed" for c in matched):
+                lines[test_id] = (False, f"{test_id}: FAILED (FAILED)")
+            else:
+                lines[test_id] = (True, f"{test_id}: passed")
+        return lines
+
+    def gate_result(self, core_gate_name: str):
+        """Whole-gate result, run once per proof run."""
+        if core_gate_name not in self._gate_results:
+            from codeframe.core import gates as core_gates
+
+            self._gate_results[core_gate_name] = core_gates.run(
+                self.workspace, gates=[core_gate_name], verbose=False
+            )
+        return self._gate_results[core_gate_name]
+
+
+#: The session of the proof run in progress. A ContextVar rather than a
+#: ``_run_gate`` parameter: callers and tests reach ``_run_gate`` directly and
+#: substitute it, and a direct call simply runs without a session.
+_active_session: ContextVar[Optional[_ProofSession]] = ContextVar(
+    "proof_session", default=None
+)
+
+
+def _scoped_rule_line(workspace: Workspace, test_id: str) -> tuple[bool, str]:
+    """Enforce one rule with its own ``pytest -k test_id`` run."""
+    from codeframe.core import gates as core_gates
+
+    result = core_gates.run(
+        workspace,
+        gates=["pytest"],
+        verbose=False,
+        test_selector=test_id,
+    )
+    check = result.checks[0] if result.checks else None
+    if check is None:
+        return False, f"{test_id}: FAILED — no gate check returned"
+    if check.exit_code == 5:
+        return False, f"{test_id}: FAILED — named test missing (not collected)"
+    if check.status == core_gates.GateStatus.PASSED:
+        return True, f"{test_id}: passed"
+    # SKIPPED (pytest unavailable) and ERROR (timeout) are not proof —
+    # enforcement needs a positive pass, unlike the whole-suite path where
+    # SKIPPED counts as passing.
+    return False, f"{test_id}: FAILED ({check.status.value})"
+
+
 def _run_gate(
     workspace: Workspace,
     gate: Gate,
@@ -254,9 +379,12 @@ def _run_gate(
     whole-suite run proves nothing about a test that was never written.
     Rules with ``must_pass=False`` are informational only.
 
-    Each enforced rule deliberately gets its own pytest subprocess — do not
-    collapse them into one ``-k "a or b"`` run; per-rule exit codes are what
-    distinguish "named test missing" from "collected but failing".
+    Inside a proof run, rule verdicts and whole-gate results come from the
+    run's ``_ProofSession``: one pytest invocation with a per-test report
+    answers every planned rule. Do not collapse rules into a plain
+    ``-k "a or b"`` run without that report — one exit code cannot tell
+    "named test missing" from "collected but failing" per rule. Outside a
+    session (a direct call), each rule gets its own scoped run.
     """
     core_gate_name = _GATE_TO_CORE.get(gate)
 
@@ -284,32 +412,18 @@ def _run_gate(
     try:
         from codeframe.core import gates as core_gates
 
+        session = _active_session.get()
         lines: list[str] = []
         all_passed = True
         unverifiable = False
 
         for rule in enforced:
-            result = core_gates.run(
-                workspace,
-                gates=["pytest"],
-                verbose=False,
-                test_selector=rule.test_id,
-            )
-            check = result.checks[0] if result.checks else None
-            if check is None:
-                lines.append(f"{rule.test_id}: FAILED — no gate check returned")
-                all_passed = False
-            elif check.exit_code == 5:
-                lines.append(f"{rule.test_id}: FAILED — named test missing (not collected)")
-                all_passed = False
-            elif check.status == core_gates.GateStatus.PASSED:
-                lines.append(f"{rule.test_id}: passed")
-            else:
-                # SKIPPED (pytest unavailable) and ERROR (timeout) are not
-                # proof — enforcement needs a positive pass, unlike the
-                # whole-suite path where SKIPPED counts as passing.
-                lines.append(f"{rule.test_id}: FAILED ({check.status.value})")
-                all_passed = False
+            verdict = session.rule_line(rule.test_id) if session is not None else None
+            if verdict is None:
+                verdict = _scoped_rule_line(workspace, rule.test_id)
+            passed, line = verdict
+            lines.append(line)
+            all_passed = all_passed and passed
 
         # A must_pass rule we cannot enforce must not silently count as
         # satisfied — that is the exact bug this module exists to prevent.
@@ -322,7 +436,10 @@ def _run_gate(
         # with no runner at all has nothing to fall back to — its evidence
         # rules above are the whole verification (#924).
         if core_gate_name and (core_gate_name != "pytest" or not enforced):
-            result = core_gates.run(workspace, gates=[core_gate_name], verbose=False)
+            if session is not None:
+                result = session.gate_result(core_gate_name)
+            else:
+                result = core_gates.run(workspace, gates=[core_gate_name], verbose=False)
             lines.extend(
                 f"{check.name}: {check.status.value}" for check in result.checks
             )
@@ -438,6 +555,22 @@ def run_proof_with_diagnostics(
         ``(results, diagnostics)`` — results maps req_id → [(Gate, GateOutcome)],
         and diagnostics explains anything the results do not (#1138).
     """
+    token = _active_session.set(_ProofSession(workspace))
+    try:
+        return _run_proof(
+            workspace, full=full, gate_filter=gate_filter, run_id=run_id
+        )
+    finally:
+        _active_session.reset(token)
+
+
+def _run_proof(
+    workspace: Workspace,
+    *,
+    full: bool,
+    gate_filter: Optional[Gate],
+    run_id: Optional[str],
+) -> tuple[dict[str, list[tuple[Gate, GateOutcome]]], ProofRunDiagnostics]:
     if not run_id:
         run_id = _new_run_id()
 
@@ -489,6 +622,19 @@ def run_proof_with_diagnostics(
     if not full:
         changed_scope = get_changed_scope(workspace)
 
+    session = _active_session.get()
+    if session is not None:
+        session.plan(
+            rule.test_id
+            for req in reqs
+            if full or changed_scope is None or intersects(req.scope, changed_scope)
+            for obl in req.obligations
+            if (gate_filter is None or obl.gate == gate_filter)
+            and (enabled_gates is None or obl.gate in enabled_gates)
+            for rule in req.evidence_rules
+            if rule.gate == obl.gate and rule.must_pass and rule.test_id.startswith("test_")
+        )
+
     results: dict[str, list[tuple[Gate, GateOutcome]]] = {}
     artifact_dir = workspace.state_dir / "proof_artifacts"
     artifact_dir.mkdir(exist_ok=True)
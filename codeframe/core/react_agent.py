@@ -13,6 +13,7 @@ import logging
 import os
 import sqlite3
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Callable, Optional
@@ -135,6 +136,56 @@ _TOOL_PHASE_MAP = {
     "run_command": AgentPhase.TESTING,
 }
 
+#: Tools that only read the workspace, so calls to them in one response can
+#: run side by side. Everything else is treated as mutating.
+_CONCURRENT_TOOLS = frozenset({"read_file", "list_files", "search_codebase"})
+
+#: Most read-only calls from one response that run at once.
+_TOOL_WORKERS = 8
+
+
+class _ToolSchedule:
+    """Executes one LLM response's tool calls, overlapping the read-only ones.
+
+    Results are requested with :meth:`result` in call order — the loop emits
+    the same events, stall notifications and recordings around each one as
+    when every call ran inline. When a read-only call is reached, it and the
+    read-only calls directly after it start together on a small pool. A
+    mutating call runs inline, so it starts only after every earlier call has
+    finished, and no later call starts before it is done.
+
+    A caller that stops early (a blocker) simply stops asking. Read-only calls
+    already started finish in the background and are discarded; mutating calls
+    after the stop are never run.
+    """
+
+    def __init__(self, tool_calls: list, execute: Callable[..., ToolResult]) -> None:
+        self._calls = list(tool_calls)
+        self._execute = execute
+        self._futures: dict[int, Future] = {}
+
+    def result(self, index: int) -> ToolResult:
+        tc = self._calls[index]
+        if tc.name in _CONCURRENT_TOOLS and index not in self._futures:
+            self._start_reads(index)
+        future = self._futures.pop(index, None)
+        return future.result() if future is not None else self._execute(tc)
+
+    def _start_reads(self, start: int) -> None:
+        end = start
+        while end < len(self._calls) and self._calls[end].name in _CONCURRENT_TOOLS:
+            end += 1
+        if end - start < 2:
+            return  # a lone read gains nothing from a pool
+        pool = ThreadPoolExecutor(
+            max_workers=min(end - start, _TOOL_WORKERS),
+            thread_name_prefix="react-tool",
+        )
+        for i in range(start, end):
+            self._futures[i] = pool.submit(self._execute, self._calls[i])
+        # Queued calls still run; the pool's threads exit once they have.
+        pool.shutdown(wait=False)
+
 # ---------------------------------------------------------------------------
 # Layer 1: Base rules (adapted from AGENT_V3_UNIFIED_PLAN.md)
 # ---------------------------------------------------------------------------
@@ -379,10 +430,11 @@ class ReactAgent:
                     )
                 if self.execution_recorder is not None:
                     try:
-                        self.execution_recorder.flush()
+                        # close() also stops a background flusher, if any.
+                        self.execution_recorder.close()
                     except Exception:
                         logger.debug(
-                            "Failed to flush execution recorder for task %s",
+                            "Failed to close execution recorder for task %s",
                             task_id,
                             exc_info=True,
                         )
@@ -401,7 +453,8 @@ class ReactAgent:
         """Return the accumulated per-call token usage records.
 
         Each record is a dict with keys: input_tokens, output_tokens, model,
-        call_type, iteration.
+        call_type, iteration, cache_creation_input_tokens,
+        cache_read_input_tokens.
         """
         return list(self._token_records)
 
@@ -496,6 +549,8 @@ class ReactAgent:
                     input_tokens=record["input_tokens"],
                     output_tokens=record["output_tokens"],
                     call_type=record["call_type"],
+                    cache_creation_tokens=record.get("cache_creation_input_tokens", 0),
+                    cache_read_tokens=record.get("cache_read_input_tokens", 0),
                 )
         except Exception:
             # Log at WARNING (issue #712): silent debug-level swallowing hid the
@@ -605,6 +660,8 @@ class ReactAgent:
                 "output_tokens": response.output_tokens,
                 "model": response.model,
                 "call_type": "task_execution",
+                "cache_creation_input_tokens": response.cache_creation_input_tokens,
+                "cache_read_input_tokens": response.cache_read_input_tokens,
                 "iteration": iterations,
             })
 
@@ -670,9 +727,11 @@ class ReactAgent:
             }
             messages.append(assistant_msg)
 
-            # Execute each tool call and collect results
+            # Execute each tool call and collect results, in call order.
+            # Independent reads overlap; writes run alone (see _ToolSchedule).
+            schedule = _ToolSchedule(response.tool_calls, self._execute_tool_with_lint)
             tool_results = []
-            for tc in response.tool_calls:
+            for i, tc in enumerate(response.tool_calls):
                 phase = _TOOL_PHASE_MAP.get(tc.name, AgentPhase.EXPLORING)
                 tc_file_path = tc.input.get("path", "") or tc.input.get("test_path", "")
                 self._emit_progress(
@@ -690,7 +749,7 @@ class ReactAgent:
                     "tool_call_id": tc.id,
                 })
 
-                result = self._execute_tool_with_lint(tc)
+                result = schedule.result(i)
 
                 if not result.is_error:
                     self._stall_monitor.notify_tool_executed(
@@ -941,6 +1000,8 @@ class ReactAgent:
                     "output_tokens": response.output_tokens,
                     "model": response.model,
                     "call_type": "verification_fix",
+                    "cache_creation_input_tokens": response.cache_creation_input_tokens,
+                    "cache_read_input_tokens": response.cache_read_input_tokens,
                     "iteration": attempt,
                 })
 
@@ -960,8 +1021,9 @@ class ReactAgent:
                 )
 
                 # Execute tools (with lint) and collect results
+                schedule = _ToolSchedule(response.tool_calls, self._execute_tool_with_lint)
                 tool_results = []
-                for tc in response.tool_calls:
+                for i, tc in enumerate(response.tool_calls):
                     tc_file_path = tc.input.get("path", "") or tc.input.get("test_path", "")
                     self._emit_progress(
                         AgentPhase.FIXING,
@@ -970,7 +1032,7 @@ class ReactAgent:
                         iteration=attempt,
                         message=f"Fixing: {tc.name}",
                     )
-                    result = self._execute_tool_with_lint(tc)
+                    result = schedule.result(i)
                     tool_results.append(
                         {
                             "tool_call_id": result.tool_call_id,
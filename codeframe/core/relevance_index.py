@@ -0,0 +1,364 @@
+"""Persistent term and symbol index for ranking files against a task.
+
+``ContextLoader`` fills the agent's token budget with the files it ranks
+highest. Ranking on path keywords alone spends that budget on files that
+merely have matching names; ``RelevanceIndex`` ranks on content instead:
+
+- every file's identifiers are split into terms — ``get_record`` and
+  ``GetRecord`` both index ``getrecord``, ``get`` and ``record`` — and
+  counted, giving an inverted index term -> {path: term frequency};
+- ``rank`` scores files with Okapi BM25 over weighted query terms (the task
+  title and description, plus the PRD at a lower weight);
+- the names a file defines (``def``, ``class``, ``function``, ``func``,
+  ``fn``, ``struct``, ``interface``, ``const x =`` ...) are indexed
+  separately, so a task that names ``ContextLoader`` can boost the file that
+  defines it over the files that merely use it.
+
+To rank a large tree in well under a second, a query keeps only its
+``_MAX_QUERY_TERMS`` most selective terms and skips terms found in more than
+half the files (the corpus's own stopwords), so the work is bounded by the
+postings of a few selective terms rather than by the file count.
+
+The index is refreshed like ``search_index``: every indexed file is
+``stat``-ed per ranking and re-read if its size or mtime changed. It is kept
+per process (``for_root``) and, for a workspace root with the default ignore
+patterns, persisted to ``.codeframe/relevance_index.json``.
+
+This module is headless - no FastAPI or HTTP dependencies.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional
+
+from codeframe.core import file_index
+from codeframe.core.atomic_io import atomic_write_text
+from codeframe.core.file_index import FileIndex
+
+logger = logging.getLogger(__name__)
+
+#: File under the workspace state dir that holds the persisted index.
+RELEVANCE_INDEX_NAME = "relevance_index.json"
+
+#: Files larger than this are not indexed (they keep their path score only).
+MAX_INDEXED_FILE_SIZE = 1_000_000
+
+#: Okapi BM25 parameters (the usual defaults).
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+#: Bumped when the persisted layout changes; older files are ignored.
+_FORMAT_VERSION = 1
+
+#: Same coarse-timestamp margin as ``search_index._RACY_NS``.
+_RACY_NS = 2_000_000_000
+
+#: Rewrite the persisted index once this many files have been re-read.
+_SAVE_AFTER_FILES = 64
+
+#: Most selective query terms kept per ranking.
+_MAX_QUERY_TERMS = 48
+
+#: Terms shorter than this are not indexed or queried.
+_MIN_TERM = 3
+
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_WORD_PART_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+#: Definition sites across the languages in ``context.CODE_EXTENSIONS``.
+_DEFINITION_RE = re.compile(
+    r"^[ \t]*(?:export[ \t]+)?(?:default[ \t]+)?(?:pub(?:\([^)\n]*\))?[ \t]+)?"
+    r"(?:async[ \t]+)?(?:abstract[ \t]+)?"
+    r"(?:def|class|function|func|fn|struct|enum|trait|interface|type|module)[ \t]+"
+    r"(?:\([^)\n]*\)[ \t]*)?([A-Za-z_][A-Za-z0-9_]*)"
+    r"|^[ \t]*(?:export[ \t]+)?(?:const|let|var)[ \t]+([A-Za-z_][A-Za-z0-9_]*)[ \t]*[:=]",
+    re.MULTILINE,
+)
+
+_split_cache: dict[str, tuple[str, ...]] = {}
+
+
+def _split(identifier: str) -> tuple[str, ...]:
+    """Terms of one identifier: the whole name and its word parts."""
+    terms = _split_cache.get(identifier)
+    if terms is None:
+        whole = identifier.lower()
+        parts = {p.lower() for p in _WORD_PART_RE.findall(identifier)}
+        parts.add(whole)
+        terms = tuple(t for t in parts if len(t) >= _MIN_TERM and not t.isdigit())
+        if len(_split_cache) > 200_000:
+            _split_cache.clear()
+        _split_cache[identifier] = terms
+    return terms
+
+
+def term_counts(text: str) -> Counter[str]:
+    """Count the index terms of ``text`` (identifiers and their word parts)."""
+    counts: Counter[str] = Counter()
+    for identifier, n in Counter(_IDENTIFIER_RE.findall(text)).items():
+        for term in _split(identifier):
+            counts[term] += n
+    return counts
+
+
+def defined_symbols(text: str) -> frozenset[str]:
+    """Lowercased names that ``text`` defines."""
+    return frozenset(
+        (a or b).lower() for a, b in _DEFINITION_RE.findall(text)
+    )
+
+
+class RelevanceIndex:
+    """BM25 term index and symbol table over files of a ``FileIndex``.
+
+    Thread-safe: ``rank`` serialises on an internal lock.
+    """
+
+    def __init__(
+        self,
+        files: FileIndex,
+        extensions: Optional[Iterable[str]] = None,
+        state_path: Optional[Path] = None,
+    ):
+        self.files = files
+        self.root = files.root
+        self.extensions = frozenset(extensions) if extensions is not None else None
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        # path -> (size, mtime_ns, read_at_ns, length, terms, symbols)
+        self._docs: dict[str, tuple[int, int, int, int, dict[str, int], frozenset[str]]] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._definers: dict[str, set[str]] = {}
+        self._total_length = 0
+        self._persisted = False
+        self._unsaved = 0
+        if state_path is not None:
+            self._load()
+
+    # -- public API ----------------------------------------------------------
+
+    def rank(
+        self,
+        query: dict[str, float],
+        symbols: Iterable[str] = (),
+    ) -> tuple[dict[str, float], set[str]]:
+        """Score indexed files against weighted query terms.
+
+        Args:
+            query: Term -> weight (terms as produced by ``term_counts``)
+            symbols: Lowercased names; files defining any of them are returned
+
+        Returns:
+            (BM25 score per path for files matching any kept term,
+             paths of files that define one of ``symbols``)
+        """
+        with self._lock:
+            self._refresh_locked()
+            n_docs = len(self._docs)
+            if not n_docs:
+                return {}, set()
+            avg_length = self._total_length / n_docs or 1.0
+
+            weighted = []
+            for term, weight in query.items():
+                postings = self._postings.get(term)
+                if not postings or len(postings) > n_docs / 2:
+                    continue
+                df = len(postings)
+                idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+                weighted.append((weight * idf, postings))
+            weighted.sort(key=lambda w: w[0], reverse=True)
+
+            docs = self._docs
+            scores: dict[str, float] = {}
+            norm = BM25_K1 * (1 - BM25_B)
+            per_length = BM25_K1 * BM25_B / avg_length
+            for boost, postings in weighted[:_MAX_QUERY_TERMS]:
+                for path, tf in postings.items():
+                    length = docs[path][3]
+                    scores[path] = scores.get(path, 0.0) + boost * tf * (BM25_K1 + 1) / (
+                        tf + norm + per_length * length
+                    )
+
+            definers: set[str] = set()
+            for symbol in symbols:
+                definers |= self._definers.get(symbol, set())
+            return scores, definers
+
+    # -- internals -----------------------------------------------------------
+
+    def _refresh_locked(self) -> None:
+        docs = self._docs
+        live: set[str] = set()
+        root = str(self.root)
+        for entry in self.files.files():
+            if entry.is_link or (
+                self.extensions is not None and entry.extension not in self.extensions
+            ):
+                continue
+            try:
+                st = os.stat(os.path.join(root, entry.path))
+            except OSError:
+                continue
+            if st.st_size > MAX_INDEXED_FILE_SIZE:
+                continue
+            live.add(entry.path)
+            doc = docs.get(entry.path)
+            if (
+                doc is not None
+                and doc[0] == st.st_size
+                and doc[1] == st.st_mtime_ns
+                and st.st_mtime_ns < doc[2] - _RACY_NS
+            ):
+                continue
+            self._index(entry.path, st.st_size, st.st_mtime_ns)
+
+        for path in [p for p in docs if p not in live]:
+            self._forget(path)
+            self._unsaved += 1
+        if self._unsaved and (not self._persisted or self._unsaved >= _SAVE_AFTER_FILES):
+            self._save()
+
+    def _index(self, path: str, size: int, mtime_ns: int) -> None:
+        read_at = time.time_ns()
+        try:
+            with open(os.path.join(self.root, path), encoding="utf-8", errors="replace") as fh:
+                text = fh.read()
+        except OSError:
+            return
+        self._forget(path)
+        self._add(path, size, mtime_ns, read_at, dict(term_counts(text)), defined_symbols(text))
+        self._unsaved += 1
+
+    def _add(
+        self,
+        path: str,
+        size: int,
+        mtime_ns: int,
+        read_at: int,
+        terms: dict[str, int],
+        symbols: frozenset[str],
+    ) -> None:
+        length = sum(terms.values())
+        self._docs[path] = (size, mtime_ns, read_at, length, terms, symbols)
+        self._total_length += length
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[path] = tf
+        for symbol in symbols:
+            self._definers.setdefault(symbol, set()).add(path)
+
+    def _forget(self, path: str) -> None:
+        doc = self._docs.pop(path, None)
+        if doc is None:
+            return
+        self._total_length -= doc[3]
+        for term in doc[4]:
+            postings = self._postings[term]
+            del postings[path]
+            if not postings:
+                del self._postings[term]
+        for symbol in doc[5]:
+            definers = self._definers[symbol]
+            definers.discard(path)
+            if not definers:
+                del self._definers[symbol]
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _FORMAT_VERSION
+            or data.get("root") != str(self.root)
+        ):
+            return
+        try:
+            for path, (size, mtime, read_at, terms, symbols) in data["files"].items():
+                self._add(
+                    path, int(size), int(mtime), int(read_at),
+                    {str(t): int(n) for t, n in terms.items()},
+                    frozenset(symbols.split()),
+                )
+            self._persisted = True
+        except (KeyError, TypeError, ValueError, AttributeError):
+            self._docs, self._postings, self._definers = {}, {}, {}
+            self._total_length = 0
+
+    def _save(self) -> None:
+        if self.state_path is None:
+            self._unsaved = 0
+            return
+        payload = {
+            "version": _FORMAT_VERSION,
+            "root": str(self.root),
+            "files": {
+                path: [size, mtime, read_at, terms, " ".join(symbols)]
+                for path, (size, mtime, read_at, _, terms, symbols) in self._docs.items()
+            },
+        }
+        try:
+            atomic_write_text(self.state_path, json.dumps(payload, separators=(",", ":")))
+            self._persisted = True
+            self._unsaved = 0
+        except OSError as exc:
+            logger.debug("Could not persist relevance index %s: %s", self.state_path, exc)
+
+
+#: Indexes kept per process (one per workspace root or task worktree).
+_MAX_INDEXES = 16
+
+_indexes: OrderedDict[tuple[str, tuple[str, ...]], RelevanceIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def for_root(
+    root: Path,
+    ignore_patterns: Optional[Iterable[str]] = None,
+    extensions: Optional[Iterable[str]] = None,
+) -> RelevanceIndex:
+    """The shared relevance index for ``root`` and ``ignore_patterns``.
+
+    Args:
+        root: Tree to index (a workspace repo or a task worktree)
+        ignore_patterns: fnmatch patterns; defaults to the context loader's
+            ``DEFAULT_IGNORE_PATTERNS``
+        extensions: File extensions to index, fixed when the index is
+            created; defaults to every file
+
+    Returns:
+        The process-wide RelevanceIndex for that pair, created on first use
+    """
+    # Deferred: context imports this module.
+    from codeframe.core.context import DEFAULT_IGNORE_PATTERNS
+
+    root = Path(root).resolve()
+    patterns = tuple(DEFAULT_IGNORE_PATTERNS if ignore_patterns is None else ignore_patterns)
+    key = (str(root), patterns)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            state_path = None
+            if patterns == tuple(DEFAULT_IGNORE_PATTERNS):
+                state_path = file_index.state_file(root, RELEVANCE_INDEX_NAME)
+            index = RelevanceIndex(
+                file_index.for_root(root, patterns),
+                extensions=extensions,
+                state_path=state_path,
+            )
+            _indexes[key] = index
+            while len(_indexes) > _MAX_INDEXES:
+                _indexes.popitem(last=False)
+        else:
+            _indexes.move_to_end(key)
+        return index
@@ -9,10 +9,11 @@ This module is headless - no FastAPI or HTTP dependencies.
 
 import json
 import logging
+import threading
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from codeframe.core.workspace import Workspace, get_db_connection
 
@@ -111,11 +112,20 @@ class ExecutionRecorder:
 
     Collects execution steps, LLM interactions, and file operations
     in memory and flushes them to the database periodically or on demand.
+    A flush writes all three buffers in one transaction (see
+    :func:`save_trace_records`), so its cost is one commit, not one per record.
+
+    With ``background=True`` the auto-flush at ``flush_interval`` is handed to
+    a daemon thread and the recording call returns immediately, so the agent
+    loop never waits on the database. An explicit :meth:`flush` still writes
+    synchronously (after any in-flight background flush); call :meth:`close`
+    when the run ends to stop the thread and write what is left.
 
     Args:
         workspace: Target workspace (for DB access).
         run_id: Run identifier to associate all records with.
         flush_interval: Number of records to buffer before auto-flushing.
+        background: Auto-flush on a background thread instead of inline.
     """
 
     def __init__(
@@ -123,6 +133,7 @@ class ExecutionRecorder:
         workspace: Workspace,
         run_id: str,
         flush_interval: int = 10,
+        background: bool = False,
     ) -> None:
         self.workspace = workspace
         self.run_id = run_id
@@ -130,6 +141,20 @@ class ExecutionRecorder:
         self._step_buffer: list[ExecutionStep] = []
         self._llm_buffer: list[LLMInteraction] = []
         self._file_op_buffer: list[FileOperation] = []
+        # _buffer_lock guards the three lists; _flush_lock serializes writers so
+        # a step is always committed no later than the records that reference it.
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._flusher: Optional[threading.Thread] = None
+        if background:
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                name=f"replay-flush-{run_id}",
+                daemon=True,
+            )
+            self._flusher.start()
 
     def record_iteration(
         self,
@@ -164,7 +189,8 @@ class ExecutionRecorder:
             output_result=llm_response_summary[:500] if llm_response_summary else None,
             metadata={"tool_names": tool_names},
         )
-        self._step_buffer.append(step)
+        with self._buffer_lock:
+            self._step_buffer.append(step)
         self._maybe_flush()
         return step_id
 
@@ -202,7 +228,8 @@ class ExecutionRecorder:
             timestamp=_utc_now(),
             purpose=purpose,
         )
-        self._llm_buffer.append(interaction)
+        with self._buffer_lock:
+            self._llm_buffer.append(interaction)
         self._maybe_flush()
         return interaction_id
 
@@ -237,30 +264,62 @@ class ExecutionRecorder:
             content_after=after,
             timestamp=_utc_now(),
         )
-        self._file_op_buffer.append(op)
+        with self._buffer_lock:
+            self._file_op_buffer.append(op)
         self._maybe_flush()
         return op_id
 
     def flush(self) -> None:
-        """Write all buffered records to the database."""
-        try:
-            for step in self._step_buffer:
-                save_execution_step(self.workspace, step)
-            for interaction in self._llm_buffer:
-                save_llm_interaction(self.workspace, interaction)
-            for op in self._file_op_buffer:
-                save_file_operation(self.workspace, op)
-            # Only clear on success — retain data for retry on failure
-            self._step_buffer.clear()
-            self._llm_buffer.clear()
-            self._file_op_buffer.clear()
-        except Exception:
-            logger.warning("ExecutionRecorder flush failed — data retained for retry", exc_info=True)
+        """Write all buffered records to the database in one transaction."""
+        with self._flush_lock:
+            with self._buffer_lock:
+                steps, self._step_buffer = self._step_buffer, []
+                interactions, self._llm_buffer = self._llm_buffer, []
+                ops, self._file_op_buffer = self._file_op_buffer, []
+            if not (steps or interactions or ops):
+                return
+            try:
+                save_trace_records(self.workspace, steps, interactions, ops)
+            except Exception:
+                # Put the batch back ahead of anything recorded meanwhile —
+                # retained for retry on the next flush.
+                with self._buffer_lock:
+                    self._step_buffer[:0] = steps
+                    self._llm_buffer[:0] = interactions
+                    self._file_op_buffer[:0] = ops
+                logger.warning("ExecutionRecorder flush failed — data retained for retry", exc_info=True)
+
+    def close(self) -> None:
+        """Stop the background flusher (if any) and flush what is buffered.
+
+        Safe to call more than once. Recording after ``close()`` still works;
+        auto-flushes then happen inline.
+        """
+        flusher = self._flusher
+        if flusher is not None:
+            self._stopping = True
+            self._wake.set()
+            flusher.join()
+            self._flusher = None
+        self.flush()
 
     def _maybe_flush(self) -> None:
         """Auto-flush when buffer reaches threshold."""
-        total = len(self._step_buffer) + len(self._llm_buffer) + len(self._file_op_buffer)
-        if total >= self._flush_interval:
+        with self._buffer_lock:
+            total = len(self._step_buffer) + len(self._llm_buffer) + len(self._file_op_buffer)
+        if total < self._flush_interval:
+            return
+        if self._flusher is not None:
+            self._wake.set()
+        else:
+            self.flush()
+
+    def _flush_loop(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._stopping:
+                return
             self.flush()
 
 
@@ -269,31 +328,35 @@ class ExecutionRecorder:
 # =============================================================================
 
 
+_INSERT_STEP_SQL = """
+    INSERT OR REPLACE INTO execution_steps
+    (id, run_id, step_number, step_type, description, started_at,
+     completed_at, status, input_context, output_result, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _step_params(step: ExecutionStep) -> tuple:
+    return (
+        step.id,
+        step.run_id,
+        step.step_number,
+        step.step_type,
+        step.description,
+        step.started_at.isoformat(),
+        step.completed_at.isoformat() if step.completed_at else None,
+        step.status,
+        step.input_context,
+        step.output_result,
+        json.dumps(step.metadata) if step.metadata else None,
+    )
+
+
 def save_execution_step(workspace: Workspace, step: ExecutionStep) -> None:
     conn = get_db_connection(workspace)
     try:
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO execution_steps
-            (id, run_id, step_number, step_type, description, started_at,
-             completed_at, status, input_context, output_result, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                step.id,
-                step.run_id,
-                step.step_number,
-                step.step_type,
-                step.description,
-                step.started_at.isoformat(),
-                step.completed_at.isoformat() if step.completed_at else None,
-                step.status,
-                step.input_context,
-                step.output_result,
-                json.dumps(step.metadata) if step.metadata else None,
-            ),
-        )
+        cursor.execute(_INSERT_STEP_SQL, _step_params(step))
         conn.commit()
     finally:
         conn.close()
@@ -325,29 +388,33 @@ def get_execution_steps(
 # =============================================================================
 
 
+_INSERT_LLM_SQL = """
+    INSERT OR REPLACE INTO llm_interactions
+    (id, run_id, step_id, prompt, response, model, tokens_used,
+     timestamp, purpose)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _llm_interaction_params(interaction: LLMInteraction) -> tuple:
+    return (
+        interaction.id,
+        interaction.run_id,
+        interaction.step_id,
+        interaction.prompt,
+        interaction.response,
+        interaction.model,
+        interaction.tokens_used,
+        interaction.timestamp.isoformat(),
+        interaction.purpose,
+    )
+
+
 def save_llm_interaction(workspace: Workspace, interaction: LLMInteraction) -> None:
     conn = get_db_connection(workspace)
     try:
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO llm_interactions
-            (id, run_id, step_id, prompt, response, model, tokens_used,
-             timestamp, purpose)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                interaction.id,
-                interaction.run_id,
-                interaction.step_id,
-                interaction.prompt,
-                interaction.response,
-                interaction.model,
-                interaction.tokens_used,
-                interaction.timestamp.isoformat(),
-                interaction.purpose,
-            ),
-        )
+        cursor.execute(_INSERT_LLM_SQL, _llm_interaction_params(interaction))
         conn.commit()
     finally:
         conn.close()
@@ -381,28 +448,32 @@ def get_llm_interactions(
 # =============================================================================
 
 
+_INSERT_FILE_OP_SQL = """
+    INSERT OR REPLACE INTO file_operations
+    (id, run_id, step_id, operation_type, file_path,
+     content_before, content_after, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _file_operation_params(op: FileOperation) -> tuple:
+    return (
+        op.id,
+        op.run_id,
+        op.step_id,
+        op.operation_type,
+        op.file_path,
+        op.content_before,
+        op.content_after,
+        op.timestamp.isoformat(),
+    )
+
+
 def save_file_operation(workspace: Workspace, op: FileOperation) -> None:
     conn = get_db_connection(workspace)
     try:
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO file_operations
-            (id, run_id, step_id, operation_type, file_path,
-             content_before, content_after, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                op.id,
-                op.run_id,
-                op.step_id,
-                op.operation_type,
-                op.file_path,
-                op.content_before,
-                op.content_after,
-                op.timestamp.isoformat(),
-            ),
-        )
+        cursor.execute(_INSERT_FILE_OP_SQL, _file_operation_params(op))
         conn.commit()
     finally:
         conn.close()
@@ -431,6 +502,37 @@ def get_file_operations(
         conn.close()
 
 
+# =============================================================================
+# Bulk write
+# =============================================================================
+
+
+def save_trace_records(
+    workspace: Workspace,
+    steps: Iterable[ExecutionStep] = (),
+    llm_interactions: Iterable[LLMInteraction] = (),
+    file_operations: Iterable[FileOperation] = (),
+) -> None:
+    """Insert steps, LLM interactions and file operations in one transaction.
+
+    Steps go first so the children's ``step_id`` foreign keys resolve within
+    the same transaction (#1061). All or nothing: on any error the whole batch
+    is rolled back and the exception propagates.
+    """
+    conn = get_db_connection(workspace)
+    try:
+        with conn:
+            conn.executemany(_INSERT_STEP_SQL, [_step_params(s) for s in steps])
+            conn.executemany(
+                _INSERT_LLM_SQL, [_llm_interaction_params(i) for i in llm_interactions]
+            )
+            conn.executemany(
+                _INSERT_FILE_OP_SQL, [_file_operation_params(op) for op in file_operations]
+            )
+    finally:
+        conn.close()
+
+
 # =============================================================================
 # Trace Loading
 # =============================================================================
@@ -7,7 +7,11 @@ analyzers without requiring v1 database persistence.
 This module is headless - no FastAPI or HTTP dependencies.
 """
 
+import itertools
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field as dataclass_field
 from pathlib import Path
 from typing import Literal, Optional
@@ -119,6 +123,107 @@ def _severity_from_score(score: float) -> Literal["critical", "high", "medium",
         return "info"
 
 
+#: Reviews of fewer files run the in-process analyzers inline: starting worker
+#: processes costs more than radon and the OWASP regexes spend on a small diff.
+PROCESS_POOL_MIN_FILES = 32
+
+#: Upper bound on analyzer worker processes.
+MAX_ANALYZER_WORKERS = 8
+
+#: (findings, error message) from one analyzer on one file.
+_AnalyzerOutcome = tuple[list, Optional[str]]
+
+
+def _read_source(full_path: Path) -> str:
+    """The file's text, or "" if it cannot be read (analyzers treat both alike)."""
+    try:
+        return full_path.read_text(encoding="utf-8", errors="replace")
+    except Exception as e:
+        logger.error(f"Error reading file {full_path}: {e}")
+        return ""
+
+
+def _review_finding(finding, file_path: str) -> ReviewFinding:
+    """An analyzer finding, reported against the caller's path."""
+    return ReviewFinding(
+        category=finding.category,
+        severity=finding.severity,
+        message=finding.message,
+        file_path=file_path,
+        line_number=finding.line_number,
+        suggestion=finding.suggestion,
+    )
+
+
+def _analyze_source(
+    complexity_analyzer: ComplexityAnalyzer,
+    owasp_checker: OWASPPatterns,
+    full_path: Path,
+    code: str,
+) -> tuple[_AnalyzerOutcome, _AnalyzerOutcome]:
+    """Complexity and OWASP findings for one file, each failing on its own."""
+    try:
+        complexity: _AnalyzerOutcome = (complexity_analyzer.analyze_code(full_path, code), None)
+    except Exception as e:
+        complexity = ([], str(e))
+    try:
+        owasp: _AnalyzerOutcome = (owasp_checker.check_code(full_path, code), None)
+    except Exception as e:
+        owasp = ([], str(e))
+    return complexity, owasp
+
+
+#: Analyzers of this worker process, per project path.
+_worker_analyzers: dict[str, tuple[ComplexityAnalyzer, OWASPPatterns]] = {}
+
+
+def _analyze_source_in_worker(
+    project_path: str, full_path: Path, code: str
+) -> tuple[_AnalyzerOutcome, _AnalyzerOutcome]:
+    """Process-pool entry point: ``_analyze_source`` with this process's analyzers."""
+    analyzers = _worker_analyzers.get(project_path)
+    if analyzers is None:
+        analyzers = (ComplexityAnalyzer(Path(project_path)), OWASPPatterns(Path(project_path)))
+        _worker_analyzers[project_path] = analyzers
+    return _analyze_source(*analyzers, full_path, code)
+
+
+def _run_local_analyzers(
+    project_path: Path,
+    complexity_analyzer: ComplexityAnalyzer,
+    owasp_checker: OWASPPatterns,
+    sources: list[tuple[Path, str]],
+) -> list[tuple[_AnalyzerOutcome, _AnalyzerOutcome]]:
+    """Run the in-process analyzers over ``sources``, results in input order.
+
+    radon and the OWASP regexes are CPU-bound, so a large review fans out
+    over a process pool. Small ones, single-CPU hosts, and any pool failure
+    run inline on the analyzers the caller built.
+    """
+    workers = min(os.cpu_count() or 1, MAX_ANALYZER_WORKERS, len(sources))
+    if len(sources) >= PROCESS_POOL_MIN_FILES and workers > 1:
+        try:
+            # spawn, not fork: review runs on server threads, and forking a
+            # threaded process can deadlock the child on a lock it inherited.
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                return list(pool.map(
+                    _analyze_source_in_worker,
+                    itertools.repeat(str(project_path)),
+                    [path for path, _ in sources],
+                    [code for _, code in sources],
+                    chunksize=max(1, len(sources) // (workers * 4)),
+                ))
+        except Exception as e:
+            logger.warning(f"Analyzer process pool failed, analyzing inline: {e}")
+
+    return [
+        _analyze_source(complexity_analyzer, owasp_checker, path, code)
+        for path, code in sources
+    ]
+
+
 def review_files(
     workspace: Workspace,
     files: list[str],
@@ -153,6 +258,8 @@ def review_files(
     analyzers_unavailable: dict[str, str] = {}
     files_skipped: list[str] = []
     files_analyzed = 0
+    # (caller's path, resolved path) for every file that passed the checks.
+    to_analyze: list[tuple[str, Path]] = []
 
     for file_path in files:
         # Security: the caller controls this string, so it is confined to the
@@ -198,71 +305,57 @@ def review_files(
             continue
 
         files_analyzed += 1
+        to_analyze.append((file_path, full_path))
+
+    # Each file is read once and the text shared by every analyzer; they used
+    # to read it three times between them.
+    sources = {full_path: _read_source(full_path) for _, full_path in to_analyze}
+
+    # Security scan: one bandit run over the whole set rather than a bandit
+    # process per file.
+    security_results: dict[Path, list] = {}
+    try:
+        security_results = security_scanner.analyze_sources(sources)
+    except ScannerUnavailableError as exc:
+        # The scanner is absent, not clean. Recorded once and reported as a
+        # finding so it drags the score and blocks "approved" (#910).
+        analyzers_unavailable["security"] = str(exc)
+    except Exception as e:
+        logger.warning(f"Security scan failed for {len(sources)} file(s): {e}")
+
+    local_results = _run_local_analyzers(
+        project_path,
+        complexity_analyzer,
+        owasp_checker,
+        [(full_path, sources[full_path]) for _, full_path in to_analyze],
+    )
 
+    # Assembled per file in the original analyzer order, so findings and the
+    # score come out exactly as when each file ran through all three in turn.
+    severity_scores = {"critical": 20, "high": 40, "medium": 60, "low": 80, "info": 95}
+    for (file_path, full_path), (complexity, owasp) in zip(to_analyze, local_results):
         # Complexity analysis
-        try:
-            complexity_findings = complexity_analyzer.analyze_file(full_path)
-            for finding in complexity_findings:
-                findings.append(
-                    ReviewFinding(
-                        category=finding.category,
-                        severity=finding.severity,
-                        message=finding.message,
-                        file_path=file_path,
-                        line_number=finding.line_number,
-                        suggestion=finding.suggestion,
-                    )
-                )
-                # Map severity to score for averaging
-                severity_scores = {"critical": 20, "high": 40, "medium": 60, "low": 80, "info": 95}
-                scores.append(severity_scores.get(finding.severity, 60))
-        except Exception as e:
-            logger.warning(f"Complexity analysis failed for {file_path}: {e}")
-
-        # Security scan
-        try:
-            security_findings = security_scanner.analyze_file(full_path)
-            for finding in security_findings:
-                findings.append(
-                    ReviewFinding(
-                        category=finding.category,
-                        severity=finding.severity,
-                        message=finding.message,
-                        file_path=file_path,
-                        line_number=finding.line_number,
-                        suggestion=finding.suggestion,
-                    )
-                )
-                # Security issues have heavier weight on score
-                severity_scores = {"critical": 20, "high": 40, "medium": 60, "low": 80, "info": 95}
-                scores.append(severity_scores.get(finding.severity, 60))
-        except ScannerUnavailableError as exc:
-            # The scanner is absent, not clean. Recorded once and reported as a
-            # finding so it drags the score and blocks "approved" (#910).
-            if "security" not in analyzers_unavailable:
-                analyzers_unavailable["security"] = str(exc)
-        except Exception as e:
-            logger.warning(f"Security scan failed for {file_path}: {e}")
+        complexity_findings, error = complexity
+        if error is not None:
+            logger.warning(f"Complexity analysis failed for {file_path}: {error}")
+        for finding in complexity_findings:
+            findings.append(_review_finding(finding, file_path))
+            # Map severity to score for averaging
+            scores.append(severity_scores.get(finding.severity, 60))
+
+        # Security scan — security issues have heavier weight on score
+        for finding in security_results.get(full_path, []):
+            findings.append(_review_finding(finding, file_path))
+            scores.append(severity_scores.get(finding.severity, 60))
 
         # OWASP pattern check
-        try:
-            owasp_findings = owasp_checker.check_file(full_path)
-            for finding in owasp_findings:
-                findings.append(
-                    ReviewFinding(
-                        category=finding.category,
-                        severity=finding.severity,
-                        message=finding.message,
-                        file_path=file_path,
-                        line_number=finding.line_number,
-                        suggestion=finding.suggestion,
-                    )
-                )
-                # OWASP findings are typically high severity
-                severity_scores = {"critical": 20, "high": 40, "medium": 60, "low": 80, "info": 95}
-                scores.append(severity_scores.get(finding.severity, 40))
-        except Exception as e:
-            logger.warning(f"OWASP check failed for {file_path}: {e}")
+        owasp_findings, error = owasp
+        if error is not None:
+            logger.warning(f"OWASP check failed for {file_path}: {error}")
+        for finding in owasp_findings:
+            findings.append(_review_finding(finding, file_path))
+            # OWASP findings are typically high severity
+            scores.append(severity_scores.get(finding.severity, 40))
 
     # An unavailable analyzer becomes a finding of its own, so it is visible in
     # every surface that shows findings, drags the score, and cannot be mistaken
@@ -13,6 +13,7 @@ from codeframe.core.sandbox.context import (
 from codeframe.core.sandbox.worktree import (
     MergeResult,
     TaskWorktree,
+    WorktreePool,
     get_base_branch,
 )
 
@@ -23,5 +24,6 @@ __all__ = [
     "validate_isolation",
     "MergeResult",
     "TaskWorktree",
+    "WorktreePool",
     "get_base_branch",
 ]
@@ -157,7 +157,7 @@ def _create_worktree_context(task_id: str, repo_path: Path) -> ExecutionContext:
     """
     import subprocess
 
-    from codeframe.core.worktrees import WORKTREE_DIR, TaskWorktree, get_base_branch
+    from codeframe.core.worktrees import WORKTREE_DIR, TaskWorktree, WorktreePool, get_base_branch
 
     # A preserved cf/<task_id> branch or worktree dir from a prior failed/conflicted
     # run would make `git worktree add -b` fail. Surface an actionable error instead
@@ -183,7 +183,9 @@ def _create_worktree_context(task_id: str, repo_path: Path) -> ExecutionContext:
 
     base_branch = get_base_branch(repo_path)
     worktree = TaskWorktree()
-    worktree_path = worktree.create(repo_path, task_id, base_branch=base_branch)
+    # Reuses a parked worktree when there is one; cleanup parks it again.
+    pool = WorktreePool(repo_path)
+    worktree_path = pool.acquire(task_id, base_branch=base_branch)
 
     def _merge_back() -> "MergeResult":
         worktree.auto_commit(worktree_path, task_id)
@@ -193,7 +195,7 @@ def _create_worktree_context(task_id: str, repo_path: Path) -> ExecutionContext:
         task_id=task_id,
         isolation=IsolationLevel.WORKTREE,
         workspace_path=worktree_path,
-        cleanup=lambda: worktree.cleanup(repo_path, task_id),
+        cleanup=lambda: pool.release(task_id),
         merge_back=_merge_back,
         preserve=_noop,  # leave worktree + branch on disk for recovery
     )
@@ -0,0 +1,407 @@
+"""Persistent token index of file contents, used to prefilter code search.
+
+The agent's ``search_codebase`` tool used to read every file under the size
+limit and run the regex over every line, on every call. ``SearchIndex`` keeps,
+per file, the set of identifier-like tokens it contains (lowercased runs of
+``[a-z0-9_]``) plus the inverted token -> files map, so a search only reads
+the files that can possibly match:
+
+- ``required_literals`` parses the regex and extracts the literal fragments
+  every match must contain, as alternatives of conjunctions (``foo.*bar|baz``
+  -> ``[["foo", "bar"], ["baz"]]``);
+- a fragment is looked up by substring in the token vocabulary, so ``_rec``
+  finds files containing ``get_record`` — a fragment always lies inside one
+  token of the matched text, because fragments never span a non-word char;
+- a regex with no usable fragment (``\\w+\\(``, ``[A-Z]{3}``) is not
+  prefiltered; the caller scans every searchable file instead.
+
+This is a ripgrep/codesearch-style literal prefilter over tokens rather than
+byte trigrams: a trigram posting list per file is several times the size of
+its token set and building it in Python runs at a few MB/s, while the token
+set falls out of one ``re.findall``.
+
+The index stays fresh by ``stat``-ing every indexed file per search and
+re-tokenizing files whose size or mtime changed (and, as in the file index,
+files modified within ``_RACY_NS`` of when they were read). It is kept per
+process (``for_root``) and persisted for a workspace root to
+``.codeframe/search_index.json`` — JSON, never pickle, since the state dir is
+writable by whatever runs in the workspace.
+
+This module is headless - no FastAPI or HTTP dependencies.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from codeframe.core import file_index
+from codeframe.core.atomic_io import atomic_write_text
+from codeframe.core.file_index import FileIndex
+
+try:  # CPython's regex parser; private, so degrade to "no prefilter" without it.
+    from re import _constants as _sre
+    from re import _parser as _sre_parser
+except ImportError:  # pragma: no cover
+    _sre = _sre_parser = None
+
+logger = logging.getLogger(__name__)
+
+#: File under the workspace state dir that holds the persisted index.
+SEARCH_INDEX_NAME = "search_index.json"
+
+#: Files larger than this are neither indexed nor searched (matches
+#: ``tools.MAX_SEARCH_FILE_SIZE``).
+MAX_INDEXED_FILE_SIZE = 1_000_000
+
+#: Bumped when the persisted layout changes; older files are ignored.
+_FORMAT_VERSION = 1
+
+#: A file modified this close to when it was read is re-read next time even
+#: if size and mtime match (same margin as ``file_index._RACY_NS``).
+_RACY_NS = 2_000_000_000
+
+#: Rewrite the persisted index once this many files have been re-tokenized
+#: since the last write.
+_SAVE_AFTER_FILES = 64
+
+#: Fragments shorter than this match too much of the vocabulary to narrow
+#: anything, so they do not count as a usable literal.
+_MIN_FRAGMENT = 3
+
+_TOKEN_RE = re.compile(rb"[a-z0-9_]+")
+_FRAGMENT_RE = re.compile(r"[a-z0-9_]{%d,}" % _MIN_FRAGMENT)
+
+#: ASCII letters that IGNORECASE also matches against non-ASCII characters
+#: ("i" ~ U+0130/U+0131, "k" ~ KELVIN SIGN, "s" ~ LONG S). Such a letter in a
+#: case-insensitive pattern can match a byte sequence our ASCII tokens split,
+#: so it ends a literal run.
+_UNICODE_FOLDED = frozenset("iIkKsS")
+
+
+# ---------------------------------------------------------------------------
+# Literal extraction
+# ---------------------------------------------------------------------------
+
+
+def required_literals(pattern: str) -> Optional[list[list[str]]]:
+    """Literal fragments a line must contain to match ``pattern``.
+
+    Returns:
+        Alternatives, each a list of lowercase fragments that must all occur
+        in the line, or None if some alternative has no usable fragment (and
+        every file must be scanned)
+    """
+    if _sre_parser is None:
+        return None
+    try:
+        parsed = _sre_parser.parse(pattern)
+    except (re.error, RecursionError):
+        return None
+    query = []
+    try:
+        for items, flags in _alternatives(list(parsed), parsed.state.flags):
+            # Longest first: the rarest, so intersections shrink fastest.
+            fragments = sorted(set(_fragments(items, flags)), key=lambda f: (-len(f), f))
+            if not fragments:
+                return None
+            query.append(fragments)
+    except (AttributeError, TypeError, ValueError):
+        return None  # the private parser changed shape; scan everything
+    return query
+
+
+def _alternatives(items: list, flags: int) -> list[tuple[list, int]]:
+    """Split a top-level ``a|b`` (optionally inside one group) into branches."""
+    if len(items) == 1:
+        op, av = items[0]
+        if op is _sre.BRANCH:
+            return [(list(branch), flags) for branch in av[1]]
+        if op is _sre.SUBPATTERN:
+            _, add, remove, sub = av
+            return _alternatives(list(sub), (flags | add) & ~remove)
+    return [(items, flags)]
+
+
+def _usable(ch: str, ignorecase: bool) -> bool:
+    return ch.isascii() and not (ignorecase and ch in _UNICODE_FOLDED)
+
+
+def _fragments(items: list, flags: int) -> list[str]:
+    """Required word fragments of a sequence of parsed regex items."""
+    fragments: list[str] = []
+    run: list[str] = []
+
+    def flush() -> None:
+        if run:
+            fragments.extend(_FRAGMENT_RE.findall("".join(run)))
+            run.clear()
+
+    ignorecase = bool(flags & _sre.SRE_FLAG_IGNORECASE) and not flags & _sre.SRE_FLAG_ASCII
+    for op, av in items:
+        if op is _sre.LITERAL:
+            ch = chr(av)
+            if _usable(ch, ignorecase):
+                run.append(ch.lower())
+                continue
+            flush()
+        elif op is _sre.SUBPATTERN:
+            flush()
+            _, add, remove, sub = av
+            fragments.extend(_fragments(list(sub), (flags | add) & ~remove))
+        elif op in (_sre.MAX_REPEAT, _sre.MIN_REPEAT, _sre.POSSESSIVE_REPEAT):
+            low, _, sub = av
+            sub = list(sub)
+            if low >= 1 and all(
+                o is _sre.LITERAL and _usable(chr(a), ignorecase) for o, a in sub
+            ):
+                # The first copy of "w" in "yzw+" continues the run.
+                run.extend(chr(a).lower() for _, a in sub)
+                flush()
+                continue
+            flush()
+            if low >= 1:
+                fragments.extend(_fragments(sub, flags))
+        elif op is _sre.ATOMIC_GROUP:
+            flush()
+            fragments.extend(_fragments(list(av), flags))
+        else:
+            # Classes, anchors, alternations, lookarounds, backreferences:
+            # nothing required, and the literal run ends here.
+            flush()
+    flush()
+    return fragments
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+class SearchIndex:
+    """Token index over the searchable files of a ``FileIndex``.
+
+    Thread-safe: ``candidates`` serialises on an internal lock.
+    """
+
+    def __init__(self, files: FileIndex, state_path: Optional[Path] = None):
+        self.files = files
+        self.root = files.root
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        # path -> (size, mtime_ns, read_at_ns, tokens); tokens None = not UTF-8
+        self._docs: dict[str, tuple[int, int, int, Optional[frozenset[str]]]] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._vocab: Optional[str] = None
+        self._persisted = False
+        self._unsaved = 0
+        if state_path is not None:
+            self._load()
+
+    # -- public API ----------------------------------------------------------
+
+    def candidates(self, pattern: str) -> tuple[list[str], bool]:
+        """Files that may contain a line matching ``pattern``, sorted by path.
+
+        Symlinked files are never indexed (their target may lie outside the
+        root) and are always returned, for the caller to vet and scan.
+
+        Returns:
+            (relative POSIX paths, whether they were narrowed by the index).
+            When not narrowed the list is every searchable file.
+        """
+        query = required_literals(pattern)
+        with self._lock:
+            links = self._refresh_locked()
+            if query is None:
+                found = {p for p, doc in self._docs.items() if doc[3] is not None}
+            else:
+                found = set()
+                for fragments in query:
+                    paths: Optional[set[str]] = None
+                    for fragment in fragments:
+                        hits = self._paths_with(fragment)
+                        paths = hits if paths is None else paths & hits
+                        if not paths:
+                            break
+                    found |= paths or set()
+        found.update(links)
+        return sorted(found), query is not None
+
+    # -- internals -----------------------------------------------------------
+
+    def _paths_with(self, fragment: str) -> set[str]:
+        """Files containing a token that contains ``fragment``."""
+        if self._vocab is None:
+            self._vocab = "\n".join(self._postings)
+        vocab, postings = self._vocab, self._postings
+        paths: set[str] = set()
+        i = vocab.find(fragment)
+        while i != -1:
+            start = vocab.rfind("\n", 0, i) + 1
+            end = vocab.find("\n", i)
+            if end == -1:
+                end = len(vocab)
+            paths |= postings[vocab[start:end]]
+            i = vocab.find(fragment, end)
+        return paths
+
+    def _refresh_locked(self) -> list[str]:
+        """Re-tokenize changed files and drop vanished ones.
+
+        Returns:
+            The symlinked files, which are listed but not indexed
+        """
+        docs = self._docs
+        live: set[str] = set()
+        links: list[str] = []
+        root = str(self.root)
+        for entry in self.files.files():
+            if entry.is_link:
+                links.append(entry.path)
+                continue
+            try:
+                st = os.stat(os.path.join(root, entry.path))
+            except OSError:
+                continue
+            if st.st_size > MAX_INDEXED_FILE_SIZE:
+                continue
+            live.add(entry.path)
+            doc = docs.get(entry.path)
+            if (
+                doc is not None
+                and doc[0] == st.st_size
+                and doc[1] == st.st_mtime_ns
+                and st.st_mtime_ns < doc[2] - _RACY_NS
+            ):
+                continue
+            self._index(entry.path, st.st_size, st.st_mtime_ns)
+
+        for path in [p for p in docs if p not in live]:
+            self._forget(path)
+            self._unsaved += 1
+        if self._unsaved and (not self._persisted or self._unsaved >= _SAVE_AFTER_FILES):
+            self._save()
+        return links
+
+    def _index(self, path: str, size: int, mtime_ns: int) -> None:
+        read_at = time.time_ns()
+        try:
+            with open(os.path.join(self.root, path), "rb") as fh:
+                data = fh.read()
+            data.decode("utf-8")
+            tokens: Optional[frozenset[str]] = frozenset(
+                t.decode("ascii") for t in set(_TOKEN_RE.findall(data.lower()))
+            )
+        except UnicodeDecodeError:
+            tokens = None  # binary: search_codebase skips it too
+        except OSError:
+            return
+        old = self._docs.get(path)
+        if old is not None and old[3] == tokens:
+            self._docs[path] = (size, mtime_ns, read_at, old[3])
+            return
+        self._forget(path)
+        self._add(path, size, mtime_ns, read_at, tokens)
+        self._unsaved += 1
+
+    def _add(
+        self,
+        path: str,
+        size: int,
+        mtime_ns: int,
+        read_at: int,
+        tokens: Optional[frozenset[str]],
+    ) -> None:
+        self._docs[path] = (size, mtime_ns, read_at, tokens)
+        for token in tokens or ():
+            paths = self._postings.get(token)
+            if paths is None:
+                self._postings[token] = {path}
+                self._vocab = None
+            else:
+                paths.add(path)
+
+    def _forget(self, path: str) -> None:
+        doc = self._docs.pop(path, None)
+        if doc is None:
+            return
+        for token in doc[3] or ():
+            paths = self._postings[token]
+            paths.discard(path)
+            if not paths:
+                del self._postings[token]
+                self._vocab = None
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _FORMAT_VERSION
+            or data.get("root") != str(self.root)
+        ):
+            return
+        try:
+            for path, (size, mtime, read_at, tokens) in data["files"].items():
+                self._add(
+                    path, int(size), int(mtime), int(read_at),
+                    None if tokens is None else frozenset(tokens.split()),
+                )
+            self._persisted = True
+        except (KeyError, TypeError, ValueError, AttributeError):
+            self._docs, self._postings, self._vocab = {}, {}, None
+
+    def _save(self) -> None:
+        if self.state_path is None:
+            self._unsaved = 0
+            return
+        payload = {
+            "version": _FORMAT_VERSION,
+            "root": str(self.root),
+            "files": {
+                path: [size, mtime, read_at, None if tokens is None else " ".join(tokens)]
+                for path, (size, mtime, read_at, tokens) in self._docs.items()
+            },
+        }
+        try:
+            atomic_write_text(self.state_path, json.dumps(payload, separators=(",", ":")))
+            self._persisted = True
+            self._unsaved = 0
+        except OSError as exc:
+            logger.debug("Could not persist search index %s: %s", self.state_path, exc)
+
+
+#: Indexes kept per process (one per workspace root or task worktree).
+_MAX_INDEXES = 16
+
+_indexes: OrderedDict[str, SearchIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def for_root(root: Path) -> SearchIndex:
+    """The shared search index for ``root``, over its default file index."""
+    root = Path(root).resolve()
+    key = str(root)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = SearchIndex(
+                file_index.for_root(root),
+                state_path=file_index.state_file(root, SEARCH_INDEX_NAME),
+            )
+            _indexes[key] = index
+            while len(_indexes) > _MAX_INDEXES:
+                _indexes.popitem(last=False)
+        else:
+            _indexes.move_to_end(key)
+        return index
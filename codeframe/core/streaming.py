@@ -18,6 +18,7 @@ import asyncio
 import codecs
 import logging
 import os
+import struct
 import threading
 import time
 from collections import defaultdict
@@ -26,6 +27,7 @@ from pathlib import Path
 from typing import (
     AsyncIterator,
     Awaitable,
+    BinaryIO,
     Callable,
     Dict,
     Iterator,
@@ -34,6 +36,7 @@ from typing import (
     TYPE_CHECKING,
 )
 
+from codeframe.core.event_notifier import EventNotifier
 from codeframe.core.workspace import Workspace
 
 if TYPE_CHECKING:
@@ -85,6 +88,8 @@ class RunOutputLogger:
             logger.write_timestamped("Step completed")
 
     The log file is flushed after each write to enable real-time streaming.
+    Alongside it the logger maintains ``output.log.idx``, the sparse line
+    index readers use to resume at ``since_line`` without scanning the log.
     """
 
     def __init__(self, workspace: Workspace, run_id: str):
@@ -98,12 +103,19 @@ class RunOutputLogger:
         self.run_id = run_id
         self.log_path = get_run_output_path(workspace, run_id)
         self._file = None  # Initialize before potential mkdir/open failure
+        self._index: Optional[_LineIndexWriter] = None
 
         # Ensure directory exists
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Open file in append mode
-        self._file = open(self.log_path, "a", encoding="utf-8")
+        # Binary append: the line index records byte offsets, so the logger
+        # must know exactly how many bytes each write put on disk.
+        self._file = open(self.log_path, "ab")
+        try:
+            self._index = _LineIndexWriter(self.log_path)
+        except OSError as exc:
+            # The index only speeds up readers; never fail a run over it.
+            logger.debug("Line index unavailable for %s: %s", self.log_path, exc)
 
     def write(self, message: str) -> None:
         """Write a message to the log file.
@@ -113,8 +125,11 @@ class RunOutputLogger:
         Args:
             message: Message to write (should include newline if desired)
         """
-        self._file.write(message)
+        data = message.encode("utf-8")
+        self._file.write(data)
         self._file.flush()
+        if self._index is not None:
+            self._index.record(data)
 
     def write_timestamped(self, message: str) -> None:
         """Write a message with a timestamp prefix.
@@ -131,6 +146,9 @@ class RunOutputLogger:
         """Close the log file."""
         if hasattr(self, "_file") and self._file and not self._file.closed:
             self._file.close()
+        if getattr(self, "_index", None) is not None:
+            self._index.close()
+            self._index = None
 
     def __enter__(self) -> "RunOutputLogger":
         """Context manager entry."""
@@ -141,6 +159,279 @@ class RunOutputLogger:
         self.close()
 
 
+# =============================================================================
+# Incremental log reading
+# =============================================================================
+
+#: Every LINE_INDEX_STRIDE-th line start is recorded in ``output.log.idx``, so
+#: resuming at any ``since_line`` scans at most this many lines of the log.
+LINE_INDEX_STRIDE = 1024
+
+_INDEX_ENTRY = struct.Struct("<Q")
+
+#: Block size for raw scans, and the most one poll reads before yielding.
+_SCAN_BLOCK = 64 * 1024
+_MAX_POLL_BYTES = 16 * _SCAN_BLOCK
+
+#: Trailing bytes of consumed log re-verified each poll to detect replacement.
+_SIGNATURE_BYTES = 32
+
+
+def _line_index_path(log_path: Path) -> Path:
+    return log_path.with_name(log_path.name + ".idx")
+
+
+def _index_checkpoint(log_path: Path, line: Optional[int] = None) -> tuple[int, int]:
+    """Nearest indexed ``(line, byte_offset)`` at or before ``line``.
+
+    ``line=None`` asks for the last checkpoint. Returns ``(0, 0)`` when there
+    is none. The entry is checked against the log (in range and preceded by a
+    newline), so an index left behind by a replaced log degrades to a scan
+    rather than a wrong seek.
+    """
+    try:
+        with open(_line_index_path(log_path), "rb") as idx:
+            entries = os.fstat(idx.fileno()).st_size // _INDEX_ENTRY.size
+            if line is not None:
+                entries = min(entries, line // LINE_INDEX_STRIDE)
+            if entries == 0:
+                return 0, 0
+            idx.seek((entries - 1) * _INDEX_ENTRY.size)
+            (offset,) = _INDEX_ENTRY.unpack(idx.read(_INDEX_ENTRY.size))
+        with open(log_path, "rb") as f:
+            if 0 < offset <= os.fstat(f.fileno()).st_size:
+                f.seek(offset - 1)
+                if f.read(1) == b"\n":
+                    return entries * LINE_INDEX_STRIDE, offset
+    except (OSError, struct.error):
+        pass
+    return 0, 0
+
+
+def _skip_lines(f: BinaryIO, offset: int, count: int) -> tuple[int, int]:
+    """Advance past ``count`` newlines from ``offset`` without decoding.
+
+    Returns ``(new_offset, lines_still_to_skip)``. The second value is
+    non-zero when EOF came first; the offset is then EOF, which may sit inside
+    an unterminated line that the remaining count will consume once it ends.
+    """
+    f.seek(offset)
+    while count:
+        block = f.read(_SCAN_BLOCK)
+        if not block:
+            break
+        newlines = block.count(b"\n")
+        if newlines < count:
+            count -= newlines
+            offset += len(block)
+            continue
+        pos = -1
+        for _ in range(count):
+            pos = block.index(b"\n", pos + 1)
+        return offset + pos + 1, 0
+    return offset, count
+
+
+class _LineIndexWriter:
+    """Maintains ``output.log.idx`` as :class:`RunOutputLogger` appends.
+
+    Entry *k* is the byte offset where line ``(k + 1) * LINE_INDEX_STRIDE``
+    starts. On open it reconciles with what is already on disk (a resumed run,
+    a log that predates the index, an index left by a replaced log) by keeping
+    the valid prefix and scanning the rest of the log once.
+    """
+
+    def __init__(self, log_path: Path) -> None:
+        self.lines, self.size = _index_checkpoint(log_path)
+        self._fd = os.open(
+            _line_index_path(log_path), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+        )
+        try:
+            os.ftruncate(self._fd, self.lines // LINE_INDEX_STRIDE * _INDEX_ENTRY.size)
+            with open(log_path, "rb") as f:
+                f.seek(self.size)
+                while block := f.read(_SCAN_BLOCK):
+                    self.record(block)
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def record(self, data: bytes) -> None:
+        """Account for ``data`` having been appended to the log."""
+        newlines = data.count(b"\n")
+        if newlines >= LINE_INDEX_STRIDE - self.lines % LINE_INDEX_STRIDE:
+            entries = bytearray()
+            line, pos = self.lines, -1
+            for _ in range(newlines):
+                pos = data.index(b"\n", pos + 1)
+                line += 1
+                if line % LINE_INDEX_STRIDE == 0:
+                    entries += _INDEX_ENTRY.pack(self.size + pos + 1)
+            try:
+                os.write(self._fd, entries)
+            except OSError as exc:
+                logger.debug("Could not extend line index: %s", exc)
+        self.lines += newlines
+        self.size += len(data)
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _LogFollower:
+    """Incremental reader over one run's output.log, shared by both tailers.
+
+    Remembers a byte offset and reads only what was appended since the last
+    poll (#902). Before this, each poll re-read the whole file with
+    ``readlines()`` (twice a second, per connected client), so following a
+    long run cost O(size) per tick and quadratic I/O over the run.
+
+    Binary mode with a persistent incremental decoder, deliberately. Text mode
+    would hand back an opaque tell() cookie (not comparable with st_size), and
+    decoding each chunk independently mangles any multibyte character whose
+    bytes straddle a poll: the partial sequence at EOF becomes U+FFFD and its
+    remaining bytes are then orphaned. The decoder holds incomplete sequences
+    until the rest arrives, so emoji/CJK output survives the boundary.
+
+    ``since_line`` is resolved once, on the first poll: jump to the nearest
+    line-index checkpoint, then count raw newlines for the rest. Lines before
+    ``since_line`` are never decoded.
+    """
+
+    def __init__(self, log_path: Path, since_line: int = 0) -> None:
+        self.log_path = log_path
+        self.offset = 0
+        self.pending = ""
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        # Last bytes we consumed, re-verified each poll to detect that the file
+        # was replaced underneath us. Inode identity is not enough on its own:
+        # a delete-then-recreate can reuse the inode number immediately, and
+        # file timestamps change on ordinary appends, so neither distinguishes
+        # "appended" from "replaced". Comparing the bytes we already read does,
+        # at the cost of one bounded extra read per poll.
+        self.signature = b""
+        self.skip_lines = max(since_line, 0)
+        self.reached_tail = self.skip_lines == 0
+        #: True when the last poll stopped at _MAX_POLL_BYTES with more to read;
+        #: callers poll again instead of sleeping.
+        self.behind = False
+        self._positioned = self.skip_lines == 0
+
+    def poll(self) -> list[str]:
+        """Complete lines appended since the last poll. Never raises.
+
+        Only complete lines are returned: a trailing fragment is a line the
+        agent is still writing, held back until its newline arrives.
+        """
+        if not self.log_path.exists():
+            return []
+        if not self._positioned:
+            self._position()
+
+        appended, was_reset = self._read_new()
+        if was_reset:
+            # Never weld a pre-rotation fragment onto the new file's head.
+            self.pending = ""
+        self.pending += appended
+        if "\n" not in self.pending:
+            return []
+
+        *lines, self.pending = self.pending.split("\n")
+        if self.skip_lines:
+            skipped = min(self.skip_lines, len(lines))
+            self.skip_lines -= skipped
+            del lines[:skipped]
+        self.reached_tail = self.reached_tail or self.skip_lines == 0
+        return [line + "\n" for line in lines]
+
+    def remainder(self) -> str:
+        """A final unterminated line, to flush when the stream closes.
+
+        Gated on having reached the live tail rather than on having returned
+        anything: with since_line == the exact number of complete lines, every
+        line is skipped, yet the trailing fragment is still the caller's.
+        """
+        return self.pending if self.pending and self.reached_tail else ""
+
+    def _position(self) -> None:
+        self._positioned = True
+        try:
+            line, offset = _index_checkpoint(self.log_path, self.skip_lines)
+            with open(self.log_path, "rb") as f:
+                offset, remaining = _skip_lines(f, offset, self.skip_lines - line)
+                start = max(offset - _SIGNATURE_BYTES, 0)
+                f.seek(start)
+                signature = f.read(offset - start)
+        except OSError:
+            return  # fall back to skipping line by line from the top
+        self.offset = offset
+        self.signature = signature
+        self.skip_lines = remaining
+        self.reached_tail = remaining == 0
+
+    def _read_new(self) -> tuple[str, bool]:
+        """``(text_appended, was_reset)``. Never raises."""
+        try:
+            with open(self.log_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                reset = size < self.offset
+                if not reset and self.offset and self.signature:
+                    f.seek(self.offset - len(self.signature))
+                    reset = f.read(len(self.signature)) != self.signature
+
+                if reset:
+                    self.offset = 0
+                    self.signature = b""
+                    self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+                f.seek(self.offset)
+                chunk = f.read(_MAX_POLL_BYTES)
+
+            self.offset += len(chunk)
+            self.behind = len(chunk) == _MAX_POLL_BYTES
+            if chunk:
+                self.signature = (self.signature + chunk)[-_SIGNATURE_BYTES:]
+            return self.decoder.decode(chunk), reset
+        except Exception:
+            self.behind = False
+            return "", False  # File might be temporarily unavailable
+
+
+def _count_lines(log_path: Path, f: BinaryIO, size: int) -> int:
+    """Line count as ``readlines()`` would report it, from the last checkpoint."""
+    line, offset = _index_checkpoint(log_path)
+    f.seek(offset)
+    while block := f.read(_SCAN_BLOCK):
+        line += block.count(b"\n")
+    if size:
+        f.seek(size - 1)
+        if f.read(1) != b"\n":
+            line += 1  # unterminated last line
+    return line
+
+
+def _read_last_lines(f: BinaryIO, size: int, count: int) -> list[str]:
+    """The last ``count`` lines, read backwards from EOF in blocks."""
+    if count <= 0:
+        return []
+    start, buf = size, b""
+    # A terminated last line needs count + 1 newlines to bound it, an
+    # unterminated one count; one extra block either way is harmless.
+    while start > 0 and buf.count(b"\n") <= count:
+        step = min(_SCAN_BLOCK, start)
+        start -= step
+        f.seek(start)
+        buf = f.read(step) + buf
+
+    *complete, last = buf.split(b"\n")
+    lines = [chunk + b"\n" for chunk in complete]
+    if last:
+        lines.append(last)
+    if start > 0:
+        lines = lines[1:]  # the first chunk may begin mid-line
+    return [line.decode("utf-8", errors="replace") for line in lines[-count:]]
+
+
 def get_latest_lines(workspace: Workspace, run_id: str, count: int) -> list[str]:
     """Get the last N lines from a run's output log.
 
@@ -163,6 +454,10 @@ def get_latest_lines_with_count(
 ) -> tuple[list[str], int]:
     """Get the last N lines and total line count from a run's output log.
 
+    Reads backwards from EOF for the lines and counts the total from the last
+    line-index checkpoint, so the cost does not grow with the size of the log.
+    The total is the ``since_line`` to resume a tail from.
+
     Args:
         workspace: Target workspace
         run_id: Run identifier
@@ -177,15 +472,10 @@ def get_latest_lines_with_count(
         return [], 0
 
     try:
-        with open(log_path, "r", encoding="utf-8") as f:
-            all_lines = f.readlines()
-
-        total = len(all_lines)
-
-        if count >= total:
-            return all_lines, total
-
-        return all_lines[-count:], total
+        with open(log_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            total = _count_lines(log_path, f, size)
+            return _read_last_lines(f, size, count), total
 
     except Exception:
         return [], 0
@@ -203,6 +493,7 @@ def tail_run_output(
 
     This generator polls the log file and yields new lines as they appear.
     It's designed to be used with `cf work follow` for real-time streaming.
+    Each poll reads only the bytes appended since the last one.
 
     Args:
         workspace: Target workspace
@@ -215,8 +506,7 @@ def tail_run_output(
     Yields:
         Lines from the log file as they appear
     """
-    log_path = get_run_output_path(workspace, run_id)
-    current_line = since_line
+    follower = _LogFollower(get_run_output_path(workspace, run_id), since_line)
     iterations = 0
     start_time = time.time()
 
@@ -228,27 +518,16 @@ def tail_run_output(
         if max_wait is not None and (time.time() - start_time) >= max_wait:
             break
 
-        # Check if file exists
-        if not log_path.exists():
-            time.sleep(poll_interval)
-            iterations += 1
-            continue
-
-        try:
-            with open(log_path, "r", encoding="utf-8") as f:
-                all_lines = f.readlines()
-
-            # Yield new lines
-            while current_line < len(all_lines):
-                yield all_lines[current_line]
-                current_line += 1
-
-        except Exception:
-            pass  # File might be temporarily unavailable
+        yield from follower.poll()
 
-        time.sleep(poll_interval)
+        if not follower.behind:
+            time.sleep(poll_interval)
         iterations += 1
 
+    remainder = follower.remainder()
+    if remainder:
+        yield remainder
+
 
 async def atail_run_output(
     workspace: Workspace,
@@ -279,68 +558,9 @@ async def atail_run_output(
     Yields:
         Lines from the log file as they appear
     """
-    log_path = get_run_output_path(workspace, run_id)
+    follower = _LogFollower(get_run_output_path(workspace, run_id), since_line)
     start_time = time.monotonic()
 
-    # Incremental tail (#902). The previous implementation re-read the whole
-    # file with readlines() on every poll — twice a second, per connected
-    # client — so a multi-MB agent log burned O(size) CPU and IO per tick on the
-    # event loop, for every open tab. We now remember a byte offset and read
-    # only what was appended since.
-    #
-    # Binary mode with a persistent incremental decoder, deliberately. Text mode
-    # would hand back an opaque tell() cookie (not comparable with st_size), and
-    # decoding each chunk independently mangles any multibyte character whose
-    # bytes straddle a poll: the partial sequence at EOF becomes U+FFFD and its
-    # remaining bytes are then orphaned. The decoder holds incomplete sequences
-    # until the rest arrives, so emoji/CJK output survives the boundary.
-    offset = 0
-    pending = ""
-    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
-    skip_lines = max(since_line, 0)
-    reached_tail = skip_lines == 0
-
-    # Last bytes we consumed, re-verified each poll to detect that the file was
-    # replaced underneath us. Inode identity is not enough on its own: a
-    # delete-then-recreate can reuse the inode number immediately, and file
-    # timestamps change on ordinary appends, so neither distinguishes "appended"
-    # from "replaced". Comparing the bytes we already read does, at the cost of
-    # one bounded extra read per poll.
-    _SIGNATURE_BYTES = 32
-    signature = b""
-
-    def _read_new() -> tuple[str, bool]:
-        """``(text_appended, was_reset)``. Never raises.
-
-        Returns ``was_reset`` rather than clearing ``pending`` itself: the
-        caller's ``pending += ...`` loads ``pending`` *before* evaluating this
-        call, so an assignment in here would be silently discarded.
-        """
-        nonlocal offset, decoder, signature
-        try:
-            size = log_path.stat().st_size
-            reset = size < offset
-            if not reset and offset and signature:
-                with open(log_path, "rb") as f:
-                    f.seek(offset - len(signature))
-                    reset = f.read(len(signature)) != signature
-
-            if reset:
-                offset = 0
-                signature = b""
-                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
-
-            with open(log_path, "rb") as f:
-                f.seek(offset)
-                chunk = f.read()
-                offset = f.tell()
-
-            if chunk:
-                signature = (signature + chunk)[-_SIGNATURE_BYTES:]
-            return decoder.decode(chunk), reset
-        except Exception:
-            return "", False  # File might be temporarily unavailable
-
     while True:
         if max_wait is not None and (time.monotonic() - start_time) >= max_wait:
             break
@@ -348,36 +568,15 @@ async def atail_run_output(
         if should_stop is not None and await should_stop():
             break
 
-        if log_path.exists():
-            appended, was_reset = _read_new()
-            if was_reset:
-                # Never weld a pre-rotation fragment onto the new file's head.
-                pending = ""
-            pending += appended
-
-            # Only emit complete lines: a trailing fragment is a line the agent
-            # is still writing. Holding it back until its newline arrives also
-            # fixes a latent bug in the old version, which could yield a partial
-            # line and then never emit its remainder.
-            while "\n" in pending:
-                line, pending = pending.split("\n", 1)
-                if skip_lines:
-                    skip_lines -= 1
-                    if skip_lines == 0:
-                        reached_tail = True
-                    continue
-                reached_tail = True
-                yield line + "\n"
+        for line in follower.poll():
+            yield line
 
-        await asyncio.sleep(poll_interval)
+        # A backlog is read in bounded slices; yield the loop between them.
+        await asyncio.sleep(0 if follower.behind else poll_interval)
 
-    # Flush a final unterminated line (a log whose last write had no newline),
-    # which would otherwise be lost when the stream closes. Gated on having
-    # reached the live tail rather than on having yielded anything: with
-    # since_line == the exact number of complete lines, every line is skipped
-    # and nothing is yielded, yet the trailing fragment is still the caller's.
-    if pending and reached_tail:
-        yield pending
+    remainder = follower.remainder()
+    if remainder:
+        yield remainder
 
 
 # =============================================================================
@@ -430,14 +629,25 @@ class EventPublisher:
     Configuration (via environment variables):
         SSE_TIMEOUT_SECONDS: Timeout for waiting on events (default: 30)
         SSE_MAX_QUEUE_SIZE: Max events per subscriber queue (default: 1000)
+
+    With a ``notifier`` (the process-wide one from ``event_notifier``), every
+    publish and completion also bumps the ``task_topic(task_id)`` generation,
+    so code without an event loop can wait for a task's activity the same way
+    ``events.tail`` waits for the event log.
     """
 
-    def __init__(self, timeout: Optional[float] = None, max_queue_size: Optional[int] = None):
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        max_queue_size: Optional[int] = None,
+        notifier: Optional[EventNotifier] = None,
+    ):
         """Initialize the event publisher.
 
         Args:
             timeout: Timeout for waiting on events (default: SSE_TIMEOUT_SECONDS env var)
             max_queue_size: Max events per queue (default: SSE_MAX_QUEUE_SIZE env var)
+            notifier: Optional shared change notifier to signal on publish
         """
         # Map task_id -> list of subscriber queues
         self._subscribers: Dict[str, List[_Subscription]] = defaultdict(list)
@@ -448,6 +658,12 @@ class EventPublisher:
         # Configuration
         self._timeout = timeout if timeout is not None else SSE_TIMEOUT_SECONDS
         self._max_queue_size = max_queue_size if max_queue_size is not None else SSE_MAX_QUEUE_SIZE
+        self._notifier = notifier
+
+    @staticmethod
+    def task_topic(task_id: str) -> str:
+        """Notifier topic bumped for each event published to ``task_id``."""
+        return f"task:{task_id}"
 
     async def subscribe(self, task_id: str) -> AsyncIterator["ExecutionEvent"]:
         """Subscribe to events for a task.
@@ -510,6 +726,8 @@ class EventPublisher:
             task_id: Task ID to publish to
             event: Event to publish
         """
+        if self._notifier is not None:
+            self._notifier.notify(self.task_topic(task_id))
         async with self._lock:
             subscribers = self._subscribers.get(task_id, [])
             for subscription in subscribers:
@@ -594,6 +812,8 @@ class EventPublisher:
         Args:
             task_id: Task ID that completed
         """
+        if self._notifier is not None:
+            self._notifier.notify(self.task_topic(task_id))
         async with self._lock:
             subscribers = self._subscribers.get(task_id, [])
             for subscription in subscribers:
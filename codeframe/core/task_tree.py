@@ -1,17 +1,23 @@
 """Recursive task decomposition and tree operations.
 
 Provides functions to classify, decompose, and recursively build task trees
-using LLM-powered analysis. Also handles tree display and status propagation.
+using LLM-powered analysis. Trees are expanded breadth-first with each level's
+LLM calls running concurrently. Also handles tree display and status
+propagation.
 
 This module is headless - no FastAPI or HTTP dependencies.
 """
 
 import json
 import logging
+import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-from codeframe.adapters.llm.base import Purpose
+from codeframe.adapters.llm.base import LLMRateLimitError, Purpose
 from codeframe.core import tasks as task_module
 from codeframe.core.state_machine import TaskStatus
 from codeframe.core.workspace import Workspace
@@ -31,6 +37,18 @@ DECOMPOSE_SYSTEM_PROMPT = (
     "testable. Return a JSON array of objects with 'title' and 'description' fields."
 )
 
+#: Overrides how many classify/decompose calls ``generate_task_tree`` keeps in
+#: flight (1 = one node at a time).
+TREE_CONCURRENCY_ENV = "CODEFRAME_TASK_TREE_CONCURRENCY"
+
+DEFAULT_TREE_CONCURRENCY = 4
+
+#: Rate-limited attempts retried per call before the error propagates, and the
+#: exponential backoff between them in seconds.
+_RATE_LIMIT_RETRIES = 5
+_RATE_LIMIT_BASE_DELAY = 2.0
+_RATE_LIMIT_MAX_DELAY = 60.0
+
 # Status display icons
 _STATUS_ICONS = {
     TaskStatus.DONE: "\u2713",
@@ -169,68 +187,151 @@ def generate_task_tree(
     lineage: Optional[list[str]] = None,
     depth: int = 0,
     max_depth: int = 3,
+    max_concurrency: Optional[int] = None,
 ) -> dict:
-    """Recursively generate a task tree using LLM classification and decomposition.
+    """Generate a task tree using LLM classification and decomposition.
+
+    Expands the tree a level at a time: every node of a level is classified
+    (and, when composite, decomposed) concurrently, so wall time grows with
+    the depth of the tree rather than its node count. A 3-level tree with a
+    fan-out of 5 used to be ~60 LLM round trips one after another.
+
+    Children are attached by their position in the decomposition, never by
+    completion order, so the tree — and what ``flatten_task_tree`` makes of
+    it — is identical to expanding the nodes one at a time.
 
     Args:
-        provider: LLM provider instance
+        provider: LLM provider instance (called from worker threads)
         description: Task description
-        lineage: Ancestor task descriptions (accumulates through recursion)
-        depth: Current recursion depth
-        max_depth: Maximum recursion depth before forcing leaf nodes
+        lineage: Ancestor task descriptions of the root
+        depth: Depth of the root
+        max_depth: Maximum depth before forcing leaf nodes
+        max_concurrency: LLM calls in flight at once; defaults to
+            CODEFRAME_TASK_TREE_CONCURRENCY, then 4. 1 expands serially.
 
     Returns:
         Tree dict with keys: title, description, is_leaf, children, lineage
+
+    Raises:
+        ValueError: If ``max_concurrency`` is less than 1.
+        LLMRateLimitError: If a call is still rate limited after the retries.
     """
-    lineage = lineage or []
-
-    # Force leaf at max depth
-    if depth >= max_depth:
-        return {
-            "title": description[:80],
-            "description": description,
-            "is_leaf": True,
-            "children": [],
-            "lineage": lineage,
-        }
-
-    kind = classify_task(provider, description, lineage)
-
-    if kind == "atomic":
-        return {
-            "title": description[:80],
-            "description": description,
-            "is_leaf": True,
-            "children": [],
-            "lineage": lineage,
-        }
-
-    # Composite: decompose and recurse
-    subtasks = decompose_task(provider, description, lineage)
-    children = []
-    child_lineage = lineage + [description]
-
-    for sub in subtasks:
-        child_tree = generate_task_tree(
-            provider,
-            sub["description"] or sub["title"],
-            lineage=child_lineage,
-            depth=depth + 1,
-            max_depth=max_depth,
-        )
-        # Use the subtask title if it's better than the truncated description
-        child_tree["title"] = sub["title"][:80]
-        children.append(child_tree)
+    if max_concurrency is None:
+        max_concurrency = _tree_concurrency()
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+    root = _tree_node(description, lineage or [])
+    backoff = _RateLimitBackoff()
+    level = [root]
 
+    executor = ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="task-tree"
+    )
+    try:
+        while level and depth < max_depth:
+            # map() yields in submission order, whatever order calls finish in.
+            expansions = list(
+                executor.map(lambda node: _expand_node(provider, node, backoff), level)
+            )
+            next_level = []
+            for node, subtasks in zip(level, expansions):
+                if subtasks is None:
+                    continue
+                node["is_leaf"] = False
+                child_lineage = node["lineage"] + [node["description"]]
+                for sub in subtasks:
+                    child = _tree_node(sub["description"] or sub["title"], child_lineage)
+                    # Use the subtask title if it's better than the truncated description
+                    child["title"] = sub["title"][:80]
+                    node["children"].append(child)
+                    next_level.append(child)
+            level = next_level
+            depth += 1
+    finally:
+        # A hard failure on one node must not leave the rest of its level
+        # queued up spending tokens on a tree that will be discarded.
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    return root
+
+
+def _tree_concurrency() -> int:
+    """CODEFRAME_TASK_TREE_CONCURRENCY, or the default; a bad value warns."""
+    raw = os.getenv(TREE_CONCURRENCY_ENV)
+    if not raw:
+        return DEFAULT_TREE_CONCURRENCY
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning("%s=%r is not an integer; ignoring", TREE_CONCURRENCY_ENV, raw)
+        return DEFAULT_TREE_CONCURRENCY
+    if value <= 0:
+        logger.warning("%s=%d must be positive; ignoring", TREE_CONCURRENCY_ENV, value)
+        return DEFAULT_TREE_CONCURRENCY
+    return value
+
+
+def _tree_node(description: str, lineage: list[str]) -> dict:
+    """A leaf node; ``generate_task_tree`` turns it composite when it expands."""
     return {
         "title": description[:80],
         "description": description,
-        "is_leaf": False,
-        "children": children,
+        "is_leaf": True,
+        "children": [],
         "lineage": lineage,
     }
 
 
+def _expand_node(
+    provider, node: dict, backoff: "_RateLimitBackoff"
+) -> Optional[list[dict]]:
+    """Classify ``node``; the subtasks to attach if composite, else ``None``."""
+    description, lineage = node["description"], node["lineage"]
+    if backoff.call(classify_task, provider, description, lineage) == "atomic":
+        return None
+    return backoff.call(decompose_task, provider, description, lineage)
+
+
+class _RateLimitBackoff:
+    """Retry rate-limited calls, pausing every worker while the limit lasts.
+
+    A 429 is about the account, not the call that happened to receive it, so
+    one rate-limited call pushes back the next attempt of *all* in-flight
+    calls instead of letting the siblings keep hammering the API.
+    """
+
+    def __init__(self) -> None:
+        self.retries = _RATE_LIMIT_RETRIES
+        self.base_delay = _RATE_LIMIT_BASE_DELAY
+        self.max_delay = _RATE_LIMIT_MAX_DELAY
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def call(self, fn, *args):
+        for attempt in range(self.retries + 1):
+            self._wait()
+            try:
+                return fn(*args)
+            except LLMRateLimitError as exc:
+                if attempt >= self.retries:
+                    raise
+                delay = min(self.max_delay, self.base_delay * 2**attempt)
+                with self._lock:
+                    self._resume_at = max(self._resume_at, time.monotonic() + delay)
+                logger.warning(
+                    "Rate limited during task decomposition (attempt %d/%d); "
+                    "backing off %.1fs: %s",
+                    attempt + 1, self.retries + 1, delay, exc,
+                )
+
+    def _wait(self) -> None:
+        with self._lock:
+            remaining = self._resume_at - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+
 def flatten_task_tree(
     tree: dict,
     workspace: Workspace,
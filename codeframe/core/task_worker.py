@@ -0,0 +1,404 @@
+"""Warm worker pool for batch task execution.
+
+Each batch task used to start with ``python -m codeframe.cli.app work start
+...``: a fresh interpreter that pays startup plus the import of the whole CLI
+(typer, rich, every sub-app) before doing any work. On a batch of hundreds of
+small tasks that overhead is a large share of the wall time.
+
+A warm worker is a long-lived ``python -m codeframe.core.task_worker`` process
+that imports the CLI once and then serves assignments read from its stdin, one
+JSON line each. For every assignment it forks: the child ``chdir``s to the
+task's directory and runs the CLI entry point exactly as the fresh interpreter
+would, then exits as it would too — ``atexit`` handlers included, so buffered
+events are committed and temp files removed. So every task still gets its own
+process — its own pid to SIGTERM on a force stop, its own memory, no state
+leaking into the next task — only the import is shared, copy-on-write. The
+worker reports the child's pid and, when it exits, its return code on a
+separate reply pipe, leaving stdout and stderr to the task as before.
+
+Workers are recycled after ``max_tasks_per_worker`` assignments or once memory
+grows more than ``max_rss_mb`` past the post-fork baseline: a task's peak over
+what it inherited, or the worker's own growth since its first fork. POSIX only
+(it needs ``os.fork``); the conductor falls back to one interpreter per task
+elsewhere.
+
+The conductor side of this module is headless; the worker process itself
+imports the CLI, which is the point of it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import importlib
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import threading
+import traceback
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+#: Set to 1/true/yes/on to run batch tasks on warm workers by default.
+WARM_WORKERS_ENV = "CODEFRAME_BATCH_WARM_WORKERS"
+
+#: What a worker imports once and runs in each forked child.
+DEFAULT_ENTRY = "codeframe.cli.app:main"
+
+DEFAULT_MAX_TASKS_PER_WORKER = 50
+DEFAULT_MAX_RSS_MB = 1024
+
+
+class TaskWorkerError(RuntimeError):
+    """A worker could not accept or report on an assignment."""
+
+
+def is_supported() -> bool:
+    """Whether warm workers can run here (they fork per task)."""
+    return hasattr(os, "fork")
+
+
+def warm_workers_enabled() -> bool:
+    """Default for ``execute_batch(warm_workers=None)``: CODEFRAME_BATCH_WARM_WORKERS."""
+    raw = os.getenv(WARM_WORKERS_ENV, "").strip().lower()
+    return raw in {"1", "true", "yes", "on"}
+
+
+# =============================================================================
+# Conductor side
+# =============================================================================
+
+
+class PooledTaskProcess:
+    """One task running in a worker's forked child.
+
+    Quacks like the ``subprocess.Popen`` the conductor used to track —
+    ``wait()``, ``poll()``, ``terminate()``, ``kill()``, ``pid`` — so force
+    stop and reconciliation handle it without knowing the difference.
+    """
+
+    def __init__(self, worker: "_Worker", pid: int, on_done) -> None:
+        self._worker = worker
+        self.pid = pid
+        self.returncode: Optional[int] = None
+        self._on_done = on_done
+
+    def wait(self) -> int:
+        if self.returncode is None:
+            try:
+                reply = self._worker.read_reply()
+                self.returncode = int(reply["returncode"])
+                self._worker.rss_growth_kb = int(reply.get("rss_growth_kb") or 0)
+            except (TaskWorkerError, KeyError, TypeError, ValueError) as exc:
+                logger.warning("Task worker %s lost its task (pid %s): %s",
+                               self._worker.pid, self.pid, exc)
+                self._worker.broken = True
+                self.returncode = 1
+            self._on_done(self._worker)
+        return self.returncode
+
+    def poll(self) -> Optional[int]:
+        return self.returncode
+
+    def _signal(self, signum: int) -> None:
+        if self.returncode is not None:
+            return
+        try:
+            os.kill(self.pid, signum)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def terminate(self) -> None:
+        self._signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self._signal(signal.SIGKILL)
+
+
+class _Worker:
+    """A warm worker process and its reply pipe."""
+
+    def __init__(self, entry: str) -> None:
+        read_fd, write_fd = os.pipe()
+        try:
+            self.proc = subprocess.Popen(
+                [
+                    sys.executable, "-m", "codeframe.core.task_worker",
+                    "--reply-fd", str(write_fd), "--entry", entry,
+                ],
+                stdin=subprocess.PIPE,
+                pass_fds=(write_fd,),
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+        except Exception:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+        self._replies = os.fdopen(read_fd, "r", encoding="utf-8")
+        self.tasks_run = 0
+        self.rss_growth_kb = 0
+        self.broken = False
+
+    @property
+    def pid(self) -> int:
+        return self.proc.pid
+
+    def alive(self) -> bool:
+        return not self.broken and self.proc.poll() is None
+
+    def assign(self, cli_args: list[str], cwd: str) -> int:
+        """Hand the worker a task; returns the pid of the child running it."""
+        try:
+            assert self.proc.stdin is not None
+            self.proc.stdin.write(json.dumps({"argv": cli_args, "cwd": cwd}) + "\n")
+            self.proc.stdin.flush()
+        except (OSError, ValueError) as exc:
+            self.broken = True
+            raise TaskWorkerError(f"worker {self.pid} is gone: {exc}") from exc
+        self.tasks_run += 1
+        # Blocks until the worker has forked — on a fresh worker, that
+        # includes finishing the one-time import.
+        return int(self.read_reply()["pid"])
+
+    def read_reply(self) -> dict[str, Any]:
+        line = self._replies.readline()
+        if not line:
+            self.broken = True
+            raise TaskWorkerError(
+                f"worker {self.pid} exited (code {self.proc.poll()})"
+            )
+        return json.loads(line)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Ask the worker to exit (EOF on stdin); kill it if it does not."""
+        try:
+            if self.proc.stdin is not None:
+                self.proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+        self._replies.close()
+
+
+class TaskWorkerPool:
+    """Warm workers that run ``cf`` commands in forked children.
+
+    Args:
+        size: Workers started up front (the pool grows on demand past this
+            when more tasks run at once).
+        max_tasks_per_worker: Assignments after which a worker is retired.
+        max_rss_mb: Memory growth past the post-fork baseline after which a
+            worker is retired.
+        entry: ``module:function`` each worker imports once and calls per task.
+
+    Thread-safe: the conductor's parallel executor launches from many threads.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_tasks_per_worker: int = DEFAULT_MAX_TASKS_PER_WORKER,
+        max_rss_mb: int = DEFAULT_MAX_RSS_MB,
+        entry: str = DEFAULT_ENTRY,
+    ) -> None:
+        if not is_supported():
+            raise TaskWorkerError("warm workers need os.fork")
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_rss_mb = max_rss_mb
+        self.entry = entry
+        self._lock = threading.Lock()
+        self._idle: list[_Worker] = []
+        self._closed = False
+        # Spawned now so the imports overlap with the conductor's own setup.
+        for _ in range(max(0, size)):
+            self._idle.append(_Worker(entry))
+
+    def launch(self, cli_args: list[str], cwd: str) -> PooledTaskProcess:
+        """Run ``cf <cli_args>`` in ``cwd`` on a warm worker.
+
+        Raises:
+            TaskWorkerError: If no worker could take the task.
+        """
+        worker = self._checkout()
+        try:
+            pid = worker.assign(cli_args, cwd)
+        except (TaskWorkerError, KeyError, TypeError, ValueError) as exc:
+            worker.broken = True
+            self._retire(worker)
+            raise TaskWorkerError(str(exc)) from exc
+        return PooledTaskProcess(worker, pid, self._checkin)
+
+    def shutdown(self) -> None:
+        """Stop idle workers now; busy ones are stopped when their task ends."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+    def _checkout(self) -> _Worker:
+        dead: list[_Worker] = []
+        found: Optional[_Worker] = None
+        with self._lock:
+            if self._closed:
+                raise TaskWorkerError("pool is shut down")
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive():
+                    found = worker
+                    break
+                dead.append(worker)
+        for worker in dead:
+            self._retire(worker)
+        if found is not None:
+            return found
+        try:
+            return _Worker(self.entry)
+        except OSError as exc:
+            raise TaskWorkerError(f"could not start a task worker: {exc}") from exc
+
+    def _checkin(self, worker: _Worker) -> None:
+        worn_out = (
+            worker.tasks_run >= self.max_tasks_per_worker
+            or worker.rss_growth_kb > self.max_rss_mb * 1024
+        )
+        with self._lock:
+            if not self._closed and not worn_out and worker.alive():
+                self._idle.append(worker)
+                return
+        if worn_out:
+            logger.debug(
+                "Recycling task worker %s after %d tasks (%d KB growth)",
+                worker.pid, worker.tasks_run, worker.rss_growth_kb,
+            )
+        self._retire(worker)
+
+    @staticmethod
+    def _retire(worker: _Worker) -> None:
+        try:
+            worker.stop()
+        except Exception:  # pragma: no cover - best effort
+            logger.debug("Could not stop task worker %s", worker.pid, exc_info=True)
+
+
+# =============================================================================
+# Worker side
+# =============================================================================
+
+
+def _rss_kb() -> int:
+    """Current resident set size of this process in KB (0 if unknown)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * (os.sysconf("SC_PAGE_SIZE") // 1024)
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+
+        return _maxrss_kb(resource.getrusage(resource.RUSAGE_SELF))
+    except (ImportError, OSError):
+        return 0
+
+
+def _maxrss_kb(usage) -> int:
+    """Peak resident set size from a ``struct_rusage``, in KB."""
+    # ru_maxrss is KB on Linux, bytes on macOS.
+    return usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+
+
+def _run_child(entry_fn, job: dict[str, Any], reply_fd: int) -> None:
+    """Body of the forked child: run one task, then ``_exit``. Never returns."""
+    code = 1
+    try:
+        os.close(reply_fd)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        # The worker's stdin carries assignments; a task must never read it.
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.close(devnull)
+        os.chdir(job["cwd"])
+        sys.argv = ["cf", *job["argv"]]
+        entry_fn()
+        code = 0
+    except SystemExit as exc:
+        if exc.code is None:
+            code = 0
+        elif isinstance(exc.code, int):
+            code = exc.code
+        else:
+            print(exc.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        try:
+            # os._exit skips interpreter shutdown, so run what it would have:
+            # the buffered event writer's final commit, temp-file cleanup.
+            atexit._run_exitfuncs()
+        finally:
+            for stream in (sys.stdout, sys.stderr):
+                try:
+                    stream.flush()
+                except Exception:
+                    pass
+            os._exit(code)
+
+
+def serve(reply_fd: int, entry: str = DEFAULT_ENTRY) -> int:
+    """Worker main loop: import ``entry`` once, then fork per assignment."""
+    # Ctrl-C reaches the whole process group; the conductor decides what to
+    # do about it. Children restore the default handler.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    module_name, _, fn_name = entry.partition(":")
+    entry_fn = getattr(importlib.import_module(module_name), fn_name)
+
+    replies = os.fdopen(reply_fd, "w", encoding="utf-8", buffering=1)
+    baseline_kb: Optional[int] = None
+    for line in sys.stdin:
+        try:
+            job = json.loads(line)
+        except ValueError:
+            continue
+        # A forked child starts out resident at the worker's size; only what
+        # it adds on top — or what the worker itself has gained since its
+        # first fork — says anything about memory growth.
+        at_fork_kb = _rss_kb()
+        if baseline_kb is None:
+            baseline_kb = at_fork_kb
+        pid = os.fork()
+        if pid == 0:
+            _run_child(entry_fn, job, reply_fd)
+        replies.write(json.dumps({"pid": pid}) + "\n")
+        _, status, usage = os.wait4(pid, 0)
+        replies.write(json.dumps({
+            "returncode": os.waitstatus_to_exitcode(status),
+            "rss_growth_kb": max(
+                _maxrss_kb(usage) - at_fork_kb, at_fork_kb - baseline_kb, 0
+            ),
+        }) + "\n")
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="codeframe.core.task_worker")
+    parser.add_argument("--reply-fd", type=int, required=True)
+    parser.add_argument("--entry", default=DEFAULT_ENTRY)
+    args = parser.parse_args(argv)
+    return serve(args.reply_fd, args.entry)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,6 +6,8 @@ This module is headless - no FastAPI or HTTP dependencies.
 """
 
 import asyncio
+import base64
+import binascii
 import json
 import sqlite3
 import logging
@@ -14,7 +16,7 @@ import threading
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterator, Optional
 from urllib.parse import urlparse
 
 from codeframe.core.state_machine import (
@@ -22,6 +24,7 @@ from codeframe.core.state_machine import (
     TaskStatus,
     validate_transition,
 )
+from codeframe.core import engine_stats
 from codeframe.core.workspace import Workspace, get_db_connection
 from codeframe.core.prd import PrdRecord
 
@@ -253,6 +256,7 @@ def create(
             """,
             (task_id, workspace.id, prd_id, title, description, status.value, priority, json.dumps(depends_on_list), estimated_hours, complexity_score, uncertainty_level, parent_id, json.dumps(lineage_list), 1 if is_leaf else 0, hierarchical_id, now, now, json.dumps(requirement_ids_list), github_issue_number, external_url, 1 if auto_close_github_issue else 0),
         )
+        _write_dependency_edges(cursor, workspace.id, task_id, depends_on_list)
         conn.commit()
     finally:
         conn.close()
@@ -539,6 +543,206 @@ def list_tasks(
     return [_row_to_task(row) for row in rows]
 
 
+#: Task columns in ``_row_to_task`` order, qualified for queries that alias
+#: tasks as ``t`` (keyset pages, joins against the dependency edge table).
+_TASK_COLUMNS_T = (
+    "t.id, t.workspace_id, t.prd_id, t.title, t.description, t.status, "
+    "t.priority, t.depends_on, t.estimated_hours, t.complexity_score, "
+    "t.uncertainty_level, t.created_at, t.updated_at, t.github_issue_number, "
+    "t.parent_id, t.lineage, t.is_leaf, t.hierarchical_id, t.requirement_ids, "
+    "t.external_url, t.auto_close_github_issue"
+)
+
+@dataclass
+class TaskPage:
+    """One page of a keyset-paginated task listing.
+
+    Attributes:
+        tasks: Tasks on this page, in ``(priority, created_at, id)`` order
+        next_cursor: Opaque cursor for the following page, or None on the last
+    """
+
+    tasks: list[Task]
+    next_cursor: Optional[str] = None
+
+
+def _encode_cursor(task: Task) -> str:
+    key = [task.priority, task.created_at.isoformat(), task.id]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """Inverse of ``_encode_cursor``; raises ValueError for anything else."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        priority, created_at, task_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid task cursor: {cursor!r}") from exc
+    if not (
+        isinstance(priority, int)
+        and isinstance(created_at, str)
+        and isinstance(task_id, str)
+    ):
+        raise ValueError(f"Invalid task cursor: {cursor!r}")
+    return priority, created_at, task_id
+
+
+def _page_query(
+    workspace_id: str,
+    *,
+    status: Optional[TaskStatus] = None,
+    prd_id: Optional[str] = None,
+    parent_id: Optional[str] = None,
+    requirement_id: Optional[str] = None,
+    after: Optional[tuple] = None,
+    limit: int = 100,
+    include_description: bool = True,
+) -> tuple[str, tuple]:
+    """Build the SQL for one keyset page.
+
+    Equality filters come first and the sort key last, matching the
+    ``idx_tasks_*_order`` indexes, so SQLite seeks straight to the cursor and
+    reads ``limit`` rows in index order — no sort, no OFFSET scan.
+    """
+    where = ["t.workspace_id = ?"]
+    params: list = [workspace_id]
+    if status is not None:
+        where.append("t.status = ?")
+        params.append(status.value)
+    if prd_id is not None:
+        where.append("t.prd_id = ?")
+        params.append(prd_id)
+    if parent_id is not None:
+        where.append("t.parent_id = ?")
+        params.append(parent_id)
+    if requirement_id is not None:
+        where.append(
+            "EXISTS (SELECT 1 FROM json_each(t.requirement_ids) r WHERE r.value = ?)"
+        )
+        params.append(requirement_id)
+    if after is not None:
+        where.append("(t.priority, t.created_at, t.id) > (?, ?, ?)")
+        params.extend(after)
+    params.append(limit)
+
+    columns = _TASK_COLUMNS_T
+    if not include_description:
+        columns = columns.replace("t.description", "'' AS description")
+    sql = (
+        f"SELECT {columns} FROM tasks t WHERE {' AND '.join(where)} "
+        "ORDER BY t.priority ASC, t.created_at ASC, t.id ASC LIMIT ?"
+    )
+    return sql, tuple(params)
+
+
+def list_tasks_page(
+    workspace: Workspace,
+    *,
+    status: Optional[TaskStatus] = None,
+    prd_id: Optional[str] = None,
+    parent_id: Optional[str] = None,
+    requirement_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    include_description: bool = True,
+    conn: Optional[sqlite3.Connection] = None,
+) -> TaskPage:
+    """List one page of tasks, resuming after ``cursor``.
+
+    Pages are keyed on ``(priority, created_at, id)`` rather than an offset,
+    so each page costs the same however deep it is, and a task created or
+    deleted between requests never shifts later pages.
+
+    Args:
+        workspace: Workspace to query
+        status: Optional status filter
+        prd_id: Optional PRD filter
+        parent_id: Optional parent task filter
+        requirement_id: Optional PROOF9 requirement filter
+        cursor: ``next_cursor`` of the previous page (None for the first)
+        limit: Maximum tasks on this page
+        include_description: False returns ``description`` as "" without
+            reading it — list views don't need the largest column
+        conn: Optional borrowed connection (caller keeps ownership)
+
+    Returns:
+        TaskPage whose ``next_cursor`` is None once the listing is exhausted
+
+    Raises:
+        ValueError: If ``cursor`` is malformed or ``limit`` is not positive
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be positive, got {limit}")
+    after = _decode_cursor(cursor) if cursor else None
+    # One extra row tells us whether another page exists without a COUNT.
+    sql, params = _page_query(
+        workspace.id,
+        status=status,
+        prd_id=prd_id,
+        parent_id=parent_id,
+        requirement_id=requirement_id,
+        after=after,
+        limit=limit + 1,
+        include_description=include_description,
+    )
+
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection(workspace)
+    try:
+        rows = conn.execute(sql, params).fetchall()
+    finally:
+        if own_conn:
+            conn.close()
+
+    page = [_row_to_task(row) for row in rows[:limit]]
+    next_cursor = _encode_cursor(page[-1]) if len(rows) > limit else None
+    return TaskPage(tasks=page, next_cursor=next_cursor)
+
+
+def iter_tasks(
+    workspace: Workspace,
+    *,
+    status: Optional[TaskStatus] = None,
+    prd_id: Optional[str] = None,
+    parent_id: Optional[str] = None,
+    requirement_id: Optional[str] = None,
+    page_size: int = 500,
+    include_description: bool = True,
+) -> Iterator[Task]:
+    """Stream every matching task, one keyset page at a time.
+
+    For bulk consumers (snapshots, exports) that need all tasks but should
+    not hold them all in memory or stop at an arbitrary cap. Each page uses
+    a short-lived connection, so a slow consumer never pins the database.
+
+    Args:
+        workspace: Workspace to query
+        status / prd_id / parent_id / requirement_id: As ``list_tasks_page``
+        page_size: Rows fetched per query
+        include_description: As ``list_tasks_page``
+
+    Yields:
+        Tasks in ``(priority, created_at, id)`` order
+    """
+    cursor = None
+    while True:
+        page = list_tasks_page(
+            workspace,
+            status=status,
+            prd_id=prd_id,
+            parent_id=parent_id,
+            requirement_id=requirement_id,
+            cursor=cursor,
+            limit=page_size,
+            include_description=include_description,
+        )
+        yield from page.tasks
+        if page.next_cursor is None:
+            return
+        cursor = page.next_cursor
+
+
 def list_by_status(workspace: Workspace) -> dict[TaskStatus, list[Task]]:
     """List tasks grouped by status.
 
@@ -914,6 +1118,7 @@ def update_depends_on(
             """,
             (json.dumps(depends_on), now, workspace.id, task_id),
         )
+        _write_dependency_edges(cursor, workspace.id, task_id, depends_on)
         conn.commit()
     finally:
         conn.close()
@@ -969,9 +1174,34 @@ def update_requirement_ids(
     return task
 
 
+def _write_dependency_edges(
+    cursor: sqlite3.Cursor, workspace_id: str, task_id: str, depends_on: list[str]
+) -> None:
+    """Replace ``task_id``'s rows in the task_dependencies edge table.
+
+    Every write of ``tasks.depends_on`` calls this on the same cursor, before
+    its commit, so the JSON column and the edge table cannot disagree.
+    """
+    cursor.execute("DELETE FROM task_dependencies WHERE task_id = ?", (task_id,))
+    cursor.executemany(
+        "INSERT OR IGNORE INTO task_dependencies (workspace_id, task_id, depends_on_id) "
+        "VALUES (?, ?, ?)",
+        [(workspace_id, task_id, dep_id) for dep_id in depends_on],
+    )
+
+
+#: Statuses that satisfy a dependency: the work has landed.
+_SATISFIED_STATUSES = (TaskStatus.DONE.value, TaskStatus.MERGED.value)
+
+
 def get_dependents(workspace: Workspace, task_id: str) -> list[Task]:
     """Get all tasks that depend on the given task.
 
+    Reads the reverse index of the edge table, so the cost is the number of
+    dependents rather than the size of the workspace. (This used to filter
+    ``list_tasks(workspace)``, whose default cap of 100 silently dropped
+    dependents in larger workspaces.)
+
     Args:
         workspace: Workspace to query
         task_id: Task ID to find dependents for
@@ -979,8 +1209,181 @@ def get_dependents(workspace: Workspace, task_id: str) -> list[Task]:
     Returns:
         List of Tasks that have task_id in their depends_on list
     """
-    all_tasks = list_tasks(workspace)
-    return [t for t in all_tasks if task_id in t.depends_on]
+    conn = get_db_connection(workspace)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT {_TASK_COLUMNS_T}
+            FROM task_dependencies d
+            JOIN tasks t ON t.id = d.task_id
+            WHERE d.depends_on_id = ? AND d.workspace_id = ?
+            ORDER BY t.priority ASC, t.created_at ASC
+            """,
+            (task_id, workspace.id),
+        )
+        rows = cursor.fetchall()
+    finally:
+        conn.close()
+
+    return [_row_to_task(row) for row in rows]
+
+
+def get_dependency_map(
+    workspace: Workspace, task_ids: list[str]
+) -> dict[str, list[str]]:
+    """Get the direct dependencies of several tasks in one query.
+
+    Args:
+        workspace: Workspace to query
+        task_ids: Tasks to look up
+
+    Returns:
+        Dict mapping each task ID in ``task_ids`` to the IDs it depends on
+        (empty list when it has none). Unknown IDs map to an empty list.
+    """
+    result: dict[str, list[str]] = {task_id: [] for task_id in task_ids}
+    if not result:
+        return result
+
+    conn = get_db_connection(workspace)
+    try:
+        cursor = conn.cursor()
+        # json_each instead of an IN (...) list keeps one statement regardless
+        # of batch size (SQLite caps bound parameters).
+        cursor.execute(
+            """
+            SELECT d.task_id, d.depends_on_id
+            FROM json_each(?) j
+            JOIN task_dependencies d ON d.task_id = j.value
+            WHERE d.workspace_id = ?
+            ORDER BY d.rowid
+            """,
+            (json.dumps(list(result)), workspace.id),
+        )
+        for task_id, dep_id in cursor.fetchall():
+            result[task_id].append(dep_id)
+    finally:
+        conn.close()
+
+    return result
+
+
+def _closure(workspace: Workspace, task_id: str, forward: bool) -> set[str]:
+    """Transitive closure over the edge table from ``task_id``.
+
+    ``forward`` follows task -> dependency (ancestors); otherwise dependency
+    -> task (descendants). ``UNION`` rather than ``UNION ALL`` discards
+    revisited IDs, so a cycle terminates instead of recursing forever.
+    """
+    src, dst = ("task_id", "depends_on_id") if forward else ("depends_on_id", "task_id")
+    conn = get_db_connection(workspace)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            f"""
+            WITH RECURSIVE reach(id) AS (
+                SELECT {dst} FROM task_dependencies
+                WHERE {src} = ? AND workspace_id = ?
+                UNION
+                SELECT d.{dst} FROM task_dependencies d
+                JOIN reach r ON d.{src} = r.id
+                WHERE d.workspace_id = ?
+            )
+            SELECT id FROM reach
+            """,
+            (task_id, workspace.id, workspace.id),
+        )
+        found = {row[0] for row in cursor.fetchall()}
+    finally:
+        conn.close()
+
+    found.discard(task_id)
+    return found
+
+
+def get_ancestor_ids(workspace: Workspace, task_id: str) -> set[str]:
+    """Get every task ``task_id`` depends on, directly or transitively.
+
+    Args:
+        workspace: Workspace to query
+        task_id: Task whose prerequisites to collect
+
+    Returns:
+        Set of task IDs (never includes ``task_id`` itself, even in a cycle)
+    """
+    return _closure(workspace, task_id, forward=True)
+
+
+def get_descendant_ids(workspace: Workspace, task_id: str) -> set[str]:
+    """Get every task that depends on ``task_id``, directly or transitively.
+
+    This is the set a failure of ``task_id`` blocks.
+
+    Args:
+        workspace: Workspace to query
+        task_id: Task whose dependents to collect
+
+    Returns:
+        Set of task IDs (never includes ``task_id`` itself, even in a cycle)
+    """
+    return _closure(workspace, task_id, forward=False)
+
+
+def list_unblocked(
+    workspace: Workspace,
+    status: Optional[TaskStatus] = None,
+    limit: Optional[int] = None,
+) -> list[Task]:
+    """List tasks whose dependencies have all landed.
+
+    A dependency counts as satisfied when its task is DONE or MERGED. An
+    edge to a task that no longer exists is unsatisfied, matching the
+    ``deps.issubset(completed)`` rule of ``DependencyResolver``.
+
+    Args:
+        workspace: Workspace to query
+        status: Optional status filter on the returned tasks
+        limit: Maximum tasks to return (``None`` for all)
+
+    Returns:
+        List of Tasks in ``list_tasks`` order
+    """
+    where = "t.workspace_id = ?"
+    params: tuple = (workspace.id,)
+    if status:
+        where += " AND t.status = ?"
+        params += (status.value,)
+    params += _SATISFIED_STATUSES
+    limit_clause = ""
+    if limit is not None:
+        limit_clause = "LIMIT ?"
+        params += (limit,)
+
+    conn = get_db_connection(workspace)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT {_TASK_COLUMNS_T}
+            FROM tasks t
+            WHERE {where}
+              AND NOT EXISTS (
+                SELECT 1 FROM task_dependencies d
+                LEFT JOIN tasks dep ON dep.id = d.depends_on_id
+                WHERE d.task_id = t.id
+                  AND (dep.id IS NULL OR dep.status NOT IN (?, ?))
+              )
+            ORDER BY t.priority ASC, t.created_at ASC
+            {limit_clause}
+            """,
+            params,
+        )
+        rows = cursor.fetchall()
+    finally:
+        conn.close()
+
+    return [_row_to_task(row) for row in rows]
 
 
 #: Tables holding rows that belong to a task, ordered grandchildren-first so
@@ -1018,6 +1421,13 @@ def _delete_task_children(
     run this inside the same transaction as the task delete itself — a
     half-deleted task with surviving children is worse than either outcome.
     """
+    # Take the runs out of the engine rollups before their log rows go; the
+    # rollups are running sums and would otherwise count them forever.
+    try:
+        engine_stats.retract_runs_conn(cursor, where, params)
+    except sqlite3.OperationalError:
+        # Table absent in an older workspace; nothing to retract.
+        pass
     for table, template in _TASK_CHILD_TABLES:
         # The predicate is substituted once per {where}, so its placeholders
         # repeat the same number of times.
@@ -1068,27 +1478,32 @@ def delete(workspace: Workspace, task_id: str) -> bool:
         deleted = cursor.rowcount > 0
 
         # Only cascade if the task actually existed, and only after the DELETE
-        # so the deleted row can't appear in the scan below. Same transaction
-        # (single commit) so no dangling reference can survive a rollback.
-        # (This is the write-side counterpart to get_dependents()'s read: the
-        # tasks that carry task_id in their depends_on JSON.) The full-workspace
-        # scan is fine for typical task counts; add a LIKE pre-filter if a
-        # workspace ever holds thousands of tasks.
+        # so the deleted row can't appear among the dependents below. Same
+        # transaction (single commit) so no dangling reference can survive a
+        # rollback. The dependents come from the edge table's reverse index,
+        # not a scan of every task's depends_on JSON.
         if deleted:
             now = _utc_now().isoformat()
             cursor.execute(
-                "SELECT id, depends_on FROM tasks WHERE workspace_id = ?",
-                (workspace.id,),
+                """
+                SELECT t.id, t.depends_on
+                FROM task_dependencies d
+                JOIN tasks t ON t.id = d.task_id
+                WHERE d.depends_on_id = ? AND d.workspace_id = ?
+                """,
+                (task_id, workspace.id),
             )
             for dep_row_id, dep_json in cursor.fetchall():
-                deps = json.loads(dep_json or "[]")
-                if task_id in deps:
-                    deps = [d for d in deps if d != task_id]
-                    cursor.execute(
-                        "UPDATE tasks SET depends_on = ?, updated_at = ? "
-                        "WHERE workspace_id = ? AND id = ?",
-                        (json.dumps(deps), now, workspace.id, dep_row_id),
-                    )
+                deps = [d for d in json.loads(dep_json or "[]") if d != task_id]
+                cursor.execute(
+                    "UPDATE tasks SET depends_on = ?, updated_at = ? "
+                    "WHERE workspace_id = ? AND id = ?",
+                    (json.dumps(deps), now, workspace.id, dep_row_id),
+                )
+            cursor.execute(
+                "DELETE FROM task_dependencies WHERE task_id = ? OR depends_on_id = ?",
+                (task_id, task_id),
+            )
 
         conn.commit()
     finally:
@@ -1118,6 +1533,9 @@ def delete_all(workspace: Workspace) -> int:
             "task_id IN (SELECT id FROM tasks WHERE workspace_id = ?)",
             (workspace.id,),
         )
+        cursor.execute(
+            "DELETE FROM task_dependencies WHERE workspace_id = ?", (workspace.id,)
+        )
 
         cursor.execute(
             """
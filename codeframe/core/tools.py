@@ -14,20 +14,25 @@ All tools enforce workspace path safety and respect ignore patterns.
 
 from __future__ import annotations
 
+import contextlib
 import fnmatch
+import itertools
 import os
 import re
 import shutil
 import subprocess
 import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
 from codeframe.adapters.llm.base import Tool, ToolCall, ToolResult
 from codeframe.core.agent_env import SAFE_ENV_VARS, build_agent_env
-from codeframe.core.context import DEFAULT_IGNORE_PATTERNS
+from codeframe.core import file_index, search_index
 from codeframe.core.editor import EditOperation, SearchReplaceEditor
 from codeframe.core.path_safety import is_path_safe
 from codeframe.core.executor import is_dangerous_command
+from codeframe.core.file_index import FileEntry
 from codeframe.core.gates import _detect_available_gates
 
 # ---------------------------------------------------------------------------
@@ -56,19 +61,24 @@ _is_path_safe = is_path_safe
 
 
 # ---------------------------------------------------------------------------
-# Ignore-pattern helper
+# Shared file index (ignore patterns: context.DEFAULT_IGNORE_PATTERNS)
 # ---------------------------------------------------------------------------
 
 
-def _should_ignore(rel_path: str) -> bool:
-    """Return True if *rel_path* matches any default ignore pattern."""
-    for pattern in DEFAULT_IGNORE_PATTERNS:
-        if fnmatch.fnmatch(rel_path, pattern):
-            return True
-        # Also check the basename for patterns like "*.pyc"
-        if fnmatch.fnmatch(os.path.basename(rel_path), pattern):
-            return True
-    return False
+def _indexed_files(workspace_path: Path) -> tuple[FileEntry, ...]:
+    """Every non-ignored file in the workspace, from the shared file index."""
+    return file_index.for_root(workspace_path).files()
+
+
+def _escapes_workspace(entry: FileEntry, workspace_path: Path) -> bool:
+    """True for a symlinked entry whose target lies outside the workspace.
+
+    Only symlinks can: the index never descends into symlinked directories.
+    """
+    if not entry.is_link:
+        return False
+    safe, _ = _is_path_safe(workspace_path / entry.path, workspace_path)
+    return not safe
 
 
 # ---------------------------------------------------------------------------
@@ -235,40 +245,27 @@ def _execute_list_files(
 
     files: list[tuple[str, int]] = []  # (relative_path, size_bytes)
 
-    for dirpath, dirnames, filenames in os.walk(target):
-        # Calculate depth relative to target
-        depth = len(Path(dirpath).relative_to(target).parts)
-        if depth >= max_depth:
-            dirnames.clear()
-
-        # Filter ignored directories in-place
-        dirnames[:] = [
-            d for d in dirnames
-            if not _should_ignore(d) and not _should_ignore(d + "/")
-        ]
-
-        for fname in filenames:
-            full = Path(dirpath) / fname
-
-            # Guard against symlinks pointing outside workspace
-            safe, _ = _is_path_safe(full, workspace_path)
-            if not safe:
-                continue
-
-            rel_to_workspace = str(full.relative_to(workspace_path))
-
-            if _should_ignore(rel_to_workspace):
-                continue
-
-            if pattern and not fnmatch.fnmatch(fname, pattern):
-                continue
-
-            try:
-                size = full.stat().st_size
-            except OSError:
-                size = 0
-
-            files.append((rel_to_workspace, size))
+    # Same selection as the os.walk it replaces: files at most max_depth
+    # directories below target, matched on the file name.
+    prefix = target.resolve().relative_to(workspace_path.resolve()).as_posix()
+    prefix = "" if prefix == "." else prefix + "/"
+    for entry in _indexed_files(workspace_path):
+        if not entry.path.startswith(prefix):
+            continue
+        below = entry.path[len(prefix):]
+        if below.count("/") > max_depth:
+            continue
+        if pattern and not fnmatch.fnmatch(below.rpartition("/")[2], pattern):
+            continue
+        if _escapes_workspace(entry, workspace_path):
+            continue
+        # The index reuses entries of unchanged directories, and an in-place
+        # write leaves its directory unchanged: stat the rows we report.
+        try:
+            size = os.stat(workspace_path / entry.path).st_size
+        except OSError:
+            size = 0
+        files.append((entry.path.replace("/", os.sep), size))
 
     files.sort(key=lambda f: f[0])
 
@@ -331,58 +328,26 @@ def _execute_search_codebase(
             is_error=True,
         )
 
-    matches: list[str] = []
-    truncated = False
-
-    for dirpath, dirnames, filenames in os.walk(workspace_path):
-        # Filter ignored directories in-place
-        dirnames[:] = [
-            d for d in dirnames
-            if not _should_ignore(d) and not _should_ignore(d + "/")
-        ]
-
-        for fname in filenames:
-            if len(matches) >= max_results:
-                truncated = True
-                break
-
-            full = Path(dirpath) / fname
-
-            # Guard against symlinks pointing outside workspace
-            safe, _ = _is_path_safe(full, workspace_path)
-            if not safe:
-                continue
-
-            rel = str(full.relative_to(workspace_path))
-
-            if _should_ignore(rel):
-                continue
-
-            if file_glob and not fnmatch.fnmatch(fname, file_glob):
-                continue
-
-            # Skip oversized files to prevent OOM
-            try:
-                if full.stat().st_size > MAX_SEARCH_FILE_SIZE:
-                    continue
-            except OSError:
-                continue
-
-            # Skip binary files by attempting UTF-8 decode
-            try:
-                text = full.read_text(encoding="utf-8")
-            except (UnicodeDecodeError, OSError):
-                continue
-
-            for line_num, line in enumerate(text.splitlines(), start=1):
-                if compiled.search(line):
-                    matches.append(f"{rel}:{line_num}: {line.rstrip()}")
-                    if len(matches) >= max_results:
-                        truncated = True
-                        break
+    paths, prefiltered = search_index.for_root(workspace_path).candidates(raw_pattern)
+    if file_glob:
+        paths = [p for p in paths if fnmatch.fnmatch(p.rpartition("/")[2], file_glob)]
+    # Only symlinks can escape: the index never descends into linked dirs.
+    paths = [
+        p for p in paths
+        if not os.path.islink(workspace_path / p)
+        or _is_path_safe(workspace_path / p, workspace_path)[0]
+    ]
 
-        if truncated:
-            break
+    # Candidates from the index all contain the pattern's literals, so the
+    # first few usually fill max_results; a pattern without one reads every
+    # file, a chunk at a time in parallel. Either way files are consumed in
+    # path order and reading stops once max_results lines are in.
+    lines = _matching_lines(
+        workspace_path, paths, compiled, max_results, parallel=not prefiltered
+    )
+    with contextlib.closing(lines):
+        matches = list(itertools.islice(lines, max(max_results, 0)))
+    truncated = len(matches) >= max_results
 
     count = len(matches)
     header = f'Found {count} matches for pattern "{raw_pattern}":\n\n'
@@ -398,6 +363,49 @@ def _execute_search_codebase(
     )
 
 
+#: Files per parallel batch in an unindexed search, and threads reading them.
+_SCAN_CHUNK = 64
+_SCAN_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _file_matches(workspace_path: Path, path: str, compiled: re.Pattern, limit: int) -> list[str]:
+    """Up to ``limit`` formatted matching lines of one file."""
+    rel = path.replace("/", os.sep)
+    # Skip binary files by attempting UTF-8 decode
+    try:
+        text = (workspace_path / rel).read_text(encoding="utf-8")
+    except (UnicodeDecodeError, OSError):
+        return []
+    found: list[str] = []
+    for line_num, line in enumerate(text.splitlines(), start=1):
+        if compiled.search(line):
+            found.append(f"{rel}:{line_num}: {line.rstrip()}")
+            if len(found) >= limit:
+                break
+    return found
+
+
+def _matching_lines(
+    workspace_path: Path,
+    paths: list[str],
+    compiled: re.Pattern,
+    limit: int,
+    parallel: bool,
+) -> Iterator[str]:
+    """Matching lines of ``paths``, in order, produced lazily."""
+    if not parallel or len(paths) <= _SCAN_CHUNK:
+        for path in paths:
+            yield from _file_matches(workspace_path, path, compiled, limit)
+        return
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+        for i in range(0, len(paths), _SCAN_CHUNK):
+            chunk = paths[i:i + _SCAN_CHUNK]
+            for found in pool.map(
+                lambda p: _file_matches(workspace_path, p, compiled, limit), chunk
+            ):
+                yield from found
+
+
 # ---------------------------------------------------------------------------
 # edit_file
 # ---------------------------------------------------------------------------
@@ -11,13 +11,16 @@ This module is headless - no FastAPI or HTTP dependencies.
 import logging
 import os
 import sqlite3
+import threading
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, cast
 
 from codeframe.core.atomic_io import fsync_directory
+from codeframe.core.db_pool import ConnectionPool
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +40,11 @@ STATE_DB_NAME = "state.db"
 # 3: batch_runs.config_reloads (#957).
 # 4: batch_runs.cloud_timeout_minutes (#959).
 # 5: prds.chain_id backfill for legacy child rows (#961).
-SCHEMA_VERSION = 5
+# 6: prd_decomposition_cache (memoized PRD stress-test answers).
+# 7: task_dependencies edge table, rebuilt from tasks.depends_on.
+# 8: idx_tasks_*_order keyset-pagination indexes.
+# 9: engine_run_rollups running sums, rebuilt from run_engine_log.
+SCHEMA_VERSION = 9
 
 # Per-workspace config file written by the Settings page (issue #556).
 # Owned by the UI layer today; kept here so a future core consumer can
@@ -74,7 +81,7 @@ def _get_state_dir(repo_path: Path) -> Path:
     return repo_path / CODEFRAME_DIR
 
 
-def _open_db(db_path: str | Path) -> sqlite3.Connection:
+def _open_db(db_path: str | Path, *, check_same_thread: bool = True) -> sqlite3.Connection:
     """Open a workspace SQLite connection with concurrency safeguards.
 
     Mirrors ``codeframe/platform_store/database.py``. The substantive change is
@@ -87,13 +94,17 @@ def _open_db(db_path: str | Path) -> sqlite3.Connection:
     already defaults to a 5s timeout). Matters under parallel batch execution
     where multiple processes and background agent threads write the same DB.
 
+    ``check_same_thread=False`` is for the connection pool only, which hands an
+    idle connection to whichever thread checks it out next (never to two at
+    once).
+
     The caller is responsible for closing the connection.
     """
     # NOTE: pass ``db_path`` through unchanged (sqlite3.connect accepts both str
     # and PathLike). Do NOT wrap in ``str()`` — that would coerce a non-path
     # (e.g. a test's MagicMock) into a literal filename and silently create a
     # junk DB file instead of raising, diverging from the prior connect call.
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
     conn.execute("PRAGMA journal_mode = WAL")
     conn.execute("PRAGMA busy_timeout = 5000")
     # SQLite ignores every FK clause unless this is set PER CONNECTION (#1061).
@@ -104,6 +115,16 @@ def _open_db(db_path: str | Path) -> sqlite3.Connection:
     return conn
 
 
+def _open_pooled_db(db_path: str | Path) -> sqlite3.Connection:
+    return _open_db(db_path, check_same_thread=False)
+
+
+# One pool per process, shared by every workspace it touches. See db_pool for
+# the reuse guarantees; the short version is that get_db_connection() callers
+# keep their try/finally close() and simply stop paying for the handshake.
+_CONNECTION_POOL = ConnectionPool(_open_pooled_db)
+
+
 def _create_token_usage_schema(cursor: sqlite3.Cursor) -> None:
     """Create the per-workspace `token_usage` table + indexes (issue #712).
 
@@ -396,6 +417,29 @@ def _create_core_tables(cursor: sqlite3.Cursor) -> None:
         )
     """)
 
+    # Engine performance tracking: running sums per engine and UTC day, plus
+    # one all-time row per engine (day = ''). engine_stats is derived from the
+    # all-time row; see core/engine_stats.py.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS engine_run_rollups (
+            workspace_id TEXT NOT NULL,
+            engine TEXT NOT NULL,
+            day TEXT NOT NULL,
+            runs INTEGER NOT NULL DEFAULT 0,
+            completed INTEGER NOT NULL DEFAULT 0,
+            failed INTEGER NOT NULL DEFAULT 0,
+            gates_passed INTEGER NOT NULL DEFAULT 0,
+            gates_reported INTEGER NOT NULL DEFAULT 0,
+            self_corrected INTEGER NOT NULL DEFAULT 0,
+            duration_sum INTEGER NOT NULL DEFAULT 0,
+            duration_count INTEGER NOT NULL DEFAULT 0,
+            tokens INTEGER NOT NULL DEFAULT 0,
+            completed_tokens INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (workspace_id, engine, day)
+        )
+    """)
+
     # Execution trace tables (for debug/replay mode)
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS execution_steps (
@@ -458,6 +502,30 @@ def _create_core_tables(cursor: sqlite3.Cursor) -> None:
         )
     """)
 
+    # Task dependency edges, one row per entry of tasks.depends_on. The JSON
+    # column stays the source for Task.depends_on; this table mirrors it
+    # (tasks.create / update_depends_on / delete write both in one
+    # transaction) so reverse and transitive lookups are indexed SQL instead
+    # of a JSON parse of every task in the workspace.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS task_dependencies (
+            workspace_id TEXT NOT NULL,
+            task_id TEXT NOT NULL,
+            depends_on_id TEXT NOT NULL,
+            PRIMARY KEY (task_id, depends_on_id)
+        )
+    """)
+
+    # Memoized PRD stress-test LLM answers, keyed by a hash of the model,
+    # prompt version and prompt inputs (prd_stress_test.DecompositionCache).
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS prd_decomposition_cache (
+            cache_key TEXT PRIMARY KEY,
+            response TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+
     # Per-workspace token/cost tracking (issue #712 — was never created here,
     # so every save_token_usage() raised "no such table" and cost data dropped).
     _create_token_usage_schema(cursor)
@@ -482,6 +550,25 @@ def _create_core_indexes(cursor: sqlite3.Cursor) -> None:
     """
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_workspace ON tasks(workspace_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)")
+    # Keyset pagination (tasks.list_tasks_page): each filter the listing
+    # offers, followed by the full sort key, so every page is an index seek
+    # plus `limit` rows in order instead of a scan and sort of the workspace.
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tasks_order "
+        "ON tasks(workspace_id, priority, created_at, id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tasks_status_order "
+        "ON tasks(workspace_id, status, priority, created_at, id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tasks_prd_order "
+        "ON tasks(workspace_id, prd_id, priority, created_at, id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tasks_parent_order "
+        "ON tasks(workspace_id, parent_id, priority, created_at, id)"
+    )
     # Atomic duplicate-import protection (#565): one task per (workspace, issue
     # URL). SQLite treats NULLs as distinct, so non-imported tasks (NULL
     # external_url) are unaffected.
@@ -503,6 +590,13 @@ def _create_core_indexes(cursor: sqlite3.Cursor) -> None:
             "workspace still opens normally.",
             exc,
         )
+    # The primary key covers task -> dependencies; this is the reverse
+    # direction (dependents of a task).
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_task_dependencies_depends_on "
+        "ON task_dependencies(depends_on_id, task_id)"
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_task_dependencies_workspace ON task_dependencies(workspace_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_workspace ON events(workspace_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_blockers_workspace ON blockers(workspace_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_blockers_status ON blockers(status)")
@@ -604,7 +698,7 @@ def _ensure_schema_upgrades(db_path: Path) -> None:
     with the current ``SCHEMA_VERSION``, this returns after a single read —
     zero DDL, zero write commits — so per-request workspace loads are cheap.
     """
-    conn = _open_db(db_path)
+    conn = _acquire(db_path)
     try:
         current_version = conn.execute("PRAGMA user_version").fetchone()[0]
     except Exception:
@@ -724,6 +818,15 @@ def _ensure_schema_upgrades(db_path: Path) -> None:
     if cursor.fetchone():
         cursor.execute("PRAGMA table_info(tasks)")
         task_columns = {row[1] for row in cursor.fetchall()}
+        # prd_id/priority predate every other column here, but the keyset
+        # pagination indexes (idx_tasks_*_order) cover them, so a tasks table
+        # old enough to lack them must gain them before those are created.
+        if "prd_id" not in task_columns:
+            cursor.execute("ALTER TABLE tasks ADD COLUMN prd_id TEXT")
+            conn.commit()
+        if "priority" not in task_columns:
+            cursor.execute("ALTER TABLE tasks ADD COLUMN priority INTEGER DEFAULT 0")
+            conn.commit()
         if "depends_on" not in task_columns:
             cursor.execute("ALTER TABLE tasks ADD COLUMN depends_on TEXT DEFAULT '[]'")
             conn.commit()
@@ -776,6 +879,29 @@ def _ensure_schema_upgrades(db_path: Path) -> None:
         _dedupe_external_urls(conn, cursor)
         conn.commit()
 
+        # Rebuild the dependency edge table from the JSON column (schema 7).
+        # A full rebuild rather than INSERT OR IGNORE: an older build may have
+        # edited depends_on since the table was last synced. Edges to tasks
+        # that no longer exist (pre-#724 deletes left those behind) are kept,
+        # exactly as the JSON keeps them, so readiness checks agree.
+        cursor.execute("DELETE FROM task_dependencies")
+        cursor.execute("""
+            INSERT OR IGNORE INTO task_dependencies (workspace_id, task_id, depends_on_id)
+            SELECT t.workspace_id, t.id, j.value
+            FROM tasks t,
+                 json_each(CASE WHEN json_valid(t.depends_on) THEN t.depends_on ELSE '[]' END) j
+            WHERE j.type = 'text'
+        """)
+        conn.commit()
+
+    conn.commit()
+
+    # Seed the engine rollups from the run log (schema 9). A full rebuild on
+    # every upgrade, like task_dependencies: an older build may have logged
+    # runs without maintaining them.
+    from codeframe.core.engine_stats import rebuild_stats_conn
+
+    rebuild_stats_conn(conn)
     conn.commit()
 
     # LAST, and from the same definition the fresh path uses. Everything above
@@ -972,11 +1098,13 @@ def get_workspace(repo_path: Path) -> Workspace:
     # Ensure schema is up to date for existing workspaces
     _ensure_schema_upgrades(db_path)
 
-    conn = _open_db(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, repo_path, tech_stack, created_at FROM workspace LIMIT 1")
-    row = cursor.fetchone()
-    conn.close()
+    conn = _acquire(db_path)
+    try:
+        row = conn.execute(
+            "SELECT id, repo_path, tech_stack, created_at FROM workspace LIMIT 1"
+        ).fetchone()
+    finally:
+        conn.close()
 
     if not row:
         raise FileNotFoundError("Workspace database exists but contains no workspace record")
@@ -990,10 +1118,57 @@ def get_workspace(repo_path: Path) -> Workspace:
     )
 
 
+# repo path -> ((st_dev, st_ino) of state.db, Workspace). See get_cached_workspace.
+_WORKSPACE_CACHE: dict[Path, tuple[tuple[int, int], Workspace]] = {}
+_WORKSPACE_CACHE_LOCK = threading.Lock()
+
+
+def get_cached_workspace(repo_path: Path) -> Workspace:
+    """:func:`get_workspace`, memoized per process.
+
+    For hot paths that resolve a workspace from a path over and over (e.g.
+    ``events.emit(repo_path=...)``): a hit costs one ``stat`` instead of the
+    schema-version read and workspace SELECT. The entry is dropped when
+    ``state.db`` is replaced or removed, so a re-initialized workspace is
+    never served under its old id. Mutable fields (``tech_stack``) reflect the
+    first load; callers that display them should use :func:`get_workspace`.
+
+    Raises:
+        FileNotFoundError: If no workspace exists at this path
+    """
+    repo_path = repo_path.resolve()
+    db_path = _get_state_dir(repo_path) / STATE_DB_NAME
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        with _WORKSPACE_CACHE_LOCK:
+            _WORKSPACE_CACHE.pop(repo_path, None)
+        raise FileNotFoundError(f"No workspace found at {repo_path}") from None
+    identity = (st.st_dev, st.st_ino)
+
+    with _WORKSPACE_CACHE_LOCK:
+        cached = _WORKSPACE_CACHE.get(repo_path)
+    if cached is not None and cached[0] == identity:
+        return cached[1]
+
+    workspace = get_workspace(repo_path)
+    with _WORKSPACE_CACHE_LOCK:
+        _WORKSPACE_CACHE[repo_path] = (identity, workspace)
+    return workspace
+
+
+def _acquire(db_path: str | Path) -> sqlite3.Connection:
+    # PooledConnection is a drop-in for sqlite3.Connection (attribute access,
+    # transactions, close()); the cast keeps every caller's annotations valid.
+    return cast(sqlite3.Connection, _CONNECTION_POOL.acquire(db_path))
+
+
 def get_db_connection(workspace: Workspace) -> sqlite3.Connection:
     """Get a database connection for a workspace.
 
-    The caller is responsible for closing the connection.
+    The connection comes from the process-wide pool: ``close()`` hands it back
+    for reuse rather than tearing it down. The caller is responsible for
+    closing it, exactly as with an unpooled connection.
 
     Args:
         workspace: Workspace object
@@ -1001,17 +1176,28 @@ def get_db_connection(workspace: Workspace) -> sqlite3.Connection:
     Returns:
         SQLite connection
     """
-    return _open_db(workspace.db_path)
+    return _acquire(workspace.db_path)
 
 
 def get_db_connection_by_path(db_path: str | Path) -> sqlite3.Connection:
-    """Open a workspace DB connection from a raw path (WAL + busy_timeout).
+    """Get a pooled workspace DB connection from a raw path (WAL + busy_timeout).
 
     Same connection setup as :func:`get_db_connection`, for callers that hold a
     path rather than a :class:`Workspace` (e.g. the costs router's helpers that
     tolerate fresh/locked DBs). The caller is responsible for closing it.
     """
-    return _open_db(db_path)
+    return _acquire(db_path)
+
+
+@contextmanager
+def db_connection(workspace: Workspace) -> Iterator[sqlite3.Connection]:
+    """``with db_connection(workspace) as conn:`` — a pooled connection that is
+    released on exit. Does not commit; call ``conn.commit()`` as usual."""
+    conn = _acquire(workspace.db_path)
+    try:
+        yield conn
+    finally:
+        conn.close()
 
 
 def workspace_exists(repo_path: Path) -> bool:
@@ -1050,13 +1236,16 @@ def update_workspace_tech_stack(repo_path: Path, tech_stack: Optional[str]) -> W
 
     now = _utc_now().isoformat()
 
-    conn = _open_db(db_path)
-    cursor = conn.cursor()
-    cursor.execute(
-        "UPDATE workspace SET tech_stack = ?, updated_at = ?",
-        (tech_stack, now),
-    )
-    conn.commit()
-    conn.close()
+    conn = _acquire(db_path)
+    try:
+        conn.execute(
+            "UPDATE workspace SET tech_stack = ?, updated_at = ?",
+            (tech_stack, now),
+        )
+        conn.commit()
+    finally:
+        conn.close()
 
+    with _WORKSPACE_CACHE_LOCK:
+        _WORKSPACE_CACHE.pop(repo_path, None)
     return get_workspace(repo_path)
@@ -9,13 +9,21 @@ Lifecycle:
     2. Agent runs with cwd set to worktree
     3. merge_back(workspace_path, task_id) → MergeResult
     4. cleanup(workspace_path, task_id)
+
+``WorktreePool`` replaces steps 1 and 4 with reuse: a finished worktree is
+parked instead of deleted, and the next task gets it reset to its base, so
+only the files that differ are rewritten rather than the whole tree.
 """
 
 from __future__ import annotations
 
 import contextlib
 import logging
+import os
+import shutil
 import subprocess
+import threading
+import uuid
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator, Optional
@@ -29,6 +37,18 @@ logger = logging.getLogger(__name__)
 
 WORKTREE_DIR = ".codeframe/worktrees"
 
+#: Parked worktrees waiting for a task, under WORKTREE_DIR. Dot-prefixed so it
+#: can never collide with a task id.
+POOL_DIR = ".idle"
+
+#: Idle worktrees kept per repository; 0 creates and deletes one per task.
+WORKTREE_POOL_ENV = "CODEFRAME_WORKTREE_POOL_SIZE"
+
+DEFAULT_POOL_SIZE = 4
+
+#: Name prefix of a worktree still being created in the pool directory.
+_CREATING_PREFIX = ".creating-"
+
 
 @contextlib.contextmanager
 def _main_tree_lock(workspace_path: Path) -> Iterator[None]:
@@ -40,10 +60,20 @@ def _main_tree_lock(workspace_path: Path) -> Iterator[None]:
     corrupt it. This is a cross-process advisory lock (``flock``) keyed on the
     repo. Best-effort: a no-op where ``fcntl`` is unavailable (non-POSIX).
     """
+    with _flock(workspace_path / ".git" / "cf-merge.lock"):
+        yield
+
+
+@contextlib.contextmanager
+def _flock(lock_path: Path) -> Iterator[None]:
+    """Exclusive ``flock`` on ``lock_path``; a no-op without ``fcntl``.
+
+    Each call opens the file anew, so threads of one process exclude each
+    other as well as other processes.
+    """
     if fcntl is None:
         yield
         return
-    lock_path = workspace_path / ".git" / "cf-merge.lock"
     lock_path.parent.mkdir(parents=True, exist_ok=True)
     with open(lock_path, "w") as handle:
         fcntl.flock(handle, fcntl.LOCK_EX)
@@ -292,6 +322,232 @@ class TaskWorktree:
                 )
 
 
+def _pool_size() -> int:
+    """CODEFRAME_WORKTREE_POOL_SIZE, or DEFAULT_POOL_SIZE; a bad value warns."""
+    raw = os.getenv(WORKTREE_POOL_ENV)
+    if not raw:
+        return DEFAULT_POOL_SIZE
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning("%s=%r is not an integer; ignoring", WORKTREE_POOL_ENV, raw)
+        return DEFAULT_POOL_SIZE
+    if value < 0:
+        logger.warning("%s=%d must not be negative; ignoring", WORKTREE_POOL_ENV, value)
+        return DEFAULT_POOL_SIZE
+    return value
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _git(cwd: Path, *args: str) -> subprocess.CompletedProcess:
+    """Run git in ``cwd``, raising CalledProcessError on failure."""
+    return subprocess.run(
+        ["git", *args],
+        cwd=str(cwd),
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        check=True,
+    )
+
+
+class WorktreePool:
+    """Task worktrees that are reused instead of created and deleted per task.
+
+    ``git worktree add`` writes out the whole tree — seconds per task on a
+    large repository — and ``cleanup`` deletes it again. The pool parks a
+    finished worktree (detached, under ``WORKTREE_DIR/.idle``) and hands it to
+    the next task: ``git worktree move`` puts it at the task's usual path,
+    ``git checkout -f -b cf/<task_id> <base>`` rewrites only the files that
+    differ, and ``git clean -ffdx`` leaves it exactly as a fresh checkout.
+    ``prewarm`` fills the pool in the background so the first tasks of a
+    batch find worktrees waiting.
+
+    A task's worktree keeps its path and branch, so preserving it for
+    recovery, ``env doctor`` and the "already exists" check behave as before.
+    Any git failure falls back to ``TaskWorktree.create`` / ``cleanup``.
+
+    Pool bookkeeping is serialised by its own ``flock`` (``.git/cf-worktree-
+    pool.lock``). It never touches the main working tree, so it does not
+    contend with ``_main_tree_lock``; a merge-back running alongside only
+    moves the base ref, which a checkout reads atomically.
+
+    Crash safety: a worktree is only created under a ``.creating-<pid>-``
+    name and moved into place once complete; ``recover`` removes those whose
+    process is gone. A crash between ``acquire``'s move and its checkout
+    leaves a worktree at the task's path, which the next run reports as a
+    leftover to discard, like any other.
+
+    Args:
+        workspace_path: Root of the git repository.
+        max_idle: Worktrees kept parked (default: CODEFRAME_WORKTREE_POOL_SIZE
+            or 4). 0 turns the pool off.
+    """
+
+    def __init__(self, workspace_path: Path, max_idle: Optional[int] = None) -> None:
+        self.workspace_path = workspace_path
+        self.max_idle = _pool_size() if max_idle is None else max_idle
+        self.pool_dir = workspace_path / WORKTREE_DIR / POOL_DIR
+        self._stop = threading.Event()
+        self._fresh = TaskWorktree()
+
+    def _lock(self):
+        return _flock(self.workspace_path / ".git" / "cf-worktree-pool.lock")
+
+    def idle(self) -> list[Path]:
+        """Parked worktrees, oldest first (never one still being created)."""
+        try:
+            parked = [p for p in self.pool_dir.iterdir()
+                      if p.is_dir() and not p.name.startswith(".")]
+        except OSError:
+            return []
+        return sorted(parked, key=lambda p: p.stat().st_mtime)
+
+    def acquire(self, task_id: str, base_branch: str = "main") -> Path:
+        """A worktree for ``task_id`` on a new ``cf/<task_id>`` branch.
+
+        Same contract as ``TaskWorktree.create``: the worktree is at
+        ``WORKTREE_DIR/<task_id>`` and the branch must not exist yet.
+
+        Raises:
+            subprocess.CalledProcessError: If no worktree could be created.
+        """
+        worktree_path = self.workspace_path / WORKTREE_DIR / task_id
+        branch_name = f"cf/{task_id}"
+        parked = self._take(worktree_path) if self.max_idle > 0 else False
+        if parked:
+            try:
+                _git(worktree_path, "checkout", "-f", "-b", branch_name, base_branch)
+                _git(worktree_path, "clean", "-ffdxq")
+                logger.info("Reused pooled worktree for %s at %s", task_id, worktree_path)
+                return worktree_path
+            except subprocess.CalledProcessError as exc:
+                logger.warning("Could not reset pooled worktree for %s: %s",
+                               task_id, (exc.stderr or "").strip()[:500])
+                self._fresh.cleanup(self.workspace_path, task_id)
+        return self._fresh.create(self.workspace_path, task_id, base_branch=base_branch)
+
+    def _take(self, worktree_path: Path) -> bool:
+        """Move a parked worktree to ``worktree_path``; False if none usable."""
+        with self._lock():
+            for parked in self.idle():
+                worktree_path.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    _git(self.workspace_path, "worktree", "move", str(parked), str(worktree_path))
+                    return True
+                except subprocess.CalledProcessError as exc:
+                    logger.warning("Discarding unusable pooled worktree %s: %s",
+                                   parked.name, (exc.stderr or "").strip()[:500])
+                    self._discard(parked)
+        return False
+
+    def release(self, task_id: str) -> None:
+        """Park the task's worktree for reuse, or remove it if the pool is full.
+
+        Called where ``TaskWorktree.cleanup`` was — after a successful
+        merge-back, or when there is nothing to preserve. Deletes the
+        ``cf/<task_id>`` branch either way. Never raises.
+        """
+        worktree_path = self.workspace_path / WORKTREE_DIR / task_id
+        if self.max_idle <= 0 or not worktree_path.is_dir():
+            self._fresh.cleanup(self.workspace_path, task_id)
+            return
+        try:
+            with self._lock():
+                if len(self.idle()) >= self.max_idle:
+                    parked = None
+                else:
+                    parked = self.pool_dir / uuid.uuid4().hex[:12]
+                    self.pool_dir.mkdir(parents=True, exist_ok=True)
+                    # Off the branch first: git will not delete a checked-out one.
+                    _git(worktree_path, "checkout", "--detach")
+                    _git(self.workspace_path, "branch", "-D", f"cf/{task_id}")
+                    _git(self.workspace_path, "worktree", "move", str(worktree_path), str(parked))
+                    # Stamped under the lock: once it is released another
+                    # process's _take may move this directory away. The
+                    # worktree is parked either way; the stamp only orders reuse.
+                    with contextlib.suppress(OSError):
+                        os.utime(parked)  # most recently parked is the last to be reused
+        except (subprocess.CalledProcessError, OSError) as exc:
+            logger.warning("Could not return the worktree for %s to the pool: %s",
+                           task_id, getattr(exc, "stderr", None) or exc)
+            parked = None
+        if parked is None:
+            self._fresh.cleanup(self.workspace_path, task_id)
+        else:
+            logger.info("Parked worktree for %s as %s", task_id, parked.name)
+
+    def prewarm(self, count: int, base_branch: str = "main") -> threading.Thread:
+        """Fill the pool to ``count`` worktrees (capped at ``max_idle``) in the background.
+
+        Returns the started thread; ``stop`` ends it after its current worktree.
+        """
+        thread = threading.Thread(
+            target=self._fill,
+            args=(min(count, self.max_idle), base_branch),
+            name="worktree-prewarm",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        """Ask a running ``prewarm`` to finish."""
+        self._stop.set()
+
+    def _fill(self, count: int, base_branch: str) -> None:
+        self.recover()
+        while not self._stop.is_set() and len(self.idle()) < count:
+            staging = self.pool_dir / f"{_CREATING_PREFIX}{os.getpid()}-{uuid.uuid4().hex[:8]}"
+            self.pool_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                _git(self.workspace_path, "worktree", "add", "--detach", str(staging), base_branch)
+                with self._lock():
+                    _git(self.workspace_path, "worktree", "move", str(staging),
+                         str(self.pool_dir / uuid.uuid4().hex[:12]))
+            except (subprocess.CalledProcessError, OSError) as exc:
+                logger.warning("Could not pre-create a worktree: %s",
+                               getattr(exc, "stderr", None) or exc)
+                self._discard(staging)
+                return
+
+    def recover(self) -> None:
+        """Remove worktrees left half-created by a process that died."""
+        with self._lock():
+            try:
+                entries = list(self.pool_dir.iterdir())
+            except OSError:
+                entries = []
+            for entry in entries:
+                if not entry.name.startswith(_CREATING_PREFIX):
+                    continue
+                pid = entry.name[len(_CREATING_PREFIX):].split("-", 1)[0]
+                if pid.isdigit() and not _pid_alive(int(pid)):
+                    self._discard(entry)
+            subprocess.run(["git", "worktree", "prune"], cwd=str(self.workspace_path),
+                           capture_output=True)
+
+    def _discard(self, path: Path) -> None:
+        subprocess.run(
+            ["git", "worktree", "remove", "--force", str(path)],
+            cwd=str(self.workspace_path),
+            capture_output=True,
+        )
+        shutil.rmtree(path, ignore_errors=True)
+        subprocess.run(["git", "worktree", "prune"], cwd=str(self.workspace_path),
+                       capture_output=True)
+
+
 def get_base_branch(workspace_path: Path) -> str:
     """Return the current HEAD branch name, defaulting to 'main' on failure.
 
@@ -76,6 +76,12 @@ MODEL_PRICING = {
 #: which is different from having no pricing at all.
 MODEL_PRICING_ENV_VAR = "CODEFRAME_MODEL_PRICING"
 
+#: Prompt-cache rates as multiples of a model's input rate, used when its
+#: pricing entry has no explicit "cache_write"/"cache_read" key. Anthropic
+#: bills 5-minute cache writes at 1.25x and cache reads at 0.1x base input.
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.10
+
 
 def _pricing_table() -> Dict[str, Dict[str, float]]:
     """MODEL_PRICING with any CODEFRAME_MODEL_PRICING overrides applied.
@@ -92,10 +98,12 @@ def _pricing_table() -> Dict[str, Dict[str, float]]:
         overrides = json.loads(raw)
         if not isinstance(overrides, dict):
             raise ValueError(f"expected an object, got {type(overrides).__name__}")
-        clean = {
-            model: {"input": float(p["input"]), "output": float(p["output"])}
-            for model, p in overrides.items()
-        }
+        clean = {}
+        for model, p in overrides.items():
+            clean[model] = {"input": float(p["input"]), "output": float(p["output"])}
+            for key in ("cache_write", "cache_read"):
+                if key in p:
+                    clean[model][key] = float(p[key])
     except (json.JSONDecodeError, ValueError, TypeError, KeyError) as exc:
         logger.warning(
             "Ignoring malformed %s (%s). Using built-in pricing.",
@@ -181,7 +189,11 @@ class MetricsTracker:
 
     @staticmethod
     def calculate_cost(
-        model_name: str, input_tokens: int, output_tokens: int
+        model_name: str,
+        input_tokens: int,
+        output_tokens: int,
+        cache_creation_tokens: int = 0,
+        cache_read_tokens: int = 0,
     ) -> Optional[float]:
         """Calculate estimated cost in USD for an LLM call.
 
@@ -191,8 +203,12 @@ class MetricsTracker:
 
         Args:
             model_name: Model identifier (e.g., "claude-sonnet-4-5" or "claude-sonnet-4-5-20250514")
-            input_tokens: Number of input tokens
+            input_tokens: Number of uncached input tokens
             output_tokens: Number of output tokens
+            cache_creation_tokens: Input tokens written to the prompt cache,
+                priced at the model's "cache_write" rate
+            cache_read_tokens: Input tokens served from the prompt cache,
+                priced at the model's "cache_read" rate
 
         Returns:
             Estimated cost in USD (rounded to 6 decimal places), or **None** when
@@ -226,7 +242,12 @@ class MetricsTracker:
         # Calculate cost: (tokens * price_per_mtok) / 1,000,000
         input_cost = (input_tokens * prices["input"]) / 1_000_000
         output_cost = (output_tokens * prices["output"]) / 1_000_000
-        total_cost = input_cost + output_cost
+        cache_write_rate = prices.get("cache_write", prices["input"] * CACHE_WRITE_MULTIPLIER)
+        cache_read_rate = prices.get("cache_read", prices["input"] * CACHE_READ_MULTIPLIER)
+        cache_cost = (
+            cache_creation_tokens * cache_write_rate + cache_read_tokens * cache_read_rate
+        ) / 1_000_000
+        total_cost = input_cost + output_cost + cache_cost
 
         # Round to 6 decimal places for precision
         return round(total_cost, 6)
@@ -240,6 +261,8 @@ class MetricsTracker:
         input_tokens: int,
         output_tokens: int,
         call_type: CallType = CallType.OTHER,
+        cache_creation_tokens: int = 0,
+        cache_read_tokens: int = 0,
     ) -> int:
         """Record token usage for an LLM call.
 
@@ -254,6 +277,10 @@ class MetricsTracker:
             input_tokens: Number of input tokens
             output_tokens: Number of output tokens
             call_type: Type of call (TASK_EXECUTION, CODE_REVIEW, COORDINATION, OTHER)
+            cache_creation_tokens: Prompt-cache write tokens (priced, not
+                added to ``input_tokens``)
+            cache_read_tokens: Prompt-cache read tokens (priced, not added
+                to ``input_tokens``)
 
         Returns:
             Database ID of the created token usage record
@@ -277,12 +304,18 @@ class MetricsTracker:
             ... )
         """
         # Validate inputs
-        if input_tokens < 0 or output_tokens < 0:
+        if min(input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens) < 0:
             raise ValueError("Token counts cannot be negative")
 
         # None when the model has no pricing — stored as NULL so it is excluded
         # from cost sums rather than counted as free (#932).
-        estimated_cost = self.calculate_cost(model_name, input_tokens, output_tokens)
+        estimated_cost = self.calculate_cost(
+            model_name,
+            input_tokens,
+            output_tokens,
+            cache_creation_tokens=cache_creation_tokens,
+            cache_read_tokens=cache_read_tokens,
+        )
 
         # Create TokenUsage model
         token_usage = TokenUsage(
@@ -318,6 +351,8 @@ class MetricsTracker:
         input_tokens: int,
         output_tokens: int,
         call_type: CallType = CallType.OTHER,
+        cache_creation_tokens: int = 0,
+        cache_read_tokens: int = 0,
     ) -> int:
         """Record token usage for an LLM call (synchronous version).
 
@@ -332,6 +367,10 @@ class MetricsTracker:
             input_tokens: Number of input tokens
             output_tokens: Number of output tokens
             call_type: Type of call (TASK_EXECUTION, CODE_REVIEW, COORDINATION, OTHER)
+            cache_creation_tokens: Prompt-cache write tokens (priced, not
+                added to ``input_tokens``)
+            cache_read_tokens: Prompt-cache read tokens (priced, not added
+                to ``input_tokens``)
 
         Returns:
             Database ID of the created token usage record
@@ -339,10 +378,16 @@ class MetricsTracker:
         Raises:
             ValueError: If token counts are negative
         """
-        if input_tokens < 0 or output_tokens < 0:
+        if min(input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens) < 0:
             raise ValueError("Token counts cannot be negative")
 
-        estimated_cost = self.calculate_cost(model_name, input_tokens, output_tokens)
+        estimated_cost = self.calculate_cost(
+            model_name,
+            input_tokens,
+            output_tokens,
+            cache_creation_tokens=cache_creation_tokens,
+            cache_read_tokens=cache_read_tokens,
+        )
 
         token_usage = TokenUsage(
             task_id=task_id,
@@ -78,6 +78,23 @@ class ComplexityAnalyzer:
             logger.error(f"Error reading file {file_path}: {e}")
             return []
 
+        return self.analyze_code(file_path, code)
+
+    def analyze_code(self, file_path: Path, code: str) -> List[ReviewFinding]:
+        """Analyze already-read source for complexity issues.
+
+        For callers that read each file once and share the text between
+        analyzers (``core.review``). ``file_path`` only labels the findings.
+
+        Args:
+            file_path: Path the code was read from
+            code: File content
+
+        Returns:
+            List of ReviewFinding objects for complexity issues
+        """
+        file_path = Path(file_path)
+
         if not code.strip():
             return []
 
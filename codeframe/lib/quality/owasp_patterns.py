@@ -77,6 +77,23 @@ class OWASPPatterns:
             logger.error(f"Error reading file {file_path}: {e}")
             return []
 
+        return self.check_code(file_path, code)
+
+    def check_code(self, file_path: Path, code: str) -> List[ReviewFinding]:
+        """Check already-read source for OWASP patterns.
+
+        For callers that read each file once and share the text between
+        analyzers (``core.review``). ``file_path`` only labels the findings.
+
+        Args:
+            file_path: Path the code was read from
+            code: File content
+
+        Returns:
+            List of ReviewFinding objects for OWASP violations
+        """
+        file_path = Path(file_path)
+
         if not code.strip():
             return []
 
@@ -5,15 +5,20 @@ Scans code for security vulnerabilities using bandit and maps severity levels.
 
 import json
 import logging
+import os
 import shutil
 import subprocess
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Mapping, Optional, Sequence
 
 from codeframe.core.models import ReviewFinding
 
 logger = logging.getLogger(__name__)
 
+#: Files per bandit invocation in ``analyze_sources``. Keeps the command line
+#: far below ARG_MAX while still amortising bandit's startup over many files.
+BANDIT_BATCH_SIZE = 200
+
 
 class ScannerUnavailableError(RuntimeError):
     """The scanner binary is absent, so no analysis was performed.
@@ -67,11 +72,7 @@ class SecurityScanner:
         # review of, say, a newly added empty __init__.py came back
         # "approved"/100 on an install with no bandit — the original bug,
         # surviving in the empty-file subset.
-        if shutil.which("bandit") is None:
-            raise ScannerUnavailableError(
-                "bandit is not installed, so no security analysis was performed. "
-                "Reinstall codeframe, or: pip install bandit"
-            )
+        self._require_bandit()
 
         # Read file to check if empty
         try:
@@ -83,28 +84,89 @@ class SecurityScanner:
         if not code.strip():
             return []
 
-        findings = []
+        bandit_output = self._run_bandit([file_path])
+        if bandit_output is None:
+            return []
+        return self._parse_bandit_output(bandit_output, file_path)
+
+    def analyze_sources(self, sources: Mapping[Path, str]) -> Dict[Path, List[ReviewFinding]]:
+        """Scan many already-read files with one bandit run per batch.
+
+        ``analyze_file`` starts a bandit process per file, so a 300-file review
+        started 300 of them. This runs bandit over up to
+        :data:`BANDIT_BATCH_SIZE` files at a time and fans the JSON results
+        back out by filename. Bandit checks each file independently, so every
+        file's findings are the ones ``analyze_file`` would have reported.
+
+        Args:
+            sources: File path -> content, as read by the caller. Empty files
+                are not handed to bandit, as in ``analyze_file``.
 
+        Returns:
+            Findings per path, with every key of ``sources`` present.
+
+        Raises:
+            ScannerUnavailableError: If any Python file was given and bandit is
+                not installed — even if every one of them is empty (#910).
+        """
+        results: Dict[Path, List[ReviewFinding]] = {path: [] for path in sources}
+        python_files = [path for path in sources if Path(path).suffix == ".py"]
+        if not python_files:
+            return results
+
+        self._require_bandit()
+
+        to_scan = [path for path in python_files if sources[path].strip()]
+        for start in range(0, len(to_scan), BANDIT_BATCH_SIZE):
+            batch = to_scan[start:start + BANDIT_BATCH_SIZE]
+            bandit_output = self._run_bandit(batch)
+            if bandit_output is None:
+                continue
+            # bandit echoes each filename back, give or take a leading "./".
+            by_name = {os.path.normpath(str(path)): path for path in batch}
+            per_file: Dict[Path, list] = {}
+            for item in bandit_output.get("results", []):
+                path = by_name.get(os.path.normpath(item.get("filename") or ""))
+                if path is not None:
+                    per_file.setdefault(path, []).append(item)
+            for path, items in per_file.items():
+                results[path] = self._parse_bandit_output({"results": items}, Path(path))
+
+        return results
+
+    @staticmethod
+    def _require_bandit() -> None:
+        if shutil.which("bandit") is None:
+            raise ScannerUnavailableError(
+                "bandit is not installed, so no security analysis was performed. "
+                "Reinstall codeframe, or: pip install bandit"
+            )
+
+    def _run_bandit(self, file_paths: Sequence[Path]) -> Optional[dict]:
+        """Run bandit over ``file_paths``; its parsed JSON report, or None on failure."""
+        target = str(file_paths[0]) if len(file_paths) == 1 else f"{len(file_paths)} files"
         try:
-            # Run bandit on the file
             result = subprocess.run(
-                ["bandit", "-f", "json", str(file_path)],
+                # -q: past a few files bandit draws a progress bar on stdout,
+                # in front of the JSON.
+                ["bandit", "-q", "-f", "json", *(str(path) for path in file_paths)],
                 capture_output=True,
                 text=True,
                 encoding="utf-8",
                 errors="replace",
-                timeout=30,
+                # 30s was the budget for one file; a batch gets a little more
+                # per file on top.
+                timeout=30 + len(file_paths) - 1,
             )
 
             # Parse JSON output
             if result.stdout:
-                bandit_output = json.loads(result.stdout)
-                findings = self._parse_bandit_output(bandit_output, file_path)
+                return json.loads(result.stdout)
 
         except subprocess.TimeoutExpired:
-            logger.error(f"Bandit timeout analyzing {file_path}")
+            logger.error(f"Bandit timeout analyzing {target}")
         except json.JSONDecodeError as e:
-            logger.error(f"Error parsing bandit output for {file_path}: {e}")
+            logger.error(f"Error parsing bandit output for {target}: {e}")
         except FileNotFoundError as exc:
             # Not a clean scan — a scan that never happened. Returning [] here
             # made "no security findings" indistinguishable from "no security
@@ -114,9 +176,9 @@ class SecurityScanner:
                 "Reinstall codeframe, or: pip install bandit"
             ) from exc
         except Exception as e:
-            logger.error(f"Error running bandit on {file_path}: {e}")
+            logger.error(f"Error running bandit on {target}: {e}")
 
-        return findings
+        return None
 
     def _parse_bandit_output(self, bandit_output: dict, file_path: Path) -> List[ReviewFinding]:
         """Parse bandit JSON output into ReviewFinding objects.
@@ -0,0 +1,279 @@
+"""Cross-worker rate-limit storage in a local SQLite file.
+
+slowapi's default in-memory storage keeps counters per process, so with
+several uvicorn workers every limit — auth brute-force protection included —
+is multiplied by the worker count (issue #678). Redis fixes that but is one
+more service to run. This backend keeps the counters in a WAL-mode SQLite file
+under the state directory instead, so every worker on the host shares them.
+
+It implements the ``limits`` storage interface for all three strategies:
+fixed window (``incr``/``get``), moving window (``acquire_entry``) and the
+sliding window counter. Each check-and-update runs in one ``BEGIN IMMEDIATE``
+transaction, so concurrent workers never both take the last slot; a hit costs
+tens of microseconds. Counters are ephemeral, so commits are not fsynced
+(``synchronous = NORMAL`` in WAL mode) and expired rows are swept lazily.
+
+Selected with ``RATE_LIMIT_STORAGE=sqlite``; see ``lib.rate_limiter``.
+"""
+
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import ClassVar, Optional, Tuple
+
+from limits.storage import MovingWindowSupport, SlidingWindowCounterSupport, Storage
+from limits.storage.base import TimestampedSlidingWindow
+
+logger = logging.getLogger(__name__)
+
+#: ``limits`` storage scheme. Namespaced so it cannot collide with a scheme a
+#: future ``limits`` release registers.
+SCHEME = "codeframe+sqlite"
+
+#: A writer holds the lock for microseconds; waiting longer than this means
+#: something is wrong, and the request should fail rather than stall the loop.
+_BUSY_TIMEOUT_MS = 1000
+
+#: Seconds between sweeps of expired counters and window entries.
+_SWEEP_INTERVAL_SECONDS = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS counters (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL,
+    expires REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS window_entries (
+    key TEXT NOT NULL,
+    at REAL NOT NULL,
+    expires REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_window_entries_key_at ON window_entries (key, at);
+CREATE INDEX IF NOT EXISTS idx_window_entries_expires ON window_entries (expires);
+"""
+
+
+class SQLiteStorage(
+    Storage, MovingWindowSupport, SlidingWindowCounterSupport, TimestampedSlidingWindow
+):
+    """``limits`` storage shared by every process that opens the same file.
+
+    Construct it through slowapi/limits with
+    ``storage_uri="codeframe+sqlite://"`` and ``storage_options={"path": ...}``.
+    Times are wall-clock (``time.time()``) because they are compared across
+    processes.
+    """
+
+    STORAGE_SCHEME: ClassVar[list[str]] = [SCHEME]
+
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        wrap_exceptions: bool = False,
+        path: Optional[str] = None,
+        **options: float | str | bool,
+    ):
+        if not path:
+            raise ValueError("SQLiteStorage requires a 'path' storage option")
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._next_sweep = 0.0
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        # Open now so a bad path fails at startup, not on the first request.
+        with self._lock:
+            self._connection()
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return sqlite3.Error
+
+    def _connection(self) -> sqlite3.Connection:
+        """This process's connection; call with ``_lock`` held.
+
+        Reopened after a fork: a preloading server (gunicorn ``--preload``)
+        creates the limiter in the parent, and a SQLite connection must not be
+        used across ``fork()``.
+        """
+        pid = os.getpid()
+        if self._conn is None or self._pid != pid:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path),
+                isolation_level=None,
+                check_same_thread=False,
+                timeout=_BUSY_TIMEOUT_MS / 1000,
+            )
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn, self._pid = conn, pid
+        return self._conn
+
+    def _write(self, fn, *args):
+        """Run ``fn(conn, now, *args)`` in one IMMEDIATE transaction."""
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(conn, now, *args)
+                if now >= self._next_sweep:
+                    conn.execute("DELETE FROM counters WHERE expires <= ?", (now,))
+                    conn.execute("DELETE FROM window_entries WHERE expires <= ?", (now,))
+                    self._next_sweep = now + _SWEEP_INTERVAL_SECONDS
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            return result
+
+    def _read(self, sql: str, params: tuple) -> Optional[tuple]:
+        with self._lock:
+            return self._connection().execute(sql, params).fetchone()
+
+    # -- fixed window -------------------------------------------------------
+
+    @staticmethod
+    def _incr(conn: sqlite3.Connection, now: float, key: str, expiry: float, amount: int) -> int:
+        conn.execute(
+            "INSERT INTO counters (key, value, expires) VALUES (?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET "
+            "value = CASE WHEN expires <= ? THEN excluded.value ELSE value + excluded.value END, "
+            "expires = CASE WHEN expires <= ? THEN excluded.expires ELSE expires END",
+            (key, amount, now + expiry, now, now),
+        )
+        return conn.execute("SELECT value FROM counters WHERE key = ?", (key,)).fetchone()[0]
+
+    @staticmethod
+    def _get(conn: sqlite3.Connection, now: float, key: str) -> int:
+        row = conn.execute(
+            "SELECT value FROM counters WHERE key = ? AND expires > ?", (key, now)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        """Increment ``key``, starting a new ``expiry``-second window if none is live."""
+        return self._write(self._incr, key, expiry, amount)
+
+    def get(self, key: str) -> int:
+        """The live counter for ``key``, 0 if absent or expired."""
+        with self._lock:
+            return self._get(self._connection(), time.time(), key)
+
+    def get_expiry(self, key: str) -> float:
+        """When ``key``'s window ends; now if it has none."""
+        now = time.time()
+        row = self._read(
+            "SELECT expires FROM counters WHERE key = ? AND expires > ?", (key, now)
+        )
+        return row[0] if row else now
+
+    def clear(self, key: str) -> None:
+        def clear(conn: sqlite3.Connection, now: float) -> None:
+            conn.execute("DELETE FROM counters WHERE key = ?", (key,))
+            conn.execute("DELETE FROM window_entries WHERE key = ?", (key,))
+
+        self._write(clear)
+
+    def reset(self) -> Optional[int]:
+        def reset(conn: sqlite3.Connection, now: float) -> int:
+            count = max(
+                conn.execute("SELECT COUNT(*) FROM counters").fetchone()[0],
+                conn.execute("SELECT COUNT(DISTINCT key) FROM window_entries").fetchone()[0],
+            )
+            conn.execute("DELETE FROM counters")
+            conn.execute("DELETE FROM window_entries")
+            return count
+
+        return self._write(reset)
+
+    def check(self) -> bool:
+        try:
+            return self._read("SELECT 1", ()) is not None
+        except sqlite3.Error:
+            return False
+
+    # -- moving window ------------------------------------------------------
+
+    def acquire_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        """Record ``amount`` hits if fewer than ``limit`` fall in the last ``expiry`` s."""
+        if amount > limit:
+            return False
+
+        def acquire(conn: sqlite3.Connection, now: float) -> bool:
+            # The (limit - amount + 1)-th newest entry: if it is still inside
+            # the window, taking ``amount`` more would exceed the limit.
+            row = conn.execute(
+                "SELECT at FROM window_entries WHERE key = ? "
+                "ORDER BY at DESC LIMIT 1 OFFSET ?",
+                (key, limit - amount),
+            ).fetchone()
+            if row is not None and row[0] >= now - expiry:
+                return False
+            conn.executemany(
+                "INSERT INTO window_entries (key, at, expires) VALUES (?, ?, ?)",
+                [(key, now, now + expiry)] * amount,
+            )
+            return True
+
+        return self._write(acquire)
+
+    def get_moving_window(self, key: str, limit: int, expiry: int) -> Tuple[float, int]:
+        """(oldest entry in the window, entries in the window)."""
+        now = time.time()
+        oldest, count = self._read(
+            "SELECT MIN(at), COUNT(*) FROM window_entries WHERE key = ? AND at >= ?",
+            (key, now - expiry),
+        )
+        return (oldest, count) if count else (now, 0)
+
+    # -- sliding window counter --------------------------------------------
+
+    def _sliding_window(
+        self, conn: sqlite3.Connection, now: float, key: str, expiry: int
+    ) -> Tuple[int, float, int, float]:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_count = self._get(conn, now, previous_key)
+        current_count = self._get(conn, now, current_key)
+        previous_ttl = (
+            (1 - (((now - expiry) / expiry) % 1)) * expiry if previous_count else 0.0
+        )
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def acquire_sliding_window_entry(
+        self, key: str, limit: int, expiry: int, amount: int = 1
+    ) -> bool:
+        if amount > limit:
+            return False
+
+        def acquire(conn: sqlite3.Connection, now: float) -> bool:
+            previous_count, previous_ttl, current_count, _ = self._sliding_window(
+                conn, now, key, expiry
+            )
+            weighted = previous_count * previous_ttl / expiry + current_count
+            if math.floor(weighted) + amount > limit:
+                return False
+            # Checked and counted in one transaction, so unlike the in-memory
+            # storage there is no over-admit-then-decrement race to undo.
+            _, current_key = self.sliding_window_keys(key, expiry, now)
+            self._incr(conn, now, current_key, 2 * expiry, amount)
+            return True
+
+        return self._write(acquire)
+
+    def get_sliding_window(self, key: str, expiry: int) -> Tuple[int, float, int, float]:
+        with self._lock:
+            return self._sliding_window(self._connection(), time.time(), key, expiry)
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        self.clear(previous_key)
+        self.clear(current_key)
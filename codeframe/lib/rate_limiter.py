@@ -9,6 +9,11 @@ Rate limit categories:
 - ai: AI/expensive operations (chat, generation)
 - websocket: WebSocket connections
 
+Storage (RATE_LIMIT_STORAGE):
+- memory: per-process counters (the default; per-worker under several workers)
+- sqlite: a counter file in the state directory, shared by every local worker
+- redis: shared across hosts
+
 Key extraction:
 - Authenticated requests: User ID from token
 - Unauthenticated requests: Client IP address
@@ -21,6 +26,7 @@ Security:
 
 import asyncio
 import logging
+import sqlite3
 import threading
 from typing import Any, Callable, Optional
 
@@ -32,6 +38,7 @@ from slowapi.errors import RateLimitExceeded
 from slowapi.wrappers import Limit
 
 from codeframe.config.rate_limits import get_rate_limit_config
+from codeframe.lib import rate_limit_storage
 
 logger = logging.getLogger(__name__)
 
@@ -177,6 +184,21 @@ def get_rate_limiter() -> Optional[Limiter]:
             except ImportError as e:
                 logger.error(f"Redis storage requested but redis module not available: {e}. Falling back to memory.")
                 _limiter = Limiter(key_func=get_rate_limit_key)
+        elif config.storage == "sqlite" and config.storage_path:
+            # Shared by every worker on the host, without a Redis to run.
+            try:
+                _limiter = Limiter(
+                    key_func=get_rate_limit_key,
+                    storage_uri=f"{rate_limit_storage.SCHEME}://",
+                    storage_options={"path": config.storage_path},
+                )
+                logger.info(f"Rate limiter initialized with SQLite storage at {config.storage_path}")
+            except (OSError, sqlite3.Error) as e:
+                logger.error(
+                    f"SQLite rate-limit storage at {config.storage_path} is unusable: {e}. "
+                    f"Falling back to memory."
+                )
+                _limiter = Limiter(key_func=get_rate_limit_key)
         else:
             _limiter = Limiter(key_func=get_rate_limit_key)
             logger.info("Rate limiter initialized with in-memory storage")
@@ -124,16 +124,25 @@ class InteractiveSessionRepository(BaseRepository):
         role: str,
         content: str,
         metadata: Optional[dict] = None,
+        token_count: Optional[int] = None,
     ) -> dict:
+        """Append a message to a session.
+
+        ``token_count`` is the message's replay cost, if the caller has
+        counted it; chat replay counts and backfills rows left NULL. The
+        returned ``seq`` is the row's insertion order (see
+        :meth:`get_messages_after`).
+        """
         now = datetime.now(UTC).isoformat()
         message_id = str(uuid.uuid4())
         metadata_json = json.dumps(metadata) if metadata is not None else None
-        self._execute_write(
+        cursor = self._execute_write(
             """
-            INSERT INTO session_messages (id, session_id, role, content, metadata, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
+            INSERT INTO session_messages
+                (id, session_id, role, content, metadata, created_at, token_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
             """,
-            (message_id, session_id, role, content, metadata_json, now),
+            (message_id, session_id, role, content, metadata_json, now, token_count),
         )
         return {
             "id": message_id,
@@ -142,6 +151,8 @@ class InteractiveSessionRepository(BaseRepository):
             "content": content,
             "metadata": metadata,
             "created_at": now,
+            "token_count": token_count,
+            "seq": cursor.lastrowid,
         }
 
     def get_messages(
@@ -172,7 +183,7 @@ class InteractiveSessionRepository(BaseRepository):
         """
         rows = self._fetchall(
             """
-            SELECT * FROM session_messages
+            SELECT rowid AS seq, * FROM session_messages
             WHERE session_id = ?
             ORDER BY created_at DESC, rowid DESC
             LIMIT ?
@@ -181,6 +192,41 @@ class InteractiveSessionRepository(BaseRepository):
         )
         return [self._message_row_to_dict(row) for row in reversed(rows)]
 
+    def get_messages_after(self, session_id: str, seq: int, limit: int = 100) -> list[dict]:
+        """Return up to ``limit`` messages inserted after ``seq``, oldest first.
+
+        Lets chat replay keep a history window in memory and pick up only the
+        rows written since it last looked — by this process or any other.
+        """
+        rows = self._fetchall(
+            """
+            SELECT rowid AS seq, * FROM session_messages
+            WHERE session_id = ? AND rowid > ?
+            ORDER BY rowid
+            LIMIT ?
+            """,
+            (session_id, seq, limit),
+        )
+        return [self._message_row_to_dict(row) for row in rows]
+
+    def set_token_counts(self, counts: dict[str, int]) -> None:
+        """Store replay token counts for messages that were saved without one.
+
+        One statement for the whole batch, so a legacy session's first replay
+        backfills its window in a single commit.
+        """
+        if not counts:
+            return
+        payload = json.dumps(counts)
+        self._execute_write(
+            """
+            UPDATE session_messages
+            SET token_count = (SELECT value FROM json_each(?) WHERE key = session_messages.id)
+            WHERE token_count IS NULL AND id IN (SELECT key FROM json_each(?))
+            """,
+            (payload, payload),
+        )
+
     def _message_row_to_dict(self, row) -> dict:
         d = self._row_to_dict(row)
         if d.get("metadata"):
@@ -38,6 +38,55 @@ def _migration_001_interactive_sessions_user_id(cursor: sqlite3.Cursor) -> None:
         )
 
 
+def _migration_002_auth_generation(cursor: sqlite3.Cursor) -> None:
+    """Add the ``auth_generation`` counter and the triggers that bump it.
+
+    API-key auth caches successful verifications in each worker process. A
+    worker cannot see another worker's revoke, so every change that can take a
+    credential away — a key revoked, deleted, re-scoped or re-assigned, its
+    owner deactivated, deleted, demoted or re-passworded — bumps this single
+    row, and a cached verification made at an older generation is discarded.
+    Triggers rather than repository calls, so a direct ``UPDATE users`` (the
+    CLI, an operator's sqlite shell) invalidates too. ``last_used_at`` is
+    deliberately not a trigger column: auth itself writes it.
+    """
+    cursor.execute(
+        "CREATE TABLE IF NOT EXISTS auth_generation ("
+        "id INTEGER PRIMARY KEY CHECK (id = 1), value INTEGER NOT NULL)"
+    )
+    cursor.execute("INSERT OR IGNORE INTO auth_generation (id, value) VALUES (1, 0)")
+    bump = "UPDATE auth_generation SET value = value + 1 WHERE id = 1;"
+    for name, event in (
+        ("users_update", "UPDATE OF id, is_active, is_superuser, hashed_password ON users"),
+        ("users_delete", "DELETE ON users"),
+        (
+            "api_keys_update",
+            (
+                "UPDATE OF id, user_id, key_hash, prefix, scopes, expires_at, is_active "
+                "ON api_keys"
+            ),
+        ),
+        ("api_keys_delete", "DELETE ON api_keys"),
+    ):
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS trg_auth_generation_{name} "
+            f"AFTER {event} BEGIN {bump} END"
+        )
+
+
+def _migration_003_session_message_token_count(cursor: sqlite3.Cursor) -> None:
+    """Add ``session_messages.token_count``.
+
+    Interactive chat trims its replayed history to a token budget. Counting is
+    done once per message and stored with it; rows written before this column
+    (or by a caller that does not count) stay NULL and are counted — and
+    backfilled — the first time they are replayed.
+    """
+    existing = {row[1] for row in cursor.execute("PRAGMA table_info(session_messages)")}
+    if existing and "token_count" not in existing:
+        cursor.execute("ALTER TABLE session_messages ADD COLUMN token_count INTEGER")
+
+
 class SchemaManager:
     """Manages database schema creation and migrations.
 
@@ -63,12 +112,14 @@ class SchemaManager:
     """
 
     #: Version a fully-migrated database reports via ``PRAGMA user_version``.
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 3
 
     #: Ordered ``(target_version, callable(cursor))`` pairs. Each callable must
     #: be idempotent — it also runs once against a freshly created database.
     MIGRATIONS = [
         (1, _migration_001_interactive_sessions_user_id),
+        (2, _migration_002_auth_generation),
+        (3, _migration_003_session_message_token_count),
     ]
 
     def __init__(self, conn: sqlite3.Connection):
@@ -260,7 +311,9 @@ class SchemaManager:
                     CHECK (role IN ('user', 'assistant', 'tool_use', 'tool_result', 'thinking', 'system', 'error')),
                 content     TEXT NOT NULL,
                 metadata    TEXT,
-                created_at  TEXT NOT NULL
+                created_at  TEXT NOT NULL,
+                -- Replay token count; NULL until first counted (migration 3).
+                token_count INTEGER
             )
             """
         )
@@ -41,21 +41,41 @@ async def list_events(
     workspace: Workspace = Depends(get_v2_workspace),
     limit: int = Query(20, ge=1, le=100, description="Maximum events to return"),
     since_id: Optional[int] = Query(None, description="Only return events after this ID"),
+    wait: float = Query(
+        0,
+        ge=0,
+        le=30,
+        description=(
+            "Long-poll: when nothing is newer than since_id, hold the request up to "
+            "this many seconds until an event is committed"
+        ),
+    ),
 ):
     """List recent events for a workspace.
 
     Returns events in reverse chronological order (newest first).
 
+    With ``wait``, a dashboard following the log makes one request that
+    returns as soon as an event lands instead of re-polling on a timer. The
+    wait is on the shared event notifier, not the database, so held requests
+    cost no queries.
+
     Args:
         request: HTTP request for rate limiting
         workspace: Resolved workspace from workspace_path query param
         limit: Maximum number of events (1-100, default 20)
         since_id: Optional event ID for pagination
+        wait: Optional long-poll timeout in seconds (0-30, default 0)
 
     Returns:
         List of events with total count
     """
+    # Generation first, then the query: a commit between the two still wakes us.
+    generation = events.change_generation(workspace) if wait else 0
     event_list = events.list_recent(workspace, limit=limit, since_id=since_id)
+    if not event_list and wait:
+        if await events.wait_for_change_async(workspace, generation, timeout=wait):
+            event_list = events.list_recent(workspace, limit=limit, since_id=since_id)
 
     return EventListResponse(
         events=[
@@ -315,7 +315,10 @@ async def _stress_test_event_stream(
     Stops early if the client disconnects, so an abandoned stream does not keep
     issuing LLM calls — mirroring ``event_stream_generator`` in streaming_v2.
     """
-    from codeframe.core.prd_stress_test import stress_test_prd_stream
+    from codeframe.core.prd_stress_test import (
+        DecompositionCache,
+        stress_test_prd_stream,
+    )
 
     record = prd.get_latest(workspace)
     if not record:
@@ -376,6 +379,7 @@ async def _stress_test_event_stream(
         async for event in stress_test_prd_stream(
             record.content, provider, max_depth=max_depth,
             is_cancelled=lambda: disconnected,
+            cache=DecompositionCache(workspace),
         ):
             # Still checked per event as well as on the poll interval: a stream
             # that produces events faster than the poll would otherwise run to
@@ -14,6 +14,7 @@ from typing import AsyncGenerator, Callable, Optional
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse  # noqa: F401 — re-exported
 
+from codeframe.core.event_notifier import get_notifier
 from codeframe.core.models import ExecutionEvent
 from codeframe.core.streaming import EventPublisher
 
@@ -37,7 +38,7 @@ def get_event_publisher() -> EventPublisher:
     """
     global _event_publisher
     if _event_publisher is None:
-        _event_publisher = EventPublisher()
+        _event_publisher = EventPublisher(notifier=get_notifier())
     return _event_publisher
 
 
@@ -203,6 +203,10 @@ class TaskListResponse(BaseModel):
     tasks: list[TaskResponse]
     total: int
     by_status: dict[str, int]
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Pass as ?cursor= to fetch the next page; null on the last page",
+    )
 
 
 class UpdateTaskRequest(BaseModel):
@@ -229,17 +233,29 @@ def list_tasks(
     request: Request,
     status: Optional[str] = Query(None, description="Filter by status (BACKLOG, READY, IN_PROGRESS, DONE, BLOCKED, FAILED)"),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    prd_id: Optional[str] = Query(None, description="Filter by PRD"),
+    parent_id: Optional[str] = Query(None, description="Filter by parent task"),
+    requirement_id: Optional[str] = Query(None, description="Filter by PROOF9 requirement ID"),
+    include_description: bool = Query(
+        True, description="False returns an empty description (smaller list payloads)"
+    ),
     workspace: Workspace = Depends(get_v2_workspace),
 ) -> TaskListResponse:
-    """List tasks in the workspace.
+    """List tasks in the workspace, one keyset page at a time.
 
     Args:
         status: Optional status filter
         limit: Maximum tasks to return
+        cursor: Resume after the page that returned this cursor
+        prd_id: Optional PRD filter
+        parent_id: Optional parent task filter
+        requirement_id: Optional requirement filter
+        include_description: Whether to load task descriptions
         workspace: v2 Workspace
 
     Returns:
-        List of tasks with counts by status
+        A page of tasks with counts by status and the next page's cursor
     """
     # Parse status filter
     status_filter = None
@@ -257,15 +273,35 @@ def list_tasks(
             )
 
     # Get tasks
-    task_list = tasks.list_tasks(workspace, status=status_filter, limit=limit)
+    try:
+        page = tasks.list_tasks_page(
+            workspace,
+            status=status_filter,
+            prd_id=prd_id,
+            parent_id=parent_id,
+            requirement_id=requirement_id,
+            cursor=cursor,
+            limit=limit,
+            include_description=include_description,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=api_error(
+                "Invalid cursor",
+                ErrorCodes.VALIDATION_ERROR,
+                str(e),
+            ),
+        )
 
     # Get counts by status
     status_counts = tasks.count_by_status(workspace)
 
     return TaskListResponse(
-        tasks=[TaskResponse.from_task(t) for t in task_list],
-        total=len(task_list),
+        tasks=[TaskResponse.from_task(t) for t in page.tasks],
+        total=len(page.tasks),
         by_status=status_counts,
+        next_cursor=page.next_cursor,
     )
 
 
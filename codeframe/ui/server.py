@@ -413,7 +413,7 @@ def _per_worker_rate_limit_warning(
     With in-memory storage each worker process keeps its own rate-limit
     counters, so the effective limit multiplies by the worker count — silently
     weakening brute-force protection on the auth endpoints (issue #678). Returns
-    ``None`` when the configuration is safe (rate limiting disabled,
+    ``None`` when the configuration is safe (rate limiting disabled, sqlite- or
     redis-backed, or a single worker).
     """
     if not enabled or storage != "memory" or worker_count <= 1:
@@ -422,8 +422,9 @@ def _per_worker_rate_limit_warning(
         f"⚠️  Rate limiting uses in-memory storage with {worker_count} workers: "
         f"counters are per-worker, so limits (including auth brute-force "
         f"protection) are effectively multiplied by ~{worker_count}x. "
-        f"Set RATE_LIMIT_STORAGE=redis (with REDIS_URL) for shared, "
-        f"cross-worker rate limiting."
+        f"Set RATE_LIMIT_STORAGE=sqlite (workers on one host) or "
+        f"RATE_LIMIT_STORAGE=redis (with REDIS_URL) for shared, cross-worker "
+        f"rate limiting."
     )
 
 
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Auth-only requests per second for API keys, with and without the cache.
+
+Serves a route whose only work is ``require_auth`` and drives it with
+``X-API-Key`` requests through the ASGI test client, for a current SHA-256
+key and a legacy bcrypt key:
+
+- uncached: every request takes the full path (prefix lookup, hash verify,
+            owner checks) — the behaviour before the verification cache
+- cached:   repeat requests are served from the verified-credential cache
+
+It also times ``_resolve_api_key`` alone, without the HTTP stack, from
+``--threads`` threads sharing the worker's connection.
+
+Usage:
+    bench_api_key_auth.py                   # 2000 requests per row
+    bench_api_key_auth.py --requests 500 --threads 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import bcrypt  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from codeframe.auth import dependencies as deps  # noqa: E402
+from codeframe.auth.api_keys import SCOPE_READ, SCOPE_WRITE, generate_api_key  # noqa: E402
+from codeframe.core.api_key_service import ApiKeyService  # noqa: E402
+from codeframe.platform_store.database import Database  # noqa: E402
+
+
+def _setup(db: Database) -> dict[str, str]:
+    """One user with a SHA-256 key and a legacy bcrypt key; returns name -> key."""
+    db.conn.execute(
+        "INSERT OR REPLACE INTO users (id, email, name, hashed_password, is_active, is_superuser,"
+        " is_verified, email_verified) VALUES (1, 'bench@example.com', 'Bench',"
+        " 'x', 1, 0, 1, 1)"
+    )
+    db.conn.commit()
+    current = ApiKeyService(db).create_api_key(
+        user_id=1, name="current", scopes=[SCOPE_READ, SCOPE_WRITE]
+    )
+    legacy, _, prefix = generate_api_key()
+    db.conn.execute(
+        "INSERT INTO api_keys (id, user_id, name, key_hash, prefix, scopes)"
+        " VALUES ('legacy', 1, 'legacy', ?, ?, '[\"read\"]')",
+        (bcrypt.hashpw(legacy.encode(), bcrypt.gensalt(rounds=12)).decode(), prefix),
+    )
+    db.conn.commit()
+    return {"sha256": current.key, "bcrypt": legacy}
+
+
+def _http_rate(client: TestClient, key: str, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = client.get("/whoami", headers={"X-API-Key": key})
+        assert response.status_code == 200, response.text
+    return requests / (time.perf_counter() - start)
+
+
+def _resolve_rate(app: FastAPI, key: str, requests: int, threads: int) -> float:
+    class _Request:
+        pass
+
+    request = _Request()
+    request.app = app
+
+    def resolve(_: int) -> None:
+        assert deps._resolve_api_key(key, request) is not None
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(resolve, range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args(argv)
+    ttl = deps._API_KEY_CACHE_TTL_SECONDS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(Path(tmp) / "state.db")
+        db.initialize()
+        keys = _setup(db)
+        app = FastAPI()
+        app.state.db = db
+
+        @app.get("/whoami")
+        async def whoami(user=Depends(deps.require_auth)):
+            return {"user_id": user["user_id"]}
+
+        rows = []
+        with TestClient(app) as client:
+            for name, key in keys.items():
+                # bcrypt is ~1000x slower; keep its uncached rows short.
+                count = args.requests if name == "sha256" else max(args.requests // 50, 5)
+                for mode, mode_ttl in (("uncached", 0.0), ("cached", ttl)):
+                    deps._API_KEY_CACHE_TTL_SECONDS = mode_ttl
+                    deps.clear_api_key_cache()
+                    n = args.requests if mode == "cached" else count
+                    rows.append((
+                        name, mode,
+                        _http_rate(client, key, n),
+                        _resolve_rate(app, key, n, args.threads),
+                    ))
+        deps._API_KEY_CACHE_TTL_SECONDS = ttl
+        db.close()
+
+    print(f"{'key':<8} {'mode':<9} {'http req/s':>11} {'resolve/s':>11}")
+    for name, mode, http_rate, resolve_rate in rows:
+        print(f"{name:<8} {mode:<9} {http_rate:>11.0f} {resolve_rate:>11.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
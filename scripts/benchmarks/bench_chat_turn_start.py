@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Interactive-chat turn-start latency for a long session.
+
+Seeds a session with N persisted messages (default 1000, sized so the replay
+window overruns the token budget and truncation has to drop turns), then
+times the work ``send_message`` does before the first provider call — load
+the replay history and trim it to ``_MAX_HISTORY_TOKENS`` — three ways:
+
+- rescan: the previous path — re-read the newest 100 rows, then re-encode the
+          remaining list after every pair dropped
+- cold:   the first turn on a fresh adapter process: read the window and its
+          stored counts, prefix-sum truncation
+- warm:   later turns: top up the cached window with rows written since
+
+Counting uses tiktoken when its encoding is available, else the 4-chars-per-
+token estimate; the header says which.
+
+Usage:
+    bench_chat_turn_start.py                   # 1000 messages, 50 turns
+    bench_chat_turn_start.py --messages 5000 --turns 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from codeframe.adapters.llm.mock import MockProvider  # noqa: E402
+from codeframe.core.adapters import streaming_chat  # noqa: E402
+from codeframe.core.adapters.streaming_chat import StreamingChatAdapter  # noqa: E402
+from codeframe.platform_store.database import Database  # noqa: E402
+
+_WORDS = ("the", "session", "replay", "window", "keeps", "recent", "turns", "in", "memory")
+
+
+def _seed(db: Database, messages: int, words: int) -> str:
+    rng = random.Random(0)
+    repo = db.interactive_sessions
+    session_id = repo.create(workspace_path="/tmp/bench-chat")["id"]
+    for i in range(messages):
+        content = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(words // 2, words)))
+        repo.add_message(session_id, role=("user", "assistant")[i % 2], content=content)
+    return session_id
+
+
+def _rescan(adapter: StreamingChatAdapter) -> list[dict]:
+    """Turn start as it was: re-read, then count the whole list per drop."""
+    rows = adapter._db_repo.get_recent_messages(
+        adapter._session_id, limit=streaming_chat._MAX_REPLAY_MESSAGES
+    )
+    messages = [
+        {"role": streaming_chat._REPLAY_ROLE_MAP[r["role"]], "content": r["content"]}
+        for r in rows
+    ] + [{"role": "user", "content": "next question"}]
+    count = streaming_chat._count_tokens
+    while messages and sum(count(m["content"]) for m in messages) > streaming_chat._MAX_HISTORY_TOKENS:
+        trimmed = messages[2:] if len(messages) >= 2 else messages[1:]
+        if not trimmed:
+            break
+        messages = trimmed
+    return messages
+
+
+def _current(adapter: StreamingChatAdapter) -> list[dict]:
+    history, counts = adapter._load_window().replay()
+    messages = history + [{"role": "user", "content": "next question"}]
+    counts = counts + [streaming_chat._count_tokens("next question")]
+    return adapter._truncate_history(messages, counts)
+
+
+def _ms(fn, adapter, turns: int, reset=None) -> float:
+    total = 0.0
+    for _ in range(turns):
+        if reset:
+            reset()
+        start = time.perf_counter()
+        fn(adapter)
+        total += time.perf_counter() - start
+    return total / turns * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument(
+        "--words", type=int, default=3000,
+        help="max words per message (the default overruns the token budget)",
+    )
+    args = parser.parse_args(argv)
+
+    db = Database(":memory:")
+    db.initialize()
+    session_id = _seed(db, args.messages, args.words)
+    adapter = StreamingChatAdapter(
+        session_id=session_id, db_repo=db.interactive_sessions,
+        workspace_path=Path("/tmp"), provider=MockProvider(),
+    )
+    counter = "tiktoken" if streaming_chat._encoding() is not None else "4-chars-per-token"
+
+    def drop_window() -> None:
+        streaming_chat._windows.pop(db.interactive_sessions, None)
+
+    rescan = _ms(_rescan, adapter, args.turns)
+    cold = _ms(_current, adapter, args.turns, reset=drop_window)
+    kept = len(_current(adapter))
+    warm = _ms(_current, adapter, args.turns)
+
+    print(f"{args.messages} messages, {kept} replayed after truncation, counter: {counter}")
+    print(f"{'path':<8} {'ms/turn':>9}")
+    for name, ms in (("rescan", rescan), ("cold", cold), ("warm", warm)):
+        print(f"{name:<8} {ms:>9.2f}")
+    db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Ranking a large tree for a task: path keywords vs the BM25 relevance index.
+
+Builds a tree of N source files and times one ``RelevanceIndex.rank`` for a
+task-sized query three ways:
+
+- cold:      first ranking (reads and indexes every file, then persists)
+- warm:      a later ranking in the same process after one file changed
+- from disk: a new process's first ranking, loading ``relevance_index.json``
+
+Usage:
+    bench_context_ranking.py                # 50k files
+    bench_context_ranking.py --files 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from codeframe.core import file_index, relevance_index  # noqa: E402
+from codeframe.core.context import CODE_EXTENSIONS, DEFAULT_IGNORE_PATTERNS  # noqa: E402
+from codeframe.core.file_index import FileIndex  # noqa: E402
+from codeframe.core.relevance_index import RelevanceIndex  # noqa: E402
+
+_WORDS = (
+    "account ledger invoice payment customer order shipment refund tax "
+    "report export schedule retry queue worker cache session token user"
+).split()
+
+_TASK = (
+    "Retry failed invoice exports from the ReportScheduler when the payment "
+    "queue is saturated, and record each retry on the ledger"
+)
+
+
+def _make_tree(root: Path, files: int) -> None:
+    for n in range(files):
+        directory = root / "src" / f"pkg{n // 1000}" / f"mod{n // 50}"
+        if n % 50 == 0:
+            directory.mkdir(parents=True)
+        a, b, c = (_WORDS[(n * k) % len(_WORDS)] for k in (1, 7, 13))
+        (directory / f"{a}_{b}_{n}.py").write_text(
+            f"class {a.title()}{b.title()}{n}:\n"
+            f"    def {c}_{a}(self, {b}_id):\n"
+            f"        return self.{b}_store.get_{c}({b}_id, limit={n})\n"
+        )
+    (root / "src" / "pkg0" / "mod0" / "scheduler.py").write_text(
+        "class ReportScheduler:\n    def retry_export(self, invoice):\n        pass\n"
+    )
+
+
+def _timed(fn) -> tuple[float, int]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=50_000)
+    args = parser.parse_args(argv)
+    # Everything is freshly written; skip the coarse-timestamp safety margins
+    # so the warm run measures the steady state rather than the first minute.
+    file_index._RACY_NS = 0
+    relevance_index._RACY_NS = 0
+    query = {t: 1.0 for t in relevance_index.term_counts(_TASK)}
+    symbols = {"reportscheduler"}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "repo"
+        (root / ".codeframe").mkdir(parents=True)
+        _make_tree(root, args.files)
+        state = root / ".codeframe" / relevance_index.RELEVANCE_INDEX_NAME
+
+        def fresh() -> RelevanceIndex:
+            return RelevanceIndex(
+                FileIndex(root, DEFAULT_IGNORE_PATTERNS),
+                extensions=CODE_EXTENSIONS,
+                state_path=state,
+            )
+
+        index = fresh()
+        rows = [("cold", *_timed(lambda: len(index.rank(query, symbols)[0])))]
+        (root / "src" / "pkg0" / "mod0" / "new.py").write_text("invoice = None\n")
+        rows.append(("warm", *_timed(lambda: len(index.rank(query, symbols)[0]))))
+        rows.append(("from disk", *_timed(lambda: len(fresh().rank(query, symbols)[0]))))
+
+    print(f"{'mode':<10} {'seconds':>9} {'scored':>8}")
+    for mode, seconds, scored in rows:
+        print(f"{mode:<10} {seconds:>9.3f} {scored:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Pooled vs unpooled ``events.emit_for_workspace`` throughput.
+
+Each emit is one INSERT + COMMIT. Unpooled, every emit also pays a connect and
+three pragmas (WAL, busy_timeout, foreign_keys); pooled, it reuses an idle
+connection. Runs single-threaded and with N threads emitting into the same
+workspace, which is what a parallel batch does.
+
+Usage:
+    bench_db_pool.py                    # 2000 emits, 1 and 8 threads
+    bench_db_pool.py --emits 5000 --threads 1 4 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from codeframe.core import events  # noqa: E402
+from codeframe.core import workspace as ws_mod  # noqa: E402
+from codeframe.core.db_pool import ConnectionPool  # noqa: E402
+
+
+def _run(ws: ws_mod.Workspace, emits: int, threads: int) -> float:
+    per_thread = emits // threads
+
+    def worker() -> None:
+        for i in range(per_thread):
+            events.emit_for_workspace(ws, "BENCH", {"i": i}, print_event=False)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return (per_thread * threads) / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--emits", type=int, default=2000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8])
+    args = parser.parse_args(argv)
+
+    modes = {
+        "unpooled": ConnectionPool(ws_mod._open_pooled_db, max_idle_per_db=0),
+        "pooled": ConnectionPool(ws_mod._open_pooled_db),
+    }
+    original = ws_mod._CONNECTION_POOL
+    print(f"{'mode':<10} {'threads':>7} {'emits/s':>10}")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            ws = ws_mod.create_or_load_workspace(Path(tmp))
+            for threads in args.threads:
+                for name, pool in modes.items():
+                    ws_mod._CONNECTION_POOL = pool
+                    rate = _run(ws, args.emits, threads)
+                    print(f"{name:<10} {threads:>7} {rate:>10.0f}")
+                    pool.clear()
+    finally:
+        ws_mod._CONNECTION_POOL = original
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
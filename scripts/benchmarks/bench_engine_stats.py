@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Cost of recording one engine run as the run history grows.
+
+Seeds a workspace's ``run_engine_log`` with H historical runs (spread over
+the last 90 days), rebuilds the rollups, then times ``record_run`` two ways:
+
+- rescan:      the previous implementation — insert, then re-aggregate the
+               engine's whole history and rewrite ``engine_stats``
+- incremental: ``engine_stats.record_run`` — insert plus O(1) rollup deltas
+
+It also times ``cf stats rebuild`` (``rebuild_stats``) and a 30-day windowed
+read (``get_engine_stats_window``) at each history size.
+
+Usage:
+    bench_engine_stats.py                        # 1k, 10k and 50k runs
+    bench_engine_stats.py --history 100000 --runs 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from codeframe.core import engine_stats  # noqa: E402
+from codeframe.core.workspace import (  # noqa: E402
+    create_or_load_workspace,
+    get_db_connection,
+)
+
+# The aggregate record_run ran after every insert before the rollups.
+_RESCAN = (
+    "SELECT COUNT(*), "
+    "COUNT(CASE WHEN status = 'COMPLETED' THEN 1 END), "
+    "COUNT(CASE WHEN status = 'FAILED' THEN 1 END), "
+    "COUNT(CASE WHEN gates_passed = 1 THEN 1 END), "
+    "COUNT(CASE WHEN gates_passed IS NOT NULL THEN 1 END), "
+    "COUNT(CASE WHEN self_corrections > 0 THEN 1 END), "
+    "AVG(CASE WHEN duration_ms IS NOT NULL THEN duration_ms END), "
+    "SUM(tokens_used), "
+    "SUM(CASE WHEN status = 'COMPLETED' THEN tokens_used ELSE 0 END), "
+    "COUNT(CASE WHEN status = 'COMPLETED' THEN 1 END) "
+    "FROM run_engine_log WHERE engine = ? AND workspace_id = ?"
+)
+
+
+def _seed(workspace, history: int) -> None:
+    now = datetime.now(timezone.utc)
+    rows = [
+        (
+            f"seed-{n}", "react", f"task-{n % 500}", workspace.id,
+            ("COMPLETED", "FAILED", "BLOCKED")[n % 3], 1000 + n % 5000,
+            n % 4000, (1, 0, None)[n % 3], n % 2,
+            (now - timedelta(minutes=n * 90 * 24 * 60 // max(history, 1))).isoformat(),
+        )
+        for n in range(history)
+    ]
+    conn = get_db_connection(workspace)
+    try:
+        conn.executemany(
+            "INSERT INTO run_engine_log (run_id, engine, task_id, workspace_id, "
+            "status, duration_ms, tokens_used, gates_passed, self_corrections, "
+            "created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    engine_stats.rebuild_stats(workspace)
+
+
+def _record_rescan(workspace) -> None:
+    """record_run as it was: insert, re-aggregate, rewrite eight rows."""
+    now = datetime.now(timezone.utc).isoformat()
+    conn = get_db_connection(workspace)
+    try:
+        conn.execute(
+            "INSERT INTO run_engine_log (run_id, engine, task_id, workspace_id, "
+            "status, duration_ms, tokens_used, gates_passed, self_corrections, "
+            "created_at) VALUES (?, 'react', 't', ?, 'COMPLETED', 1200, 300, 1, 0, ?)",
+            (str(uuid.uuid4()), workspace.id, now),
+        )
+        row = conn.execute(_RESCAN, ("react", workspace.id)).fetchone()
+        for metric, value in zip(range(8), row):
+            conn.execute(
+                "INSERT OR REPLACE INTO engine_stats (workspace_id, engine, metric, "
+                "value, updated_at) VALUES (?, 'react', ?, ?, ?)",
+                (workspace.id, f"bench_{metric}", float(value or 0), now),
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _record_incremental(workspace) -> None:
+    engine_stats.record_run(
+        workspace, str(uuid.uuid4()), "react", "t", "COMPLETED",
+        duration_ms=1200, tokens_used=300, gates_passed=1,
+    )
+
+
+def _per_call_ms(fn, workspace, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn(workspace)
+    return (time.perf_counter() - start) / calls * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--history", type=int, nargs="+", default=[1000, 10_000, 50_000])
+    parser.add_argument("--runs", type=int, default=100, help="record_run calls to time")
+    args = parser.parse_args(argv)
+
+    print(f"{'history':>8} {'rescan ms':>10} {'incr ms':>8} {'rebuild ms':>11} {'30d ms':>7}")
+    for history in args.history:
+        with tempfile.TemporaryDirectory() as tmp:
+            workspace = create_or_load_workspace(Path(tmp))
+            _seed(workspace, history)
+            rescan = _per_call_ms(_record_rescan, workspace, args.runs)
+            incremental = _per_call_ms(_record_incremental, workspace, args.runs)
+            rebuild = _per_call_ms(engine_stats.rebuild_stats, workspace, 3)
+            window = _per_call_ms(
+                lambda ws: engine_stats.get_engine_stats_window(ws, 30), workspace, 20
+            )
+        print(
+            f"{history:>8} {rescan:>10.2f} {incremental:>8.2f} "
+            f"{rebuild:>11.1f} {window:>7.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Listing a large tree: per-call os.walk vs the persistent file index.
+
+Builds a tree of N files (with an ignored node_modules alongside) and times
+one listing of the non-ignored files four ways:
+
+- walk:      ``os.walk`` + ``fnmatch`` against every ignore pattern, which
+             ContextLoader and each list_files/search_codebase call did
+- cold:      ``FileIndex`` first build (full scan, then persisted)
+- warm:      ``FileIndex.refresh`` in the same process after one file changed
+- from disk: a new process's first listing, loading ``file_index.json``
+
+Usage:
+    bench_file_index.py                 # 100k files
+    bench_file_index.py --files 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from codeframe.core import file_index  # noqa: E402
+from codeframe.core.context import DEFAULT_IGNORE_PATTERNS  # noqa: E402
+from codeframe.core.file_index import FileIndex  # noqa: E402
+
+
+def _make_tree(root: Path, files: int) -> None:
+    for n in range(files):
+        directory = root / "src" / f"pkg{n // 1000}" / f"mod{n // 50}"
+        if n % 50 == 0:
+            directory.mkdir(parents=True)
+        (directory / f"f{n}.py").write_text("x = 1\n")
+    for n in range(files // 10):
+        directory = root / "node_modules" / f"dep{n // 100}"
+        if n % 100 == 0:
+            directory.mkdir(parents=True)
+        (directory / f"i{n}.js").write_text("module.exports = 1\n")
+
+
+def _walk(root: Path) -> int:
+    """The scanner ContextLoader used before the index."""
+
+    def ignored(path: str) -> bool:
+        rel = os.path.relpath(path, root)
+        return any(
+            fnmatch.fnmatch(rel, p) or fnmatch.fnmatch(os.path.basename(path), p)
+            for p in DEFAULT_IGNORE_PATTERNS
+        )
+
+    count = 0
+    for current, dirs, names in os.walk(root):
+        dirs[:] = [d for d in dirs if not ignored(os.path.join(current, d))]
+        for name in names:
+            path = os.path.join(current, name)
+            if not ignored(path):
+                os.path.getsize(path)
+                count += 1
+    return count
+
+
+def _timed(fn) -> tuple[float, int]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100_000)
+    args = parser.parse_args(argv)
+    # Everything is freshly written; skip the coarse-timestamp safety margin
+    # so the warm runs measure the steady state rather than the first minute.
+    file_index._RACY_NS = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "repo"
+        (root / ".codeframe").mkdir(parents=True)
+        _make_tree(root, args.files)
+        state = root / ".codeframe" / file_index.FILE_INDEX_NAME
+
+        walk_s, walk_n = _timed(lambda: _walk(root))
+        index = FileIndex(root, DEFAULT_IGNORE_PATTERNS, state_path=state)
+        cold_s, cold_n = _timed(lambda: len(index.files()))
+        (root / "src" / "pkg0" / "mod0" / "new.py").write_text("y = 2\n")
+        warm_s, warm_n = _timed(lambda: len(index.files()))
+        disk_s, disk_n = _timed(
+            lambda: len(FileIndex(root, DEFAULT_IGNORE_PATTERNS, state_path=state).files())
+        )
+
+    print(f"{'mode':<10} {'seconds':>9} {'files':>8}")
+    print(f"{'walk':<10} {walk_s:>9.3f} {walk_n:>8}")
+    print(f"{'cold':<10} {cold_s:>9.3f} {cold_n:>8}")
+    print(f"{'warm':<10} {warm_s:>9.3f} {warm_n:>8}")
+    print(f"{'from disk':<10} {disk_s:>9.3f} {disk_n:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
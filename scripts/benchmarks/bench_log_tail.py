@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Run-output tailing cost on a large log: full re-read vs incremental reads.
+
+Builds an output.log of the requested size through ``RunOutputLogger`` (so the
+``output.log.idx`` line index is written as it would be in a real run), then
+times the three operations ``cf work follow`` performs:
+
+- poll:   one follow poll after a single line is appended
+- tail:   ``--tail 100`` (last 100 lines plus the total line count)
+- resume: start following at ``since_line`` = 100 lines before the end
+
+"legacy" is what the old code did for each: ``readlines()`` over the whole file.
+
+Usage:
+    bench_log_tail.py                 # 100MB log
+    bench_log_tail.py --size-mb 20 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from codeframe.core import streaming  # noqa: E402
+from codeframe.core import workspace as ws_mod  # noqa: E402
+
+RUN_ID = "bench"
+
+
+def _legacy_lines(path: Path) -> list[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.readlines()
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ws = ws_mod.create_or_load_workspace(Path(tmp))
+        line = "[12:00:00] tool call: read_file src/module.py -> 4096 bytes ok\n"
+        block = line * 1000
+        target = args.size_mb * 1024 * 1024
+        with streaming.RunOutputLogger(ws, RUN_ID) as log:
+            written = 0
+            while written < target:
+                log.write(block)
+                written += len(block)
+        path = streaming.get_run_output_path(ws, RUN_ID)
+        _, total = streaming.get_latest_lines_with_count(ws, RUN_ID, 1)
+        print(f"log: {path.stat().st_size / 2**20:.0f}MB, {total:,} lines\n")
+
+        follower = streaming._LogFollower(path, since_line=total)
+        follower.poll()
+
+        def incremental_poll() -> None:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+            assert follower.poll() == [line]
+
+        def legacy_poll() -> None:
+            # Same cost with or without the append: every poll re-reads it all.
+            _legacy_lines(path)[-1:]
+
+        def legacy_tail() -> None:
+            lines = _legacy_lines(path)
+            len(lines), lines[-100:]
+
+        def legacy_resume() -> None:
+            _legacy_lines(path)[-100:]
+
+        def incremental_resume() -> None:
+            _, count = streaming.get_latest_lines_with_count(ws, RUN_ID, 0)
+            lines = streaming._LogFollower(path, since_line=count - 100).poll()
+            assert len(lines) == 100
+
+        cases = [
+            ("poll", legacy_poll, incremental_poll),
+            ("tail", legacy_tail, lambda: streaming.get_latest_lines_with_count(ws, RUN_ID, 100)),
+            ("resume", legacy_resume, incremental_resume),
+        ]
+        print(f"{'operation':<10} {'legacy ms':>12} {'incremental ms':>16} {'speedup':>9}")
+        for name, legacy, incremental in cases:
+            old = _best(legacy, args.repeat)
+            new = _best(incremental, args.repeat)
+            print(f"{name:<10} {old * 1000:>12.1f} {new * 1000:>16.3f} {old / new:>8.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
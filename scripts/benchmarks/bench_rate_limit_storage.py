@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Rate-limit storage under multi-process load: in-memory vs shared SQLite.
+
+Starts W worker processes (standing in for uvicorn workers) that each make N
+``limiter.hit`` calls, for each storage and strategy, in two workloads:
+
+- spread: hits cycle over 1000 client keys under a generous limit, so every
+          hit is granted — measures the cost per hit
+- hot:    every hit targets one key limited to 100/minute — measures how many
+          hits the workers let through between them
+
+In-memory storage keeps a counter per process, so in the hot workload it
+grants the limit once per worker; the shared storage grants it once.
+
+Usage:
+    bench_rate_limit_storage.py                 # 4 workers x 5000 hits
+    bench_rate_limit_storage.py --workers 8 --hits 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from limits import parse  # noqa: E402
+from limits.storage import MemoryStorage  # noqa: E402
+from limits.strategies import FixedWindowRateLimiter, MovingWindowRateLimiter  # noqa: E402
+
+from codeframe.lib.rate_limit_storage import SQLiteStorage  # noqa: E402
+
+_STRATEGIES = {"fixed": FixedWindowRateLimiter, "moving": MovingWindowRateLimiter}
+
+
+def _worker(storage: str, path: str, strategy: str, workload: str, hits: int, start, out) -> None:
+    backend = MemoryStorage() if storage == "memory" else SQLiteStorage(path=path)
+    limiter = _STRATEGIES[strategy](backend)
+    if workload == "spread":
+        item, keys = parse("1000000/minute"), [f"ip:10.0.{n // 256}.{n % 256}" for n in range(1000)]
+    else:
+        item, keys = parse("100/minute"), ["ip:10.0.0.1"]
+    start.wait()
+    began = time.perf_counter()
+    granted = sum(limiter.hit(item, "login", keys[n % len(keys)]) for n in range(hits))
+    out.put((time.perf_counter() - began, granted))
+
+
+def _run(storage: str, path: str, strategy: str, workload: str, workers: int, hits: int):
+    ctx = multiprocessing.get_context("spawn")
+    start, out = ctx.Barrier(workers), ctx.Queue()
+    procs = [
+        ctx.Process(target=_worker, args=(storage, path, strategy, workload, hits, start, out))
+        for _ in range(workers)
+    ]
+    for proc in procs:
+        proc.start()
+    results = [out.get() for _ in procs]
+    for proc in procs:
+        proc.join()
+    elapsed = max(seconds for seconds, _ in results)
+    return workers * hits / elapsed, elapsed / hits * 1e6, sum(g for _, g in results)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--hits", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for workload in ("spread", "hot"):
+            for strategy in _STRATEGIES:
+                for storage in ("memory", "sqlite"):
+                    path = str(Path(tmp) / f"{workload}-{strategy}.db")
+                    rows.append((workload, strategy, storage, *_run(
+                        storage, path, strategy, workload, args.workers, args.hits
+                    )))
+
+    print(f"{args.workers} workers x {args.hits} hits")
+    print(f"{'workload':<9} {'strategy':<8} {'storage':<8} {'hits/s':>10} {'us/hit':>8} {'granted':>8}")
+    for workload, strategy, storage, rate, per_hit, granted in rows:
+        print(
+            f"{workload:<9} {strategy:<8} {storage:<8} {rate:>10.0f} "
+            f"{per_hit:>8.1f} {granted:>8}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
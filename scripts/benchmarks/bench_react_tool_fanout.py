@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Wall time of one ReAct turn that fans out into several read-only tool calls.
+
+Copies ``codeframe/`` into a scratch workspace and replays the tool calls of a
+typical exploration turn — five ``read_file`` and two ``search_codebase`` (one
+with a literal the search index can use, one regex it cannot) — with the real
+tool implementations, two ways:
+
+- serial:    one call after another, as the loop used to run them
+- scheduled: through ``_ToolSchedule``, which overlaps the read-only calls
+
+``slowest`` is the slowest single call (mean over the turns), the floor for a
+fully overlapped turn. The search index is warmed first so both rows see the
+same index state.
+
+With a warm page cache these calls are CPU-bound Python and mostly hold the
+GIL, so overlap gains little; it pays off when reads wait on storage (a cold
+cache, a network filesystem). ``--latency-ms`` adds that wait to every call.
+
+Usage:
+    bench_react_tool_fanout.py                  # 20 turns, no added latency
+    bench_react_tool_fanout.py --latency-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO))
+
+from codeframe.adapters.llm.base import ToolCall  # noqa: E402
+from codeframe.core.react_agent import _ToolSchedule  # noqa: E402
+from codeframe.core.tools import execute_tool  # noqa: E402
+
+_READS = (
+    "codeframe/core/react_agent.py",
+    "codeframe/core/tools.py",
+    "codeframe/core/workspace.py",
+    "codeframe/core/tasks.py",
+    "codeframe/core/conductor.py",
+)
+_SEARCHES = (r"def execute_tool\b", r"\b[A-Z_]{12,}\s*=")
+
+
+def _turn() -> list[ToolCall]:
+    calls = [ToolCall(id=f"r{i}", name="read_file", input={"path": p}) for i, p in enumerate(_READS)]
+    calls += [
+        ToolCall(id=f"s{i}", name="search_codebase", input={"pattern": p, "max_results": 200})
+        for i, p in enumerate(_SEARCHES)
+    ]
+    return calls
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0,
+        help="simulated storage wait added to every tool call",
+    )
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        shutil.copytree(REPO / "codeframe", root / "codeframe",
+                        ignore=shutil.ignore_patterns("__pycache__"))
+
+        def execute(tc: ToolCall):
+            if args.latency_ms:
+                time.sleep(args.latency_ms / 1000)
+            return execute_tool(tc, root)
+
+        calls = _turn()
+        for tc in calls:  # warm the file and search indexes
+            assert not execute(tc).is_error, tc
+
+        per_call = dict.fromkeys((tc.id for tc in calls), 0.0)
+        for _ in range(args.turns):
+            for tc in calls:
+                start = time.perf_counter()
+                execute(tc)
+                per_call[tc.id] += time.perf_counter() - start
+        serial = sum(per_call.values()) / args.turns
+        slowest = max(per_call.values()) / args.turns
+
+        start = time.perf_counter()
+        for _ in range(args.turns):
+            schedule = _ToolSchedule(calls, execute)
+            for i in range(len(calls)):
+                schedule.result(i)
+        scheduled = (time.perf_counter() - start) / args.turns
+
+    print(
+        f"{len(calls)} tool calls per turn, {args.turns} turns, "
+        f"{args.latency_ms:g} ms added latency"
+    )
+    print(f"{'mode':<10} {'ms/turn':>9}")
+    for name, seconds in (("serial", serial), ("scheduled", scheduled), ("slowest", slowest)):
+        print(f"{name:<10} {seconds * 1000:>9.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Replay trace persistence: one commit per record vs one bulk transaction.
+
+Buffers N records (a third each steps, LLM interactions and file operations,
+every child parented by a step, as the ReAct loop records them) and times
+writing them:
+
+- per-record: ``save_execution_step`` / ``save_llm_interaction`` /
+  ``save_file_operation`` per record, which is what ``flush`` used to do
+- bulk:       ``ExecutionRecorder.flush``, one ``executemany`` transaction
+
+Also reports how long recording calls block the caller with
+``background=True`` and the default flush interval.
+
+Usage:
+    bench_replay_flush.py                 # 10k records
+    bench_replay_flush.py --records 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from codeframe.core import replay  # noqa: E402
+from codeframe.core import tasks  # noqa: E402
+from codeframe.core import workspace as ws_mod  # noqa: E402
+
+
+def _new_run(ws: ws_mod.Workspace, run_id: str, task_id: str) -> None:
+    conn = ws_mod.get_db_connection(ws)
+    try:
+        conn.execute(
+            "INSERT INTO runs (id, workspace_id, task_id, status, started_at)"
+            " VALUES (?,?,?,?,?)",
+            (run_id, ws.id, task_id, "RUNNING", "2026-01-01T00:00:00+00:00"),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _fill(recorder: replay.ExecutionRecorder, records: int) -> None:
+    for n in range(records // 3):
+        step_id = recorder.record_iteration(n, ["edit_file"], "edited a file")
+        recorder.record_llm_call(step_id, "prompt", "response", "model", 100, "execution")
+        recorder.record_file_operation(step_id, "edit", f"src/f{n}.py", "old", "new")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ws = ws_mod.create_or_load_workspace(Path(tmp))
+        task = tasks.create(ws, title="bench", description="")
+
+        _new_run(ws, "per-record", task.id)
+        recorder = replay.ExecutionRecorder(ws, "per-record", flush_interval=10**9)
+        _fill(recorder, args.records)
+        start = time.perf_counter()
+        for step in recorder._step_buffer:
+            replay.save_execution_step(ws, step)
+        for interaction in recorder._llm_buffer:
+            replay.save_llm_interaction(ws, interaction)
+        for op in recorder._file_op_buffer:
+            replay.save_file_operation(ws, op)
+        per_record = time.perf_counter() - start
+
+        _new_run(ws, "bulk", task.id)
+        recorder = replay.ExecutionRecorder(ws, "bulk", flush_interval=10**9)
+        _fill(recorder, args.records)
+        start = time.perf_counter()
+        recorder.flush()
+        bulk = time.perf_counter() - start
+
+        _new_run(ws, "background", task.id)
+        recorder = replay.ExecutionRecorder(ws, "background", background=True)
+        start = time.perf_counter()
+        _fill(recorder, args.records)
+        blocked = time.perf_counter() - start
+        recorder.close()
+
+    records = args.records // 3 * 3
+    print(f"{'mode':<12} {'seconds':>9} {'records/s':>11}")
+    print(f"{'per-record':<12} {per_record:>9.3f} {records / per_record:>11.0f}")
+    print(f"{'bulk':<12} {bulk:>9.3f} {records / bulk:>11.0f}")
+    print(f"background recording blocked the caller for {blocked:.3f}s total")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
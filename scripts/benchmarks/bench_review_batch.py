@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Code review over many files: per-file analyzers vs the batched pipeline.
+
+Generates a synthetic project of N Python files (a mix of clean code, bandit
+and OWASP hits, and branchy functions) and times:
+
+- per-file: ``ComplexityAnalyzer.analyze_file``, ``SecurityScanner.analyze_file``
+  and ``OWASPPatterns.check_file`` per file — three reads and one bandit
+  process per file, which is what ``review_files`` used to do
+- batched:  ``review_files``, one read per file, one bandit run per
+  ``BANDIT_BATCH_SIZE`` files, radon/OWASP on a process pool
+
+Usage:
+    bench_review_batch.py               # 500 files
+    bench_review_batch.py --files 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from codeframe.core import review  # noqa: E402
+from codeframe.core import workspace as ws_mod  # noqa: E402
+from codeframe.lib.quality.complexity_analyzer import ComplexityAnalyzer  # noqa: E402
+from codeframe.lib.quality.owasp_patterns import OWASPPatterns  # noqa: E402
+from codeframe.lib.quality.security_scanner import SecurityScanner  # noqa: E402
+
+SOURCES = [
+    "def add(a, b):\n    return a + b\n" * 20,
+    "import subprocess\n\ndef run(cmd):\n    subprocess.call(cmd, shell=True)\n",
+    "import hashlib\nPASSWORD = 'hunter2'\n\ndef h(x):\n    return hashlib.md5(x).hexdigest()\n",
+    "def f(x):\n"
+    + "".join(f"    if x == {n}:\n        return {n}\n" for n in range(15))
+    + "    return -1\n",
+]
+
+
+def _project(root: Path, count: int) -> list[str]:
+    (root / "pkg").mkdir(parents=True)
+    files = []
+    for n in range(count):
+        rel = f"pkg/mod_{n}.py"
+        (root / rel).write_text(SOURCES[n % len(SOURCES)])
+        files.append(rel)
+    return files
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "repo"
+        files = _project(root, args.files)
+        ws = ws_mod.create_or_load_workspace(root)
+
+        complexity = ComplexityAnalyzer(root)
+        security = SecurityScanner(root)
+        owasp = OWASPPatterns(root)
+        start = time.perf_counter()
+        per_file_findings = 0
+        for rel in files:
+            path = root / rel
+            per_file_findings += len(complexity.analyze_file(path))
+            per_file_findings += len(security.analyze_file(path))
+            per_file_findings += len(owasp.check_file(path))
+        per_file = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = review.review_files(ws, files)
+        batched = time.perf_counter() - start
+
+    print(f"{'mode':<10} {'seconds':>9} {'files/s':>9} {'findings':>9}")
+    print(f"{'per-file':<10} {per_file:>9.2f} {args.files / per_file:>9.0f} {per_file_findings:>9}")
+    print(f"{'batched':<10} {batched:>9.2f} {args.files / batched:>9.0f} {len(result.findings):>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""search_codebase on a large tree: full scan vs the token-prefiltered index.
+
+Builds a tree of N source files and times ``search_codebase`` for a rare
+identifier (one file defines it), comparing:
+
+- scan:     reading every file and matching every line, as before the index
+- cold:     first indexed search (tokenizes everything, then persists)
+- warm:     a later search in the same process after one file changed
+- fallback: a pattern with no usable literal, scanned in parallel
+
+The tree and its persisted index live in a temporary directory; nothing is
+written to the checkout the script runs from.
+
+Usage:
+    bench_search_index.py                # 20k files
+    bench_search_index.py --files 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from codeframe.core import file_index, search_index  # noqa: E402
+from codeframe.core.tools import _execute_search_codebase  # noqa: E402
+
+_BODY = "".join(
+    f"def handler_{n}(request, context):\n    return process(request, {n})\n\n"
+    for n in range(40)
+)
+
+
+def _make_tree(root: Path, files: int) -> None:
+    for n in range(files):
+        directory = root / "src" / f"pkg{n // 1000}" / f"mod{n // 50}"
+        if n % 50 == 0:
+            directory.mkdir(parents=True)
+        (directory / f"f{n}.py").write_text(f"# file {n}\n{_BODY}")
+    (root / "src" / "pkg0" / "mod0" / "f7.py").write_text("def reconcile_ledger():\n    pass\n")
+
+
+def _scan(root: Path, pattern: str) -> int:
+    """The per-call scan search_codebase did before the index."""
+    compiled = re.compile(pattern)
+    count = 0
+    for current, _, names in os.walk(root):
+        for name in names:
+            try:
+                text = Path(current, name).read_text(encoding="utf-8")
+            except (UnicodeDecodeError, OSError):
+                continue
+            count += sum(1 for line in text.splitlines() if compiled.search(line))
+    return count
+
+
+def _search(root: Path, pattern: str) -> int:
+    content = _execute_search_codebase({"pattern": pattern}, root, "bench").content
+    return int(content.split()[1])
+
+
+def _timed(fn) -> tuple[float, int]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=20_000)
+    args = parser.parse_args(argv)
+    # Everything is freshly written; skip the coarse-timestamp safety margins
+    # so the warm run measures the steady state rather than the first minute.
+    file_index._RACY_NS = 0
+    search_index._RACY_NS = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "repo"
+        (root / ".codeframe").mkdir(parents=True)
+        _make_tree(root, args.files)
+        rare = r"def reconcile_\w+"
+        # The index persists next to the tree it covers, never in the checkout.
+        assert search_index.for_root(root).state_path.is_relative_to(root)
+
+        rows = [("scan", *_timed(lambda: _scan(root, rare)))]
+        rows.append(("cold", *_timed(lambda: _search(root, rare))))
+        (root / "src" / "pkg0" / "mod0" / "f3.py").write_text("x = 1\n")
+        rows.append(("warm", *_timed(lambda: _search(root, rare))))
+        rows.append(("fallback", *_timed(lambda: _search(root, r"\(\w+, 39\)"))))
+
+    print(f"{'mode':<10} {'seconds':>9} {'matches':>8}")
+    for mode, seconds, matches in rows:
+        print(f"{mode:<10} {seconds:>9.3f} {matches:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Worktree start latency: fresh ``git worktree add`` vs the worktree pool.
+
+Builds a repository of N files (one commit) and times how long it takes to
+get a batch of T tasks each into its own worktree:
+
+- fresh:  ``TaskWorktree.create`` per task, which is what every task did
+- pooled: ``WorktreePool.acquire`` per task after ``prewarm(T)`` finished —
+  the steady state of a batch once finished worktrees are parked
+
+Also times one full reuse cycle (release + acquire on a moved base), the
+cost a task pays when it picks up the previous task's worktree.
+
+Usage:
+    bench_worktree_pool.py                      # 50k files, 8 tasks
+    bench_worktree_pool.py --files 5000 --tasks 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from codeframe.core.worktrees import TaskWorktree, WorktreePool  # noqa: E402
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+def _make_repo(root: Path, files: int) -> None:
+    subprocess.run(["git", "init", "-q", "-b", "main", str(root)], check=True)
+    _git(root, "config", "user.email", "bench@example.com")
+    _git(root, "config", "user.name", "bench")
+    (root / ".gitignore").write_text(".codeframe/\n")
+    for n in range(files):
+        directory = root / "src" / f"d{n // 500}"
+        if n % 500 == 0:
+            directory.mkdir(parents=True)
+        (directory / f"f{n}.py").write_text(f"VALUE = {n}\n" + "# padding\n" * 20)
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "init")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=50_000)
+    parser.add_argument("--tasks", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp) / "repo"
+        start = time.perf_counter()
+        _make_repo(repo, args.files)
+        print(f"built a {args.files}-file repo in {time.perf_counter() - start:.1f}s")
+
+        fresh = TaskWorktree()
+        start = time.perf_counter()
+        for n in range(args.tasks):
+            fresh.create(repo, f"fresh-{n}", base_branch="main")
+        fresh_s = time.perf_counter() - start
+        for n in range(args.tasks):
+            fresh.cleanup(repo, f"fresh-{n}")
+
+        pool = WorktreePool(repo, max_idle=args.tasks)
+        start = time.perf_counter()
+        pool.prewarm(args.tasks, base_branch="main").join()
+        prewarm_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for n in range(args.tasks):
+            pool.acquire(f"pooled-{n}", base_branch="main")
+        pooled_s = time.perf_counter() - start
+
+        # One reuse cycle with a base that moved by one commit.
+        (repo / "src" / "d0" / "f0.py").write_text("VALUE = -1\n")
+        _git(repo, "commit", "-q", "-am", "move base")
+        start = time.perf_counter()
+        pool.release("pooled-0")
+        pool.acquire("reused", base_branch="main")
+        cycle_s = time.perf_counter() - start
+
+    print(f"{'mode':<8} {'batch start (s)':>16} {'per task (s)':>13}")
+    print(f"{'fresh':<8} {fresh_s:>16.2f} {fresh_s / args.tasks:>13.3f}")
+    print(f"{'pooled':<8} {pooled_s:>16.2f} {pooled_s / args.tasks:>13.3f}")
+    print(f"background prewarm took {prewarm_s:.2f}s; one release+reuse cycle {cycle_s:.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
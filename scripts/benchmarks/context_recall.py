@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""How often the files a change edited land in the agent's loaded context.
+
+Replays a repository's recent commits as tasks: the commit message is the
+task title and description, and the code files the commit modified are the
+files the task "needed". For each commit the files are ranked two ways and
+the token budget is filled the way ``ContextLoader._load_file_contents``
+fills it:
+
+- path: the path-keyword heuristic alone (``_calculate_relevance``), which
+        is how files were ranked before the relevance index
+- bm25: ``ContextLoader._score_relevance`` (path + BM25 content + symbols)
+
+and the harness reports recall — the share of edited files that were loaded —
+plus recall within the top 10.
+
+Rankings use the current tree, not each commit's parent, so a commit's own
+additions are visible to both rankers; compare the two columns, not the
+absolute numbers. The tracked files are ranked from a temporary copy, so the
+indexes built along the way are never persisted into the repository's own
+``.codeframe/``.
+
+Usage:
+    context_recall.py                       # this repository, 50 commits
+    context_recall.py --repo ../other --commits 200 --max-tokens 60000
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from codeframe.core.context import (  # noqa: E402
+    CHARS_PER_TOKEN,
+    CODE_EXTENSIONS,
+    DEFAULT_FILE_TOKENS,
+    DEFAULT_MAX_TOKENS,
+    ContextLoader,
+    FileInfo,
+)
+from codeframe.core.state_machine import TaskStatus  # noqa: E402
+from codeframe.core.tasks import Task  # noqa: E402
+from codeframe.core.workspace import Workspace  # noqa: E402
+
+
+def _commits(repo: Path, count: int) -> list[tuple[str, str, set[str]]]:
+    """(subject, body, modified code files) for recent non-merge commits."""
+    log = subprocess.run(
+        ["git", "log", "--no-merges", f"-{count}", "--format=%x00%s%x01%b%x01",
+         "--name-only", "--diff-filter=M"],
+        cwd=repo, capture_output=True, text=True, encoding="utf-8",
+        errors="replace", check=True,
+    ).stdout
+    commits = []
+    for record in log.split("\x00")[1:]:
+        subject, body, names = record.split("\x01", 2)
+        files = {
+            name for name in names.split()
+            if Path(name).suffix.lower() in CODE_EXTENSIONS
+        }
+        if files:
+            commits.append((subject.strip(), body.strip(), files))
+    return commits
+
+
+def _copy_tracked(repo: Path, dest: Path) -> None:
+    """Copy the working-tree state of every tracked file into ``dest``."""
+    names = subprocess.run(
+        ["git", "ls-files", "-z"], cwd=repo, capture_output=True, check=True,
+    ).stdout.decode("utf-8", errors="replace").split("\0")
+    for name in filter(None, names):
+        source = repo / name
+        if source.is_file():
+            (dest / name).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, dest / name)
+
+
+def _loaded(ranked: list[FileInfo], task_text: str, max_tokens: int) -> list[str]:
+    """Paths ``_load_file_contents`` would load, without reading them."""
+    used = len(task_text) // CHARS_PER_TOKEN
+    loaded = []
+    for info in ranked:
+        if max_tokens - used < DEFAULT_FILE_TOKENS:
+            break
+        tokens = min(info.size_bytes, DEFAULT_FILE_TOKENS * CHARS_PER_TOKEN) // CHARS_PER_TOKEN
+        if tokens <= max_tokens - used:
+            loaded.append(info.path.replace("\\", "/"))
+            used += tokens
+    return loaded
+
+
+def _recall(
+    repo: Path, tree_root: Path, commits: int, max_tokens: int
+) -> tuple[dict[str, list[int]], int]:
+    """Loaded / top-10 hits per ranking, and how many edited files were wanted."""
+    now = datetime.now(timezone.utc)
+    workspace = Workspace(
+        id="recall", repo_path=tree_root, state_dir=tree_root / ".codeframe", created_at=now
+    )
+    loader = ContextLoader(workspace, max_tokens=max_tokens)
+    tree = loader._scan_file_tree()
+    present = {f.path.replace("\\", "/") for f in tree}
+
+    totals = {"path": [0, 0], "bm25": [0, 0]}
+    wanted = 0
+    for subject, body, files in _commits(repo, commits):
+        files &= present
+        if not files:
+            continue
+        wanted += len(files)
+        task = Task(
+            id="recall", workspace_id="recall", prd_id=None, title=subject,
+            description=body, status=TaskStatus.READY, priority=0,
+            created_at=now, updated_at=now,
+        )
+        text = subject + " " + body
+        keywords = loader._extract_keywords(text)
+        by_path = sorted(
+            tree, key=lambda f: loader._calculate_relevance(f, keywords), reverse=True
+        )
+        by_bm25 = list(loader._score_relevance(tree, task, None))
+        for name, ranked in (("path", by_path), ("bm25", by_bm25)):
+            loaded = _loaded(ranked, text, max_tokens)
+            totals[name][0] += len(files & set(loaded))
+            totals[name][1] += len(files & set(loaded[:10]))
+    return totals, wanted
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repo", type=Path, default=Path(__file__).resolve().parents[2])
+    parser.add_argument("--commits", type=int, default=50)
+    parser.add_argument("--max-tokens", type=int, default=DEFAULT_MAX_TOKENS)
+    args = parser.parse_args(argv)
+
+    repo = args.repo.resolve()
+    with tempfile.TemporaryDirectory() as tmp:
+        tree_root = Path(tmp) / "tree"
+        tree_root.mkdir()
+        _copy_tracked(repo, tree_root)
+        totals, wanted = _recall(repo, tree_root, args.commits, args.max_tokens)
+
+    if not wanted:
+        print("No commits modified files in the current tree.")
+        return 1
+    print(f"{wanted} edited files across the last {args.commits} commits")
+    print(f"{'ranking':<8} {'loaded':>8} {'top 10':>8}")
+    for name, (loaded, top) in totals.items():
+        print(f"{name:<8} {loaded / wanted:>8.1%} {top / wanted:>8.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,166 @@
+"""Prompt caching in AnthropicProvider and cache-aware cost accounting.
+
+A ReAct loop resends its tool schemas, system prompt and whole history on
+every iteration. Marking those prefixes cacheable turns the repeat into cache
+reads at a tenth of the input rate — but only if the request carries the
+markers, the usage reports the cache counters, and the cost code prices them.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from codeframe.adapters.llm.anthropic import AnthropicProvider
+from codeframe.adapters.llm.base import LLMResponse, Tool
+from codeframe.core.cost_tracker import CostTracker
+from codeframe.lib.metrics_tracker import MetricsTracker
+
+pytestmark = pytest.mark.v2
+
+EPHEMERAL = {"type": "ephemeral"}
+
+TOOLS = [
+    Tool(name="read_file", description="Read", input_schema={"type": "object"}),
+    Tool(name="edit_file", description="Edit", input_schema={"type": "object"}),
+]
+
+
+def _sdk_response(**usage):
+    usage = {"input_tokens": 10, "output_tokens": 5, **usage}
+    return SimpleNamespace(
+        content=[SimpleNamespace(type="text", text="ok")],
+        stop_reason="end_turn",
+        model="claude-sonnet-4-5",
+        usage=SimpleNamespace(**usage),
+    )
+
+
+def _complete(provider, messages, **kwargs):
+    fake_client = MagicMock()
+    fake_client.messages.create.return_value = _sdk_response()
+    provider._client = fake_client
+    provider.complete(messages=messages, **kwargs)
+    return fake_client.messages.create.call_args.kwargs
+
+
+class TestRequestShape:
+    def test_tools_system_and_history_are_marked(self):
+        messages = [
+            {"role": "user", "content": "do it"},
+            {"role": "assistant", "content": "", "tool_calls": [
+                {"id": "t1", "name": "read_file", "input": {"path": "a"}},
+            ]},
+            {"role": "user", "content": "", "tool_results": [
+                {"tool_call_id": "t1", "content": "data"},
+            ]},
+        ]
+        kwargs = _complete(
+            AnthropicProvider(api_key="k"), messages, tools=TOOLS, system="You are..."
+        )
+
+        assert kwargs["tools"][-1]["cache_control"] == EPHEMERAL
+        assert "cache_control" not in kwargs["tools"][0]
+        assert kwargs["system"] == [
+            {"type": "text", "text": "You are...", "cache_control": EPHEMERAL}
+        ]
+        last_block = kwargs["messages"][-1]["content"][-1]
+        assert last_block["type"] == "tool_result"
+        assert last_block["cache_control"] == EPHEMERAL
+        # Only the newest message carries the rolling breakpoint.
+        assert all(
+            "cache_control" not in block
+            for msg in kwargs["messages"][:-1]
+            for block in msg["content"] if isinstance(block, dict)
+        )
+
+    def test_plain_string_message_becomes_a_marked_text_block(self):
+        kwargs = _complete(AnthropicProvider(api_key="k"), [{"role": "user", "content": "hi"}])
+        assert kwargs["messages"] == [{
+            "role": "user",
+            "content": [{"type": "text", "text": "hi", "cache_control": EPHEMERAL}],
+        }]
+
+    def test_caller_messages_are_not_mutated(self):
+        messages = [{"role": "user", "content": [{"type": "text", "text": "hi"}]}]
+        _complete(AnthropicProvider(api_key="k"), messages)
+        assert messages == [{"role": "user", "content": [{"type": "text", "text": "hi"}]}]
+
+    def test_disabled_leaves_the_request_untouched(self):
+        kwargs = _complete(
+            AnthropicProvider(api_key="k", prompt_caching=False),
+            [{"role": "user", "content": "hi"}],
+            tools=TOOLS,
+            system="sys",
+        )
+        assert kwargs["system"] == "sys"
+        assert kwargs["messages"] == [{"role": "user", "content": "hi"}]
+        assert all("cache_control" not in t for t in kwargs["tools"])
+
+    async def test_async_stream_marks_prefixes_without_mutating_tools(self):
+        provider = AnthropicProvider(api_key="k")
+        fake_async = MagicMock()
+        fake_async.messages.stream.side_effect = RuntimeError("stop")
+        provider._async_client = fake_async
+        tools = [{"name": "t", "description": "d", "input_schema": {}}]
+
+        with pytest.raises(RuntimeError):
+            async for _ in provider.async_stream(
+                messages=[{"role": "user", "content": "hi"}],
+                system="sys", tools=tools, model="claude-sonnet-4-5", max_tokens=100,
+            ):
+                pass
+        kwargs = fake_async.messages.stream.call_args.kwargs
+        assert kwargs["tools"][-1]["cache_control"] == EPHEMERAL
+        assert kwargs["system"][0]["cache_control"] == EPHEMERAL
+        assert "cache_control" not in tools[0]
+
+
+class TestUsageParsing:
+    def test_cache_counters_are_reported(self):
+        provider = AnthropicProvider(api_key="k")
+        response = provider._parse_response(
+            _sdk_response(cache_creation_input_tokens=2000, cache_read_input_tokens=8000)
+        )
+        assert response.cache_creation_input_tokens == 2000
+        assert response.cache_read_input_tokens == 8000
+        assert response.input_tokens == 10
+
+    def test_missing_or_null_counters_are_zero(self):
+        provider = AnthropicProvider(api_key="k")
+        response = provider._parse_response(_sdk_response(cache_read_input_tokens=None))
+        assert response.cache_creation_input_tokens == 0
+        assert response.cache_read_input_tokens == 0
+
+
+class TestCachePricing:
+    def test_reads_and_writes_use_cache_rates(self):
+        # claude-sonnet-4-5 input is $3/MTok: writes 1.25x, reads 0.1x.
+        cost = MetricsTracker.calculate_cost(
+            "claude-sonnet-4-5", 0, 0,
+            cache_creation_tokens=1_000_000, cache_read_tokens=1_000_000,
+        )
+        assert cost == pytest.approx(3.75 + 0.30)
+
+    def test_explicit_rates_override_the_multipliers(self, monkeypatch):
+        monkeypatch.setenv(
+            "CODEFRAME_MODEL_PRICING",
+            '{"my-model": {"input": 1, "output": 1, "cache_write": 2, "cache_read": 0.5}}',
+        )
+        cost = MetricsTracker.calculate_cost(
+            "my-model", 0, 0, cache_creation_tokens=1_000_000, cache_read_tokens=1_000_000
+        )
+        assert cost == pytest.approx(2.5)
+
+    def test_cost_tracker_prices_cached_responses(self):
+        tracker = CostTracker()
+        tracker.record_response(LLMResponse(
+            content="", model="claude-sonnet-4-5",
+            input_tokens=0, output_tokens=0, cache_read_input_tokens=1_000_000,
+        ))
+        assert tracker.estimate_cost() == pytest.approx(0.30)
+        # Records without cache keys still price as before.
+        tracker.records.append(
+            {"model": "claude-sonnet-4-5", "input_tokens": 1_000_000, "output_tokens": 0}
+        )
+        assert tracker.estimate_cost() == pytest.approx(3.30)
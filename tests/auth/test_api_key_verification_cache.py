@@ -0,0 +1,197 @@
+"""Successful API-key verifications are cached per process.
+
+Every API-key request paid a hash verify per prefix candidate (bcrypt for
+legacy keys) plus three owner SELECTs. A verified key is now served from an in-process cache for a
+short TTL — but anything that could take the credential away (revoke, owner
+deactivation or demotion, scope change), made by any worker, bumps the
+control-plane ``auth_generation`` and invalidates it on the next request.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from codeframe.auth import dependencies as deps
+from codeframe.auth.api_keys import SCOPE_ADMIN, SCOPE_READ, SCOPE_WRITE
+from codeframe.core.api_key_service import ApiKeyService
+from codeframe.platform_store.database import Database
+from tests.conftest import setup_test_user
+
+pytestmark = pytest.mark.v2
+
+
+class _State:
+    pass
+
+
+class _App:
+    def __init__(self, db):
+        self.state = _State()
+        self.state.db = db
+
+
+class _Request:
+    def __init__(self, db):
+        self.app = _App(db)
+        self.state = _State()
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    deps.clear_api_key_cache()
+    deps._last_used_writes.clear()
+    yield
+    deps.clear_api_key_cache()
+    deps._last_used_writes.clear()
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "state.db"))
+    database = Database(tmp_path / "state.db")
+    database.initialize()
+    setup_test_user(database, user_id=1)
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def verifications(monkeypatch):
+    """Count key-hash verifications."""
+    calls = []
+    real = deps.verify_api_key
+
+    def counting(key, key_hash):
+        calls.append(key_hash)
+        return real(key, key_hash)
+
+    monkeypatch.setattr(deps, "verify_api_key", counting)
+    return calls
+
+
+def _create(db, scopes=(SCOPE_READ, SCOPE_WRITE), **kwargs):
+    return ApiKeyService(db).create_api_key(user_id=1, name="k", scopes=list(scopes), **kwargs)
+
+
+def _resolve(db, key):
+    return deps._resolve_api_key(key, _Request(db))
+
+
+def _sql(db, statement, *params):
+    db.conn.execute(statement, params)
+    db.conn.commit()
+
+
+class TestCacheHits:
+    def test_repeat_requests_verify_once(self, db, verifications):
+        key = _create(db)
+
+        principals = [_resolve(db, key.key) for _ in range(5)]
+
+        assert len(verifications) == 1
+        assert all(p == principals[0] for p in principals)
+        assert principals[0]["scopes"] == [SCOPE_READ, SCOPE_WRITE]
+
+    def test_wrong_keys_are_never_cached(self, db, verifications):
+        key = _create(db)
+        wrong = key.key[:-4] + ("0000" if not key.key.endswith("0000") else "1111")
+
+        assert _resolve(db, wrong) is None
+        assert _resolve(db, wrong) is None
+
+        assert len(verifications) == 2
+
+    def test_last_used_refresh_does_not_invalidate(self, db, verifications):
+        key = _create(db)
+        _resolve(db, key.key)
+        deps._last_used_writes.clear()  # force the next request to write
+
+        _resolve(db, key.key)
+        _resolve(db, key.key)
+
+        assert len(verifications) == 1
+
+    def test_cache_holds_no_plaintext_key(self, db):
+        key = _create(db)
+        _resolve(db, key.key)
+
+        assert key.key not in repr(deps._api_key_cache)
+
+    def test_ttl_expiry_reverifies(self, db, verifications, monkeypatch):
+        key = _create(db)
+        _resolve(db, key.key)
+        now = deps.time.monotonic()
+        monkeypatch.setattr(
+            deps.time, "monotonic", lambda: now + deps._API_KEY_CACHE_TTL_SECONDS + 1
+        )
+
+        assert _resolve(db, key.key) is not None
+        assert len(verifications) == 2
+
+    def test_never_served_past_the_keys_own_expiry(self, db, monkeypatch):
+        key = _create(db, expires_at=datetime.now(timezone.utc) + timedelta(seconds=5))
+        _resolve(db, key.key)
+        now = deps.time.monotonic()
+        monkeypatch.setattr(deps.time, "monotonic", lambda: now + 6)
+
+        (cached,) = deps._api_key_cache.values()
+        assert cached[1] <= now + 5.5
+        assert deps._cached_principal(next(iter(deps._api_key_cache)), cached[0]) is None
+
+
+class TestInvalidation:
+    def test_revoke_from_another_connection(self, db, tmp_path):
+        key = _create(db)
+        assert _resolve(db, key.key) is not None
+        # A second Database on the same file stands in for another worker.
+        other = Database(tmp_path / "state.db")
+        other.initialize()
+        try:
+            assert other.api_keys.revoke(key.id, 1)
+        finally:
+            other.close()
+
+        assert _resolve(db, key.key) is None
+
+    def test_owner_deactivation(self, db):
+        key = _create(db)
+        _resolve(db, key.key)
+
+        _sql(db, "UPDATE users SET is_active = 0 WHERE id = 1")
+
+        assert _resolve(db, key.key) is None
+
+    def test_owner_demotion_drops_admin(self, db):
+        _sql(db, "UPDATE users SET is_superuser = 1 WHERE id = 1")
+        key = _create(db, scopes=(SCOPE_READ, SCOPE_ADMIN))
+        assert SCOPE_ADMIN in _resolve(db, key.key)["scopes"]
+
+        _sql(db, "UPDATE users SET is_superuser = 0 WHERE id = 1")
+
+        assert _resolve(db, key.key)["scopes"] == [SCOPE_READ]
+
+    def test_scope_change(self, db):
+        key = _create(db)
+        _resolve(db, key.key)
+
+        _sql(db, "UPDATE api_keys SET scopes = ? WHERE id = ?", '["read"]', key.id)
+
+        assert _resolve(db, key.key)["scopes"] == [SCOPE_READ]
+
+    def test_key_deleted(self, db):
+        key = _create(db)
+        _resolve(db, key.key)
+
+        assert db.api_keys.delete(key.id, 1)
+
+        assert _resolve(db, key.key) is None
+
+    def test_database_without_the_counter_is_not_cached(self, db, verifications):
+        key = _create(db)
+        _sql(db, "DROP TABLE auth_generation")
+
+        _resolve(db, key.key)
+        _resolve(db, key.key)
+
+        assert len(verifications) == 2
+        assert not deps._api_key_cache
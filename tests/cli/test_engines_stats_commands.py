@@ -103,6 +103,20 @@ class TestEnginesStats:
         assert result.exit_code == 0
         mock_es.get_engine_stats.assert_called_once_with("fake-ws", engine="react")
 
+    @patch("codeframe.cli.engines_commands.engine_stats")
+    @patch("codeframe.cli.engines_commands.get_workspace")
+    def test_engines_stats_days_window(self, mock_get_ws, mock_es, tmp_path, monkeypatch):
+        """--days reads the windowed stats instead of the all-time ones."""
+        monkeypatch.chdir(tmp_path)
+        mock_get_ws.return_value = "fake-ws"
+        mock_es.get_engine_stats_window.return_value = SAMPLE_STATS
+
+        result = runner.invoke(app, ["engines", "stats", "--days", "7"])
+        assert result.exit_code == 0
+        assert "last 7 days" in result.output
+        mock_es.get_engine_stats_window.assert_called_once_with("fake-ws", 7, engine=None)
+        mock_es.get_engine_stats.assert_not_called()
+
 
 class TestEnginesCompare:
     """Tests for 'cf engines compare' command."""
@@ -141,3 +155,29 @@ class TestEnginesCompare:
         react_pos = result.output.index("react")
         plan_pos = result.output.index("plan")
         assert react_pos < plan_pos
+
+
+class TestStatsRebuild:
+    """Tests for 'cf stats rebuild'."""
+
+    def test_rebuild_no_workspace(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(app, ["stats", "rebuild"])
+        assert result.exit_code == 1
+        assert "No workspace found" in result.output
+
+    def test_rebuild_from_a_subdirectory(self, tmp_path, monkeypatch):
+        from codeframe.core import engine_stats
+        from codeframe.core.workspace import create_or_load_workspace
+
+        workspace = create_or_load_workspace(tmp_path)
+        engine_stats.record_run(workspace, "r1", "react", "t1", "COMPLETED")
+        engine_stats.record_run(workspace, "r2", "react", "t2", "FAILED")
+        (tmp_path / "src").mkdir()
+        monkeypatch.chdir(tmp_path / "src")
+
+        result = runner.invoke(app, ["stats", "rebuild"])
+
+        assert result.exit_code == 0, result.output
+        assert "2 recorded run" in result.output
+        assert engine_stats.get_engine_stats(workspace)["react"]["tasks_attempted"] == 2.0
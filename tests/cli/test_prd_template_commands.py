@@ -95,8 +95,10 @@ class TestPrdTemplatesExport:
 class TestPrdTemplatesImport:
     """Tests for 'cf prd templates import' command."""
 
-    def test_import_template_from_file(self, tmp_path):
+    def test_import_template_from_file(self, tmp_path, monkeypatch):
         """Import command loads template from file."""
+        # The import persists into the cwd's .codeframe/, not the checkout's.
+        monkeypatch.chdir(tmp_path)
         # Create a valid template file
         template_file = tmp_path / "custom.yaml"
         template_file.write_text("""
@@ -139,6 +139,8 @@ class TestConfig:
         """Test sprint validation through Config."""
         # Set API key in environment
         monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+        # The default log and database paths are cwd-relative.
+        monkeypatch.chdir(tmp_path)
 
         config = Config(tmp_path)
         # Should not raise with API key set
@@ -274,6 +274,17 @@ def reset_singletons():
     # Cleanup after test
 
 
+@pytest.fixture(autouse=True)
+def gate_cache_off(monkeypatch):
+    """Keep the gate result cache out of tests that don't ask for it.
+
+    Tests re-run gates against an unchanged tmp repo with different mocks, and
+    the cache's own ``git`` calls would consume ``subprocess.run`` side effects
+    meant for the gate. Cache tests pass ``use_cache=True`` explicitly.
+    """
+    monkeypatch.setenv("CODEFRAME_GATE_CACHE", "0")
+
+
 @pytest.fixture
 def anthropic_api_key(mock_env) -> str:
     """Provide a mock Anthropic API key.
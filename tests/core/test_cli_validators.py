@@ -322,7 +322,7 @@ class TestThinkPhaseProviderResolution:
 
         seen_providers = []
 
-        def fake_stress_test(content, provider, max_depth=3):
+        def fake_stress_test(content, provider, max_depth=3, cache=None):
             seen_providers.append(provider)
             # The real dataclass, not a SimpleNamespace: this stub only cares
             # about which provider was resolved, so it must not also encode a
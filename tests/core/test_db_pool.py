@@ -0,0 +1,204 @@
+"""Tests for the per-process workspace connection pool (codeframe/core/db_pool.py).
+
+get_db_connection() now checks connections out of a pool; ``close()`` returns
+them. These pin the properties the ~120 existing call sites rely on without
+knowing a pool is there: a released handle is dead, nothing leaks between
+callers, and a replaced state.db is never read through a stale handle.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from codeframe.core import events
+from codeframe.core.db_pool import ConnectionPool, PooledConnection
+from codeframe.core.workspace import (
+    _open_pooled_db,
+    create_or_load_workspace,
+    db_connection,
+    get_db_connection,
+)
+
+pytestmark = pytest.mark.v2
+
+
+@pytest.fixture
+def pool():
+    p = ConnectionPool(_open_pooled_db)
+    yield p
+    p.clear()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return create_or_load_workspace(tmp_path).db_path
+
+
+class TestReuse:
+    def test_release_then_acquire_reuses_the_connection(self, pool, db_path):
+        conn = pool.acquire(db_path)
+        conn.close()
+        conn = pool.acquire(db_path)
+        conn.close()
+
+        assert pool.stats()["opened"] == 1
+        assert pool.stats()["reused"] == 1
+
+    def test_concurrent_checkouts_get_distinct_connections(self, pool, db_path):
+        a = pool.acquire(db_path)
+        b = pool.acquire(db_path)
+        try:
+            assert a._conn is not b._conn
+        finally:
+            a.close()
+            b.close()
+        assert pool.stats()["idle"] == 2
+
+    def test_pooled_connection_keeps_the_workspace_pragmas(self, pool, db_path):
+        with pool.connection(db_path) as conn:
+            pass
+        with pool.connection(db_path) as conn:
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_idle_connection_can_move_to_another_thread(self, pool, db_path):
+        pool.acquire(db_path).close()
+        seen = []
+
+        def worker():
+            with pool.connection(db_path) as conn:
+                seen.append(conn.execute("SELECT 1").fetchone()[0])
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+
+        assert seen == [1]
+        assert pool.stats()["reused"] == 1
+
+
+class TestReleasedHandle:
+    def test_use_after_close_raises_like_a_closed_connection(self, pool, db_path):
+        conn = pool.acquire(db_path)
+        conn.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_double_close_does_not_pool_twice(self, pool, db_path):
+        conn = pool.acquire(db_path)
+        conn.close()
+        conn.close()
+        assert pool.stats()["idle"] == 1
+
+    def test_uncommitted_write_is_rolled_back_on_release(self, pool, tmp_path):
+        path = tmp_path / "x.db"
+        with pool.connection(path) as conn:
+            conn.execute("CREATE TABLE t (v TEXT)")
+            conn.commit()
+
+        conn = pool.acquire(path)
+        conn.execute("INSERT INTO t VALUES ('uncommitted')")
+        conn.close()
+
+        with pool.connection(path) as conn:
+            assert not conn.in_transaction
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_row_factory_does_not_leak_to_the_next_caller(self, pool, db_path):
+        conn = pool.acquire(db_path)
+        conn.row_factory = sqlite3.Row
+        conn.close()
+
+        with pool.connection(db_path) as conn:
+            assert conn.row_factory is None
+            assert isinstance(conn.execute("SELECT 1").fetchone(), tuple)
+
+
+class TestHealthChecks:
+    def test_recreated_database_file_is_not_read_through_a_stale_handle(
+        self, pool, tmp_path
+    ):
+        """A deleted-and-recreated workspace (``rm -rf .codeframe && cf init``)
+        is a new inode at the same path; the idle handle still points at the
+        old one."""
+        path = tmp_path / "x.db"
+        with pool.connection(path) as conn:
+            conn.execute("CREATE TABLE t (v TEXT)")
+            conn.execute("INSERT INTO t VALUES ('old')")
+            conn.commit()
+
+        for suffix in ("", "-wal", "-shm"):
+            (tmp_path / f"x.db{suffix}").unlink(missing_ok=True)
+        fresh = sqlite3.connect(path)
+        fresh.execute("CREATE TABLE t (v TEXT)")
+        fresh.execute("INSERT INTO t VALUES ('new')")
+        fresh.commit()
+        fresh.close()
+
+        with pool.connection(path) as conn:
+            assert conn.execute("SELECT v FROM t").fetchone()[0] == "new"
+        assert pool.stats()["opened"] == 2
+
+    def test_expired_idle_connections_are_not_reused(self, db_path):
+        pool = ConnectionPool(_open_pooled_db, max_idle_seconds=-1)
+        pool.acquire(db_path).close()
+        pool.acquire(db_path).close()
+        assert pool.stats()["reused"] == 0
+        pool.clear()
+
+
+class TestBounds:
+    def test_idle_per_database_is_capped(self, db_path):
+        pool = ConnectionPool(_open_pooled_db, max_idle_per_db=2)
+        handles = [pool.acquire(db_path) for _ in range(5)]
+        for h in handles:
+            h.close()
+        assert pool.stats()["idle"] == 2
+        pool.clear()
+
+    def test_idle_total_evicts_least_recently_used_database(self, tmp_path):
+        pool = ConnectionPool(_open_pooled_db, max_idle_total=2)
+        for name in ("a.db", "b.db", "c.db"):
+            pool.acquire(tmp_path / name).close()
+
+        stats = pool.stats()
+        assert stats["idle"] == 2
+        pool.acquire(tmp_path / "a.db").close()
+        assert pool.stats()["reused"] == 0
+        pool.clear()
+
+    def test_zero_idle_disables_reuse(self, db_path):
+        pool = ConnectionPool(_open_pooled_db, max_idle_per_db=0)
+        pool.acquire(db_path).close()
+        pool.acquire(db_path).close()
+        assert pool.stats() == {"opened": 2, "reused": 0, "idle": 0, "databases": 0}
+
+
+class TestWorkspaceIntegration:
+    def test_get_db_connection_is_pooled(self, tmp_path):
+        ws = create_or_load_workspace(tmp_path)
+        conn = get_db_connection(ws)
+        assert isinstance(conn, PooledConnection)
+        conn.close()
+
+    def test_db_connection_context_manager_releases(self, tmp_path):
+        ws = create_or_load_workspace(tmp_path)
+        with db_connection(ws) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM workspace").fetchone()[0] == 1
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_emits_reuse_connections(self, tmp_path, monkeypatch):
+        from codeframe.core import workspace as ws_mod
+
+        pool = ConnectionPool(_open_pooled_db)
+        monkeypatch.setattr(ws_mod, "_CONNECTION_POOL", pool)
+        ws = create_or_load_workspace(tmp_path)
+
+        for i in range(20):
+            events.emit_for_workspace(ws, "BENCH", {"i": i}, print_event=False)
+
+        assert pool.stats()["opened"] == 1
+        assert len(events.list_recent(ws, limit=50)) == 20
+        pool.clear()
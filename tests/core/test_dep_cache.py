@@ -0,0 +1,271 @@
+"""Tests for the shared dependency cache (codeframe/core/dep_cache.py).
+
+Worktrees with the same lockfile must share one install: parallel misses build
+once, every worktree gets its own hardlinked tree (or a symlink where links
+cannot cross filesystems), venv scripts point at the worktree, and the store
+evicts least recently used entries past its budget.
+"""
+
+import errno
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from codeframe.core import dep_cache, gates
+from codeframe.core.dep_cache import DependencyCache
+
+pytestmark = pytest.mark.v2
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DependencyCache(tmp_path / "store", max_bytes=10**9)
+
+
+def _fake_venv_builder(calls, delay=0.0):
+    """Builds a venv-shaped tree whose script embeds the venv's own path."""
+    lock = threading.Lock()
+
+    def build(venv):
+        with lock:
+            calls.append(venv)
+        time.sleep(delay)
+        (venv / "bin").mkdir(parents=True)
+        (venv / "lib").mkdir()
+        (venv / "lib" / "pkg.py").write_text("VALUE = 1\n")
+        script = venv / "bin" / "tool"
+        script.write_text(f"#!{venv}/bin/python\nprint('hi')\n")
+        script.chmod(0o755)
+        os.symlink("../lib", venv / "bin" / "lib-link")
+        return True, "Installed Python dependencies via uv: requirements.txt"
+
+    return build
+
+
+def _worktree(tmp_path, name, requirements="packaging==24.0\n"):
+    """A directory that looks like a linked worktree (``.git`` is a file)."""
+    repo = tmp_path / name
+    repo.mkdir()
+    (repo / ".git").write_text("gitdir: /elsewhere\n")
+    (repo / "requirements.txt").write_text(requirements)
+    return repo
+
+
+class TestMaterialize:
+    def test_parallel_misses_build_once(self, store, tmp_path):
+        calls = []
+        build = _fake_venv_builder(calls, delay=0.2)
+        targets = [tmp_path / f"wt{n}" / ".venv" for n in range(20)]
+        for target in targets:
+            target.parent.mkdir()
+        results = [None] * len(targets)
+
+        def worker(n):
+            results[n] = store.materialize("python-abc", targets[n], build)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert all(ok for ok, _ in results)
+        stored = store.entry_dir("python-abc") / ".venv" / "lib" / "pkg.py"
+        for target in targets:
+            assert (target / "lib" / "pkg.py").stat().st_ino == stored.stat().st_ino
+            assert os.readlink(target / "bin" / "lib-link") == "../lib"
+
+    def test_hit_reports_link_mode(self, store, tmp_path):
+        build = _fake_venv_builder([])
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        store.materialize("python-abc", tmp_path / "a" / ".venv", build)
+
+        ok, message = store.materialize("python-abc", tmp_path / "b" / ".venv", build)
+
+        assert ok
+        assert message == "Linked cached dependencies into .venv (hardlink)"
+
+    def test_failed_build_is_not_cached(self, store, tmp_path):
+        attempts = []
+
+        def failing(venv):
+            attempts.append(venv)
+            venv.mkdir()
+            return False, "Failed to install Python dependencies: boom"
+
+        target = tmp_path / ".venv"
+        assert store.materialize("python-abc", target, failing) == (
+            False, "Failed to install Python dependencies: boom"
+        )
+        store.materialize("python-abc", target, failing)
+
+        assert len(attempts) == 2
+        assert not target.exists()
+        assert store.entries() == []
+
+    def test_relocate_rewrites_scripts_only(self, store, tmp_path):
+        (tmp_path / "wt").mkdir()
+        target = tmp_path / "wt" / ".venv"
+        store.materialize("python-abc", target, _fake_venv_builder([]), relocate=True)
+
+        stored = store.entry_dir("python-abc") / ".venv"
+        assert (target / "bin" / "tool").read_text().startswith(f"#!{target}/bin/python")
+        assert (stored / "bin" / "tool").read_text().startswith(f"#!{stored}/bin/python")
+        assert os.access(target / "bin" / "tool", os.X_OK)
+        assert (target / "lib" / "pkg.py").stat().st_ino == (stored / "lib" / "pkg.py").stat().st_ino
+
+    def test_cross_device_falls_back_to_a_symlink(self, store, tmp_path, monkeypatch):
+        build = _fake_venv_builder([])
+        (tmp_path / "wt").mkdir()
+        target = tmp_path / "wt" / ".venv"
+
+        def no_links(src, dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(dep_cache.os, "link", no_links)
+        ok, message = store.materialize("python-abc", target, build)
+
+        assert ok and "symlink" in message
+        assert target.resolve() == (store.entry_dir("python-abc") / ".venv").resolve()
+
+    def test_dangling_symlink_from_eviction_is_repaired(self, store, tmp_path):
+        (tmp_path / "wt").mkdir()
+        target = tmp_path / "wt" / ".venv"
+        os.symlink(tmp_path / "evicted", target)
+
+        ok, _ = store.materialize("python-abc", target, _fake_venv_builder([]))
+
+        assert ok
+        assert not target.is_symlink()
+        assert (target / "lib" / "pkg.py").exists()
+
+    def test_an_existing_target_is_never_replaced(self, store, tmp_path):
+        target = tmp_path / ".venv"
+        target.mkdir()
+        (target / "mine").write_text("x")
+        built_at = []
+
+        store.materialize("python-abc", target, lambda p: (built_at.append(p), (True, "ok"))[1])
+
+        assert built_at == [target]
+        assert (target / "mine").exists()
+
+
+class TestEviction:
+    def test_least_recently_used_goes_first(self, tmp_path):
+        store = DependencyCache(tmp_path / "store", max_bytes=10**9)
+        for n, key in enumerate(["python-a", "python-b", "python-c"]):
+            (tmp_path / key).mkdir()
+            store.materialize(key, tmp_path / key / ".venv", _fake_venv_builder([]))
+            meta = store.entry_dir(key) / ".cf-dep-cache.json"
+            os.utime(meta, (1000 + n, 1000 + n))
+        store.materialize("python-a", tmp_path / "again" / ".venv", _fake_venv_builder([]))
+
+        store.max_bytes = sum(e.size_bytes for e in store.entries()) - 1
+        evicted = store.evict()
+
+        assert evicted == ["python-b"]
+        assert [e.key for e in store.entries()] == ["python-c", "python-a"]
+        # A hardlinked worktree outlives the entry it came from.
+        assert (tmp_path / "python-b" / ".venv" / "lib" / "pkg.py").exists()
+
+    def test_new_entry_is_kept_even_when_over_budget(self, tmp_path):
+        store = DependencyCache(tmp_path / "store", max_bytes=1)
+        (tmp_path / "wt").mkdir()
+        store.materialize("python-a", tmp_path / "wt" / ".venv", _fake_venv_builder([]))
+        assert [e.key for e in store.entries()] == ["python-a"]
+
+
+class TestKeys:
+    def test_python_key_follows_the_requirements(self, tmp_path):
+        repo = _worktree(tmp_path, "wt")
+        req = repo / "requirements.txt"
+        key = dep_cache.python_key(repo, req, "uv")
+
+        assert dep_cache.python_key(repo, req, "uv") == key
+        assert dep_cache.python_key(repo, req, "3.12.1") != key
+        (repo / ".python-version").write_text("3.12\n")
+        assert dep_cache.python_key(repo, req, "uv") != key
+
+    @pytest.mark.parametrize("line", ["-e .", "-r base.txt", "./libs/x", "file:///tmp/x"])
+    def test_requirements_outside_the_file_are_not_shared(self, tmp_path, line):
+        repo = _worktree(tmp_path, "wt", requirements=f"packaging\n{line}\n")
+        assert dep_cache.python_key(repo, repo / "requirements.txt", "uv") is None
+
+    def test_node_key(self, tmp_path):
+        (tmp_path / "package.json").write_text('{"dependencies": {"left-pad": "1.3.0"}}')
+        key = dep_cache.node_key(tmp_path)
+        (tmp_path / "package-lock.json").write_text("{}")
+        assert key is not None and dep_cache.node_key(tmp_path) != key
+
+        (tmp_path / "package.json").write_text('{"dependencies": {"x": "file:../x"}}')
+        assert dep_cache.node_key(tmp_path) is None
+        (tmp_path / "package.json").write_text('{"workspaces": ["a"]}')
+        assert dep_cache.node_key(tmp_path) is None
+
+
+class TestGatesIntegration:
+    @pytest.fixture
+    def fake_install(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(dep_cache.DEP_CACHE_DIR_ENV, str(tmp_path / "store"))
+        monkeypatch.delenv(dep_cache.DEP_CACHE_ENV, raising=False)
+        monkeypatch.setattr(gates.shutil, "which", lambda name: f"/usr/bin/{name}")
+        calls = []
+        build = _fake_venv_builder(calls)
+        monkeypatch.setattr(
+            gates, "_install_python_requirements",
+            lambda repo, req, venv=None: build(venv or repo / ".venv"),
+        )
+        return calls
+
+    def test_worktrees_share_one_install(self, tmp_path, fake_install):
+        for name in ("wt1", "wt2", "wt3"):
+            ok, _ = gates._ensure_dependencies_installed(_worktree(tmp_path, name))
+            assert ok
+            assert (tmp_path / name / ".venv" / "lib" / "pkg.py").exists()
+        assert len(fake_install) == 1
+
+    def test_main_checkout_installs_in_place(self, tmp_path, fake_install):
+        repo = _worktree(tmp_path, "main")
+        (repo / ".git").unlink()
+        (repo / ".git").mkdir()
+
+        gates._ensure_dependencies_installed(repo)
+
+        assert fake_install == [repo / ".venv"]
+
+    def test_cache_can_be_disabled(self, tmp_path, fake_install, monkeypatch):
+        monkeypatch.setenv(dep_cache.DEP_CACHE_ENV, "0")
+        repo = _worktree(tmp_path, "wt")
+        gates._ensure_dependencies_installed(repo)
+        assert fake_install == [repo / ".venv"]
+
+
+def test_a_linked_venv_runs_as_the_worktrees_own(tmp_path, store):
+    """A real venv: its interpreter and pip both resolve to the worktree."""
+    repo = _worktree(tmp_path, "wt", requirements="# nothing to install\n")
+    target = repo / ".venv"
+
+    def build(venv):
+        created = subprocess.run([sys.executable, "-m", "venv", str(venv)], capture_output=True)
+        if created.returncode != 0:
+            pytest.skip("python -m venv is unavailable here")
+        return True, "built"
+
+    ok, _ = store.materialize("python-real", target, build, relocate=True)
+    assert ok
+
+    python = target / "bin" / "python"
+    prefix = subprocess.run(
+        [str(python), "-c", "import sys; print(sys.prefix)"],
+        capture_output=True, text=True, check=True,
+    ).stdout.strip()
+    assert prefix == str(target)
+    shebang = (target / "bin" / "pip").read_text().splitlines()[0]
+    assert shebang == f"#!{target}/bin/python"
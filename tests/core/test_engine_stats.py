@@ -239,3 +239,175 @@ class TestAggregateCalculations:
 
         assert stats["react"]["tasks_completed"] == 0.0
         assert stats["react"]["avg_tokens_per_task"] == 0.0
+
+
+def _stats_after_rebuild(workspace):
+    from codeframe.core.engine_stats import get_engine_stats, rebuild_stats
+
+    rebuild_stats(workspace)
+    return get_engine_stats(workspace)
+
+
+def _backdate(workspace, run_id, days):
+    from datetime import datetime, timedelta, timezone
+
+    when = datetime.now(timezone.utc) - timedelta(days=days)
+    conn = get_db_connection(workspace)
+    conn.execute(
+        "UPDATE run_engine_log SET created_at = ? WHERE run_id = ?",
+        (when.isoformat(), run_id),
+    )
+    conn.commit()
+    conn.close()
+
+
+class TestRunningSums:
+    """Aggregates are maintained by deltas, not re-aggregated per run."""
+
+    def test_incremental_stats_match_a_full_rebuild(self, workspace):
+        from codeframe.core.engine_stats import get_engine_stats
+
+        _record(workspace, "react", "COMPLETED", duration_ms=3000, tokens_used=500,
+                gates_passed=1, self_corrections=2)
+        _record(workspace, "react", "FAILED", duration_ms=None, tokens_used=None,
+                gates_passed=0)
+        _record(workspace, "react", "BLOCKED", duration_ms=1001, tokens_used=70)
+        _record(workspace, "plan", "COMPLETED", duration_ms=4000, tokens_used=800,
+                gates_passed=1)
+
+        incremental = get_engine_stats(workspace)
+
+        assert incremental == _stats_after_rebuild(workspace)
+        assert incremental["react"] == {
+            "tasks_attempted": 3.0,
+            "tasks_completed": 1.0,
+            "tasks_failed": 1.0,
+            "gate_pass_rate": 50.0,
+            "self_correction_rate": 33.33,
+            "avg_duration_ms": 2000.5,
+            "total_tokens": 570.0,
+            "avg_tokens_per_task": 500.0,
+        }
+
+    def test_record_run_does_not_scan_the_log(self, workspace, monkeypatch):
+        from codeframe.core import engine_stats
+
+        for _ in range(3):
+            _record(workspace, "react", "COMPLETED", duration_ms=10)
+        statements = []
+        real = engine_stats.get_db_connection
+
+        def traced(ws):
+            conn = real(ws)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        monkeypatch.setattr(engine_stats, "get_db_connection", traced)
+        _record(workspace, "react", "COMPLETED", duration_ms=10)
+
+        reads = [s for s in statements if "FROM run_engine_log" in s]
+        assert reads and all("WHERE run_id = " in s for s in reads)
+
+    def test_rebuild_recovers_runs_logged_without_rollups(self, workspace):
+        from codeframe.core.engine_stats import get_engine_stats
+
+        _record(workspace, "react", "COMPLETED", duration_ms=10)
+        # An older CodeFRAME logs a run but knows nothing of the rollups.
+        conn = get_db_connection(workspace)
+        conn.execute(
+            "INSERT INTO run_engine_log (run_id, engine, task_id, workspace_id, "
+            "status, created_at) VALUES ('old', 'react', 't', ?, 'FAILED', ?)",
+            (workspace.id, "2026-01-01T00:00:00+00:00"),
+        )
+        conn.commit()
+        conn.close()
+        assert get_engine_stats(workspace)["react"]["tasks_attempted"] == 1.0
+
+        stats = _stats_after_rebuild(workspace)
+
+        assert stats["react"]["tasks_attempted"] == 2.0
+        assert stats["react"]["tasks_failed"] == 1.0
+
+    def test_deleting_a_task_retracts_its_runs(self, workspace):
+        from codeframe.core import tasks
+        from codeframe.core.engine_stats import get_engine_stats, record_run
+
+        kept = tasks.create(workspace, title="kept")
+        doomed = tasks.create(workspace, title="doomed")
+        for task, status in ((kept, "COMPLETED"), (doomed, "FAILED"), (doomed, "FAILED")):
+            record_run(workspace, str(uuid.uuid4()), "react", task.id, status,
+                       duration_ms=100, tokens_used=10)
+
+        assert tasks.delete(workspace, doomed.id)
+
+        stats = get_engine_stats(workspace)
+        assert stats["react"]["tasks_attempted"] == 1.0
+        assert stats["react"]["tasks_failed"] == 0.0
+        assert stats == _stats_after_rebuild(workspace)
+
+    def test_deleting_every_run_clears_the_engine(self, workspace):
+        from codeframe.core import tasks
+        from codeframe.core.engine_stats import get_engine_stats, record_run
+
+        task = tasks.create(workspace, title="only")
+        record_run(workspace, str(uuid.uuid4()), "plan", task.id, "COMPLETED")
+
+        tasks.delete(workspace, task.id)
+
+        assert get_engine_stats(workspace) == {}
+
+
+class TestWindowedStats:
+    """Last-N-days stats come from the per-day rollups."""
+
+    def test_window_excludes_older_days(self, workspace):
+        from codeframe.core.engine_stats import get_engine_stats_window
+
+        _record(workspace, "react", "COMPLETED", duration_ms=1000)
+        _backdate(workspace, _record(workspace, "react", "FAILED", duration_ms=3000), 10)
+        _backdate(workspace, _record(workspace, "plan", "FAILED"), 40)
+        _stats_after_rebuild(workspace)
+
+        week = get_engine_stats_window(workspace, 7)
+        month = get_engine_stats_window(workspace, 30)
+
+        assert set(week) == {"react"}
+        assert week["react"]["tasks_attempted"] == 1.0
+        assert week["react"]["avg_duration_ms"] == 1000.0
+        assert set(month) == {"react"}
+        assert month["react"]["tasks_attempted"] == 2.0
+        assert month["react"]["avg_duration_ms"] == 2000.0
+
+    def test_window_filters_by_engine(self, workspace):
+        from codeframe.core.engine_stats import get_engine_stats_window
+
+        _record(workspace, "react", "COMPLETED")
+        _record(workspace, "plan", "COMPLETED")
+
+        assert set(get_engine_stats_window(workspace, 1, engine="plan")) == {"plan"}
+
+    def test_window_must_be_positive(self, workspace):
+        from codeframe.core.engine_stats import get_engine_stats_window
+
+        with pytest.raises(ValueError):
+            get_engine_stats_window(workspace, 0)
+
+
+def test_schema_upgrade_seeds_rollups_from_the_log(workspace):
+    from codeframe.core.engine_stats import get_engine_stats
+    from codeframe.core.workspace import get_workspace
+
+    _record(workspace, "react", "COMPLETED", duration_ms=10)
+    _record(workspace, "react", "FAILED", duration_ms=30)
+    conn = get_db_connection(workspace)
+    conn.execute("DROP TABLE engine_run_rollups")
+    conn.execute("DELETE FROM engine_stats")
+    conn.execute("PRAGMA user_version = 8")
+    conn.commit()
+    conn.close()
+
+    reloaded = get_workspace(workspace.repo_path)
+
+    stats = get_engine_stats(reloaded)
+    assert stats["react"]["tasks_attempted"] == 2.0
+    assert stats["react"]["avg_duration_ms"] == 20.0
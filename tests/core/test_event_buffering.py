@@ -0,0 +1,177 @@
+"""Tests for buffered (group-commit) event writes in codeframe/core/events.py."""
+
+import threading
+import time
+
+import pytest
+
+from codeframe.core import events
+from codeframe.core.events import BufferedEventWriter
+from codeframe.core.workspace import create_or_load_workspace, get_db_connection
+
+pytestmark = pytest.mark.v2
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    return create_or_load_workspace(tmp_path)
+
+
+@pytest.fixture
+def buffered():
+    writer = events.enable_buffered_writes(flush_interval=5.0)
+    yield writer
+    events.disable_buffered_writes()
+
+
+def _count(ws) -> int:
+    conn = get_db_connection(ws)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestBufferedEmit:
+    def test_events_are_not_written_until_flushed(self, workspace, buffered):
+        before = _count(workspace)
+        event = events.emit_for_workspace(workspace, "BUF", {"n": 1}, print_event=False)
+
+        assert event.id == 0
+        assert _count(workspace) == before
+
+        assert events.flush(timeout=5)
+        assert _count(workspace) == before + 1
+        assert event.id > 0
+
+    def test_flush_preserves_emit_order(self, workspace, buffered):
+        emitted = [
+            events.emit_for_workspace(workspace, "BUF", {"n": i}, print_event=False)
+            for i in range(50)
+        ]
+        events.flush(timeout=5)
+
+        ids = [e.id for e in emitted]
+        assert ids == sorted(ids)
+        recent = events.list_recent(workspace, limit=50)
+        assert [e.payload["n"] for e in reversed(recent)] == list(range(50))
+
+    def test_disable_flushes_outstanding_events(self, workspace):
+        events.enable_buffered_writes(flush_interval=5.0)
+        before = _count(workspace)
+        events.emit_for_workspace(workspace, "BUF", print_event=False)
+
+        events.disable_buffered_writes()
+
+        assert _count(workspace) == before + 1
+
+    def test_concurrent_emitters_all_land(self, workspace, buffered):
+        before = _count(workspace)
+
+        def worker():
+            for _ in range(25):
+                events.emit_for_workspace(workspace, "BUF", print_event=False)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        events.flush(timeout=5)
+
+        assert _count(workspace) == before + 100
+
+    def test_unbuffered_by_default(self, workspace):
+        event = events.emit_for_workspace(workspace, "SYNC", print_event=False)
+        assert event.id > 0
+
+
+class TestBufferedEventWriter:
+    def test_batch_size_triggers_a_commit_without_flush(self, workspace):
+        writer = BufferedEventWriter(flush_interval=60.0, max_batch=3)
+        try:
+            before = _count(workspace)
+            for i in range(3):
+                writer.submit(
+                    workspace,
+                    (workspace.id, "BUF", "{}", "2026-01-01T00:00:00+00:00"),
+                    events.Event(0, workspace.id, "BUF", {}, None),
+                )
+            for _ in range(100):
+                if _count(workspace) == before + 3:
+                    break
+                time.sleep(0.01)
+            assert _count(workspace) == before + 3
+        finally:
+            writer.close()
+
+    def test_full_queue_applies_back_pressure(self, workspace):
+        writer = BufferedEventWriter(flush_interval=0.01, max_queue=1)
+        try:
+            for _ in range(20):
+                assert writer.submit(
+                    workspace,
+                    (workspace.id, "BUF", "{}", "2026-01-01T00:00:00+00:00"),
+                    events.Event(0, workspace.id, "BUF", {}, None),
+                )
+            assert writer.flush(timeout=5)
+        finally:
+            writer.close()
+
+    def test_closed_writer_refuses_and_emit_falls_back(self, workspace):
+        writer = events.enable_buffered_writes()
+        writer.close()
+
+        assert not writer.submit(workspace, ("x", "BUF", "{}", "t"), None)
+        event = events.emit_for_workspace(workspace, "SYNC", print_event=False)
+        assert event.id > 0
+        events.disable_buffered_writes()
+
+    def test_write_failure_drops_batch_without_killing_writer(self, workspace):
+        writer = BufferedEventWriter(flush_interval=0.01)
+        try:
+            conn = get_db_connection(workspace)
+            conn.execute("DROP TABLE events")
+            conn.commit()
+            conn.close()
+
+            lost = events.Event(0, workspace.id, "BUF", {}, None)
+            writer.submit(workspace, (workspace.id, "BUF", "{}", "t"), lost)
+            assert writer.flush(timeout=5)
+            assert lost.id == 0
+            assert writer.alive
+        finally:
+            writer.close()
+
+
+class TestEmitWorkspaceCache:
+    def test_emit_by_repo_path_resolves_workspace_once(self, workspace, monkeypatch):
+        from codeframe.core import workspace as ws_mod
+
+        calls = []
+        real = ws_mod.get_workspace
+
+        def counting(path):
+            calls.append(path)
+            return real(path)
+
+        monkeypatch.setattr(ws_mod, "get_workspace", counting)
+        ws_mod._WORKSPACE_CACHE.clear()
+
+        for _ in range(5):
+            events.emit(workspace.id, "X", repo_path=workspace.repo_path, print_event=False)
+
+        assert len(calls) == 1
+
+    def test_recreated_workspace_is_reloaded(self, tmp_path):
+        import shutil
+
+        from codeframe.core.workspace import get_cached_workspace
+
+        first = create_or_load_workspace(tmp_path)
+        assert get_cached_workspace(tmp_path).id == first.id
+
+        shutil.rmtree(first.state_dir)
+        second = create_or_load_workspace(tmp_path)
+
+        assert get_cached_workspace(tmp_path).id == second.id
@@ -0,0 +1,197 @@
+"""Tests for push-based event tailing (codeframe/core/event_notifier.py).
+
+events.tail used to poll list_recent every 500ms; it now sleeps on the shared
+notifier and only queries after a commit wakes it — in-process directly,
+cross-process through the workspace's events.signal file.
+"""
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from codeframe.core import events
+from codeframe.core.event_notifier import EventNotifier
+from codeframe.core.streaming import EventPublisher
+from codeframe.core.workspace import create_or_load_workspace
+
+pytestmark = pytest.mark.v2
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    return create_or_load_workspace(tmp_path)
+
+
+class TestEventNotifier:
+    def test_notify_wakes_a_waiting_thread(self):
+        notifier = EventNotifier()
+        gen = notifier.generation("topic")
+        threading.Timer(0.05, notifier.notify, args=("topic",)).start()
+
+        assert notifier.wait("topic", gen, timeout=5)
+
+    def test_change_before_wait_is_not_lost(self):
+        notifier = EventNotifier()
+        gen = notifier.generation("topic")
+        notifier.notify("topic")
+
+        start = time.monotonic()
+        assert notifier.wait("topic", gen, timeout=5)
+        assert time.monotonic() - start < 0.5
+
+    def test_wait_times_out_without_a_change(self):
+        notifier = EventNotifier()
+        gen = notifier.generation("topic")
+        assert not notifier.wait("topic", gen, timeout=0.05)
+
+    def test_wait_async(self):
+        notifier = EventNotifier()
+
+        async def scenario():
+            gen = notifier.generation("topic")
+            threading.Timer(0.05, notifier.notify, args=("topic",)).start()
+            return await notifier.wait_async("topic", gen, timeout=5)
+
+        assert asyncio.run(scenario())
+
+    @pytest.mark.parametrize("use_inotify", [True, False], ids=["inotify", "poll"])
+    def test_other_process_signal_wakes_waiter(self, tmp_path, use_inotify):
+        notifier = EventNotifier(use_inotify=use_inotify)
+        signal = tmp_path / "events.signal"
+        gen = notifier.generation("topic", signal_path=signal)
+        time.sleep(0.1)  # let the watcher arm
+
+        writer = (
+            "import os, sys; fd = os.open(sys.argv[1], os.O_WRONLY | os.O_CREAT);"
+            "os.pwrite(fd, b'42'.ljust(32), 0); os.close(fd)"
+        )
+        subprocess.run([sys.executable, "-c", writer, str(signal)], check=True)
+
+        assert notifier.wait("topic", gen, timeout=5)
+
+    def test_own_signal_write_is_not_a_second_wakeup(self, tmp_path):
+        notifier = EventNotifier()
+        signal = tmp_path / "events.signal"
+        notifier.generation("topic", signal_path=signal)
+        time.sleep(0.1)
+
+        gen = notifier.generation("topic", signal_path=signal)
+        notifier.notify("topic", "7", signal_path=signal)
+        time.sleep(0.2)
+
+        assert notifier.generation("topic") == gen + 1
+
+    def test_notify_without_readers_keeps_no_topic(self):
+        notifier = EventNotifier()
+        for i in range(1000):
+            notifier.notify(EventPublisher.task_topic(f"t{i}"))
+
+        assert notifier._topics == {}
+
+    def test_idle_topics_are_forgotten(self):
+        notifier = EventNotifier(idle_timeout=0.05)
+        notifier.generation("old")
+        time.sleep(0.1)
+
+        notifier.generation("new")
+
+        assert set(notifier._topics) == {"new"}
+
+    def test_a_recreated_topic_does_not_hide_a_change(self):
+        notifier = EventNotifier(idle_timeout=0.05)
+        gen = notifier.generation("topic")
+        time.sleep(0.1)
+        notifier.generation("other")  # drops "topic"
+        notifier.notify("topic")
+
+        assert notifier.wait("topic", gen, timeout=0.05)
+
+
+class TestTail:
+    def test_tail_wakes_promptly_on_emit(self, workspace):
+        since = events.emit_for_workspace(workspace, "SEED", print_event=False).id
+        received = []
+
+        def follow():
+            for event in events.tail(workspace, since_id=since):
+                received.append((event, time.monotonic()))
+                return
+
+        t = threading.Thread(target=follow, daemon=True)
+        t.start()
+        time.sleep(0.2)
+        sent = time.monotonic()
+        events.emit_for_workspace(workspace, "LIVE", print_event=False)
+        t.join(5)
+
+        assert received and received[0][0].event_type == "LIVE"
+        assert received[0][1] - sent < 0.25
+
+    def test_idle_tail_does_not_query(self, workspace, monkeypatch):
+        queries = []
+        real = events._list_after
+
+        def counting(*args, **kwargs):
+            queries.append(1)
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(events, "_list_after", counting)
+        it = events.tail(workspace, since_id=10**9, max_wait=30)
+
+        t = threading.Thread(target=lambda: next(it, None), daemon=True)
+        t.start()
+        time.sleep(0.5)
+
+        assert len(queries) == 1
+
+    def test_backlog_is_replayed_oldest_first_without_gaps(self, workspace):
+        """Paging used to take the NEWEST 50 after since_id, silently skipping
+        the middle of any backlog longer than a page."""
+        emitted = [
+            events.emit_for_workspace(workspace, "BACKLOG", {"n": i}, print_event=False)
+            for i in range(260)
+        ]
+
+        got = []
+        for event in events.tail(workspace, since_id=emitted[0].id - 1):
+            got.append(event.payload["n"])
+            if len(got) == 260:
+                break
+
+        assert got == list(range(260))
+
+
+class TestLongPollHelpers:
+    def test_wait_for_change_async_wakes_on_emit(self, workspace):
+        async def scenario():
+            gen = events.change_generation(workspace)
+            loop = asyncio.get_running_loop()
+            loop.call_later(
+                0.05,
+                lambda: events.emit_for_workspace(workspace, "X", print_event=False),
+            )
+            return await events.wait_for_change_async(workspace, gen, timeout=5)
+
+        assert asyncio.run(scenario())
+
+
+class TestEventPublisherNotifier:
+    def test_publish_bumps_the_task_topic(self):
+        from codeframe.core.models import ProgressEvent
+
+        notifier = EventNotifier()
+        publisher = EventPublisher(notifier=notifier)
+        topic = EventPublisher.task_topic("t1")
+        gen = notifier.generation(topic)
+
+        asyncio.run(
+            publisher.publish(
+                "t1", ProgressEvent(task_id="t1", phase="p", step=0, total_steps=0)
+            )
+        )
+
+        assert notifier.generation(topic) == gen + 1
@@ -39,6 +39,7 @@ pytestmark = pytest.mark.v2
 #: execution_steps / llm_interactions / file_operations rows against them.
 _RUN_IDS = (
     "run-1",
+    "run-bg-1",
     "run-cmp-1",
     "run-edit-1",
     "run-fop-1",
@@ -300,6 +301,31 @@ class TestReactAgentRecording:
         assert len(interactions) == 2  # one per LLM call
         assert interactions[0].purpose == "execution"
 
+    @patch("codeframe.core.react_agent.gates")
+    @patch("codeframe.core.react_agent.TaskContextPackager")
+    def test_run_closes_a_background_recorder(
+        self, mock_ctx_loader, mock_gates, workspace, provider, mock_context
+    ):
+        """The agent stops the recorder's flusher thread and writes the remainder."""
+        from codeframe.core.react_agent import ReactAgent
+
+        provider.add_text_response("Done.")
+        mock_ctx_loader.return_value.load_context.return_value = mock_context
+        mock_gates.run.return_value = _gate_passed()
+
+        recorder = ExecutionRecorder(
+            workspace=workspace, run_id="run-bg-1", flush_interval=1000, background=True
+        )
+        flusher = recorder._flusher
+        ReactAgent(
+            workspace=workspace,
+            llm_provider=provider,
+            execution_recorder=recorder,
+        ).run("task-1")
+
+        assert not flusher.is_alive()
+        assert len(get_execution_steps(workspace, "run-bg-1")) == 1
+
     @patch("codeframe.core.react_agent.gates")
     @patch("codeframe.core.react_agent.execute_tool")
     @patch("codeframe.core.react_agent.TaskContextPackager")
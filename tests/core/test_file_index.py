@@ -0,0 +1,216 @@
+"""Tests for the shared workspace file index (codeframe/core/file_index.py).
+
+The index must list exactly what the per-call ``os.walk`` + ``fnmatch``
+scanners listed, and after the first walk rescan only directories whose
+listing changed — verified here by counting ``os.scandir`` calls.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+
+import pytest
+
+from codeframe.core import file_index
+from codeframe.core.context import DEFAULT_IGNORE_PATTERNS, ContextLoader
+from codeframe.core.file_index import FileIndex, IgnoreMatcher
+from codeframe.core.tools import _execute_list_files, _execute_search_codebase
+from codeframe.core.workspace import create_or_load_workspace
+
+pytestmark = pytest.mark.v2
+
+
+def _write(root, rel, text="x = 1\n"):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "repo"
+    _write(root, "app.py")
+    _write(root, "src/pkg/mod.py")
+    _write(root, "src/pkg/__pycache__/mod.cpython-311.pyc")
+    _write(root, "node_modules/left-pad/index.js")
+    _write(root, "web/node_modules/react/index.js")
+    _write(root, "web/src/main.ts")
+    _write(root, "poetry.lock")
+    return root
+
+
+@pytest.fixture
+def scandirs(monkeypatch):
+    """Directories passed to os.scandir by the index."""
+    calls = []
+    real = os.scandir
+
+    def counting(path):
+        calls.append(os.path.basename(str(path)) or "<root>")
+        return real(path)
+
+    monkeypatch.setattr(file_index.os, "scandir", counting)
+    return calls
+
+
+@pytest.fixture
+def no_racy_window(monkeypatch):
+    # Timestamps here are nanosecond-precise; the 2s safety margin would
+    # otherwise rescan everything the test just created.
+    monkeypatch.setattr(file_index, "_RACY_NS", 0)
+
+
+def _paths(index):
+    return [e.path for e in index.files()]
+
+
+class TestIgnoreMatcher:
+    @pytest.mark.parametrize(
+        "path",
+        ["app.py", "src/x.pyc", ".git", "build/out.js", "a/b.min.js",
+         "poetry.lock", "src/build/x.py", "package-lock.json", "docs/readme.md"],
+    )
+    def test_agrees_with_per_pattern_fnmatch(self, path):
+        expected = any(
+            fnmatch.fnmatch(path, p) or fnmatch.fnmatch(os.path.basename(path), p)
+            for p in DEFAULT_IGNORE_PATTERNS
+        )
+        assert IgnoreMatcher(DEFAULT_IGNORE_PATTERNS).matches(path) == expected
+
+    def test_directories_are_pruned_at_any_depth(self):
+        matcher = IgnoreMatcher(DEFAULT_IGNORE_PATTERNS)
+        assert matcher.matches_dir("web/node_modules")
+        assert matcher.matches_dir(".git")
+        assert not matcher.matches_dir("src/pkg")
+
+
+class TestFileIndex:
+    def test_lists_non_ignored_files(self, tree):
+        index = FileIndex(tree, DEFAULT_IGNORE_PATTERNS)
+        assert _paths(index) == ["app.py", "src/pkg/mod.py", "web/src/main.ts"]
+
+    def test_unchanged_tree_is_not_rescanned(self, tree, scandirs, no_racy_window):
+        index = FileIndex(tree, DEFAULT_IGNORE_PATTERNS)
+        index.refresh()
+        scandirs.clear()
+
+        assert index.refresh() is False
+        assert scandirs == []
+
+    def test_only_changed_directories_are_rescanned(self, tree, scandirs, no_racy_window):
+        index = FileIndex(tree, DEFAULT_IGNORE_PATTERNS)
+        index.refresh()
+        scandirs.clear()
+
+        _write(tree, "src/pkg/new.py")
+        (tree / "web" / "src" / "main.ts").unlink()
+
+        assert index.refresh() is True
+        assert sorted(scandirs) == ["pkg", "src"]
+        assert _paths(index) == ["app.py", "src/pkg/mod.py", "src/pkg/new.py"]
+
+    def test_removed_directory_drops_its_files(self, tree, no_racy_window):
+        index = FileIndex(tree, DEFAULT_IGNORE_PATTERNS)
+        index.refresh()
+        (tree / "src" / "pkg" / "mod.py").unlink()
+        (tree / "src" / "pkg" / "__pycache__" / "mod.cpython-311.pyc").unlink()
+        (tree / "src" / "pkg" / "__pycache__").rmdir()
+        (tree / "src" / "pkg").rmdir()
+
+        assert _paths(index) == ["app.py", "web/src/main.ts"]
+
+    def test_recent_directories_are_rescanned_despite_equal_mtime(self, tree, scandirs):
+        index = FileIndex(tree, DEFAULT_IGNORE_PATTERNS)
+        index.refresh()
+        scandirs.clear()
+
+        index.refresh()
+
+        # Everything was just written, so all of it is inside the racy window.
+        assert "pkg" in scandirs
+
+    def test_directory_symlinks_are_not_followed(self, tree, tmp_path):
+        outside = tmp_path / "outside"
+        _write(outside, "secret.py")
+        os.symlink(outside, tree / "linked")
+
+        assert "linked/secret.py" not in _paths(FileIndex(tree, DEFAULT_IGNORE_PATTERNS))
+
+    def test_persisted_index_starts_warm(self, tree, scandirs, no_racy_window):
+        state = tree / ".codeframe" / file_index.FILE_INDEX_NAME
+        state.parent.mkdir()
+        FileIndex(tree, DEFAULT_IGNORE_PATTERNS, state_path=state).refresh()
+        scandirs.clear()
+
+        fresh = FileIndex(tree, DEFAULT_IGNORE_PATTERNS, state_path=state)
+
+        assert _paths(fresh) == ["app.py", "src/pkg/mod.py", "web/src/main.ts"]
+        assert scandirs == []
+
+    def test_persisted_index_with_other_patterns_is_ignored(self, tree):
+        state = tree / ".codeframe" / file_index.FILE_INDEX_NAME
+        state.parent.mkdir()
+        FileIndex(tree, ["*.ts"], state_path=state).refresh()
+
+        fresh = FileIndex(tree, DEFAULT_IGNORE_PATTERNS, state_path=state)
+
+        assert "web/src/main.ts" in _paths(fresh)
+
+
+class TestForRoot:
+    def test_workspace_root_persists_and_worktree_does_not(self, tmp_path):
+        repo = tmp_path / "repo"
+        _write(repo, "a.py")
+        create_or_load_workspace(repo)
+        worktree = tmp_path / "wt"
+        _write(worktree, "a.py")
+
+        file_index.for_root(repo).refresh()
+        file_index.for_root(worktree).refresh()
+
+        assert (repo / ".codeframe" / file_index.FILE_INDEX_NAME).exists()
+        assert not (worktree / ".codeframe").exists()
+        assert file_index.for_root(repo) is file_index.for_root(repo)
+
+
+class TestConsumers:
+    def test_context_loader_reads_the_index(self, tree):
+        ws = create_or_load_workspace(tree)
+        paths = {f.path for f in ContextLoader(ws)._scan_file_tree()}
+        assert paths == {"app.py", os.path.join("src", "pkg", "mod.py"),
+                         os.path.join("web", "src", "main.ts")}
+
+    def test_list_files_respects_depth_and_pattern(self, tree):
+        result = _execute_list_files({"path": "src", "max_depth": 1}, tree, "t")
+        assert "mod.py" in result.content
+        result = _execute_list_files({"path": ".", "max_depth": 1}, tree, "t")
+        assert "mod.py" not in result.content
+        result = _execute_list_files({"path": ".", "pattern": "*.ts"}, tree, "t")
+        assert "main.ts" in result.content and "app.py" not in result.content
+
+    def test_list_files_reports_the_size_after_an_in_place_write(self, tree, no_racy_window):
+        _execute_list_files({"path": "."}, tree, "t")
+        (tree / "app.py").write_text("x" * 4000)  # directory mtime unchanged
+
+        result = _execute_list_files({"path": "."}, tree, "t")
+
+        assert "        4000  | app.py" in result.content
+
+    def test_context_loader_sizes_follow_in_place_writes(self, tree, no_racy_window):
+        loader = ContextLoader(create_or_load_workspace(tree))
+        loader._scan_file_tree()
+        (tree / "app.py").write_text("x" * 60000)
+
+        sizes = {f.path: f.size_bytes for f in loader._scan_file_tree()}
+
+        assert sizes["app.py"] == 60000
+
+    def test_search_sees_a_file_created_after_the_first_call(self, tree):
+        assert "(no matches)" in _execute_search_codebase({"pattern": "needle"}, tree, "t").content
+        _write(tree, "src/pkg/late.py", "needle = 1\n")
+
+        result = _execute_search_codebase({"pattern": "needle"}, tree, "t")
+
+        assert "late.py:1: needle = 1" in result.content
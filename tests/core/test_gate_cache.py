@@ -0,0 +1,173 @@
+"""Tests for the gate result cache (codeframe/core/gate_cache.py).
+
+The cache is only safe if the fingerprint moves whenever a gate's verdict
+could: any tracked, staged, dirty or untracked change. These pin that, the
+LRU eviction, and that ``gates.run`` serves hits marked ``cached=True``.
+"""
+
+import os
+import shutil
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from codeframe.core import gate_cache, gates
+from codeframe.core.gate_cache import GateCache, cache_key, tree_fingerprint
+from codeframe.core.gates import GateCheck, GateStatus
+from codeframe.core.workspace import create_or_load_workspace
+
+pytestmark = [
+    pytest.mark.v2,
+    pytest.mark.skipif(shutil.which("git") is None, reason="git not installed"),
+]
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.email=t@t", "-c", "user.name=t", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "app.py").write_text("x = 1\n")
+    _git(tmp_path, "add", "app.py")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+class TestTreeFingerprint:
+    def test_stable_for_an_unchanged_tree(self, repo):
+        assert tree_fingerprint(repo) == tree_fingerprint(repo)
+
+    def test_dirty_edit_changes_it(self, repo):
+        before = tree_fingerprint(repo)
+        (repo / "app.py").write_text("x = 2\n")
+        assert tree_fingerprint(repo) != before
+
+    def test_second_dirty_edit_changes_it_again(self, repo):
+        (repo / "app.py").write_text("x = 2\n")
+        first = tree_fingerprint(repo)
+        (repo / "app.py").write_text("x = 3\n")
+        assert tree_fingerprint(repo) != first
+
+    def test_untracked_file_changes_it(self, repo):
+        before = tree_fingerprint(repo)
+        (repo / "new.py").write_text("")
+        assert tree_fingerprint(repo) != before
+
+    def test_deleted_file_changes_it(self, repo):
+        before = tree_fingerprint(repo)
+        (repo / "app.py").unlink()
+        assert tree_fingerprint(repo) != before
+
+    def test_state_dir_and_tool_caches_are_ignored(self, repo):
+        before = tree_fingerprint(repo)
+        (repo / ".codeframe" / "gate_cache").mkdir(parents=True)
+        (repo / ".codeframe" / "gate_cache" / "x.json").write_text("{}")
+        (repo / "__pycache__").mkdir()
+        (repo / "__pycache__" / "app.pyc").write_bytes(b"\0")
+        assert tree_fingerprint(repo) == before
+
+    def test_none_outside_git(self, tmp_path):
+        assert tree_fingerprint(tmp_path) is None
+
+
+class TestCacheKey:
+    def test_selector_and_config_are_part_of_the_key(self, repo):
+        tree = tree_fingerprint(repo)
+        plain = cache_key(repo, "pytest", tree)
+        assert cache_key(repo, "pytest", tree, test_selector="test_a") != plain
+        (repo / "pytest.ini").write_text("[pytest]\n")
+        assert cache_key(repo, "pytest", tree) != plain
+
+    def test_gates_do_not_share_keys(self, repo):
+        tree = tree_fingerprint(repo)
+        assert cache_key(repo, "ruff", tree) != cache_key(repo, "mypy", tree)
+
+
+class TestGateCache:
+    def test_round_trip(self, tmp_path):
+        cache = GateCache(tmp_path)
+        cache.put("k", {"name": "ruff", "status": "PASSED"})
+        assert cache.get("k") == {"name": "ruff", "status": "PASSED"}
+
+    @pytest.mark.parametrize("status", ["SKIPPED", "ERROR"])
+    def test_non_verdicts_are_not_stored(self, tmp_path, status):
+        cache = GateCache(tmp_path)
+        cache.put("k", {"name": "ruff", "status": status})
+        assert cache.get("k") is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = GateCache(tmp_path)
+        (tmp_path / "k.json").write_text("{not json")
+        assert cache.get("k") is None
+        assert not (tmp_path / "k.json").exists()
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = GateCache(tmp_path, max_entries=2)
+        cache.put("a", {"status": "PASSED"})
+        cache.put("b", {"status": "PASSED"})
+        os.utime(tmp_path / "a.json", ns=(1, 1))
+        os.utime(tmp_path / "b.json", ns=(2, 2))
+        cache.get("a")  # touches a: b is now the oldest
+        cache.put("c", {"status": "PASSED"})
+        assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["a", "c"]
+
+    def test_evicts_by_size(self, tmp_path):
+        cache = GateCache(tmp_path, max_bytes=1)
+        cache.put("a", {"status": "PASSED", "output": "x" * 100})
+        assert list(tmp_path.glob("*.json")) == []
+
+
+class TestRunUsesCache:
+    @pytest.fixture
+    def workspace(self, repo):
+        return create_or_load_workspace(repo)
+
+    def _run(self, workspace, calls, **kwargs):
+        def fake_gate(name, *args, **kw):
+            calls.append(name)
+            return GateCheck(name=name, status=GateStatus.PASSED, exit_code=0, output="ok")
+
+        with patch(
+            "codeframe.core.gates._ensure_dependencies_installed",
+            return_value=(True, "ok"),
+        ), patch("codeframe.core.gates._run_gate", side_effect=fake_gate):
+            return gates.run(workspace, gates=["ruff", "mypy"], max_cpu=1, **kwargs)
+
+    def test_unchanged_tree_is_served_from_cache(self, workspace):
+        calls: list[str] = []
+        first = self._run(workspace, calls, use_cache=True)
+        second = self._run(workspace, calls, use_cache=True)
+
+        assert calls == ["ruff", "mypy"]
+        assert [c.cached for c in first.checks] == [False, False]
+        assert [c.cached for c in second.checks] == [True, True]
+        assert second.passed
+        assert second.checks[0].output == "ok"
+
+    def test_edit_invalidates(self, workspace):
+        calls: list[str] = []
+        self._run(workspace, calls, use_cache=True)
+        (workspace.repo_path / "app.py").write_text("x = 2\n")
+        self._run(workspace, calls, use_cache=True)
+        assert calls == ["ruff", "mypy", "ruff", "mypy"]
+
+    def test_use_cache_false_always_runs(self, workspace):
+        calls: list[str] = []
+        self._run(workspace, calls, use_cache=True)
+        result = self._run(workspace, calls, use_cache=False)
+        assert calls == ["ruff", "mypy", "ruff", "mypy"]
+        assert not any(c.cached for c in result.checks)
+
+    def test_bypassed_context_disables_the_default(self, workspace, monkeypatch):
+        monkeypatch.delenv(gate_cache.GATE_CACHE_ENV, raising=False)
+        calls: list[str] = []
+        self._run(workspace, calls)
+        with gate_cache.bypassed():
+            self._run(workspace, calls)
+        assert calls == ["ruff", "mypy", "ruff", "mypy"]
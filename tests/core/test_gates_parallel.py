@@ -0,0 +1,139 @@
+"""Tests for concurrent gate execution in ``gates.run``.
+
+Independent gates overlap within a CPU budget; ``npm-build`` runs alone; the
+result order never depends on which gate finished first; and each gate's wall
+time reaches the GATES_COMPLETED payload.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from codeframe.core import events, gates
+from codeframe.core.gates import GateCheck, GateStatus, _gate_cost, _schedule_gates
+from codeframe.core.workspace import create_or_load_workspace
+
+pytestmark = pytest.mark.v2
+
+
+class _Recorder:
+    """A fake gate runner that sleeps and tracks how many gates overlap."""
+
+    def __init__(self, delays: dict[str, float]):
+        self.delays = delays
+        self.lock = threading.Lock()
+        self.active: set[str] = set()
+        self.overlaps: list[frozenset[str]] = []
+        self.peak = 0
+
+    def __call__(self, name: str) -> GateCheck:
+        with self.lock:
+            self.active.add(name)
+            self.overlaps.append(frozenset(self.active))
+            self.peak = max(self.peak, len(self.active))
+        time.sleep(self.delays.get(name, 0.05))
+        with self.lock:
+            self.active.discard(name)
+        return GateCheck(name=name, status=GateStatus.PASSED)
+
+
+class TestScheduleGates:
+    def test_results_follow_input_order_not_completion_order(self):
+        runner = _Recorder({"ruff": 0.15, "mypy": 0.01, "bandit": 0.08})
+        checks = _schedule_gates(["ruff", "mypy", "bandit"], runner, max_cpu=4)
+        assert [c.name for c in checks] == ["ruff", "mypy", "bandit"]
+
+    def test_independent_gates_overlap(self):
+        names = ["ruff", "mypy", "bandit", "tsc"]
+        runner = _Recorder({n: 0.2 for n in names})
+        start = time.monotonic()
+        _schedule_gates(names, runner, max_cpu=4)
+        elapsed = time.monotonic() - start
+        assert runner.peak == 4
+        assert elapsed < 0.6
+
+    def test_max_cpu_bounds_concurrency(self):
+        names = ["ruff", "mypy", "bandit", "tsc"]
+        runner = _Recorder({n: 0.05 for n in names})
+        _schedule_gates(names, runner, max_cpu=2)
+        assert runner.peak == 2
+
+    def test_test_runners_take_two_slots(self):
+        runner = _Recorder({"pytest": 0.1, "ruff": 0.1, "mypy": 0.1})
+        _schedule_gates(["pytest", "ruff", "mypy"], runner, max_cpu=3)
+        assert frozenset({"pytest", "ruff", "mypy"}) not in runner.overlaps
+
+    def test_exclusive_gate_runs_alone(self):
+        names = ["ruff", "npm-build", "tsc", "npm-lint"]
+        runner = _Recorder({n: 0.05 for n in names})
+        _schedule_gates(names, runner, max_cpu=8)
+        assert all(
+            s == {"npm-build"} for s in runner.overlaps if "npm-build" in s
+        )
+
+    def test_max_cpu_one_is_sequential(self):
+        runner = _Recorder({})
+        _schedule_gates(["ruff", "mypy", "tsc"], runner, max_cpu=1)
+        assert runner.peak == 1
+
+    def test_raising_gate_becomes_error_without_stopping_the_rest(self):
+        def runner(name: str) -> GateCheck:
+            if name == "mypy":
+                raise RuntimeError("boom")
+            return GateCheck(name=name, status=GateStatus.PASSED)
+
+        checks = _schedule_gates(["ruff", "mypy", "tsc"], runner, max_cpu=4)
+        assert [c.status for c in checks] == [
+            GateStatus.PASSED, GateStatus.ERROR, GateStatus.PASSED,
+        ]
+        assert "boom" in checks[1].output
+
+    def test_wall_time_fills_missing_duration(self):
+        runner = _Recorder({"ruff": 0.05})
+        (check,) = _schedule_gates(["ruff"], runner, max_cpu=4)
+        assert check.duration_ms >= 50
+
+    def test_cost_is_clamped_to_budget(self):
+        assert _gate_cost("pytest", 1) == 1
+        assert _gate_cost("npm-build", 6) == 6
+        assert _gate_cost("ruff", 6) == 1
+
+
+class TestMaxCpuSetting:
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv(gates.GATE_MAX_CPU_ENV, "3")
+        assert gates._gate_max_cpu() == 3
+
+    @pytest.mark.parametrize("raw", ["lots", "0", "-2"])
+    def test_bad_value_falls_back_to_cpu_count(self, monkeypatch, raw):
+        monkeypatch.setenv(gates.GATE_MAX_CPU_ENV, raw)
+        with patch("codeframe.core.gates.os.cpu_count", return_value=5):
+            assert gates._gate_max_cpu() == 5
+
+
+class TestRunPayload:
+    def test_gates_completed_records_each_gate_duration(self, tmp_path):
+        workspace = create_or_load_workspace(tmp_path)
+        runner = _Recorder({"ruff": 0.05, "mypy": 0.02})
+
+        with patch(
+            "codeframe.core.gates._ensure_dependencies_installed",
+            return_value=(True, "ok"),
+        ), patch(
+            "codeframe.core.gates._run_gate",
+            side_effect=lambda name, *a, **kw: runner(name),
+        ), patch("codeframe.core.gates.events.emit_for_workspace") as emit:
+            result = gates.run(workspace, gates=["ruff", "mypy"], max_cpu=2)
+
+        assert [c.name for c in result.checks] == ["ruff", "mypy"]
+        completed = [
+            call.args[2] for call in emit.call_args_list
+            if call.args[1] == events.EventType.GATES_COMPLETED
+        ]
+        assert len(completed) == 1
+        payload = completed[0]
+        assert [c["name"] for c in payload["checks"]] == ["ruff", "mypy"]
+        assert payload["checks"][0]["duration_ms"] >= 50
+        assert payload["duration_ms"] >= payload["checks"][0]["duration_ms"]
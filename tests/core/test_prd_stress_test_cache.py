@@ -0,0 +1,150 @@
+"""Tests for the memoized PRD stress test (DecompositionCache).
+
+A re-run must reuse the stored answers for goals whose PRD sections did not
+change and pay only for the ones that did. Reused answers must not spend the
+call budget, and the stream has to say how many were reused.
+"""
+
+import json
+
+import pytest
+
+from codeframe.adapters.llm.base import LLMResponse
+from codeframe.adapters.llm.mock import MockProvider
+from codeframe.core.prd_stress_test import (
+    DecompositionCache,
+    prd_section_hash,
+    stress_test_prd,
+    stress_test_prd_stream,
+)
+from codeframe.core.workspace import create_or_load_workspace
+
+pytestmark = pytest.mark.v2
+
+PRD = """# Invoice SaaS
+
+## User Authentication
+Users register with email and password.
+
+## PDF Export
+Invoices export to PDF.
+"""
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DecompositionCache(create_or_load_workspace(tmp_path))
+
+
+def _provider(answers=None):
+    """Two goals; every goal splits into two atomic parts."""
+    provider = MockProvider()
+    answers = answers or {}
+
+    def handler(messages):
+        content = messages[0]["content"]
+        if not content.startswith("Goal: "):
+            return LLMResponse(content=json.dumps(["User Authentication", "PDF Export"]))
+        title = content.splitlines()[0][len("Goal: "):]
+        if title in answers:
+            return LLMResponse(content=answers[title])
+        if title.endswith(" part"):
+            return LLMResponse(content=json.dumps({"classification": "atomic"}))
+        return LLMResponse(content=json.dumps({
+            "classification": "composite",
+            "children": [
+                {"title": f"{title} part", "description": "a"},
+                {"title": f"{title} part", "description": "b"},
+            ],
+        }))
+
+    provider.set_response_handler(handler)
+    return provider
+
+
+def _titles(provider):
+    return [
+        c["messages"][0]["content"].splitlines()[0]
+        for c in provider.calls
+        if c["messages"][0]["content"].startswith("Goal: ")
+    ]
+
+
+class TestReuse:
+    def test_unchanged_prd_reruns_without_llm_calls(self, cache):
+        first = stress_test_prd(PRD, _provider(), cache=cache)
+        provider = _provider()
+
+        second = stress_test_prd(PRD, provider, cache=cache)
+
+        assert provider.call_count == 0
+        # 1 goal list + 2 goals + 4 parts.
+        assert (first.cache_hits, second.cache_hits) == (0, 7)
+        assert second.tech_spec_markdown == first.tech_spec_markdown
+
+    def test_editing_a_section_only_reasks_its_goal(self, cache):
+        stress_test_prd(PRD, _provider(), cache=cache)
+        provider = _provider()
+
+        edited = PRD.replace("Invoices export to PDF.", "Invoices export to PDF and CSV.")
+        result = stress_test_prd(edited, provider, cache=cache)
+
+        # The goal list is re-extracted (the document changed), then only the
+        # PDF Export subtree is classified again.
+        assert provider.call_count == 4
+        assert all("PDF Export" in t for t in _titles(provider))
+        assert result.cache_hits == 3
+
+    def test_without_a_cache_nothing_is_reused(self, cache):
+        stress_test_prd(PRD, _provider(), cache=cache)
+        provider = _provider()
+        result = stress_test_prd(PRD, provider)
+        assert provider.call_count == 7
+        assert result.cache_hits == 0
+
+    def test_unparseable_answers_are_not_cached(self, cache):
+        stress_test_prd(PRD, _provider({"PDF Export": "not json"}), cache=cache)
+        provider = _provider()
+
+        stress_test_prd(PRD, provider, cache=cache)
+
+        assert _titles(provider) == ["Goal: PDF Export"] + ["Goal: PDF Export part"] * 2
+
+    def test_reused_ambiguities_get_fresh_ids(self, cache):
+        answers = {"PDF Export": json.dumps({
+            "classification": "ambiguous", "ambiguity_label": "FORMAT",
+            "questions": ["Which?"], "recommendation": "Say",
+        })}
+        first = stress_test_prd(PRD, _provider(answers), cache=cache)
+        second = stress_test_prd(PRD, _provider(answers), cache=cache)
+
+        assert [a.label for a in second.ambiguities] == ["FORMAT"]
+        assert second.ambiguities[0].id != first.ambiguities[0].id
+
+
+class TestStreamReportsSavings:
+    async def test_cache_hits_do_not_spend_the_budget(self, cache):
+        stress_test_prd(PRD, _provider(), cache=cache)
+
+        events = [
+            ev async for ev in stress_test_prd_stream(PRD, _provider(), cache=cache)
+        ]
+
+        complete = events[-1]
+        assert complete["type"] == "complete"
+        assert (complete["llm_calls"], complete["cache_hits"]) == (0, 7)
+        assert events[0]["cache_hits"] == 1
+
+
+class TestSectionHash:
+    def test_only_the_goals_sections_matter(self):
+        base = prd_section_hash("PDF Export", PRD)
+        auth_edit = PRD.replace("email and password", "SSO")
+        pdf_edit = PRD.replace("to PDF.", "to PDF/A.")
+
+        assert prd_section_hash("PDF Export", auth_edit) == base
+        assert prd_section_hash("PDF Export", pdf_edit) != base
+
+    def test_unmatched_goal_is_keyed_by_the_whole_document(self):
+        base = prd_section_hash("Billing", PRD)
+        assert prd_section_hash("Billing", PRD + "\nmore") != base
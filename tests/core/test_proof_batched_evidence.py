@@ -0,0 +1,185 @@
+"""Tests for the per-run proof session in proof/runner.py.
+
+A proof run resolves every enforced evidence rule from one pytest invocation
+with a JUnit report, and runs each whole gate once however many requirements
+share it. The per-rule verdicts must be the ones a scoped run per rule gives:
+"named test missing" is distinct from "collected but failing".
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from codeframe.core.gates import GateCheck, GateResult, GateStatus, _parse_junit_cases
+from codeframe.core.proof.ledger import init_proof_tables, save_requirement
+from codeframe.core.proof.models import (
+    EvidenceRule,
+    Gate,
+    GateOutcome,
+    Obligation,
+    Requirement,
+    RequirementScope,
+    ReqStatus,
+    Severity,
+    Source,
+)
+from codeframe.core.proof.runner import _case_matches, run_proof
+from codeframe.core.workspace import Workspace, create_or_load_workspace
+
+pytestmark = pytest.mark.v2
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Workspace:
+    ws = create_or_load_workspace(tmp_path)
+    init_proof_tables(ws)
+    return ws
+
+
+def _req(req_id: str, gate: Gate, test_ids: list[str]) -> Requirement:
+    return Requirement(
+        id=req_id,
+        title=req_id,
+        description="test",
+        severity=Severity.MEDIUM,
+        source=Source.QA,
+        scope=RequirementScope(files=["x.py"]),
+        obligations=[Obligation(gate=gate)],
+        evidence_rules=[EvidenceRule(test_id=t, gate=gate) for t in test_ids],
+        status=ReqStatus.OPEN,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+_CASES = [
+    {"classname": "tests.test_calc.TestCalc", "name": "test_unit_a", "outcome": "passed"},
+    {"classname": "tests.test_calc", "name": "test_unit_b[1]", "outcome": "failed"},
+    {"classname": "tests.test_calc", "name": "test_unit_c", "outcome": "skipped"},
+]
+
+
+class _FakeGates:
+    """Stands in for gates.run; answers the batched pytest run with _CASES."""
+
+    def __init__(self, cases=_CASES, exit_code=1):
+        self.cases = cases
+        self.exit_code = exit_code
+        self.calls: list[dict] = []
+
+    def __call__(self, ws, gates=None, verbose=False, test_selector=None, **kw):
+        self.calls.append({"gates": gates, "test_selector": test_selector, **kw})
+        if gates == ["pytest"] and kw.get("collect_test_cases"):
+            check = GateCheck(
+                name="pytest", status=GateStatus.FAILED,
+                exit_code=self.exit_code, test_cases=self.cases,
+            )
+            return GateResult(passed=False, checks=[check])
+        if gates == ["pytest"]:
+            # A scoped fallback run: report the selector as missing.
+            check = GateCheck(name="pytest", status=GateStatus.FAILED, exit_code=5)
+            return GateResult(passed=False, checks=[check])
+        check = GateCheck(name=gates[0], status=GateStatus.PASSED, exit_code=0)
+        return GateResult(passed=True, checks=[check])
+
+
+class TestCaseMatches:
+    def test_matches_test_name_substring(self):
+        assert _case_matches("test_unit_b", _CASES[1])
+
+    def test_matches_parent_names(self):
+        assert _case_matches("TestCalc", _CASES[0])
+        assert _case_matches("test_calc", _CASES[2])
+
+    def test_is_case_insensitive(self):
+        assert _case_matches("TEST_UNIT_A", _CASES[0])
+
+    def test_no_match(self):
+        assert not _case_matches("test_unit_z", _CASES[0])
+
+
+class TestParseJunit:
+    def test_outcomes(self, tmp_path):
+        report = tmp_path / "r.xml"
+        report.write_text(
+            '<testsuites><testsuite>'
+            '<testcase classname="t.m" name="test_ok"/>'
+            '<testcase classname="t.m" name="test_bad"><failure message="x"/></testcase>'
+            '<testcase classname="t.m" name="test_err"><error message="x"/></testcase>'
+            '<testcase classname="t.m" name="test_skip"><skipped message="x"/></testcase>'
+            '</testsuite></testsuites>'
+        )
+        outcomes = [c["outcome"] for c in _parse_junit_cases(report)]
+        assert outcomes == ["passed", "failed", "failed", "skipped"]
+
+    def test_unreadable_report_is_none(self, tmp_path):
+        (tmp_path / "r.xml").write_text("<not xml")
+        assert _parse_junit_cases(tmp_path / "r.xml") is None
+        assert _parse_junit_cases(tmp_path / "missing.xml") is None
+
+
+class TestBatchedRules:
+    def test_one_pytest_run_answers_every_rule(self, workspace):
+        save_requirement(workspace, _req("REQ-1", Gate.UNIT, ["test_unit_a"]))
+        save_requirement(workspace, _req("REQ-2", Gate.UNIT, ["test_unit_b"]))
+        save_requirement(workspace, _req("REQ-3", Gate.UNIT, ["test_unit_missing", "test_unit_c"]))
+        fake = _FakeGates()
+
+        with patch("codeframe.core.gates.run", side_effect=fake):
+            results = run_proof(workspace, full=True)
+
+        assert len(fake.calls) == 1
+        assert fake.calls[0]["test_selector"] == (
+            "test_unit_a or test_unit_b or test_unit_c or test_unit_missing"
+        )
+        assert results["REQ-1"] == [(Gate.UNIT, GateOutcome.PASSED)]
+        assert results["REQ-2"] == [(Gate.UNIT, GateOutcome.FAILED)]
+        assert results["REQ-3"] == [(Gate.UNIT, GateOutcome.FAILED)]
+
+    def test_missing_and_failing_are_reported_distinctly(self, workspace):
+        save_requirement(workspace, _req("REQ-1", Gate.UNIT, ["test_unit_b", "test_unit_missing"]))
+        fake = _FakeGates()
+
+        with patch("codeframe.core.gates.run", side_effect=fake):
+            run_proof(workspace, full=True, run_id="distinct")
+
+        artifact = workspace.state_dir / "proof_artifacts" / "REQ-1_unit_distinct.txt"
+        text = artifact.read_text()
+        assert "test_unit_b: FAILED (FAILED)" in text
+        assert "test_unit_missing: FAILED — named test missing (not collected)" in text
+
+    def test_no_report_falls_back_to_scoped_runs(self, workspace):
+        save_requirement(workspace, _req("REQ-1", Gate.UNIT, ["test_unit_a", "test_unit_b"]))
+        fake = _FakeGates(cases=None)
+
+        with patch("codeframe.core.gates.run", side_effect=fake):
+            run_proof(workspace, full=True)
+
+        scoped = [c["test_selector"] for c in fake.calls if not c.get("collect_test_cases")]
+        assert scoped == ["test_unit_a", "test_unit_b"]
+
+    def test_interrupted_session_falls_back_to_scoped_runs(self, workspace):
+        save_requirement(workspace, _req("REQ-1", Gate.UNIT, ["test_unit_a"]))
+        fake = _FakeGates(exit_code=2)
+
+        with patch("codeframe.core.gates.run", side_effect=fake):
+            run_proof(workspace, full=True)
+
+        assert [c["test_selector"] for c in fake.calls] == ["test_unit_a", "test_unit_a"]
+
+
+class TestWholeGateMemo:
+    def test_shared_gate_runs_once_per_proof_run(self, workspace):
+        save_requirement(workspace, _req("REQ-1", Gate.SEC, []))
+        save_requirement(workspace, _req("REQ-2", Gate.SEC, []))
+        fake = _FakeGates()
+
+        with patch("codeframe.core.gates.run", side_effect=fake):
+            results = run_proof(workspace, full=True)
+            run_proof(workspace, full=True)
+
+        # Memoized within a run, never across runs.
+        assert [c["gates"] for c in fake.calls] == [["bandit"], ["bandit"]]
+        assert results["REQ-1"] == [(Gate.SEC, GateOutcome.PASSED)]
+        assert results["REQ-2"] == [(Gate.SEC, GateOutcome.PASSED)]
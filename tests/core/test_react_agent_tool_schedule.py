@@ -0,0 +1,193 @@
+"""Tests for concurrent read-only tool calls within one ReAct turn.
+
+A response that fans out into several reads runs them side by side; writes
+still run alone and in order, and results, events and early stops look
+exactly as they did when every call ran inline.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from codeframe.adapters.llm.base import ToolCall, ToolResult
+from codeframe.adapters.llm.mock import MockProvider
+from codeframe.core.agent import AgentStatus
+from codeframe.core.context import TaskContext
+from codeframe.core.events import EventType
+from codeframe.core.gates import GateCheck, GateResult, GateStatus
+from codeframe.core.react_agent import ReactAgent, _ToolSchedule
+from codeframe.core.tasks import Task, TaskStatus
+from codeframe.core.workspace import Workspace
+
+pytestmark = pytest.mark.v2
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    state_dir = tmp_path / ".codeframe"
+    state_dir.mkdir()
+    return Workspace(
+        id="ws-test",
+        repo_path=tmp_path,
+        state_dir=state_dir,
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        tech_stack="Python with uv",
+    )
+
+
+@pytest.fixture
+def context():
+    ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return TaskContext(task=Task(
+        id="task-1", workspace_id="ws-test", prd_id=None, title="t", description="d",
+        status=TaskStatus.IN_PROGRESS, priority=1, created_at=ts, updated_at=ts,
+    ))
+
+
+def _calls(*names: str) -> list[ToolCall]:
+    return [ToolCall(id=f"tc{i}", name=n, input={"path": f"f{i}.py"}) for i, n in enumerate(names)]
+
+
+class _Recorder:
+    """A tool executor that logs when each call starts and finishes."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.log: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, tc: ToolCall) -> ToolResult:
+        with self._lock:
+            self.log.append(("start", tc.id))
+        time.sleep(self.delay)
+        with self._lock:
+            self.log.append(("end", tc.id))
+        return ToolResult(tool_call_id=tc.id, content=f"out {tc.id}")
+
+
+class TestToolSchedule:
+    def test_reads_run_concurrently_and_return_in_call_order(self):
+        calls = _calls("read_file", "search_codebase", "list_files", "read_file")
+        barrier = threading.Barrier(len(calls), timeout=5)
+
+        def execute(tc):
+            barrier.wait()  # deadlocks unless all four are in flight at once
+            return ToolResult(tool_call_id=tc.id, content=f"out {tc.id}")
+
+        schedule = _ToolSchedule(calls, execute)
+
+        assert [schedule.result(i).tool_call_id for i in range(4)] == ["tc0", "tc1", "tc2", "tc3"]
+
+    def test_fan_out_takes_about_the_slowest_call(self):
+        recorder = _Recorder(delay=0.2)
+        schedule = _ToolSchedule(_calls(*["read_file"] * 6), recorder)
+
+        start = time.perf_counter()
+        for i in range(6):
+            schedule.result(i)
+
+        assert time.perf_counter() - start < 0.2 * 3
+
+    def test_writes_are_serialized_between_reads(self):
+        recorder = _Recorder()
+        calls = _calls("read_file", "read_file", "edit_file", "read_file", "run_tests")
+        schedule = _ToolSchedule(calls, recorder)
+
+        for i in range(len(calls)):
+            schedule.result(i)
+
+        log = recorder.log
+        edit_start = log.index(("start", "tc2"))
+        assert log.index(("end", "tc0")) < edit_start
+        assert log.index(("end", "tc1")) < edit_start
+        assert log.index(("end", "tc2")) < log.index(("start", "tc3"))
+        assert log.index(("end", "tc3")) < log.index(("start", "tc4"))
+
+    def test_a_write_after_an_early_stop_never_runs(self):
+        recorder = _Recorder(delay=0.0)
+        schedule = _ToolSchedule(_calls("read_file", "read_file", "create_file"), recorder)
+
+        schedule.result(0)
+
+        time.sleep(0.05)
+        assert ("start", "tc2") not in recorder.log
+
+    def test_errors_surface_at_their_own_call(self):
+        def execute(tc):
+            if tc.id == "tc1":
+                raise RuntimeError("boom")
+            return ToolResult(tool_call_id=tc.id, content="ok")
+
+        schedule = _ToolSchedule(_calls("read_file", "read_file"), execute)
+
+        assert schedule.result(0).content == "ok"
+        with pytest.raises(RuntimeError, match="boom"):
+            schedule.result(1)
+
+
+class TestReactLoopFanOut:
+    @patch("codeframe.core.react_agent.events")
+    @patch("codeframe.core.react_agent.gates")
+    @patch("codeframe.core.react_agent.execute_tool")
+    @patch("codeframe.core.react_agent.TaskContextPackager")
+    def test_results_and_events_keep_call_order(
+        self, mock_ctx_loader, mock_exec_tool, mock_gates, mock_events, workspace, context,
+    ):
+        provider = MockProvider()
+        calls = _calls("read_file", "read_file", "search_codebase")
+        provider.add_tool_response(calls)
+        provider.add_text_response("Done.")
+        mock_ctx_loader.return_value.load_context.return_value = context
+        mock_gates.run.return_value = GateResult(
+            passed=True, checks=[GateCheck(name="ruff", status=GateStatus.PASSED)]
+        )
+        # The first call finishes last; the order seen by the model must not change.
+        delays = {"tc0": 0.1, "tc1": 0.0, "tc2": 0.05}
+
+        def execute(tc, _path):
+            time.sleep(delays[tc.id])
+            return ToolResult(tool_call_id=tc.id, content=f"out {tc.id}")
+
+        mock_exec_tool.side_effect = execute
+
+        status = ReactAgent(workspace=workspace, llm_provider=provider).run("task-1")
+
+        assert status == AgentStatus.COMPLETED
+        tool_turn = provider.calls[1]["messages"][-1]
+        assert [r["tool_call_id"] for r in tool_turn["tool_results"]] == ["tc0", "tc1", "tc2"]
+        tool_events = [
+            (c.args[1], c.args[2].get("tool_call_id"))
+            for c in mock_events.emit_for_workspace.call_args_list
+            if c.args[1] in (EventType.AGENT_TOOL_DISPATCHED, EventType.AGENT_TOOL_RESULT)
+        ]
+        assert tool_events == [
+            (event, f"tc{i}")
+            for i in range(3)
+            for event in (EventType.AGENT_TOOL_DISPATCHED, EventType.AGENT_TOOL_RESULT)
+        ]
+
+    @patch("codeframe.core.react_agent.gates")
+    @patch("codeframe.core.react_agent.execute_tool")
+    @patch("codeframe.core.react_agent.TaskContextPackager")
+    def test_blocking_read_error_still_skips_later_writes(
+        self, mock_ctx_loader, mock_exec_tool, mock_gates, workspace, context,
+    ):
+        provider = MockProvider()
+        provider.add_tool_response(_calls("read_file", "read_file", "edit_file"))
+        mock_ctx_loader.return_value.load_context.return_value = context
+
+        def execute(tc, _path):
+            if tc.id == "tc0":
+                return ToolResult(tool_call_id=tc.id, content="Access denied", is_error=True)
+            return ToolResult(tool_call_id=tc.id, content="ok")
+
+        mock_exec_tool.side_effect = execute
+
+        with patch("codeframe.core.react_agent.blockers"):
+            status = ReactAgent(workspace=workspace, llm_provider=provider).run("task-1")
+
+        assert status == AgentStatus.BLOCKED
+        assert "edit_file" not in [c.args[0].name for c in mock_exec_tool.call_args_list]
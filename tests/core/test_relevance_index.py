@@ -0,0 +1,135 @@
+"""Tests for content-based context ranking (codeframe/core/relevance_index.py).
+
+Files are ranked by BM25 over identifier terms, with a boost for defining a
+symbol the task names, so the token budget goes to the code a task is about
+rather than to files that merely have matching names.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from codeframe.core import relevance_index, tasks
+from codeframe.core.context import CODE_EXTENSIONS, ContextLoader
+from codeframe.core.file_index import FileIndex
+from codeframe.core.relevance_index import RelevanceIndex, defined_symbols, term_counts
+from codeframe.core.workspace import create_or_load_workspace
+
+pytestmark = pytest.mark.v2
+
+
+def _write(root, rel, text):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    _write(root, "billing/ledger.py", "class Ledger:\n    def post(self, entry):\n        pass\n")
+    _write(root, "billing/invoice.py", (
+        "from billing.ledger import Ledger\n\n"
+        "class InvoiceExporter:\n"
+        "    def export_invoice(self, invoice):\n"
+        "        return render_invoice(invoice)\n"
+    ))
+    _write(root, "auth/session.py", "def refresh_session(token):\n    return token\n")
+    _write(root, "auth/invoice_notes.md", "Nothing about exporting here.\n")
+    return root
+
+
+def _index(root, **kwargs):
+    return RelevanceIndex(FileIndex(root, []), extensions=CODE_EXTENSIONS, **kwargs)
+
+
+def _query(text):
+    return {term: 1.0 for term in term_counts(text)}
+
+
+class TestTerms:
+    def test_identifiers_are_split_into_word_parts(self):
+        counts = term_counts("InvoiceExporter.export_invoice(HTTPServer)")
+        assert counts["invoice"] == 2
+        assert {"invoiceexporter", "exporter", "export_invoice", "httpserver",
+                "http", "server"} <= set(counts)
+
+    def test_short_and_numeric_terms_are_dropped(self):
+        assert set(term_counts("a id x1 2024 ok")) == set()
+
+    def test_defined_symbols_across_languages(self):
+        source = (
+            "class Ledger:\n"
+            "    async def post(self): ...\n"
+            "export function renderInvoice() {}\n"
+            "export const API_URL = ''\n"
+            "func (s *Server) ServeHTTP() {}\n"
+            "pub fn parse_args() {}\n"
+            "interface Props {}\n"
+        )
+        assert defined_symbols(source) == {
+            "ledger", "post", "renderinvoice", "api_url", "servehttp", "parse_args", "props",
+        }
+
+
+class TestRank:
+    def test_content_matches_outrank_name_matches(self, repo):
+        scores, _ = _index(repo).rank(_query("export invoice"))
+
+        assert max(scores, key=scores.get) == "billing/invoice.py"
+        assert "auth/invoice_notes.md" not in scores or (
+            scores["auth/invoice_notes.md"] < scores["billing/invoice.py"]
+        )
+
+    def test_definers_of_named_symbols(self, repo):
+        _, definers = _index(repo).rank({}, {"ledger"})
+        assert definers == {"billing/ledger.py"}
+
+    def test_terms_in_most_files_are_skipped(self, repo):
+        for i in range(6):
+            _write(repo, f"pkg/m{i}.py", "common_helper = 1\n")
+
+        scores, _ = _index(repo).rank(_query("common_helper"))
+
+        assert scores == {}
+
+    def test_edits_are_picked_up(self, repo):
+        index = _index(repo)
+        index.rank({})
+        _write(repo, "auth/session.py", "def export_invoice_audit(invoice, invoice_id):\n    pass\n")
+
+        scores, _ = index.rank(_query("export_invoice_audit"))
+
+        assert max(scores, key=scores.get) == "auth/session.py"
+
+    def test_persisted_index_is_reused(self, repo, monkeypatch):
+        monkeypatch.setattr(relevance_index, "_RACY_NS", 0)
+        state = repo.parent / relevance_index.RELEVANCE_INDEX_NAME
+        _index(repo, state_path=state).rank({})
+        reads = []
+        monkeypatch.setattr(RelevanceIndex, "_index", lambda self, *a: reads.append(a))
+
+        scores, _ = _index(repo, state_path=state).rank(_query("refresh_session"))
+
+        assert list(scores) == ["auth/session.py"]
+        assert reads == []
+
+
+class TestContextLoader:
+    def test_task_loads_the_file_that_defines_what_it_names(self, repo):
+        for i in range(30):
+            _write(repo, f"invoice_views/view{i}.py", f"VIEW_{i} = 'invoice'\n")
+        ws = create_or_load_workspace(repo)
+        task = tasks.create(
+            ws, title="Fix rounding in InvoiceExporter",
+            description="export_invoice drops cents",
+        )
+
+        context = ContextLoader(ws).load(task.id)
+
+        top = context.relevant_files[0]
+        assert top.path == os.path.join("billing", "invoice.py")
+        assert 0.0 < top.relevance_score <= 1.0
@@ -0,0 +1,113 @@
+"""Tests for ExecutionRecorder's bulk flush and background flusher.
+
+A flush writes every buffered step, LLM interaction and file operation in one
+transaction on one connection, so buffering actually saves the per-record
+commit. With ``background=True`` the auto-flush happens off the caller's thread.
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from codeframe.core import replay
+from codeframe.core.replay import (
+    ExecutionRecorder,
+    get_execution_steps,
+    get_file_operations,
+    get_llm_interactions,
+)
+from codeframe.core.workspace import create_or_load_workspace, get_db_connection
+
+pytestmark = pytest.mark.v2
+
+RUN_ID = "run-bulk"
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """A workspace with a real ``runs`` row for RUN_ID (foreign keys, #1061)."""
+    from codeframe.core import tasks
+
+    ws = create_or_load_workspace(tmp_path)
+    task = tasks.create(ws, title="bulk flush fixture", description="")
+    conn = get_db_connection(ws)
+    try:
+        conn.execute(
+            "INSERT INTO runs (id, workspace_id, task_id, status, started_at)"
+            " VALUES (?,?,?,?,?)",
+            (RUN_ID, ws.id, task.id, "RUNNING", "2026-01-01T00:00:00+00:00"),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    return ws
+
+
+def _record_step(recorder, n):
+    step_id = recorder.record_iteration(
+        step_number=n, tool_names=["edit_file"], llm_response_summary="edit"
+    )
+    recorder.record_llm_call(step_id, "prompt", "response", "model", 10, "execution")
+    recorder.record_file_operation(step_id, "edit", f"f{n}.py", "a", "b")
+    return step_id
+
+
+class TestBulkFlush:
+    def test_one_connection_per_flush(self, workspace):
+        recorder = ExecutionRecorder(workspace, RUN_ID, flush_interval=1000)
+        for n in range(1, 51):
+            _record_step(recorder, n)
+
+        with patch.object(
+            replay, "get_db_connection", wraps=replay.get_db_connection
+        ) as conns:
+            recorder.flush()
+
+        assert conns.call_count == 1
+        assert len(get_execution_steps(workspace, RUN_ID)) == 50
+        assert len(get_llm_interactions(workspace, RUN_ID)) == 50
+        assert len(get_file_operations(workspace, RUN_ID)) == 50
+
+    def test_failed_flush_writes_nothing_and_retains_the_batch(self, workspace):
+        recorder = ExecutionRecorder(workspace, RUN_ID, flush_interval=1000)
+        _record_step(recorder, 1)
+        # An orphan interaction: its step does not exist, so the FK rejects it.
+        recorder.record_llm_call("no-such-step", "p", "r", "model", 1, "execution")
+
+        recorder.flush()
+
+        assert get_execution_steps(workspace, RUN_ID) == []
+        assert len(recorder._step_buffer) == 1
+        assert len(recorder._llm_buffer) == 2
+        assert len(recorder._file_op_buffer) == 1
+
+    def test_empty_flush_does_not_touch_the_database(self, workspace):
+        recorder = ExecutionRecorder(workspace, RUN_ID)
+        with patch.object(replay, "get_db_connection") as conns:
+            recorder.flush()
+        conns.assert_not_called()
+
+
+class TestBackgroundFlusher:
+    def test_auto_flush_happens_off_thread(self, workspace):
+        recorder = ExecutionRecorder(workspace, RUN_ID, flush_interval=3, background=True)
+        try:
+            _record_step(recorder, 1)
+            deadline = time.monotonic() + 5
+            while not get_execution_steps(workspace, RUN_ID) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert len(get_execution_steps(workspace, RUN_ID)) == 1
+        finally:
+            recorder.close()
+
+    def test_close_flushes_the_remainder_and_stops_the_thread(self, workspace):
+        recorder = ExecutionRecorder(workspace, RUN_ID, flush_interval=1000, background=True)
+        flusher = recorder._flusher
+        _record_step(recorder, 1)
+
+        recorder.close()
+
+        assert not flusher.is_alive()
+        assert len(get_execution_steps(workspace, RUN_ID)) == 1
+        recorder.close()  # idempotent
@@ -62,8 +62,10 @@ def quiet_heavy_analyzers(monkeypatch):
     path exercises a real analyzer (it returns [] for trivial files); individual
     tests override it via monkeypatch when they need controlled findings.
     """
-    monkeypatch.setattr(SecurityScanner, "analyze_file", lambda self, p: [])
-    monkeypatch.setattr(OWASPPatterns, "check_file", lambda self, p: [])
+    monkeypatch.setattr(
+        SecurityScanner, "analyze_sources", lambda self, sources: {p: [] for p in sources}
+    )
+    monkeypatch.setattr(OWASPPatterns, "check_code", lambda self, p, code: [])
 
 
 def _write_py(workspace: Workspace, name: str = "mod.py") -> str:
@@ -128,8 +130,8 @@ class TestReviewFiles:
         name = _write_py(workspace)
         monkeypatch.setattr(
             ComplexityAnalyzer,
-            "analyze_file",
-            lambda self, p: [_Finding("high", message="too complex")],
+            "analyze_code",
+            lambda self, p, code: [_Finding("high", message="too complex")],
         )
         result = review_files(workspace, [name])
 
@@ -145,8 +147,8 @@ class TestReviewFiles:
         name = _write_py(workspace)
         monkeypatch.setattr(
             ComplexityAnalyzer,
-            "analyze_file",
-            lambda self, p: [_Finding("low"), _Finding("info")],
+            "analyze_code",
+            lambda self, p, code: [_Finding("low"), _Finding("info")],
         )
         result = review_files(workspace, [name])
         # low=80, info=95 → average 87.5 → approved
@@ -173,10 +175,10 @@ class TestReviewFiles:
     def test_analyzer_exception_is_caught(self, workspace, monkeypatch):
         name = _write_py(workspace)
 
-        def boom(self, p):
+        def boom(self, p, code):
             raise RuntimeError("analyzer exploded")
 
-        monkeypatch.setattr(ComplexityAnalyzer, "analyze_file", boom)
+        monkeypatch.setattr(ComplexityAnalyzer, "analyze_code", boom)
         # Should not propagate; other analyzers still run → no findings.
         result = review_files(workspace, [name])
         assert isinstance(result, ReviewResult)
@@ -275,11 +277,11 @@ class TestWorkspaceContainment:
         each so an escape would also be visible in the result."""
         seen: list = []
 
-        def _record(self, path):
+        def _record(self, path, code):
             seen.append(Path(path))
             return [_Finding("high")]
 
-        monkeypatch.setattr(ComplexityAnalyzer, "analyze_file", _record)
+        monkeypatch.setattr(ComplexityAnalyzer, "analyze_code", _record)
         return seen
 
     @pytest.mark.parametrize(
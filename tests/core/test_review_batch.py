@@ -0,0 +1,147 @@
+"""Tests for batched review analysis (codeframe/core/review.py).
+
+A review reads each file once, runs bandit once over the whole set, and fans
+radon and the OWASP checks out over a process pool when the set is large. None
+of that may change what a review reports: findings, their order and the score
+must be exactly those of running every analyzer over every file in turn.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from codeframe.core import review
+from codeframe.core.workspace import create_or_load_workspace
+from codeframe.lib.quality import security_scanner as scanner_module
+from codeframe.lib.quality.complexity_analyzer import ComplexityAnalyzer
+from codeframe.lib.quality.owasp_patterns import OWASPPatterns
+from codeframe.lib.quality.security_scanner import (
+    ScannerUnavailableError,
+    SecurityScanner,
+)
+
+pytestmark = pytest.mark.v2
+
+requires_bandit = pytest.mark.skipif(
+    scanner_module.shutil.which("bandit") is None, reason="bandit is not installed"
+)
+
+VARIANTS = [
+    # Clean.
+    "def add(a, b):\n    return a + b\n",
+    # bandit: subprocess with shell=True; OWASP: command injection.
+    "import subprocess\n\ndef run(cmd):\n    subprocess.call(cmd, shell=True)\n",
+    # bandit + OWASP: hardcoded secret and weak hash.
+    "import hashlib\nPASSWORD = 'hunter2'\n\ndef h(x):\n    return hashlib.md5(x).hexdigest()\n",
+    # Complexity: deeply branching function.
+    "def f(x):\n"
+    + "".join(f"    if x == {n}:\n        return {n}\n" for n in range(15))
+    + "    return -1\n",
+    # Empty file.
+    "",
+]
+
+
+def _project(tmp_path, count):
+    root = tmp_path / "repo"
+    (root / "pkg").mkdir(parents=True)
+    files = []
+    for n in range(count):
+        rel = f"pkg/mod_{n}.py"
+        (root / rel).write_text(VARIANTS[n % len(VARIANTS)])
+        files.append(rel)
+    return create_or_load_workspace(root), files
+
+
+def _per_file_findings(root, files):
+    """What review_files reported when every analyzer read every file itself."""
+    complexity = ComplexityAnalyzer(root)
+    security = SecurityScanner(root)
+    owasp = OWASPPatterns(root)
+    found = []
+    for rel in files:
+        path = root / rel
+        for finding in [
+            *complexity.analyze_file(path),
+            *security.analyze_file(path),
+            *owasp.check_file(path),
+        ]:
+            found.append((rel, finding.category, finding.severity,
+                          finding.line_number, finding.message))
+    return found
+
+
+def _summary(report):
+    return [
+        (f.file_path, f.category, f.severity, f.line_number, f.message)
+        for f in report.findings
+    ]
+
+
+@requires_bandit
+class TestSameResults:
+    def test_inline_path_matches_per_file_analysis(self, tmp_path):
+        ws, files = _project(tmp_path, 10)
+        report = review.review_files(ws, files)
+        assert _summary(report) == _per_file_findings(ws.repo_path, files)
+
+    def test_process_pool_path_matches_per_file_analysis(self, tmp_path, monkeypatch):
+        ws, files = _project(tmp_path, 12)
+        monkeypatch.setattr(review, "PROCESS_POOL_MIN_FILES", 2)
+        monkeypatch.setattr(review.os, "cpu_count", lambda: 2)
+
+        with patch.object(review, "ProcessPoolExecutor", wraps=review.ProcessPoolExecutor) as pool:
+            report = review.review_files(ws, files)
+
+        pool.assert_called_once()
+        assert _summary(report) == _per_file_findings(ws.repo_path, files)
+
+    def test_bandit_runs_once_for_the_whole_review(self, tmp_path):
+        # Enough files that bandit would draw its progress bar on stdout.
+        ws, files = _project(tmp_path, 100)
+        with patch.object(
+            scanner_module.subprocess, "run", wraps=scanner_module.subprocess.run
+        ) as run:
+            report = review.review_files(ws, files)
+
+        assert run.call_count == 1
+        flagged = {f.file_path for f in report.findings if f.category == "security"}
+        assert flagged >= {f"pkg/mod_{n}.py" for n in range(1, 100, len(VARIANTS))}
+
+
+@requires_bandit
+class TestAnalyzeSources:
+    def test_batches_bandit_and_keys_every_source(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(scanner_module, "BANDIT_BATCH_SIZE", 2)
+        sources = {}
+        for n in range(5):
+            path = tmp_path / f"m{n}.py"
+            path.write_text(VARIANTS[1])
+            sources[path] = VARIANTS[1]
+        sources[tmp_path / "empty.py"] = ""
+        sources[tmp_path / "notes.md"] = "shell=True"
+
+        with patch.object(
+            scanner_module.subprocess, "run", wraps=scanner_module.subprocess.run
+        ) as run:
+            results = SecurityScanner(tmp_path).analyze_sources(sources)
+
+        assert run.call_count == 3  # 5 non-empty Python files, 2 per run
+        assert set(results) == set(sources)
+        assert all(results[tmp_path / f"m{n}.py"] for n in range(5))
+        assert results[tmp_path / "empty.py"] == []
+        assert results[tmp_path / "notes.md"] == []
+
+
+class TestBanditMissing:
+    def test_missing_bandit_is_unavailable_not_clean(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text(VARIANTS[1])
+        with patch.object(scanner_module.shutil, "which", return_value=None):
+            with pytest.raises(ScannerUnavailableError):
+                SecurityScanner(tmp_path).analyze_sources({path: VARIANTS[1]})
+
+    def test_no_python_files_needs_no_bandit(self, tmp_path):
+        path = tmp_path / "a.md"
+        with patch.object(scanner_module.shutil, "which", return_value=None):
+            assert SecurityScanner(tmp_path).analyze_sources({path: "x"}) == {path: []}
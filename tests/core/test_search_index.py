@@ -0,0 +1,186 @@
+"""Tests for the search_codebase prefilter (codeframe/core/search_index.py).
+
+The index may only ever narrow the files a search reads: every line the old
+read-everything scan found must still be found, in the same order and with
+the same output, while files without the pattern's literals are not opened.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+
+import pytest
+
+from codeframe.core import file_index, search_index, tools
+from codeframe.core.search_index import SearchIndex, required_literals
+from codeframe.core.tools import _execute_search_codebase
+from codeframe.core.workspace import create_or_load_workspace
+
+pytestmark = pytest.mark.v2
+
+
+def _write(root, rel, text):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    _write(root, "a.py", "def get_record(x):\n    return x\n")
+    _write(root, "b.py", "class Foo:\n    bar = 1\n")
+    _write(root, "c.py", "import os\nimport re\n")
+    _write(root, "docs/notes.md", "Kelvin and KELVIN\nKelvin sign\n")
+    (root / "blob.bin").write_bytes(b"\xff\xfe get_record \x00")
+    return root
+
+
+def _index(root, **kwargs):
+    return SearchIndex(file_index.FileIndex(root, []), **kwargs)
+
+
+def _brute_force(root, pattern):
+    compiled = re.compile(pattern)
+    found = []
+    for current, dirs, names in sorted(os.walk(root)):
+        dirs[:] = [d for d in dirs if d != ".codeframe"]
+        for name in sorted(names):
+            path = os.path.join(current, name)
+            try:
+                with open(path, encoding="utf-8") as fh:
+                    text = fh.read()
+            except UnicodeDecodeError:
+                continue
+            rel = os.path.relpath(path, root)
+            found += [f"{rel}:{n}: {line.rstrip()}"
+                      for n, line in enumerate(text.splitlines(), 1) if compiled.search(line)]
+    return sorted(found)
+
+
+class TestRequiredLiterals:
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            ("get_record", [["get_record"]]),
+            ("foo.*bar|baz", [["bar", "foo"], ["baz"]]),
+            ("(get|set)_record", [["_record"]]),
+            ("def \\w+\\(self", [["self", "def"]]),
+            ("x?yzw+", [["yzw"]]),
+            ("(?a)(?i)kelvin", [["kelvin"]]),
+        ],
+    )
+    def test_extracts_required_fragments(self, pattern, expected):
+        assert required_literals(pattern) == expected
+
+    @pytest.mark.parametrize(
+        "pattern", ["\\w+\\(", "[A-Z]{3}", "ab|ac", "(?:abc)?x", "été", "xy+z"]
+    )
+    def test_no_usable_literal(self, pattern):
+        assert required_literals(pattern) is None
+
+    def test_case_insensitive_letters_with_unicode_folds_end_a_run(self):
+        # (?i)k also matches U+212A KELVIN SIGN, which is not in any token.
+        assert required_literals("(?i)kelvin") == [["elv"]]
+
+
+class TestSearchIndex:
+    def test_candidates_are_narrowed_by_literals(self, repo):
+        assert _index(repo).candidates("get_rec") == (["a.py"], True)
+        assert _index(repo).candidates("class Foo|import") == (["b.py", "c.py"], True)
+
+    def test_unindexable_pattern_lists_every_text_file(self, repo):
+        paths, narrowed = _index(repo).candidates("\\w+\\(")
+        assert narrowed is False
+        assert paths == ["a.py", "b.py", "c.py", "docs/notes.md"]
+
+    def test_in_place_edit_is_reindexed(self, repo, monkeypatch):
+        monkeypatch.setattr(search_index, "_RACY_NS", 0)
+        index = _index(repo)
+        index.candidates("x")
+        path = repo / "c.py"
+        stat = path.stat()
+        # Same size and mtime: only the racy window catches this edit.
+        path.write_text("import ab\nimport cd\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        monkeypatch.setattr(search_index, "_RACY_NS", 10**18)
+
+        assert index.candidates("import ab")[0] == ["c.py"]
+
+    def test_deleted_file_is_dropped(self, repo):
+        index = _index(repo)
+        index.candidates("x")
+        (repo / "a.py").unlink()
+
+        assert index.candidates("get_record")[0] == []
+
+    def test_persisted_index_is_reused(self, repo, monkeypatch):
+        monkeypatch.setattr(search_index, "_RACY_NS", 0)
+        state = repo.parent / search_index.SEARCH_INDEX_NAME
+        _index(repo, state_path=state).candidates("x")
+        reads = []
+        monkeypatch.setattr(SearchIndex, "_index", lambda self, *a: reads.append(a))
+
+        fresh = _index(repo, state_path=state)
+
+        assert fresh.candidates("get_record")[0] == ["a.py"]
+        assert reads == []
+
+    def test_symlinks_are_always_candidates(self, repo, tmp_path):
+        _write(tmp_path, "outside.py", "get_record = 1\n")
+        os.symlink(tmp_path / "outside.py", repo / "link.py")
+
+        assert "link.py" in _index(repo).candidates("zzz_absent")[0]
+
+
+class TestSearchCodebase:
+    @pytest.mark.parametrize(
+        "pattern",
+        ["get_rec", "(?i)kelvin", "import (os|re)", "\\w+ = 1", "^class", "x"],
+    )
+    def test_matches_a_full_scan(self, repo, pattern):
+        create_or_load_workspace(repo)
+        expected = _brute_force(repo, pattern)
+
+        result = _execute_search_codebase({"pattern": pattern, "max_results": 100}, repo, "t")
+
+        body = result.content.split("\n\n", 1)[1]
+        assert body.splitlines() == (expected or ["(no matches)"])
+
+    def test_files_without_the_literal_are_not_read(self, repo, monkeypatch):
+        search_index.for_root(repo).candidates("x")
+        opened = []
+        real = tools._file_matches
+
+        def recording(root, path, *args):
+            opened.append(path)
+            return real(root, path, *args)
+
+        monkeypatch.setattr(tools, "_file_matches", recording)
+
+        _execute_search_codebase({"pattern": "class Foo"}, repo, "t")
+
+        assert opened == ["b.py"]
+
+    def test_symlink_outside_workspace_is_not_searched(self, repo, tmp_path):
+        _write(tmp_path, "secret.py", "needle = 1\n")
+        os.symlink(tmp_path / "secret.py", repo / "link.py")
+
+        result = _execute_search_codebase({"pattern": "needle"}, repo, "t")
+
+        assert "(no matches)" in result.content
+
+    def test_parallel_scan_keeps_order_and_stops_at_max_results(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(tools, "_SCAN_CHUNK", 4)
+        root = tmp_path / "many"
+        for i in range(30):
+            _write(root, f"f{i:02}.py", "v = 1\nw = 2\n")
+
+        result = _execute_search_codebase({"pattern": "\\w = \\d", "max_results": 9}, root, "t")
+
+        lines = result.content.split("\n\n")[1].splitlines()
+        assert lines[:3] == ["f00.py:1: v = 1", "f00.py:2: w = 2", "f01.py:1: v = 1"]
+        assert len(lines) == 9
+        assert result.content.endswith("[Results truncated to 9]")
@@ -0,0 +1,191 @@
+"""Replay history is counted once per message and kept in memory between turns.
+
+Turn start used to re-read the newest 100 rows and re-encode every message on
+every pass of the truncation loop — quadratic in history length. Counts now
+live on the ``session_messages`` row, truncation bisects a prefix sum, and the
+session's window is topped up with only the rows written since the last turn.
+"""
+
+import random
+import sqlite3
+
+import pytest
+
+from codeframe.adapters.llm.base import StreamChunk
+from codeframe.adapters.llm.mock import MockProvider
+from codeframe.core.adapters import streaming_chat
+from codeframe.core.adapters.streaming_chat import StreamingChatAdapter
+from codeframe.platform_store.database import Database
+
+pytestmark = pytest.mark.v2
+
+
+@pytest.fixture
+def repo():
+    db = Database(":memory:")
+    db.initialize()
+    return db.interactive_sessions
+
+
+@pytest.fixture
+def counted(monkeypatch):
+    """Record every message content handed to the token counter."""
+    seen: list[str] = []
+    real = streaming_chat._count_tokens
+
+    def spy(text):
+        seen.append(text)
+        return real(text)
+
+    monkeypatch.setattr(streaming_chat, "_count_tokens", spy)
+    return seen
+
+
+def _adapter(repo, session_id, provider=None):
+    return StreamingChatAdapter(
+        session_id=session_id,
+        db_repo=repo,
+        workspace_path="/tmp",
+        provider=provider or MockProvider(),
+    )
+
+
+def _seed(repo, count: int) -> str:
+    session = repo.create(workspace_path="/tmp/ws-window")
+    for i in range(count):
+        repo.add_message(
+            session["id"], role="user" if i % 2 == 0 else "assistant", content=f"msg {i:04d}"
+        )
+    return session["id"]
+
+
+def _reference_truncate(messages, count, budget):
+    """The pre-prefix-sum loop, kept as an oracle."""
+    while messages and sum(count(m) for m in messages) > budget:
+        trimmed = messages[2:] if len(messages) >= 2 else messages[1:]
+        if not trimmed:
+            break
+        messages = trimmed
+    while messages and messages[0].get("role") != "user":
+        messages = messages[1:]
+    return messages
+
+
+class TestRepository:
+    def test_token_count_and_seq_are_stored(self, repo):
+        session = repo.create(workspace_path="/tmp/ws")
+        first = repo.add_message(session["id"], role="user", content="a", token_count=7)
+        second = repo.add_message(session["id"], role="assistant", content="b")
+
+        rows = repo.get_recent_messages(session["id"], limit=10)
+
+        assert [r["token_count"] for r in rows] == [7, None]
+        assert [r["seq"] for r in rows] == [first["seq"], second["seq"]]
+        assert repo.get_messages_after(session["id"], first["seq"])[0]["content"] == "b"
+
+    def test_set_token_counts_only_fills_missing(self, repo):
+        session = repo.create(workspace_path="/tmp/ws")
+        kept = repo.add_message(session["id"], role="user", content="a", token_count=7)
+        filled = repo.add_message(session["id"], role="assistant", content="b")
+
+        repo.set_token_counts({kept["id"]: 1, filled["id"]: 2})
+
+        rows = repo.get_recent_messages(session["id"], limit=10)
+        assert [r["token_count"] for r in rows] == [7, 2]
+
+    def test_migration_adds_the_column_to_an_existing_table(self):
+        from codeframe.platform_store.schema_manager import (
+            _migration_003_session_message_token_count,
+        )
+
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE session_messages (id TEXT PRIMARY KEY, content TEXT)")
+        _migration_003_session_message_token_count(conn.cursor())
+        _migration_003_session_message_token_count(conn.cursor())
+
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(session_messages)")}
+        assert "token_count" in columns
+
+
+class TestPrefixSumTruncation:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_the_pairwise_loop(self, seed, monkeypatch):
+        rng = random.Random(seed)
+        monkeypatch.setattr(streaming_chat, "_MAX_HISTORY_TOKENS", rng.randint(0, 60))
+        messages = [
+            {"role": rng.choice(["user", "assistant"]), "content": "x" * rng.randint(0, 40)}
+            for _ in range(rng.randint(0, 12))
+        ]
+        adapter = StreamingChatAdapter.__new__(StreamingChatAdapter)
+
+        expected = _reference_truncate(
+            messages, lambda m: streaming_chat._count_tokens(m["content"]),
+            streaming_chat._MAX_HISTORY_TOKENS,
+        )
+
+        assert adapter._truncate_history(messages) == expected
+
+    def test_supplied_counts_are_used_instead_of_encoding(self, counted, monkeypatch):
+        monkeypatch.setattr(streaming_chat, "_MAX_HISTORY_TOKENS", 10)
+        messages = [{"role": r, "content": "?"} for r in ("user", "assistant", "user")]
+        adapter = StreamingChatAdapter.__new__(StreamingChatAdapter)
+
+        result = adapter._truncate_history(messages, [8, 8, 1])
+
+        assert result == messages[2:]
+        assert counted == []
+
+
+class TestHistoryWindow:
+    def test_each_message_is_counted_once_across_turns(self, repo, counted):
+        session_id = _seed(repo, 6)
+
+        _adapter(repo, session_id)._load_history()
+        _adapter(repo, session_id)._load_history()
+
+        assert sorted(counted) == [f"msg {i:04d}" for i in range(6)]
+        rows = repo.get_recent_messages(session_id, limit=10)
+        assert all(r["token_count"] is not None for r in rows)
+
+    def test_later_turns_read_only_new_rows(self, repo, monkeypatch):
+        session_id = _seed(repo, 4)
+        _adapter(repo, session_id)._load_history()
+        monkeypatch.setattr(
+            repo, "get_recent_messages",
+            lambda *a, **k: pytest.fail("warm window re-read the history"),
+        )
+        repo.add_message(session_id, role="user", content="added over REST")
+
+        history = _adapter(repo, session_id)._load_history()
+
+        assert [m["content"] for m in history][-2:] == ["msg 0003", "added over REST"]
+
+    def test_window_keeps_the_newest_rows(self, repo):
+        session_id = _seed(repo, 3)
+        _adapter(repo, session_id)._load_history()
+        for i in range(3, 150):
+            repo.add_message(
+                session_id, role="user" if i % 2 == 0 else "assistant", content=f"msg {i:04d}"
+            )
+
+        contents = [m["content"] for m in _adapter(repo, session_id)._load_history()]
+
+        assert contents == [f"msg {i:04d}" for i in range(50, 150)]
+
+    @pytest.mark.asyncio
+    async def test_a_turn_persists_counts_and_extends_the_window(self, repo, counted):
+        session_id = _seed(repo, 2)
+        provider = MockProvider()
+        provider.add_stream_chunks([
+            StreamChunk(type="text_delta", text="the answer"),
+            StreamChunk(type="message_stop", stop_reason="end_turn"),
+        ])
+
+        _ = [e async for e in _adapter(repo, session_id, provider).send_message("question", [])]
+        counted.clear()
+        history = _adapter(repo, session_id)._load_history()
+
+        assert [m["content"] for m in history][-2:] == ["question", "the answer"]
+        assert counted == []
+        rows = repo.get_recent_messages(session_id, limit=10)
+        assert all(r["token_count"] is not None for r in rows)
@@ -0,0 +1,222 @@
+"""Line index and seek-based reads for run output logs (codeframe/core/streaming.py).
+
+``--tail N`` and ``since_line`` resumption used to read the whole log with
+``readlines()``; they now read backwards from EOF and jump through the
+``output.log.idx`` sidecar. Tests use a small stride so checkpoints appear in
+small logs.
+"""
+
+import struct
+
+import pytest
+
+from codeframe.core import streaming
+from codeframe.core.streaming import (
+    RunOutputLogger,
+    get_latest_lines_with_count,
+    get_run_output_path,
+    tail_run_output,
+)
+
+pytestmark = pytest.mark.v2
+
+RUN_ID = "run-index"
+STRIDE = 4
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    from codeframe.core.workspace import create_or_load_workspace
+
+    return create_or_load_workspace(tmp_path)
+
+
+@pytest.fixture(autouse=True)
+def small_stride(monkeypatch):
+    monkeypatch.setattr(streaming, "LINE_INDEX_STRIDE", STRIDE)
+
+
+def _index(workspace) -> list[int]:
+    data = streaming._line_index_path(get_run_output_path(workspace, RUN_ID)).read_bytes()
+    return [offset for (offset,) in struct.iter_unpack("<Q", data)]
+
+
+def _line_starts(path) -> list[int]:
+    starts, pos = [], 0
+    for line in path.read_bytes().splitlines(keepends=True):
+        pos += len(line)
+        starts.append(pos)
+    return starts
+
+
+def _tail(workspace, since_line=0):
+    return list(tail_run_output(workspace, RUN_ID, since_line=since_line, max_iterations=1))
+
+
+class TestLineIndex:
+    def test_logger_records_every_stride_line_start(self, workspace):
+        with RunOutputLogger(workspace, RUN_ID) as log:
+            for i in range(10):
+                log.write(f"line {i} ✅\n")
+
+        starts = _line_starts(get_run_output_path(workspace, RUN_ID))
+        assert _index(workspace) == [starts[3], starts[7]]
+
+    def test_multi_line_writes_are_indexed(self, workspace):
+        with RunOutputLogger(workspace, RUN_ID) as log:
+            log.write("".join(f"l{i}\n" for i in range(9)))
+
+        starts = _line_starts(get_run_output_path(workspace, RUN_ID))
+        assert _index(workspace) == [starts[3], starts[7]]
+
+    def test_resumed_logger_continues_the_index(self, workspace):
+        with RunOutputLogger(workspace, RUN_ID) as log:
+            for i in range(6):
+                log.write(f"first {i}\n")
+        with RunOutputLogger(workspace, RUN_ID) as log:
+            for i in range(6):
+                log.write(f"second {i}\n")
+
+        starts = _line_starts(get_run_output_path(workspace, RUN_ID))
+        assert _index(workspace) == [starts[3], starts[7], starts[11]]
+
+    def test_log_without_index_is_indexed_on_open(self, workspace):
+        path = get_run_output_path(workspace, RUN_ID)
+        path.parent.mkdir(parents=True)
+        path.write_text("".join(f"old {i}\n" for i in range(9)))
+
+        RunOutputLogger(workspace, RUN_ID).close()
+
+        starts = _line_starts(path)
+        assert _index(workspace) == [starts[3], starts[7]]
+
+    def test_stale_index_is_rebuilt(self, workspace):
+        with RunOutputLogger(workspace, RUN_ID) as log:
+            log.write("".join(f"long line number {i}\n" for i in range(12)))
+        path = get_run_output_path(workspace, RUN_ID)
+        path.write_text("".join(f"s{i}\n" for i in range(5)))
+
+        RunOutputLogger(workspace, RUN_ID).close()
+
+        assert _index(workspace) == [_line_starts(path)[3]]
+
+
+class TestSinceLine:
+    def test_resume_jumps_to_the_nearest_checkpoint(self, workspace, monkeypatch):
+        with RunOutputLogger(workspace, RUN_ID) as log:
+            for i in range(30):
+                log.write(f"line {i}\n")
+
+        scanned = []
+        real = streaming._skip_lines
+
+        def counting(f, offset, count):
+            scanned.append(count)
+            return real(f, offset, count)
+
+        monkeypatch.setattr(streaming, "_skip_lines", counting)
+
+        assert _tail(workspace, since_line=27) == ["line 27\n", "line 28\n", "line 29\n"]
+        assert scanned == [27 - 24]
+
+    def test_stale_index_does_not_misplace_the_resume(self, workspace):
+        with RunOutputLogger(workspace, RUN_ID) as log:
+            log.write("".join(f"a much longer original line {i}\n" for i in range(12)))
+        get_run_output_path(workspace, RUN_ID).write_text(
+            "".join(f"r{i}\n" for i in range(12))
+        )
+
+        assert _tail(workspace, since_line=10) == ["r10\n", "r11\n"]
+
+    def test_since_line_past_a_partial_line_skips_its_completion(self, workspace):
+        """--tail counts an unterminated last line; resuming from that total
+        must not replay the line's remainder as a new line."""
+        path = get_run_output_path(workspace, RUN_ID)
+        path.parent.mkdir(parents=True)
+        path.write_text("a\nb\npar")
+        _, total = get_latest_lines_with_count(workspace, RUN_ID, 10)
+        assert total == 3
+
+        follower = streaming._LogFollower(path, since_line=total)
+        assert follower.poll() == []
+        with path.open("a") as f:
+            f.write("tial\nnext\n")
+
+        assert follower.poll() == ["next\n"]
+
+
+class TestLatestLines:
+    @pytest.mark.parametrize("count", [1, 3, 7, 50])
+    def test_matches_readlines(self, workspace, count, monkeypatch):
+        monkeypatch.setattr(streaming, "_SCAN_BLOCK", 16)
+        path = get_run_output_path(workspace, RUN_ID)
+        path.parent.mkdir(parents=True)
+        path.write_text("".join(f"línea {i} 日本\n" for i in range(20)) + "tail")
+        expected = path.read_text().splitlines(keepends=True)
+
+        lines, total = get_latest_lines_with_count(workspace, RUN_ID, count)
+
+        assert lines == expected[-count:]
+        assert total == len(expected)
+
+    def test_reads_only_the_end_of_a_large_log(self, workspace, monkeypatch):
+        monkeypatch.setattr(streaming, "_SCAN_BLOCK", 256)
+        path = get_run_output_path(workspace, RUN_ID)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"x" * 50 + b"\n" + b"".join(b"%d\n" % i for i in range(20_000)))
+        RunOutputLogger(workspace, RUN_ID).close()  # builds the index
+
+        read = []
+
+        class CountingFile:
+            def __init__(self, f):
+                self._f = f
+
+            def read(self, n=-1):
+                data = self._f.read(n)
+                read.append(len(data))
+                return data
+
+            def seek(self, *args):
+                return self._f.seek(*args)
+
+        real_count, real_last = streaming._count_lines, streaming._read_last_lines
+        monkeypatch.setattr(
+            streaming, "_count_lines",
+            lambda log_path, f, size: real_count(log_path, CountingFile(f), size),
+        )
+        monkeypatch.setattr(
+            streaming, "_read_last_lines",
+            lambda f, size, count: real_last(CountingFile(f), size, count),
+        )
+        lines, total = get_latest_lines_with_count(workspace, RUN_ID, 2)
+
+        assert lines == ["19998\n", "19999\n"]
+        assert total == 20_001
+        assert sum(read) < 1024 < path.stat().st_size
+
+
+class TestSyncTail:
+    def test_partial_line_is_held_until_complete(self, workspace):
+        path = get_run_output_path(workspace, RUN_ID)
+        path.parent.mkdir(parents=True)
+        path.write_text("done\npar")
+
+        follow = tail_run_output(workspace, RUN_ID, max_iterations=3, poll_interval=0)
+        assert next(follow) == "done\n"
+        with path.open("a") as f:
+            f.write("tial\n")
+
+        assert list(follow) == ["partial\n"]
+
+    def test_backlog_larger_than_one_poll_is_delivered_in_order(
+        self, workspace, monkeypatch
+    ):
+        monkeypatch.setattr(streaming, "_MAX_POLL_BYTES", 64)
+        path = get_run_output_path(workspace, RUN_ID)
+        path.parent.mkdir(parents=True)
+        path.write_text("".join(f"{i}\n" for i in range(200)))
+
+        lines = list(tail_run_output(workspace, RUN_ID, max_iterations=100, poll_interval=0))
+
+        assert lines == [f"{i}\n" for i in range(200)]
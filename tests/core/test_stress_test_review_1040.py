@@ -149,7 +149,7 @@ class TestDisconnectLatchFiresDuringAGoal:
 
         observed = {"cancelled_at_node": None}
 
-        async def _fake_stream(content, provider, max_depth=3, is_cancelled=None):
+        async def _fake_stream(content, provider, max_depth=3, is_cancelled=None, cache=None):
             yield {"type": "goals_extracted", "goals": ["one long goal"]}
 
             def _walk():
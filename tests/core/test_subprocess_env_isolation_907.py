@@ -198,9 +198,9 @@ def test_the_sanitized_env_still_runs_a_real_command(workspace):
     assert "ok" in proc.stdout
 
 
-def test_parent_process_keeps_its_own_environment(secrets_in_parent):
+def test_parent_process_keeps_its_own_environment(secrets_in_parent, tmp_path):
     """The sanitizing must not mutate os.environ for everyone else."""
-    build_agent_env(Path.cwd())
+    build_agent_env(tmp_path)
 
     assert os.environ["ANTHROPIC_API_KEY"] == "sk-ant-LEAKED"
 
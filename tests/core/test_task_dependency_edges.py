@@ -0,0 +1,159 @@
+"""Tests for the task_dependencies edge table and the queries built on it.
+
+``tasks.depends_on`` (JSON) stays the source for ``Task.depends_on``; every
+write mirrors it into ``task_dependencies`` so dependents, transitive closure
+and the ready set are indexed SQL. These tests pin the two in sync and check
+the upgrade path rebuilds the table for workspaces that predate it.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import pytest
+
+from codeframe.core import dependency_graph, tasks
+from codeframe.core.state_machine import TaskStatus
+from codeframe.core.workspace import create_or_load_workspace, get_workspace
+
+pytestmark = pytest.mark.v2
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    return create_or_load_workspace(tmp_path)
+
+
+def _edges(workspace) -> set[tuple[str, str]]:
+    conn = sqlite3.connect(workspace.db_path)
+    try:
+        return set(conn.execute("SELECT task_id, depends_on_id FROM task_dependencies"))
+    finally:
+        conn.close()
+
+
+def _chain(workspace, n: int) -> list[tasks.Task]:
+    """t0 <- t1 <- ... <- t(n-1): each task depends on the previous one."""
+    created = [tasks.create(workspace, title="t0")]
+    for i in range(1, n):
+        created.append(
+            tasks.create(workspace, title=f"t{i}", depends_on=[created[-1].id])
+        )
+    return created
+
+
+class TestEdgesStayInSync:
+    def test_create_writes_edges(self, workspace):
+        a = tasks.create(workspace, title="a")
+        b = tasks.create(workspace, title="b")
+        c = tasks.create(workspace, title="c", depends_on=[a.id, b.id])
+
+        assert _edges(workspace) == {(c.id, a.id), (c.id, b.id)}
+
+    def test_update_depends_on_replaces_edges(self, workspace):
+        a = tasks.create(workspace, title="a")
+        b = tasks.create(workspace, title="b")
+        c = tasks.create(workspace, title="c", depends_on=[a.id])
+
+        tasks.update_depends_on(workspace, c.id, [b.id])
+
+        assert _edges(workspace) == {(c.id, b.id)}
+
+    def test_delete_removes_edges_both_ways(self, workspace):
+        a, b, c = _chain(workspace, 3)
+
+        tasks.delete(workspace, b.id)
+
+        assert _edges(workspace) == set()
+        assert tasks.get(workspace, c.id).depends_on == []
+
+    def test_delete_all_clears_edges(self, workspace):
+        _chain(workspace, 3)
+        tasks.delete_all(workspace)
+        assert _edges(workspace) == set()
+
+
+class TestQueries:
+    def test_get_dependents_is_not_capped_by_list_tasks(self, workspace):
+        root = tasks.create(workspace, title="root")
+        for i in range(120):
+            tasks.create(workspace, title=f"leaf {i}", depends_on=[root.id])
+
+        assert len(tasks.get_dependents(workspace, root.id)) == 120
+
+    def test_transitive_closure(self, workspace):
+        chain = _chain(workspace, 5)
+        side = tasks.create(workspace, title="side", depends_on=[chain[1].id])
+
+        assert tasks.get_ancestor_ids(workspace, chain[3].id) == {
+            chain[0].id, chain[1].id, chain[2].id,
+        }
+        assert tasks.get_descendant_ids(workspace, chain[1].id) == {
+            chain[2].id, chain[3].id, chain[4].id, side.id,
+        }
+        assert tasks.get_ancestor_ids(workspace, chain[0].id) == set()
+
+    def test_closure_terminates_on_a_cycle(self, workspace):
+        a = tasks.create(workspace, title="a")
+        b = tasks.create(workspace, title="b", depends_on=[a.id])
+        tasks.update_depends_on(workspace, a.id, [b.id])
+
+        assert tasks.get_ancestor_ids(workspace, a.id) == {b.id}
+        assert tasks.get_descendant_ids(workspace, a.id) == {b.id}
+
+    def test_get_dependency_map_keeps_order(self, workspace):
+        a = tasks.create(workspace, title="a")
+        b = tasks.create(workspace, title="b")
+        c = tasks.create(workspace, title="c", depends_on=[b.id, a.id])
+
+        assert tasks.get_dependency_map(workspace, [c.id, a.id, "missing"]) == {
+            c.id: [b.id, a.id], a.id: [], "missing": [],
+        }
+
+    def test_list_unblocked(self, workspace):
+        done = tasks.create(workspace, title="done", status=TaskStatus.DONE)
+        pending = tasks.create(workspace, title="pending")
+        free = tasks.create(workspace, title="free")
+        after_done = tasks.create(workspace, title="after done", depends_on=[done.id])
+        after_pending = tasks.create(
+            workspace, title="after pending", depends_on=[done.id, pending.id]
+        )
+        dangling = tasks.create(workspace, title="dangling", depends_on=["gone"])
+
+        ready = {t.id for t in tasks.list_unblocked(workspace, status=TaskStatus.BACKLOG)}
+
+        assert ready == {pending.id, free.id, after_done.id}
+        assert after_pending.id not in ready and dangling.id not in ready
+
+    def test_build_graph_uses_the_edge_table(self, workspace):
+        a, b, c = _chain(workspace, 3)
+
+        graph = dependency_graph.build_graph(workspace, [b.id, c.id, "missing"])
+
+        assert graph == {b.id: [], c.id: [b.id], "missing": []}
+
+
+class TestUpgradeBackfill:
+    def test_legacy_workspace_gets_its_edges(self, tmp_path):
+        ws = create_or_load_workspace(tmp_path)
+        a = tasks.create(ws, title="a")
+        b = tasks.create(ws, title="b", depends_on=[a.id])
+        conn = sqlite3.connect(ws.db_path)
+        try:
+            conn.execute("DROP TABLE task_dependencies")
+            # Rows only an older build could have written.
+            conn.execute(
+                "UPDATE tasks SET depends_on = ? WHERE id = ?",
+                (json.dumps([a.id, "deleted-before-724"]), b.id),
+            )
+            conn.execute("UPDATE tasks SET depends_on = 'not json' WHERE id = ?", (a.id,))
+            conn.execute("PRAGMA user_version = 6")
+            conn.commit()
+        finally:
+            conn.close()
+
+        upgraded = get_workspace(tmp_path)
+
+        assert _edges(upgraded) == {(b.id, a.id), (b.id, "deleted-before-724")}
+        assert [t.id for t in tasks.get_dependents(upgraded, a.id)] == [b.id]
@@ -500,3 +500,131 @@ def _update_tree_fields(
             conn.commit()
     finally:
         conn.close()
+
+
+def _tree_handler(calls=None, delay=0.0):
+    """A deterministic stand-in for the LLM, answering by task description.
+
+    Tasks named ``...leaf...`` are atomic; every other task splits into
+    ``<name>.a``/``<name>.b``/``<name>.leaf``.
+    """
+    import threading
+    import time
+
+    from codeframe.adapters.llm.base import LLMResponse
+
+    lock = threading.Lock()
+    in_flight = [0]
+
+    def handler(messages):
+        content = messages[0]["content"].split("\n\n")[0]
+        with lock:
+            in_flight[0] += 1
+            if calls is not None:
+                calls.append(in_flight[0])
+        try:
+            time.sleep(delay)
+            if content.startswith("Task to decompose: "):
+                name = content[len("Task to decompose: "):]
+                return LLMResponse(content=json.dumps([
+                    {"title": f"T {name}.{s}", "description": f"{name}.{s}"}
+                    for s in ("a", "b", "leaf")
+                ]))
+            name = content[len("Task: "):]
+            return LLMResponse(content="atomic" if "leaf" in name else "composite")
+        finally:
+            with lock:
+                in_flight[0] -= 1
+
+    return handler
+
+
+class TestConcurrentTreeGeneration:
+    """Levels are expanded concurrently without changing the result."""
+
+    def test_same_tree_and_tasks_as_serial(self, tmp_path):
+        serial, concurrent = MockProvider(), MockProvider()
+        serial.set_response_handler(_tree_handler())
+        concurrent.set_response_handler(_tree_handler(delay=0.01))
+
+        expected = generate_task_tree(serial, "root", max_depth=3, max_concurrency=1)
+        result = generate_task_tree(concurrent, "root", max_depth=3, max_concurrency=8)
+
+        assert result == expected
+        assert concurrent.call_count == serial.call_count
+
+        flat = []
+        for name, tree in (("serial", expected), ("concurrent", result)):
+            (tmp_path / name).mkdir()
+            ws = create_or_load_workspace(tmp_path / name)
+            flat.append([
+                (t.hierarchical_id, t.title, t.is_leaf, t.lineage)
+                for t in flatten_task_tree(tree, ws)
+            ])
+        assert flat[0] == flat[1]
+
+    def test_in_flight_calls_are_capped(self):
+        calls = []
+        provider = MockProvider()
+        provider.set_response_handler(_tree_handler(calls, delay=0.02))
+
+        generate_task_tree(provider, "root", max_depth=3, max_concurrency=3)
+
+        assert 1 < max(calls) <= 3
+
+    def test_invalid_concurrency_rejected(self, provider):
+        with pytest.raises(ValueError):
+            generate_task_tree(provider, "root", max_concurrency=0)
+
+    def test_bad_env_value_falls_back_to_default(self, monkeypatch):
+        from codeframe.core import task_tree
+
+        monkeypatch.setenv(task_tree.TREE_CONCURRENCY_ENV, "lots")
+        assert task_tree._tree_concurrency() == task_tree.DEFAULT_TREE_CONCURRENCY
+        monkeypatch.setenv(task_tree.TREE_CONCURRENCY_ENV, "2")
+        assert task_tree._tree_concurrency() == 2
+
+
+class TestRateLimitBackoff:
+    """Rate-limited calls are retried after a shared backoff."""
+
+    @pytest.fixture(autouse=True)
+    def fast_backoff(self, monkeypatch):
+        from codeframe.core import task_tree
+
+        monkeypatch.setattr(task_tree, "_RATE_LIMIT_BASE_DELAY", 0.01)
+        monkeypatch.setattr(task_tree, "_RATE_LIMIT_RETRIES", 2)
+
+    def test_rate_limited_call_is_retried(self):
+        from codeframe.adapters.llm.base import LLMRateLimitError
+
+        handler = _tree_handler()
+        failures = [2]
+
+        def flaky(messages):
+            if failures[0]:
+                failures[0] -= 1
+                raise LLMRateLimitError("429")
+            return handler(messages)
+
+        provider = MockProvider()
+        provider.set_response_handler(flaky)
+        expected = MockProvider()
+        expected.set_response_handler(handler)
+
+        assert generate_task_tree(provider, "root", max_depth=2) == generate_task_tree(
+            expected, "root", max_depth=2
+        )
+
+    def test_persistent_rate_limit_propagates(self):
+        from codeframe.adapters.llm.base import LLMRateLimitError
+
+        def rate_limited(messages):
+            raise LLMRateLimitError("429")
+
+        provider = MockProvider()
+        provider.set_response_handler(rate_limited)
+
+        with pytest.raises(LLMRateLimitError):
+            generate_task_tree(provider, "root")
+        assert provider.call_count == 3
@@ -0,0 +1,183 @@
+"""Tests for the warm batch worker pool (codeframe/core/task_worker.py).
+
+The pool only pays off if it is indistinguishable from one interpreter per
+task: every task in its own process and directory with its own exit code, a
+force stop that terminates the task, and workers that are reused — then
+recycled. The workers here run a tiny stand-in CLI so the tests do not depend
+on an engine.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from codeframe.core import conductor, tasks
+from codeframe.core.task_worker import TaskWorkerPool
+from codeframe.core.workspace import create_or_load_workspace
+
+pytestmark = [
+    pytest.mark.v2,
+    pytest.mark.skipif(not hasattr(os, "fork"), reason="warm workers need os.fork"),
+]
+
+FAKE_CLI = '''
+import os, sys, time
+
+def main():
+    cmd = sys.argv[1:]
+    if cmd[0] == "exit":
+        sys.exit(int(cmd[1]))
+    if cmd[0] == "sleep":
+        time.sleep(float(cmd[1]))
+    if cmd[0] == "where":
+        with open("where.txt", "w") as f:
+            f.write(f"{os.getcwd()} {os.getpid()} {os.getppid()}")
+    if cmd[0] == "emit":
+        from pathlib import Path
+
+        from codeframe.core import events
+        from codeframe.core.workspace import get_workspace
+
+        # A long interval: only the exit-time flush can commit this event.
+        events.enable_buffered_writes(flush_interval=60)
+        events.emit_for_workspace(get_workspace(Path.cwd()), "FROM_WORKER", print_event=False)
+    if cmd[0] == "grow":
+        global ballast
+        ballast = bytearray(int(cmd[1]) * 1024 * 1024)
+        ballast[::4096] = b"x" * len(ballast[::4096])
+'''
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    (tmp_path / "fake_cli.py").write_text(FAKE_CLI)
+    path = os.pathsep.join(filter(None, [str(tmp_path), os.environ.get("PYTHONPATH")]))
+    monkeypatch.setenv("PYTHONPATH", path)
+    pool = TaskWorkerPool(size=1, entry="fake_cli:main", max_tasks_per_worker=3)
+    yield pool
+    pool.shutdown()
+
+
+def _where(pool, cwd):
+    assert pool.launch(["where"], str(cwd)).wait() == 0
+    cwd_seen, pid, parent = (cwd / "where.txt").read_text().split()
+    return cwd_seen, int(pid), int(parent)
+
+
+class TestTaskWorkerPool:
+    def test_exit_code_is_the_tasks(self, pool, tmp_path):
+        assert pool.launch(["exit", "3"], str(tmp_path)).wait() == 3
+        assert pool.launch(["exit", "0"], str(tmp_path)).wait() == 0
+
+    def test_each_task_gets_its_own_process_and_cwd(self, pool, tmp_path):
+        a, b = tmp_path / "a", tmp_path / "b"
+        a.mkdir()
+        b.mkdir()
+        cwd_a, pid_a, worker_a = _where(pool, a)
+        cwd_b, pid_b, worker_b = _where(pool, b)
+
+        assert (cwd_a, cwd_b) == (str(a), str(b))
+        assert pid_a != pid_b
+        assert worker_a == worker_b  # the warm worker was reused
+        assert os.getpid() not in (pid_a, pid_b)
+
+    def test_terminate_stops_the_task_not_the_worker(self, pool, tmp_path):
+        task = pool.launch(["sleep", "30"], str(tmp_path))
+        assert task.poll() is None
+        task.terminate()
+        assert task.wait() == -15
+        assert pool.launch(["exit", "0"], str(tmp_path)).wait() == 0
+
+    def test_worker_is_recycled_after_max_tasks(self, pool, tmp_path):
+        workers = {_where(pool, tmp_path)[2] for _ in range(4)}
+        assert len(workers) == 2
+
+    def test_worker_is_recycled_after_a_task_grows_past_max_rss(self, tmp_path, monkeypatch):
+        (tmp_path / "fake_cli.py").write_text(FAKE_CLI)
+        monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+        pool = TaskWorkerPool(size=1, entry="fake_cli:main", max_rss_mb=32)
+        try:
+            first = _where(pool, tmp_path)[2]
+            assert _where(pool, tmp_path)[2] == first  # small tasks keep it warm
+            assert pool.launch(["grow", "64"], str(tmp_path)).wait() == 0
+            assert _where(pool, tmp_path)[2] != first
+        finally:
+            pool.shutdown()
+
+    def test_buffered_events_are_committed_when_the_task_exits(self, pool, tmp_path):
+        from codeframe.core import events
+
+        workspace = create_or_load_workspace(tmp_path)
+
+        assert pool.launch(["emit"], str(tmp_path)).wait() == 0
+
+        assert [e.event_type for e in events.list_recent(workspace)] == ["FROM_WORKER"]
+
+    def test_concurrent_launches_grow_the_pool(self, pool, tmp_path):
+        running = [pool.launch(["sleep", "0.2"], str(tmp_path)) for _ in range(3)]
+        assert len({t._worker.pid for t in running}) == 3
+        assert [t.wait() for t in running] == [0, 0, 0]
+
+
+class TestConductorUsesPool:
+    @pytest.fixture
+    def workspace(self, tmp_path):
+        ws = create_or_load_workspace(tmp_path)
+        task = tasks.create(ws, title="t", description="")
+        return ws, task
+
+    def test_task_runs_on_the_batch_pool_and_force_stop_reaches_it(self, workspace):
+        ws, task = workspace
+        handle = MagicMock()
+        started = []
+
+        def wait():
+            # While the task "runs", a force stop must see and terminate it.
+            started.append(conductor._active_processes["b1"][task.id])
+            return 0
+
+        handle.wait.side_effect = wait
+        pool = MagicMock()
+        pool.launch.return_value = handle
+
+        with patch.dict(conductor._worker_pools, {"b1": pool}):
+            conductor._execute_task_subprocess(ws, task.id, "b1")
+
+        cli_args, cwd = pool.launch.call_args.args
+        assert cli_args[:3] == ["work", "start", task.id]
+        assert cwd == str(ws.repo_path)
+        assert started == [handle]
+
+    def test_pool_failure_falls_back_to_a_fresh_interpreter(self, workspace):
+        from codeframe.core.task_worker import TaskWorkerError
+
+        ws, task = workspace
+        pool = MagicMock()
+        pool.launch.side_effect = TaskWorkerError("gone")
+        fake_proc = MagicMock()
+        fake_proc.wait.return_value = 0
+
+        with patch.dict(conductor._worker_pools, {"b1": pool}), \
+             patch("codeframe.core.conductor.subprocess.Popen", return_value=fake_proc) as popen:
+            conductor._execute_task_subprocess(ws, task.id, "b1")
+
+        assert popen.call_args.args[0][:3] == [sys.executable, "-m", "codeframe.cli.app"]
+
+    def test_execute_batch_registers_and_shuts_down_the_pool(self, workspace):
+        ws, task = workspace
+        batch = conductor.create_batch(ws, task_ids=[task.id])
+        seen = []
+
+        def run_task(*args, **kwargs):
+            seen.append(conductor._worker_pools.get(batch.id))
+            return "COMPLETED"
+
+        with patch("codeframe.core.task_worker.TaskWorkerPool") as pool_cls, \
+             patch("codeframe.core.conductor._execute_task_subprocess", side_effect=run_task):
+            conductor.execute_batch(ws, batch, warm_workers=True)
+
+        assert seen == [pool_cls.return_value]
+        pool_cls.return_value.shutdown.assert_called_once()
+        assert batch.id not in conductor._worker_pools
@@ -0,0 +1,136 @@
+"""Tests for keyset-paginated task listing (list_tasks_page / iter_tasks).
+
+Pages are keyed on (priority, created_at, id): walking every cursor must visit
+each task exactly once in list order, filters must compose with the cursor,
+and each filter/sort combination must be served by an index without a sort.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from codeframe.core import checkpoints, prd, tasks
+from codeframe.core.state_machine import TaskStatus
+from codeframe.core.workspace import create_or_load_workspace, get_db_connection
+
+pytestmark = pytest.mark.v2
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    return create_or_load_workspace(tmp_path)
+
+
+def _walk(workspace, **kwargs) -> list[tasks.Task]:
+    seen, cursor = [], None
+    while True:
+        page = tasks.list_tasks_page(workspace, cursor=cursor, **kwargs)
+        seen.extend(page.tasks)
+        if page.next_cursor is None:
+            return seen
+        cursor = page.next_cursor
+
+
+class TestListTasksPage:
+    def test_cursor_walk_visits_every_task_once_in_order(self, workspace):
+        # Few distinct priorities and a tight loop, so (priority, created_at)
+        # collides often and the id tiebreak is exercised.
+        for i in range(57):
+            tasks.create(workspace, title=f"t{i}", priority=i % 3)
+
+        walked = _walk(workspace, limit=10)
+
+        assert len({t.id for t in walked}) == 57
+        keys = [(t.priority, t.created_at, t.id) for t in walked]
+        assert keys == sorted(keys)
+
+    def test_last_page_has_no_cursor(self, workspace):
+        for i in range(3):
+            tasks.create(workspace, title=f"t{i}")
+
+        assert tasks.list_tasks_page(workspace, limit=3).next_cursor is None
+        assert tasks.list_tasks_page(workspace, limit=2).next_cursor is not None
+
+    def test_inserts_between_pages_do_not_shift_the_next_page(self, workspace):
+        for i in range(6):
+            tasks.create(workspace, title=f"t{i}", priority=5)
+        first = tasks.list_tasks_page(workspace, limit=3)
+        tasks.create(workspace, title="jumps the queue", priority=0)
+
+        second = tasks.list_tasks_page(workspace, limit=3, cursor=first.next_cursor)
+
+        assert {t.id for t in first.tasks}.isdisjoint(t.id for t in second.tasks)
+        assert len(second.tasks) == 3
+
+    def test_filters(self, workspace):
+        record = prd.store(workspace, "# PRD\n", title="p")
+        parent = tasks.create(workspace, title="parent", is_leaf=False)
+        in_prd = tasks.create(workspace, title="in prd", prd_id=record.id)
+        child = tasks.create(
+            workspace, title="child", parent_id=parent.id, requirement_ids=["REQ-1"]
+        )
+        ready = tasks.create(workspace, title="ready", status=TaskStatus.READY)
+
+        def ids(**kwargs):
+            return [t.id for t in _walk(workspace, limit=1, **kwargs)]
+
+        assert ids(prd_id=record.id) == [in_prd.id]
+        assert ids(parent_id=parent.id) == [child.id]
+        assert ids(requirement_id="REQ-1") == [child.id]
+        assert ids(requirement_id="REQ") == []
+        assert ids(status=TaskStatus.READY) == [ready.id]
+
+    def test_description_can_be_left_out(self, workspace):
+        tasks.create(workspace, title="t", description="a long body")
+
+        page = tasks.list_tasks_page(workspace, include_description=False)
+
+        assert page.tasks[0].description == ""
+        assert page.tasks[0].title == "t"
+
+    @pytest.mark.parametrize("cursor", ["garbage", "bm90IGpzb24", "WzEsMl0"])
+    def test_malformed_cursor_raises_value_error(self, workspace, cursor):
+        with pytest.raises(ValueError, match="Invalid task cursor"):
+            tasks.list_tasks_page(workspace, cursor=cursor)
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {},
+            {"status": TaskStatus.READY},
+            {"prd_id": "p"},
+            {"parent_id": "x"},
+        ],
+    )
+    def test_every_filter_is_an_index_seek_without_a_sort(self, workspace, filters):
+        sql, params = tasks._page_query(workspace.id, after=(0, "2026", "x"), **filters)
+        conn = get_db_connection(workspace)
+        try:
+            plan = " ".join(r[3] for r in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+        finally:
+            conn.close()
+
+        assert "USING INDEX idx_tasks_" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+class TestIterTasks:
+    def test_streams_past_any_fixed_cap(self, workspace):
+        for i in range(25):
+            tasks.create(workspace, title=f"t{i}")
+
+        assert len(list(tasks.iter_tasks(workspace, page_size=4))) == 25
+
+    def test_checkpoint_snapshot_is_not_truncated(self, workspace, monkeypatch):
+        for i in range(12):
+            tasks.create(workspace, title=f"t{i}")
+        # A tiny page size proves the snapshot follows cursors rather than
+        # stopping at the first page.
+        real_iter = tasks.iter_tasks
+        monkeypatch.setattr(
+            tasks, "iter_tasks", lambda ws, **kw: real_iter(ws, page_size=5, **kw)
+        )
+
+        snapshot = checkpoints._build_snapshot(workspace, include_git_ref=False)
+
+        assert len(snapshot["tasks"]) == 12
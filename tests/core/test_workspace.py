@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 
+from codeframe.core.db_pool import PooledConnection
 from codeframe.core.workspace import (
     SCHEMA_VERSION,
     Workspace,
@@ -143,7 +144,8 @@ class TestGetDbConnection:
     def test_returns_valid_connection(self, initialized_workspace: Workspace):
         conn = get_db_connection(initialized_workspace)
 
-        assert isinstance(conn, sqlite3.Connection)
+        # A pooled handle standing in for sqlite3.Connection.
+        assert isinstance(conn, PooledConnection)
 
         # Should be able to execute queries
         cursor = conn.cursor()
@@ -0,0 +1,179 @@
+"""Tests for the reusable worktree pool (WorktreePool in core/worktrees.py).
+
+A pooled worktree must be indistinguishable from a fresh ``git worktree add``:
+at the base commit, on a new ``cf/<task_id>`` branch, with nothing left over
+from its previous task. Uses real git repositories.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from codeframe.core.sandbox.context import IsolationLevel, create_execution_context
+from codeframe.core.worktrees import WORKTREE_DIR, TaskWorktree, WorktreePool
+
+pytestmark = pytest.mark.v2
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(cwd), *args], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """A real git repo on 'main' with one commit."""
+    subprocess.run(["git", "init", "-b", "main"], cwd=str(tmp_path), check=True, capture_output=True)
+    _git(tmp_path, "config", "user.email", "test@test.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / ".gitignore").write_text(".codeframe/\n*.log\n")
+    (tmp_path / "app.py").write_text("v1\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "init")
+    return tmp_path
+
+
+def _worktrees(repo: Path) -> int:
+    return _git(repo, "worktree", "list").count("\n") + 1
+
+
+class TestReuse:
+    def test_released_worktree_is_reused_not_recreated(self, repo):
+        pool = WorktreePool(repo, max_idle=2)
+        pool.acquire("t1", "main")
+        pool.release("t1")
+
+        assert len(pool.idle()) == 1
+        assert _git(repo, "branch", "--list", "cf/t1") == ""
+
+        with patch.object(TaskWorktree, "create", side_effect=AssertionError("not reused")):
+            path = pool.acquire("t2", "main")
+
+        assert path == repo / WORKTREE_DIR / "t2"
+        assert pool.idle() == []
+        assert _worktrees(repo) == 2
+
+    def test_reused_worktree_matches_a_fresh_checkout(self, repo):
+        pool = WorktreePool(repo, max_idle=2)
+        old = pool.acquire("t1", "main")
+        (old / "app.py").write_text("edited by t1\n")
+        (old / "stray.txt").write_text("untracked")
+        (old / "build.log").write_text("ignored")
+        pool.release("t1")
+        # The base moves on while the worktree is parked.
+        (repo / "app.py").write_text("v2\n")
+        _git(repo, "commit", "-am", "v2")
+
+        path = pool.acquire("t2", "main")
+
+        assert (path / "app.py").read_text() == "v2\n"
+        assert not (path / "stray.txt").exists()
+        assert not (path / "build.log").exists()
+        assert _git(path, "rev-parse", "--abbrev-ref", "HEAD") == "cf/t2"
+        assert _git(path, "rev-parse", "HEAD") == _git(repo, "rev-parse", "main")
+        assert _git(path, "status", "--porcelain") == ""
+
+    def test_full_pool_removes_the_worktree(self, repo):
+        pool = WorktreePool(repo, max_idle=1)
+        pool.acquire("t1", "main")
+        pool.acquire("t2", "main")
+        pool.release("t1")
+        pool.release("t2")
+
+        assert len(pool.idle()) == 1
+        assert not (repo / WORKTREE_DIR / "t2").exists()
+        assert _git(repo, "branch", "--list", "cf/*") == ""
+
+    def test_pool_size_zero_creates_and_deletes(self, repo):
+        pool = WorktreePool(repo, max_idle=0)
+        pool.acquire("t1", "main")
+        pool.release("t1")
+
+        assert pool.idle() == []
+        assert _worktrees(repo) == 1
+
+    def test_release_survives_the_parked_worktree_vanishing(self, repo):
+        """Another process may take the parked worktree the moment it lands."""
+        pool = WorktreePool(repo, max_idle=2)
+        pool.acquire("t1", "main")
+
+        with patch("codeframe.core.worktrees.os.utime", side_effect=FileNotFoundError):
+            pool.release("t1")
+
+        assert len(pool.idle()) == 1
+
+    def test_broken_parked_worktree_falls_back_to_a_fresh_one(self, repo):
+        pool = WorktreePool(repo, max_idle=2)
+        pool.acquire("t1", "main")
+        pool.release("t1")
+        for parked in pool.idle():
+            (parked / ".git").unlink()  # no longer a worktree
+
+        path = pool.acquire("t2", "main")
+
+        assert _git(path, "rev-parse", "--abbrev-ref", "HEAD") == "cf/t2"
+        assert pool.idle() == []
+
+
+class TestPrewarm:
+    def test_fills_the_pool_in_the_background(self, repo):
+        pool = WorktreePool(repo, max_idle=3)
+        pool.prewarm(2, "main").join(timeout=60)
+
+        assert len(pool.idle()) == 2
+        assert all(not p.name.startswith(".") for p in pool.idle())
+
+    def test_capped_at_max_idle(self, repo):
+        pool = WorktreePool(repo, max_idle=1)
+        pool.prewarm(5, "main").join(timeout=60)
+        assert len(pool.idle()) == 1
+
+    def test_recover_removes_half_created_worktrees_of_dead_processes(self, repo):
+        pool = WorktreePool(repo, max_idle=2)
+        dead = pool.pool_dir / ".creating-999999999-abcd"
+        _git(repo, "worktree", "add", "--detach", str(dead), "main")
+
+        pool.recover()
+
+        assert not dead.exists()
+        assert _worktrees(repo) == 1
+
+
+class TestExecutionContext:
+    def test_cleanup_parks_and_the_next_task_reuses(self, repo):
+        first = create_execution_context("t1", IsolationLevel.WORKTREE, repo)
+        first.cleanup()
+
+        with patch.object(TaskWorktree, "create", side_effect=AssertionError("not reused")):
+            second = create_execution_context("t2", IsolationLevel.WORKTREE, repo)
+
+        assert second.workspace_path == repo / WORKTREE_DIR / "t2"
+        second.cleanup()
+        assert len(WorktreePool(repo).idle()) == 1
+
+
+class TestBatchPrewarm:
+    def test_worktree_batch_prewarms_one_per_parallel_slot(self, repo):
+        from codeframe.core import conductor, tasks
+        from codeframe.core.workspace import create_or_load_workspace
+
+        ws = create_or_load_workspace(repo)
+        task = tasks.create(ws, title="t", description="")
+        batch = conductor.create_batch(
+            ws, task_ids=[task.id], strategy="parallel", max_parallel=3, isolation="worktree",
+        )
+
+        with patch("codeframe.core.worktrees.WorktreePool") as pool_cls, \
+             patch("codeframe.core.conductor._execute_batch"):
+            pool_cls.return_value.max_idle = 2
+            conductor.execute_batch(ws, batch)
+
+        pool = pool_cls.return_value
+        pool.prewarm.assert_called_once_with(3, base_branch="main")
+        assert pool.max_idle == 3
+        pool.stop.assert_called_once()
@@ -0,0 +1,179 @@
+"""Tests for the shared SQLite rate-limit storage (codeframe/lib/rate_limit_storage.py).
+
+Two storages opened on the same file stand in for two uvicorn workers: a hit
+recorded by one must count against the other, for every ``limits`` strategy.
+"""
+
+import multiprocessing
+import sys
+import time
+
+import pytest
+from limits import parse
+from limits.strategies import (
+    FixedWindowRateLimiter,
+    MovingWindowRateLimiter,
+    SlidingWindowCounterRateLimiter,
+)
+from limits.storage import storage_from_string
+
+from codeframe.lib import rate_limit_storage
+from codeframe.lib.rate_limit_storage import SQLiteStorage
+
+pytestmark = pytest.mark.v2
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "state" / "rate_limits.db")
+
+
+@pytest.fixture
+def workers(path):
+    return SQLiteStorage(path=path), SQLiteStorage(path=path)
+
+
+def _acquire_many(path, attempts, results):
+    storage = SQLiteStorage(path=path)
+    limiter = MovingWindowRateLimiter(storage)
+    item = parse("50/minute")
+    results.put(sum(limiter.hit(item, "login", "ip:1") for _ in range(attempts)))
+
+
+class TestStorage:
+    def test_registered_with_limits(self, path):
+        storage = storage_from_string(f"{rate_limit_storage.SCHEME}://", path=path)
+        assert isinstance(storage, SQLiteStorage)
+        assert storage.check()
+
+    def test_path_is_required(self):
+        with pytest.raises(ValueError):
+            SQLiteStorage()
+
+    def test_counters_are_shared(self, workers):
+        a, b = workers
+        assert a.incr("k", 60) == 1
+        assert b.incr("k", 60) == 2
+        assert a.get("k") == 2
+        assert time.time() < b.get_expiry("k") <= time.time() + 60
+
+    def test_expired_window_restarts(self, workers, monkeypatch):
+        a, b = workers
+        a.incr("k", 60, amount=5)
+        later = time.time() + 61
+        monkeypatch.setattr(rate_limit_storage.time, "time", lambda: later)
+
+        assert b.get("k") == 0
+        assert b.incr("k", 60) == 1
+
+    def test_clear_and_reset(self, workers):
+        a, b = workers
+        a.incr("k", 60)
+        a.acquire_entry("m", 5, 60)
+        b.clear("k")
+        assert a.get("k") == 0
+        assert b.reset() == 1
+        assert a.get_moving_window("m", 5, 60)[1] == 0
+
+
+class TestStrategies:
+    def test_fixed_window(self, workers):
+        a, b = (FixedWindowRateLimiter(s) for s in workers)
+        item = parse("3/minute")
+
+        assert [a.hit(item, "x"), b.hit(item, "x"), a.hit(item, "x")] == [True] * 3
+        assert not b.hit(item, "x")
+        assert a.get_window_stats(item, "x").remaining == 0
+
+    def test_moving_window(self, workers):
+        a, b = (MovingWindowRateLimiter(s) for s in workers)
+        item = parse("3/minute")
+
+        assert a.hit(item, "x") and b.hit(item, "x", cost=2)
+        assert not a.hit(item, "x")
+        assert not b.test(item, "x")
+        stats = b.get_window_stats(item, "x")
+        assert stats.remaining == 0
+        assert time.time() < stats.reset_time <= time.time() + 60
+
+    def test_moving_window_slides(self, workers, monkeypatch):
+        a, b = (MovingWindowRateLimiter(s) for s in workers)
+        item = parse("2/minute")
+        start = time.time()
+        monkeypatch.setattr(rate_limit_storage.time, "time", lambda: start)
+        assert a.hit(item, "x")
+        monkeypatch.setattr(rate_limit_storage.time, "time", lambda: start + 30)
+        assert b.hit(item, "x")
+        assert not a.hit(item, "x")
+
+        # The first hit leaves the window; the second is still in it.
+        monkeypatch.setattr(rate_limit_storage.time, "time", lambda: start + 61)
+        assert a.hit(item, "x")
+        assert not b.hit(item, "x")
+
+    def test_cost_above_the_limit_is_refused(self, workers):
+        assert not workers[0].acquire_entry("x", 2, 60, amount=3)
+        assert not workers[0].acquire_sliding_window_entry("x", 2, 60, amount=3)
+
+    def test_sliding_window_counter(self, workers):
+        a, b = (SlidingWindowCounterRateLimiter(s) for s in workers)
+        item = parse("3/minute")
+
+        assert a.hit(item, "x") and b.hit(item, "x") and a.hit(item, "x")
+        assert not b.hit(item, "x")
+        b.clear(item, "x")
+        assert a.hit(item, "x")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fork start method")
+def test_processes_share_one_limit(path):
+    """Four processes racing for 50 slots take exactly 50 between them.
+
+    The parent's storage is opened before the fork, so the children also
+    exercise reopening the connection in a forked process.
+    """
+    SQLiteStorage(path=path)
+    ctx = multiprocessing.get_context("fork")
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_acquire_many, args=(path, 40, results)) for _ in range(4)]
+    for proc in procs:
+        proc.start()
+    granted = [results.get(timeout=30) for _ in procs]
+    for proc in procs:
+        proc.join(timeout=30)
+
+    assert sum(granted) == 50
+
+
+class TestLimiterSelection:
+    @pytest.fixture(autouse=True)
+    def reset(self, monkeypatch, tmp_path):
+        from codeframe.config.rate_limits import _reset_rate_limit_config
+        from codeframe.core.config import reset_global_config
+        from codeframe.lib.rate_limiter import reset_rate_limiter
+
+        monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+        monkeypatch.setenv("RATE_LIMIT_STORAGE", "sqlite")
+        monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "state" / "state.db"))
+        for fn in (_reset_rate_limit_config, reset_global_config, reset_rate_limiter):
+            fn()
+        yield
+        for fn in (_reset_rate_limit_config, reset_global_config, reset_rate_limiter):
+            fn()
+
+    def test_sqlite_storage_sits_next_to_the_platform_db(self, tmp_path):
+        from codeframe.lib.rate_limiter import get_rate_limiter
+
+        storage = get_rate_limiter()._storage
+
+        assert isinstance(storage, SQLiteStorage)
+        assert storage.path == tmp_path / "state" / "rate_limits.db"
+
+    def test_unusable_path_falls_back_to_memory(self, tmp_path):
+        from limits.storage import MemoryStorage
+
+        from codeframe.lib.rate_limiter import get_rate_limiter
+
+        (tmp_path / "state").write_text("not a directory")
+
+        assert isinstance(get_rate_limiter()._storage, MemoryStorage)
@@ -210,12 +210,11 @@ class TestMergeGate:
         record = get_pr_merge_override(test_workspace, 7)
         assert record["reason"] == "second"
 
-        import sqlite3
-
+        from codeframe.core.db_pool import PooledConnection
         from codeframe.core.workspace import get_db_connection
 
         conn = get_db_connection(test_workspace)
-        assert isinstance(conn, sqlite3.Connection)
+        assert isinstance(conn, PooledConnection)
         count = conn.execute(
             "SELECT COUNT(*) FROM pr_merge_overrides WHERE pr_number = 7"
         ).fetchone()[0]
@@ -65,13 +65,17 @@ def analyzed(monkeypatch):
     """
     seen: list = []
 
-    def _record(self, path):
+    def _record(self, path, code):
         seen.append(Path(path))
         return []
 
-    monkeypatch.setattr(ComplexityAnalyzer, "analyze_file", _record)
-    monkeypatch.setattr(SecurityScanner, "analyze_file", _record)
-    monkeypatch.setattr(OWASPPatterns, "check_file", _record)
+    def _record_batch(self, sources):
+        seen.extend(Path(path) for path in sources)
+        return {path: [] for path in sources}
+
+    monkeypatch.setattr(ComplexityAnalyzer, "analyze_code", _record)
+    monkeypatch.setattr(SecurityScanner, "analyze_sources", _record_batch)
+    monkeypatch.setattr(OWASPPatterns, "check_code", _record)
     return seen
 
 
@@ -0,0 +1,68 @@
+"""GET /api/v2/tasks pages with a cursor instead of truncating at ``limit``.
+
+The endpoint capped ``limit`` at 1000 with no way to ask for the rest, so a
+large workspace silently lost tasks in the UI. It now returns ``next_cursor``
+and accepts it back, plus prd/parent/requirement filters.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from codeframe.core import tasks
+from codeframe.core.workspace import create_or_load_workspace
+
+pytestmark = pytest.mark.v2
+
+
+@pytest.fixture
+def client_and_ws(tmp_path):
+    ws = create_or_load_workspace(tmp_path)
+
+    from codeframe.ui.dependencies import get_v2_workspace
+    from codeframe.ui.routers import tasks_v2
+
+    app = FastAPI()
+    app.include_router(tasks_v2.router)
+    app.dependency_overrides[get_v2_workspace] = lambda: ws
+    return TestClient(app), ws
+
+
+def test_following_next_cursor_returns_every_task(client_and_ws):
+    client, ws = client_and_ws
+    created = {tasks.create(ws, title=f"t{i}", description="body").id for i in range(7)}
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 3, "include_description": "false"}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/api/v2/tasks", params=params).json()
+        seen.extend(body["tasks"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert {t["id"] for t in seen} == created
+    assert len(seen) == 7
+    assert all(t["description"] == "" for t in seen)
+    assert body["by_status"]["BACKLOG"] == 7
+
+
+def test_parent_filter(client_and_ws):
+    client, ws = client_and_ws
+    parent = tasks.create(ws, title="parent", is_leaf=False)
+    child = tasks.create(ws, title="child", parent_id=parent.id)
+
+    body = client.get("/api/v2/tasks", params={"parent_id": parent.id}).json()
+
+    assert [t["id"] for t in body["tasks"]] == [child.id]
+    assert body["next_cursor"] is None
+
+
+def test_bad_cursor_is_a_400(client_and_ws):
+    client, _ = client_and_ws
+
+    response = client.get("/api/v2/tasks", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
@@ -94,6 +94,8 @@ export interface TaskListResponse {
   tasks: Task[];
   total: number;
   by_status: TaskStatusCounts;
+  /** Pass back as `cursor` for the next page; null on the last page. */
+  next_cursor?: string | null;
 }
 
 // Batch execution types
@@ -109,6 +109,8 @@ export type StressTestEventType =
 export interface StressTestGoalsExtractedEvent {
   type: 'goals_extracted';
   goals: string[];
+  /** Answers reused from the workspace decomposition cache so far. */
+  cache_hits?: number;
 }
 
 export interface StressTestGoalAnalyzedEvent {
@@ -116,6 +118,9 @@ export interface StressTestGoalAnalyzedEvent {
   goal: string;
   classification: 'atomic' | 'composite' | 'ambiguous';
   ambiguities_so_far: number;
+  /** Classification calls actually made so far. */
+  llm_calls?: number;
+  cache_hits?: number;
 }
 
 export type AmbiguitySeverity = 'blocking' | 'warning';
@@ -139,6 +144,8 @@ export interface StressTestCompleteEvent {
   ambiguities: StressTestAmbiguity[];
   tech_spec_markdown: string;
   ambiguity_report: string;
+  llm_calls?: number;
+  cache_hits?: number;
 }
 
 export interface StressTestErrorEvent {